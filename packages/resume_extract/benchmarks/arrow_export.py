@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+추출 결과 내보내기 방식별 처리량/크기 측정
+
+합성 ResumeInfo N건(기본 100,000)을 다음 방식으로 파일에 기록해 시간과 파일 크기를 비교합니다.
+
+- to_json: 객체마다 to_json()(indent=2)을 한 줄씩 기록
+- model_dump_json: 객체마다 model_dump_json()을 JSONL로 기록
+- parquet: ParquetResumeWriter (zstd, batch_size 4096)
+- arrow ipc: ArrowResumeWriter
+
+Usage:
+    uv run python benchmarks/arrow_export.py --count 100000
+"""
+
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+from typing import Callable, List
+
+from resume_extract import ArrowResumeWriter, ParquetResumeWriter
+from resume_extract.models import ContactInfo, EducationInfo, ExperienceInfo, ResumeInfo
+
+COMPANIES = ["네이버", "카카오", "토스", "쿠팡", "라인", "배민", "당근", "야놀자"]
+SKILLS = ["Python", "Go", "Java", "Kotlin", "React", "Kubernetes", "AWS", "PostgreSQL", "Kafka", "Redis"]
+
+
+def make_resume(i: int, rng: random.Random) -> ResumeInfo:
+    return ResumeInfo.trusted(
+        name=f"지원자{i}",
+        contact=ContactInfo.trusted(email=f"user{i}@example.com", phone="010-1234-5678"),
+        summary="백엔드 개발자",
+        skills=rng.sample(SKILLS, 5),
+        experience=[
+            ExperienceInfo.trusted(company=rng.choice(COMPANIES), position="백엔드 개발자",
+                                   duration=f"{2010 + j}.01 ~ {2011 + j}.12",
+                                   description="서비스 설계, 구현, 운영", technologies=rng.sample(SKILLS, 3))
+            for j in range(rng.randint(2, 5))
+        ],
+        education=[EducationInfo.trusted(institution="한국대학교", degree="학사", duration="2006.03 ~ 2010.02")],
+        languages=["한국어"],
+        confidence_score=0.8,
+    )
+
+
+def write_json(resumes: List[ResumeInfo], path: str, dump: Callable[[ResumeInfo], str]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for info in resumes:
+            f.write(dump(info))
+            f.write('\n')
+
+
+def write_with(writer_cls: type, resumes: List[ResumeInfo], path: str) -> None:
+    with writer_cls(path, include_raw_text=False) as writer:
+        writer.write_all(resumes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100_000, help="결과 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    resumes = [make_resume(i, rng) for i in range(args.count)]
+    # 미리 만든 결과 목록을 순환 GC가 반복해서 훑는 비용은 측정에서 제외
+    gc.freeze()
+    cases = [
+        ("to_json", "results.json", lambda path: write_json(resumes, path, ResumeInfo.to_json)),
+        ("model_dump_json", "results.jsonl", lambda path: write_json(resumes, path, ResumeInfo.model_dump_json)),
+        ("parquet", "results.parquet", lambda path: write_with(ParquetResumeWriter, resumes, path)),
+        ("arrow ipc", "results.arrows", lambda path: write_with(ArrowResumeWriter, resumes, path)),
+    ]
+
+    print(f"{args.count}건")
+    print(f"{'방식':<16} {'시간(s)':>8} {'건/s':>10} {'크기(MB)':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, filename, run in cases:
+            path = os.path.join(tmp, filename)
+            started = time.perf_counter()
+            run(path)
+            elapsed = time.perf_counter() - started
+            size = os.path.getsize(path) / 2**20
+            print(f"{label:<16} {elapsed:>8.2f} {args.count / elapsed:>10,.0f} {size:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
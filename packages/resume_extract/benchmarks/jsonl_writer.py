@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+JSON 직렬화 방식별 처리량 측정
+
+합성 ResumeInfo N건(기본 100,000, 원문 약 1KB 포함)을 파일에 기록해 시간과 크기를 비교합니다.
+
+- to_json: 객체마다 to_json()(indent=2) 문자열을 텍스트 파일에 기록
+- dump+json.dumps: 기존 batch 명령 방식 (model_dump(mode='json')을 레코드에 넣어 json.dumps)
+- JSONLWriter: pydantic-core 바이트를 버퍼에 모아 기록 (레코드 포함/압축 없음, gzip, zstd)
+
+Usage:
+    uv run python benchmarks/jsonl_writer.py --count 100000
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Callable, List
+
+from resume_extract.jsonl import JSONLWriter, json_backend
+from resume_extract.models import ContactInfo, ExperienceInfo, ResumeInfo
+
+COMPANIES = ["네이버", "카카오", "토스", "쿠팡", "라인", "배민", "당근", "야놀자"]
+SKILLS = ["Python", "Go", "Java", "Kotlin", "React", "Kubernetes", "AWS", "PostgreSQL", "Kafka", "Redis"]
+
+
+def make_resume(i: int, rng: random.Random) -> ResumeInfo:
+    experience = [
+        ExperienceInfo.trusted(company=rng.choice(COMPANIES), position="백엔드 개발자",
+                               duration=f"{2010 + j}.01 ~ {2011 + j}.12",
+                               description="서비스 설계, 구현, 운영", technologies=rng.sample(SKILLS, 3))
+        for j in range(rng.randint(2, 5))
+    ]
+    return ResumeInfo.trusted(
+        name=f"지원자{i}",
+        contact=ContactInfo.trusted(email=f"user{i}@example.com", phone="010-1234-5678"),
+        summary="백엔드 개발자",
+        skills=rng.sample(SKILLS, 5),
+        experience=experience,
+        languages=["한국어"],
+        raw_text="\n".join(f"{e.company} - {e.position} ({e.duration}) {e.description}" for e in experience) * 5,
+        confidence_score=0.8,
+    )
+
+
+def write_to_json(resumes: List[ResumeInfo], path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for info in resumes:
+            f.write(info.to_json())
+            f.write('\n')
+
+
+def write_dump_records(resumes: List[ResumeInfo], path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for i, info in enumerate(resumes):
+            record = {'id': str(i), 'source': f"{i}.pdf", 'result': info.model_dump(mode='json')}
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def write_records(resumes: List[ResumeInfo], path: str) -> None:
+    with JSONLWriter(path) as writer:
+        for i, info in enumerate(resumes):
+            writer.write_record({'id': str(i), 'source': f"{i}.pdf"}, info)
+
+
+def writer_case(compression: str = None) -> Callable[[List[ResumeInfo], str], None]:
+    def run(resumes: List[ResumeInfo], path: str) -> None:
+        with JSONLWriter(path, compression=compression) as writer:
+            writer.write_all(resumes)
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100_000, help="결과 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    resumes = [make_resume(i, rng) for i in range(args.count)]
+    # 미리 만든 결과 목록을 순환 GC가 반복해서 훑는 비용은 측정에서 제외
+    gc.freeze()
+    cases = [
+        ("to_json", "results.json", write_to_json),
+        ("dump+json.dumps", "records.jsonl", write_dump_records),
+        ("JSONLWriter 레코드", "records2.jsonl", write_records),
+        ("JSONLWriter", "results.jsonl", writer_case()),
+        ("JSONLWriter gzip", "results.jsonl.gz", writer_case('gzip')),
+    ]
+    try:
+        import zstandard  # noqa: F401
+        cases.append(("JSONLWriter zstd", "results.jsonl.zst", writer_case('zstd')))
+    except ImportError:
+        pass
+
+    print(f"{args.count}건, 레코드 JSON: {json_backend()}")
+    print(f"{'방식':<20} {'시간(s)':>8} {'건/s':>10} {'크기(MB)':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, filename, run in cases:
+            path = os.path.join(tmp, filename)
+            started = time.perf_counter()
+            run(resumes, path)
+            elapsed = time.perf_counter() - started
+            size = os.path.getsize(path) / 2**20
+            print(f"{label:<20} {elapsed:>8.2f} {args.count / elapsed:>10,.0f} {size:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+ResumeInfo 생성 방식별 객체당 비용 측정
+
+변환 코드가 만드는 것과 같은 ResumeInfo(연락처, 경력 3건, 학력, 프로젝트, 자격증)를
+다음 방식으로 만들어 객체당 시간을 비교합니다.
+
+- eager: 생성자 검증 (기존 동작, validation='eager')
+- trusted: ResumeModel.trusted (검증 없음)
+- trusted+경계 검증: trusted로 만든 뒤 validate_resume_info로 한 번 검증 (validation='lazy')
+- trusted×N+경계 검증: 내부 단계에서 N번 만들고 경계에서 한 번 검증
+
+이메일 검증(email-validator)이 eager 비용의 대부분이라 이메일 유무를 나눠 측정합니다.
+
+Usage:
+    uv run python benchmarks/model_construction.py --number 2000
+"""
+
+import argparse
+import timeit
+from typing import Callable, Optional
+
+from resume_extract import (
+    CertificationInfo,
+    ContactInfo,
+    EducationInfo,
+    ExperienceInfo,
+    ProjectInfo,
+    ResumeInfo,
+    validate_resume_info,
+)
+
+
+def build(trusted: bool, email: Optional[str]) -> ResumeInfo:
+    """langextract_integration의 변환과 같은 모양으로 생성"""
+    make = (lambda model, **data: model.trusted(**data)) if trusted else (lambda model, **data: model(**data))
+    return make(
+        ResumeInfo,
+        name="홍길동",
+        contact=make(ContactInfo, email=email, phone="010-1234-5678", github="https://github.com/hong"),
+        summary="백엔드 개발자",
+        skills=["Python", "Go", "Kubernetes", "PostgreSQL"],
+        experience=[
+            make(ExperienceInfo, company=company, position="백엔드 개발자", duration="2020.01 ~ 2023.12",
+                 technologies=["Python", "Kafka"])
+            for company in ("카카오", "네이버", "토스")
+        ],
+        education=[make(EducationInfo, institution="한국대학교", degree="학사", major="컴퓨터공학",
+                                  duration="2010.03 ~ 2014.02")],
+        projects=[make(ProjectInfo, name="추천 시스템", description="실시간 추천 API", technologies=["Redis"])],
+        certifications=[make(CertificationInfo, name="정보처리기사", issuer="한국산업인력공단")],
+        languages=["한국어", "영어"],
+        raw_text="홍길동\n" * 200,
+        confidence_score=0.8,
+    )
+
+
+def per_object_us(fn: Callable[[], object], number: int) -> float:
+    fn()
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000, help="반복 횟수")
+    parser.add_argument('--stages', type=int, default=3, help="내부 단계에서 다시 만드는 횟수 N")
+    args = parser.parse_args()
+    n = args.stages
+
+    print(f"{'방식':<26} {'이메일 있음(µs)':>16} {'이메일 없음(µs)':>16}")
+    cases = [
+        ("eager", lambda email: build(False, email)),
+        ("trusted", lambda email: build(True, email)),
+        ("trusted+경계 검증", lambda email: validate_resume_info(build(True, email))),
+        (f"eager×{n}", lambda email: [build(False, email) for _ in range(n)]),
+        (f"trusted×{n}+경계 검증", lambda email: validate_resume_info([build(True, email) for _ in range(n)][-1])),
+    ]
+    for label, case in cases:
+        with_email = per_object_us(lambda case=case: case("hong@example.com"), args.number)
+        without_email = per_object_us(lambda case=case: case(None), args.number)
+        print(f"{label:<26} {with_email:>16.1f} {without_email:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
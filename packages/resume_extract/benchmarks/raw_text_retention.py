@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+raw_text 보관 정책별 결과 메모리/JSON 크기 측정
+
+합성 이력서 N건(기본 10,000)을 MockBackend로 추출해 결과만 리스트에 보관했을 때
+tracemalloc으로 잡힌 메모리와 to_json 출력 크기를 정책별로 비교합니다.
+원문은 추출이 끝나면 버리므로, 결과가 붙잡고 있는 원문만 측정에 포함됩니다.
+
+Usage:
+    uv run python benchmarks/raw_text_retention.py --count 10000
+"""
+
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from resume_extract import FileTextStore, MockBackend, RawTextRetention, ResumeExtractor
+
+COMPANIES = ["네이버", "카카오", "토스", "쿠팡", "라인", "배민", "당근", "야놀자"]
+SKILLS = ["Python", "Go", "Java", "Kotlin", "React", "Kubernetes", "AWS", "PostgreSQL", "Kafka", "Redis"]
+
+
+def make_resume(i: int, rng: random.Random) -> str:
+    """경력 설명이 긴 3~5KB 분량의 합성 이력서"""
+    lines = [f"지원자{i}", f"이메일: user{i}@example.com", "전화: 010-1234-5678", "", "## 경력"]
+    for j in range(rng.randint(3, 6)):
+        company = rng.choice(COMPANIES)
+        lines.append(f"{company} - 백엔드 개발자 ({2010 + j}.01 ~ {2011 + j}.12)")
+        lines.extend(
+            f"- {company} 서비스 {k}번째 기능의 설계, 구현, 운영과 성능 개선을 담당했습니다. "
+            f"트래픽 증가에 대비해 캐시와 비동기 처리를 도입했습니다."
+            for k in range(rng.randint(3, 6))
+        )
+    lines += ["", "## 학력", "한국대학교 컴퓨터공학과 학사 (2006.03 ~ 2010.02)", "", "## 기술"]
+    lines.append(", ".join(rng.sample(SKILLS, 5)))
+    return "\n".join(lines)
+
+
+def measure(policy: RawTextRetention, count: int) -> dict:
+    rng = random.Random(0)
+    backend = MockBackend(extractions=[("이름", "지원자"), ("기술", "Python"), ("기술", "Go")])
+    extractor = ResumeExtractor(backend=backend, coalesce=False, raw_text_retention=policy)
+    # 프로세서 생성 등 최초 호출 비용은 측정에서 제외
+    extractor.extract_from_text(make_resume(-1, random.Random(1)))
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    results = []
+    text_chars = 0
+    for i in range(count):
+        text = make_resume(i, rng)
+        text_chars += len(text)
+        results.append(extractor.extract_from_text(text))
+    elapsed = time.perf_counter() - started
+    del text
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    json_bytes = sum(len(r.to_json().encode('utf-8')) for r in results)
+    extractor.close()
+    return {
+        'mode': policy.mode,
+        'retained_mb': retained / 2**20,
+        'json_mb': json_bytes / 2**20,
+        'text_mb': text_chars / 2**20,
+        'seconds': elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=10_000, help="이력서 수")
+    parser.add_argument('--max-chars', type=int, default=500, help="truncate에서 유지할 문자 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FileTextStore(os.path.join(tmp, "texts.bin"))
+        policies = [
+            RawTextRetention('full'),
+            RawTextRetention('truncate', max_chars=args.max_chars),
+            RawTextRetention('reference', store=store),
+            RawTextRetention('drop'),
+        ]
+        rows = [measure(policy, args.count) for policy in policies]
+        store.close()
+
+    baseline = rows[0]['retained_mb']
+    print(f"{args.count}건, 원문 합계 {rows[0]['text_mb']:.1f}M 문자")
+    print(f"{'정책':<10} {'결과 메모리(MB)':>16} {'절감':>7} {'to_json(MB)':>12} {'추출(s)':>8}")
+    for row in rows:
+        saved = 1 - row['retained_mb'] / baseline
+        print(f"{row['mode']:<10} {row['retained_mb']:>16.1f} {saved:>7.0%} {row['json_mb']:>12.1f} {row['seconds']:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
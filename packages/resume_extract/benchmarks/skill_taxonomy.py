@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+기술 사전 탐지 방식별 시간 측정
+
+기본 사전에 합성 별칭을 더해 N개(기본 50,000) 별칭 사전을 만들고, 약 5KB 이력서 원문에서
+기술을 찾는 시간을 비교합니다.
+
+- regex: 별칭을 긴 순서로 이은 대소문자 무시 alternation 정규식 (기존 휴리스틱 방식)
+- aho-corasick: SkillTaxonomy.find (별칭 수와 무관하게 원문 한 번 훑기)
+
+Usage:
+    uv run python benchmarks/skill_taxonomy.py --aliases 50000
+"""
+
+import argparse
+import random
+import re
+import string
+import time
+from typing import Callable, Dict, List
+
+from resume_extract.taxonomy import DEFAULT_ALIASES, DEFAULT_SKILLS, SkillTaxonomy
+
+SENTENCES = [
+    "카카오에서 Spring Boot와 Kotlin으로 결제 API를 설계하고 운영했습니다.",
+    "React.js, TypeScript 기반 관리자 화면을 개발하고 Node 서버를 유지보수했습니다.",
+    "AWS 위 k8s 클러스터에 Kafka, Redis, PostgreSQL을 구성했습니다.",
+    "데이터 파이프라인을 Apache Airflow와 PySpark로 옮겨 처리 시간을 절반으로 줄였습니다.",
+    "Google 검색 트래픽 분석을 위한 내부 도구를 golang으로 작성했습니다.",
+]
+
+
+def make_entries(count: int, rng: random.Random) -> Dict[str, List[str]]:
+    entries: Dict[str, List[str]] = {name: list(DEFAULT_ALIASES.get(name, ())) for name in DEFAULT_SKILLS}
+    total = sum(1 + len(aliases) for aliases in entries.values())
+    while total < count:
+        name = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12))).capitalize()
+        entries[name] = [f"{name}.js", f"{name} framework"]
+        total += 3
+    return entries
+
+
+def make_text(rng: random.Random, size: int = 5000) -> str:
+    lines = []
+    while sum(len(line) for line in lines) < size:
+        lines.append(rng.choice(SENTENCES))
+    return "\n".join(lines)
+
+
+def regex_finder(entries: Dict[str, List[str]]) -> Callable[[str], List[str]]:
+    canonical = {}
+    for name, aliases in entries.items():
+        for alias in (name, *aliases):
+            canonical.setdefault(alias.lower(), name)
+    alternation = '|'.join(re.escape(alias) for alias in sorted(canonical, key=len, reverse=True))
+    pattern = re.compile(rf'(?<![A-Za-z0-9_.+#])(?:{alternation})(?![A-Za-z0-9_+#])', re.IGNORECASE)
+
+    def find(text: str) -> List[str]:
+        return list(dict.fromkeys(canonical[m.group(0).lower()] for m in pattern.finditer(text)))
+    return find
+
+
+def timed(func: Callable, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--aliases', type=int, default=50_000, help="별칭 수")
+    parser.add_argument('--repeat', type=int, default=200, help="탐지 반복 횟수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    entries = make_entries(args.aliases, rng)
+    text = make_text(rng)
+
+    regex_find, regex_build = timed(regex_finder, entries)
+    taxonomy, taxonomy_build = timed(SkillTaxonomy, entries)
+
+    print(f"별칭 {len(taxonomy):,}개, 원문 {len(text):,}자, {args.repeat}회 반복")
+    print(f"{'방식':<14} {'생성(s)':>8} {'탐지(ms/건)':>12}  결과")
+    for label, build, find in (("regex", regex_build, regex_find),
+                               ("aho-corasick", taxonomy_build, taxonomy.find)):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            found = find(text)
+        elapsed = (time.perf_counter() - started) / args.repeat * 1000
+        print(f"{label:<14} {build:>8.2f} {elapsed:>12.2f}  {', '.join(found)}")
+
+
+if __name__ == '__main__':
+    main()
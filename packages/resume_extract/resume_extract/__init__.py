@@ -7,70 +7,70 @@ Provides structured information extraction using Google's LangExtract.
 
 __version__ = "0.0.1"
 
-from .extractor import ResumeExtractor
-from .models import (
-    ResumeInfo,
-    ContactInfo,
-    ExperienceInfo,
-    EducationInfo,
-    ProjectInfo,
-    CertificationInfo,
-)
+import logging
+
+from .backends import ExtractionBackend, LangExtractBackend, MockBackend
+from .deadline import Deadline
+from .dedup import DuplicateMatch, NearDuplicateIndex
 from .exceptions import (
-    ResumeExtractError,
-    InvalidURLError,
-    UnsupportedFileTypeError,
+    DeadlineExceededError,
     DownloadError,
-    ParseError,
     ExtractionError,
+    ExtractionTimeoutError,
+    InvalidURLError,
     LangExtractAPIError,
+    LeaseLostError,
+    ParseError,
+    ResumeExtractError,
+    UnsupportedFileTypeError,
+)
+from .export import (
+    ArrowBatchBuilder,
+    ArrowResumeWriter,
+    ParquetResumeWriter,
+    to_record_batches,
+    write_parquet,
 )
 
-# Convenience functions
-def extract_from_url(url: str, **kwargs) -> ResumeInfo:
-    """
-    Convenience function to extract resume information from a URL.
-    
-    Args:
-        url: Resume file URL
-        **kwargs: Keyword arguments to pass to ResumeExtractor constructor
-        
-    Returns:
-        ResumeInfo: Extracted resume information
-    """
-    with ResumeExtractor(**kwargs) as extractor:
-        return extractor.extract_from_url(url)
-
-
-def extract_from_file(file_path: str, **kwargs) -> ResumeInfo:
-    """
-    Convenience function to extract resume information from a local file.
-    
-    Args:
-        file_path: Local resume file path
-        **kwargs: Keyword arguments to pass to ResumeExtractor constructor
-        
-    Returns:
-        ResumeInfo: Extracted resume information
-    """
-    with ResumeExtractor(**kwargs) as extractor:
-        return extractor.extract_from_file(file_path)
-
-
-def extract_from_text(text: str, **kwargs) -> ResumeInfo:
-    """
-    Convenience function to extract resume information directly from text.
-    
-    Args:
-        text: Resume text content
-        **kwargs: Keyword arguments to pass to ResumeExtractor constructor
-        
-    Returns:
-        ResumeInfo: Extracted resume information
-    """
-    with ResumeExtractor(**kwargs) as extractor:
-        return extractor.extract_from_text(text)
+# Convenience functions (설정별 공유 추출기 풀 사용)
+from .extractor import (
+    ExtractorPool,
+    ResumeExtractor,
+    close_pool,
+    extract_from_file,
+    extract_from_text,
+    extract_from_url,
+    get_extractor,
+    warm_up,
+)
+from .hedging import HedgedCaller, RateLimiter
+from .instrumentation import (
+    CallbackHook,
+    OpenTelemetryHook,
+    add_span_hook,
+    remove_span_hook,
+)
+from .jobqueue import JobQueue, JobWorker, RetryPolicy
+from .jsonl import JSONLWriter, write_jsonl
+from .models import (
+    CertificationInfo,
+    ContactInfo,
+    EducationInfo,
+    ExperienceInfo,
+    ProjectInfo,
+    RawTextRef,
+    ResumeInfo,
+    ResumeModel,
+    validate_resume_info,
+)
+from .pipeline import BatchResult, SourceDocument
+from .retention import FileTextStore, InMemoryTextStore, RawTextRetention, TextStore
+from .streaming import ChunkExtraction, StreamEvent
+from .taxonomy import AhoCorasick, SkillTaxonomy
+from .telemetry import CallMetrics, InMemorySink, JSONLSink, MetricsSink, PrometheusSink
 
+# 라이브러리는 로깅 핸들러를 설정하지 않음 (애플리케이션에서 설정)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __all__ = [
     "__version__",
@@ -83,6 +83,56 @@ __all__ = [
     "EducationInfo",
     "ProjectInfo",
     "CertificationInfo",
+    "RawTextRef",
+    "ResumeModel",
+    "validate_resume_info",
+    # Backends
+    "ExtractionBackend",
+    "LangExtractBackend",
+    "MockBackend",
+    # Streaming
+    "StreamEvent",
+    "ChunkExtraction",
+    # Batch
+    "BatchResult",
+    "SourceDocument",
+    # Hedging
+    "HedgedCaller",
+    "RateLimiter",
+    # Telemetry
+    "CallMetrics",
+    "MetricsSink",
+    "InMemorySink",
+    "JSONLSink",
+    "PrometheusSink",
+    # Instrumentation
+    "CallbackHook",
+    "OpenTelemetryHook",
+    "add_span_hook",
+    "remove_span_hook",
+    # Deduplication
+    "NearDuplicateIndex",
+    "DuplicateMatch",
+    # Job queue
+    "JobQueue",
+    "JobWorker",
+    "RetryPolicy",
+    "Deadline",
+    "RawTextRetention",
+    "TextStore",
+    "InMemoryTextStore",
+    "FileTextStore",
+    # Export
+    "ArrowBatchBuilder",
+    "ArrowResumeWriter",
+    "ParquetResumeWriter",
+    "to_record_batches",
+    "write_parquet",
+    "JSONLWriter",
+    "write_jsonl",
+    # Skill taxonomy
+    "SkillTaxonomy",
+    "AhoCorasick",
     # Exceptions
     "ResumeExtractError",
     "InvalidURLError",
@@ -91,9 +141,16 @@ __all__ = [
     "ParseError",
     "ExtractionError",
     "LangExtractAPIError",
+    "ExtractionTimeoutError",
+    "DeadlineExceededError",
+    "LeaseLostError",
     # Convenience functions
     "extract_from_url",
     "extract_from_file",
     "extract_from_text",
+    "get_extractor",
+    "warm_up",
+    "close_pool",
+    "ExtractorPool",
 ]
 
@@ -0,0 +1,175 @@
+"""
+LLM 추출 백엔드 모듈
+
+LangExtractProcessor는 ExtractionBackend 인터페이스를 통해 모델을 호출합니다.
+실제 서비스는 LangExtractBackend를, 오프라인 부하 테스트는 MockBackend를 사용합니다.
+"""
+
+import math
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import langextract as lx
+
+# 지연 시간 분포: 호출될 때마다 지연(초)을 반환하는 함수
+LatencyDistribution = Callable[[random.Random], float]
+
+# 고정 응답: (추출 클래스, 추출 텍스트) 목록, Extraction 목록, 또는 텍스트를 받아 목록을 반환하는 함수
+CannedExtractions = Union[
+    Sequence[Union[Tuple[str, str], lx.data.Extraction]],
+    Callable[[str], Sequence[Union[Tuple[str, str], lx.data.Extraction]]],
+]
+
+
+class ExtractionBackend(ABC):
+    """LLM 추출 백엔드 인터페이스"""
+
+    @abstractmethod
+    def extract(self,
+                text: str,
+                prompt_description: str,
+                examples: List[Any],
+                model_id: str) -> Any:
+        """
+        텍스트에서 구조화된 정보를 추출합니다.
+
+        Returns:
+            extractions 속성을 가진 결과 (lx.data.AnnotatedDocument 호환).
+            제공자가 토큰 사용량을 알려주면 usage 속성
+            ({'input_tokens': int, 'output_tokens': int})으로 붙여 텔레메트리에 기록합니다.
+        """
+
+    def close(self) -> None:  # noqa: B027 - 정리할 리소스가 없는 백엔드는 재정의하지 않음
+        """리소스 정리"""
+
+
+class LangExtractBackend(ExtractionBackend):
+    """lx.extract를 호출하는 기본 백엔드"""
+
+    def __init__(self, api_key: Optional[str] = None, **extract_kwargs: Any):
+        """
+        Args:
+            api_key: 모델 제공자 API 키
+            **extract_kwargs: lx.extract에 전달할 추가 인자
+                (예: language_model_params={"model_url": ...}, max_workers)
+        """
+        self.api_key = api_key
+        self.extract_kwargs = extract_kwargs
+
+    def extract(self, text, prompt_description, examples, model_id):
+        kwargs = dict(self.extract_kwargs)
+        if self.api_key:
+            kwargs['api_key'] = self.api_key
+        return lx.extract(
+            text_or_documents=text,
+            prompt_description=prompt_description,
+            examples=examples,
+            model_id=model_id,
+            **kwargs
+        )
+
+
+class MockBackendError(RuntimeError):
+    """MockBackend가 error_rate에 따라 발생시키는 API 오류"""
+
+
+def fixed_latency(seconds: float) -> LatencyDistribution:
+    """항상 같은 지연 시간"""
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyDistribution:
+    """균등 분포 지연 시간"""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyDistribution:
+    """
+    로그정규 분포 지연 시간
+
+    LLM 응답 시간처럼 중앙값 대비 꼬리가 긴 분포를 흉내냅니다.
+    """
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def build_extractions(text: str, canned: CannedExtractions) -> List[lx.data.Extraction]:
+    """고정 응답을 입력 텍스트 위치에 맞춘 Extraction 목록으로 변환"""
+    items = canned(text) if callable(canned) else canned
+    extractions = []
+    search_from = 0
+    for item in items:
+        if isinstance(item, lx.data.Extraction):
+            extractions.append(item)
+            continue
+        extraction_class, extraction_text = item
+        start = text.find(extraction_text, search_from)
+        if start < 0:
+            start = text.find(extraction_text)
+        interval = None
+        if start >= 0:
+            interval = lx.data.CharInterval(start_pos=start, end_pos=start + len(extraction_text))
+            search_from = start
+        extractions.append(lx.data.Extraction(
+            extraction_class=extraction_class,
+            extraction_text=extraction_text,
+            char_interval=interval,
+        ))
+    return extractions
+
+
+class MockBackend(ExtractionBackend):
+    """
+    실제 모델 호출 없이 고정 응답을 반환하는 백엔드
+
+    지연 시간 분포와 오류율을 설정하여 오프라인 부하 테스트에 사용합니다.
+    """
+
+    def __init__(self,
+                 extractions: CannedExtractions = (),
+                 latency: Union[float, LatencyDistribution] = 0.0,
+                 error_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            extractions: 고정 응답
+            latency: 지연 시간(초) 또는 지연 시간 분포
+            error_rate: MockBackendError를 발생시킬 확률 (0.0 ~ 1.0)
+            seed: 난수 시드 (재현 가능한 부하 테스트용)
+        """
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate는 0.0 ~ 1.0 사이여야 합니다")
+
+        self.canned = extractions
+        self.latency = latency if callable(latency) else fixed_latency(latency)
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+
+    def extract(self, text, prompt_description, examples, model_id):
+        with self._lock:
+            self.calls += 1
+            delay = max(0.0, self.latency(self._rng))
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+
+        if delay:
+            time.sleep(delay)
+        if failed:
+            raise MockBackendError("Mock API 오류 (error_rate에 따른 의도된 실패)")
+
+        return lx.data.AnnotatedDocument(
+            text=text,
+            extractions=build_extractions(text, self.canned),
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """호출/오류 횟수 반환"""
+        with self._lock:
+            return {'calls': self.calls, 'errors': self.errors}
@@ -0,0 +1,380 @@
+"""
+resume-extract 명령줄 도구
+
+Usage:
+    resume-extract batch manifest.jsonl -o results.jsonl --checkpoint progress.txt
+    resume-extract serve --port 8080 --workers 4 --queue-size 32
+    resume-extract queue add jobs.db manifest.jsonl && resume-extract queue work jobs.db
+
+manifest는 JSONL(한 줄에 문자열 또는 {"id": ..., "source": ...}) 또는
+CSV(source/url/path 열과 선택적 id 열)입니다. 결과는 항목마다 JSON 한 줄로 기록되며
+(출력 파일 확장자가 .gz/.zst면 압축), checkpoint 파일에 완료된 항목 ID를 남겨 중단된 실행을 이어서 처리합니다.
+체크포인트는 압축하지 않은 출력 파일에만 사용할 수 있습니다.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .extractor import VALIDATION_MODES, ResumeExtractor
+from .jobqueue import DONE, FAILED, STATES, JobQueue, JobWorker, RetryPolicy
+from .jsonl import JSONLWriter, infer_compression
+from .langextract_integration import ENGINES
+from .retention import (
+    DEFAULT_MAX_CHARS,
+    REFERENCE,
+    RETENTION_MODES,
+    FileTextStore,
+    RawTextRetention,
+)
+from .taxonomy import SkillTaxonomy
+
+logger = logging.getLogger(__name__)
+
+# manifest에서 소스로 인식하는 키/열 이름 (앞쪽 우선)
+SOURCE_KEYS = ('source', 'url', 'path')
+
+
+def read_manifest(path: str) -> Iterator[Tuple[str, str]]:
+    """manifest에서 (항목 ID, 소스)를 순서대로 읽음 (ID가 없으면 소스를 ID로 사용)"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if Path(path).suffix.lower() == '.csv':
+            for row in csv.DictReader(f):
+                yield _manifest_entry(row, path)
+            return
+
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: JSON 형식이 아닙니다 ({e})") from e
+            yield _manifest_entry(entry if isinstance(entry, dict) else {'source': entry}, f"{path}:{line_no}")
+
+
+def _manifest_entry(entry: Dict[str, Any], location: str) -> Tuple[str, str]:
+    source = next((entry[key] for key in SOURCE_KEYS if entry.get(key)), None)
+    if not source:
+        raise ValueError(f"{location}: source/url/path 값이 없습니다")
+    return str(entry.get('id') or source), str(source)
+
+
+class Checkpoint:
+    """완료된 항목 ID를 한 줄씩 추가 기록하는 진행 상황 파일"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.done: Set[str] = set()
+        self._file: Optional[IO[str]] = None
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.done = {line.rstrip('\n') for line in f if line.strip()}
+
+    def mark(self, item_id: str) -> None:
+        """항목 완료 기록 (결과를 출력한 뒤 호출하여 중단 시 결과 유실 방지)"""
+        self.done.add(item_id)
+        if not self.path:
+            return
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(item_id + '\n')
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+
+
+def _drop_unfinished_records(path: str, done: Set[str]) -> None:
+    """
+    체크포인트에 없는 항목의 기록을 출력 파일에서 제거
+
+    실패한 항목은 다시 실행할 때 재시도하므로 이전 실행의 오류 기록을 지우고,
+    중단되어 잘린 마지막 줄이나 체크포인트 전에 중단된 결과도 함께 버립니다.
+    """
+    if not os.path.exists(path):
+        return
+    temp_path = path + '.tmp'
+    with open(path, 'rb') as src, open(temp_path, 'wb') as dst:
+        for line in src:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get('id') in done:
+                dst.write(line if line.endswith(b'\n') else line + b'\n')
+    os.replace(temp_path, path)
+
+
+def _build_extractor(args: argparse.Namespace, **kwargs: Any) -> ResumeExtractor:
+    """공통 추출기 옵션(--model-id, --engine, --fields, --parse-processes, --raw-text, --validation,
+    --skill-taxonomy)으로 추출기 생성"""
+    return ResumeExtractor(
+        model_id=args.model_id,
+        engine=args.engine,
+        fields=args.fields.split(',') if args.fields else None,
+        parse_processes=args.parse_processes,
+        raw_text_retention=_build_retention(args),
+        validation=args.validation,
+        skill_taxonomy=SkillTaxonomy.from_json(args.skill_taxonomy) if args.skill_taxonomy else None,
+        **kwargs,
+    )
+
+
+def _build_retention(args: argparse.Namespace) -> RawTextRetention:
+    """--raw-text, --raw-text-chars, --text-store로 raw_text 보관 정책 생성"""
+    if args.raw_text == REFERENCE and not args.text_store:
+        raise SystemExit("--raw-text reference에는 --text-store가 필요합니다")
+    store = FileTextStore(args.text_store) if args.text_store else None
+    return RawTextRetention(args.raw_text, max_chars=args.raw_text_chars, store=store)
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """batch 명령 실행 (실패한 항목이 있으면 1 반환)"""
+    output_path = args.output or '-'
+    if args.checkpoint and output_path != '-' and infer_compression(output_path) is not None:
+        # 압축 스트림은 중단되면 끝이 잘려 이어 붙일 수 없음
+        raise ValueError("--checkpoint는 압축 출력과 함께 사용할 수 없습니다 (압축하지 않고 기록한 뒤 압축하세요)")
+    checkpoint = Checkpoint(args.checkpoint)
+    ids: List[str] = []
+    skipped = 0
+
+    def pending_sources() -> Iterator[str]:
+        nonlocal skipped
+        for item_id, source in read_manifest(args.manifest):
+            if item_id in checkpoint.done:
+                skipped += 1
+                continue
+            ids.append(item_id)
+            yield source
+
+    # 이어서 실행하는 경우 완료된 결과만 남기고 그 뒤에 추가
+    if checkpoint.done and output_path != '-':
+        _drop_unfinished_records(output_path, checkpoint.done)
+    output = JSONLWriter(output_path, append=bool(checkpoint.done))
+
+    succeeded = failed = 0
+    extractor = _build_extractor(args)
+    try:
+        for item in extractor.extract_many(
+            pending_sources(),
+            download_workers=args.download_workers,
+            parse_workers=args.parse_workers,
+            extract_workers=args.extract_workers,
+            queue_size=args.queue_size,
+            ordered=args.ordered,
+        ):
+            record: Dict[str, Any] = {'id': ids[item.index], 'source': str(item.source)}
+            if item.ok:
+                output.write_record(record, item.result)
+                succeeded += 1
+            else:
+                record['error'] = {'type': type(item.error).__name__, 'message': str(item.error)}
+                output.write_record(record)
+                failed += 1
+            output.flush()
+            if item.ok:
+                checkpoint.mark(record['id'])
+    finally:
+        extractor.close()
+        output.close()
+        checkpoint.close()
+
+    print(f"완료: {succeeded}, 실패: {failed}, 건너뜀(체크포인트): {skipped}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    """serve 명령 실행 (Ctrl+C로 종료)"""
+    from .service import ExtractionService
+    from .telemetry import PrometheusSink
+
+    backend = None
+    if args.mock:
+        from .backends import MockBackend, lognormal_latency
+        latency = lognormal_latency(args.mock_latency) if args.mock_latency > 0 else 0.0
+        backend = MockBackend(extractions=[("이름", "홍길동")], latency=latency,
+                              error_rate=args.mock_error_rate)
+
+    extractor = _build_extractor(
+        args, backend=backend, call_timeout=args.call_timeout, deadline=args.deadline,
+        metrics_sink=PrometheusSink()
+    )
+    service = ExtractionService(
+        extractor,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"서비스 시작: {service.url}", file=sys.stderr)
+    service.serve_forever()
+    return 0
+
+
+def _open_queue(args: argparse.Namespace) -> JobQueue:
+    """큐 파일 열기 (work 명령이면 점유/재시도 옵션 적용)"""
+    retry = RetryPolicy(max_attempts=args.max_attempts) if getattr(args, 'max_attempts', None) else None
+    return JobQueue(args.database, visibility_timeout=getattr(args, 'visibility_timeout', 300.0), retry=retry)
+
+
+def run_queue_add(args: argparse.Namespace) -> int:
+    """queue add 명령 실행 (manifest 항목을 큐에 추가)"""
+    added = _open_queue(args).enqueue(read_manifest(args.manifest))
+    print(f"추가: {added}", file=sys.stderr)
+    return 0
+
+
+def run_queue_work(args: argparse.Namespace) -> int:
+    """queue work 명령 실행 (여러 프로세스에서 같은 큐 파일로 동시에 실행 가능)"""
+    queue = _open_queue(args)
+    extractor = _build_extractor(args)
+    workers = [JobWorker(extractor, queue, poll_interval=args.poll_interval) for _ in range(args.threads)]
+    threads = [
+        threading.Thread(target=worker.run, kwargs={'wait': args.wait}, name=f"queue-worker-{n}")
+        for n, worker in enumerate(workers)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.stop()
+        for thread in threads:
+            thread.join()
+    finally:
+        extractor.close()
+    return run_queue_status(args)
+
+
+def run_queue_status(args: argparse.Namespace) -> int:
+    """queue status 명령 실행 (failed 항목이 있으면 1 반환)"""
+    counts = _open_queue(args).counts()
+    print(json.dumps({state: counts.get(state, 0) for state in STATES}, ensure_ascii=False))
+    return 1 if counts.get(FAILED) else 0
+
+
+def run_queue_export(args: argparse.Namespace) -> int:
+    """queue export 명령 실행 (done/failed 항목을 batch 결과와 같은 JSONL로 출력)"""
+    with JSONLWriter(args.output) as output:
+        for row in _open_queue(args).records():
+            if row['state'] not in (DONE, FAILED):
+                continue
+            key = 'result' if row['state'] == DONE else 'error'
+            output.write_record({'id': row['item_id'], 'source': row['source'], key: row[key]})
+    return 0
+
+
+def _add_extractor_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--model-id', default="gemini-2.0-flash", help="모델 ID")
+    parser.add_argument('--engine', choices=ENGINES, default='langextract', help="추출 엔진")
+    parser.add_argument('--fields', help="추출할 필드 (쉼표 구분, 예: name,email,skills)")
+    parser.add_argument('--parse-processes', type=int, default=None,
+                        help="파싱 프로세스 수 (0이면 CPU 코어 수, 생략하면 스레드에서 파싱)")
+    parser.add_argument('--raw-text', choices=RETENTION_MODES, default='full',
+                        help="결과 raw_text 보관 정책 (reference는 --text-store 필요)")
+    parser.add_argument('--raw-text-chars', type=int, default=DEFAULT_MAX_CHARS, help="truncate에서 유지할 문자 수")
+    parser.add_argument('--text-store', help="원문을 이어 붙여 저장할 파일 (raw_text_ref로 참조)")
+    parser.add_argument('--validation', choices=VALIDATION_MODES, default='eager',
+                        help="결과 모델 검증 시점 (lazy: 내부 단계는 검증 없이 만들고 반환 직전에 한 번 검증)")
+    parser.add_argument('--skill-taxonomy',
+                        help="기술 분류 사전 JSON ({\"표준 이름\": [\"별칭\", ...]}), 기술 표기 통일과 원문 탐지에 사용")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='resume-extract', description="이력서 정보 추출 도구")
+    parser.add_argument('-v', '--verbose', action='store_true', help="상세 로그 출력")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    batch = commands.add_parser('batch', help="manifest의 이력서를 일괄 추출")
+    batch.add_argument('manifest', help="URL/파일 경로 목록 (JSONL 또는 CSV)")
+    batch.add_argument('-o', '--output', default='-',
+                       help="결과 JSONL 파일 (기본: 표준 출력, .gz/.zst 확장자면 압축)")
+    batch.add_argument('--checkpoint', help="완료된 항목 ID를 기록할 파일 (있으면 이어서 실행, 압축 출력에는 사용 불가)")
+    _add_extractor_options(batch)
+    batch.add_argument('--download-workers', type=int, default=8, help="동시 다운로드 수")
+    batch.add_argument('--parse-workers', type=int, default=None, help="동시 파싱 수")
+    batch.add_argument('--extract-workers', type=int, default=4, help="동시 모델 호출 수")
+    batch.add_argument('--queue-size', type=int, default=16, help="단계 사이 큐 크기")
+    batch.add_argument('--ordered', action='store_true', help="manifest 순서대로 출력")
+    batch.set_defaults(handler=run_batch)
+
+    serve = commands.add_parser('serve', help="HTTP 추출 서비스 실행")
+    serve.add_argument('--host', default="127.0.0.1", help="바인딩 주소")
+    serve.add_argument('--port', type=int, default=8080, help="포트")
+    serve.add_argument('--workers', type=int, default=4, help="동시 추출 수")
+    serve.add_argument('--queue-size', type=int, default=32, help="대기열 크기 (초과 시 429)")
+    _add_extractor_options(serve)
+    serve.add_argument('--call-timeout', type=float, default=None, help="모델 호출 마감 시간(초)")
+    serve.add_argument('--deadline', type=float, default=None,
+                       help="이력서 한 건의 다운로드~추출 전체 마감 시간(초, 초과 시 504)")
+    serve.add_argument('--mock', action='store_true', help="모델 대신 MockBackend 사용 (부하 테스트)")
+    serve.add_argument('--mock-latency', type=float, default=0.0, help="MockBackend 지연 시간 중앙값(초)")
+    serve.add_argument('--mock-error-rate', type=float, default=0.0, help="MockBackend 오류율")
+    serve.set_defaults(handler=run_serve)
+
+    queue = commands.add_parser('queue', help="SQLite 작업 큐로 배치 추출 (중단 후 복구, 다중 프로세스)")
+    queue_commands = queue.add_subparsers(dest='queue_command', required=True)
+
+    add = queue_commands.add_parser('add', help="manifest 항목을 큐에 추가 (이미 있는 ID는 무시)")
+    add.add_argument('database', help="큐 파일 (SQLite)")
+    add.add_argument('manifest', help="URL/파일 경로 목록 (JSONL 또는 CSV)")
+    add.set_defaults(handler=run_queue_add)
+
+    work = queue_commands.add_parser('work', help="큐의 항목 처리 (프로세스 여러 개로 실행 가능)")
+    work.add_argument('database', help="큐 파일 (SQLite)")
+    _add_extractor_options(work)
+    work.add_argument('--threads', type=int, default=4, help="프로세스당 워커 스레드 수")
+    work.add_argument('--visibility-timeout', type=float, default=300.0,
+                      help="하트비트 없이 항목을 점유할 수 있는 시간(초)")
+    work.add_argument('--max-attempts', type=int, default=3, help="항목당 최대 시도 횟수")
+    work.add_argument('--poll-interval', type=float, default=1.0, help="대기 항목 확인 주기(초)")
+    work.add_argument('--wait', action='store_true', help="큐가 비어도 종료하지 않고 새 항목 대기")
+    work.set_defaults(handler=run_queue_work)
+
+    status = queue_commands.add_parser('status', help="상태별 항목 수 출력")
+    status.add_argument('database', help="큐 파일 (SQLite)")
+    status.set_defaults(handler=run_queue_status)
+
+    export = queue_commands.add_parser('export', help="완료/실패 항목을 JSONL로 출력")
+    export.add_argument('database', help="큐 파일 (SQLite)")
+    export.add_argument('-o', '--output', default='-',
+                        help="결과 JSONL 파일 (기본: 표준 출력, .gz/.zst 확장자면 압축)")
+    export.set_defaults(handler=run_queue_export)
+    return parser
+
+
+def configure_logging(verbose: bool = False) -> None:
+    """
+    콘솔 스크립트용 로그 설정
+
+    라이브러리는 NullHandler만 등록하므로, 진입점에서 표준 에러 핸들러를 설치합니다.
+    -v는 resume_extract 로거만 DEBUG로 낮추고 다른 라이브러리 로그는 WARNING 이상만 출력합니다.
+    """
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    logging.getLogger('resume_extract').setLevel(logging.DEBUG if verbose else logging.WARNING)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """콘솔 스크립트 진입점"""
+    args = build_parser().parse_args(argv)
+    configure_logging(args.verbose)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
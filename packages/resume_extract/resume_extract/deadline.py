@@ -0,0 +1,71 @@
+"""
+이력서 한 건의 처리 마감 시간 모듈
+
+timeout은 요청 하나(소켓 연산 하나)의 제한이라 다운로드 재시도, 파싱, 모델 호출이
+이어지면 이력서 한 건의 전체 지연 시간은 제한되지 않습니다. Deadline은 이력서 처리를
+시작할 때 한 번 만들어 다운로드 → 파싱 → 추출 단계에 그대로 전달하며, 각 단계는
+남은 시간만큼만 기다리고 시간이 다 되면 DeadlineExceededError로 중단합니다.
+
+Usage:
+    deadline = Deadline(5.0)
+    text, path = downloader.download_and_extract_text(url, deadline=deadline)
+    text = parser.parse(path, deadline=deadline)
+    info = processor.extract_resume_info(text, deadline=deadline)
+"""
+
+import time
+from typing import Optional
+
+from .exceptions import DeadlineExceededError
+
+# 단계 이름 (DeadlineExceededError.stage)
+DOWNLOAD = 'download'
+PARSE = 'parse'
+EXTRACT = 'extract'
+
+
+class Deadline:
+    """단조 시계 기준의 처리 마감 시각"""
+
+    def __init__(self, seconds: float):
+        """
+        Args:
+            seconds: 지금부터 허용할 전체 처리 시간(초)
+        """
+        if seconds <= 0:
+            raise ValueError("seconds는 0보다 커야 합니다")
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def after(cls, seconds: Optional[float]) -> Optional['Deadline']:
+        """seconds가 None이면 None (마감 시간 없음)"""
+        return cls(seconds) if seconds is not None else None
+
+    def remaining(self) -> float:
+        """남은 시간(초, 0 이상)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self, stage: str) -> None:
+        """마감 시간이 지났으면 DeadlineExceededError"""
+        if self.expired:
+            raise DeadlineExceededError(self.seconds, stage)
+
+    def timeout(self, stage: str, default: Optional[float] = None) -> float:
+        """
+        이번 대기에 쓸 시간 제한: default와 남은 시간 중 작은 값
+
+        Raises:
+            DeadlineExceededError: 남은 시간이 없음
+        """
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(self.seconds, stage)
+        return remaining if default is None else min(default, remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline({self.seconds:g}s, remaining={self.remaining():.3f}s)"
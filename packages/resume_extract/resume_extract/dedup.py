@@ -0,0 +1,240 @@
+"""
+유사 중복 이력서 탐지 모듈
+
+같은 이력서가 PDF, DOCX, 웹페이지로 들어오면 파싱된 텍스트가 조금씩 달라 정확한 해시로는
+찾을 수 없습니다. NearDuplicateIndex는 정규화한 텍스트의 문자 shingle로 MinHash 서명을
+만들고, LSH banding으로 후보를 찾은 뒤 서명 일치율(추정 Jaccard 유사도)로 확인합니다.
+
+서명 계산은 numpy로 벡터화되어 있어 signatures()/add_many()로 문서 여러 개를 한 번에
+처리할 수 있습니다.
+
+Usage:
+    index = NearDuplicateIndex(threshold=0.8)
+    index.add("resume-1", text, value=resume_info)
+    match = index.best_match(other_text)
+    if match:
+        print(match.key, match.similarity)
+"""
+
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+# shingle 다항식 해시의 밑
+_BASE = np.uint64(1_000_003)
+
+# 한 번에 계산할 (순열 수 × shingle 수) 원소 수 (16MB 버퍼, 캐시 효율과 메모리 사용량 제한)
+_CHUNK_ELEMENTS = 1 << 21
+
+_MAX_HASH = np.uint32(0xFFFFFFFF)
+
+
+class DuplicateMatch(NamedTuple):
+    """유사 중복 검색 결과"""
+    key: Any
+    similarity: float  # 추정 Jaccard 유사도 (0.0 ~ 1.0)
+    value: Any
+
+
+def normalize_text(text: str) -> str:
+    """형식 차이를 없앤 비교용 텍스트 (NFKC, 소문자, 기호 제거, 공백 정리)"""
+    text = unicodedata.normalize('NFKC', text).lower()
+    return _NON_WORD.sub(' ', text).strip()
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """64비트 해시 값을 고르게 섞음 (MurmurHash3 finalizer)"""
+    values = values ^ (values >> np.uint64(33))
+    values = values * np.uint64(0xFF51AFD7ED558CCD)
+    return values ^ (values >> np.uint64(33))
+
+
+def _optimal_rows(num_perm: int, threshold: float) -> int:
+    """S-curve 중간점 (1/b)^(1/r)이 threshold 이하인 가장 큰 band 행 수"""
+    best = 1
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows == 0 and (rows / num_perm) ** (1 / rows) <= threshold:
+            best = rows
+    return best
+
+
+class NearDuplicateIndex:
+    """MinHash + LSH 기반 유사 중복 인덱스 (스레드 안전)"""
+
+    def __init__(self,
+                 threshold: float = 0.8,
+                 num_perm: int = 128,
+                 bands: Optional[int] = None,
+                 shingle_size: int = 5,
+                 seed: int = 1):
+        """
+        Args:
+            threshold: 중복으로 볼 최소 추정 Jaccard 유사도
+            num_perm: MinHash 서명 길이
+            bands: LSH band 수 (num_perm의 약수, None이면 threshold에 맞춰 선택)
+            shingle_size: 문자 shingle 길이
+            seed: 해시 함수 난수 시드 (같은 시드끼리만 서명 비교 가능)
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold는 0.0 초과 1.0 이하여야 합니다")
+        if bands is None:
+            bands = num_perm // _optimal_rows(num_perm, threshold)
+        if num_perm % bands:
+            raise ValueError("bands는 num_perm의 약수여야 합니다")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        # multiply-shift 해시: ((a * x + b) mod 2^64) >> 32, a는 홀수
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        self._band_weights = _mix(rng.integers(1, 2**63, size=self.rows, dtype=np.uint64))
+        self._powers = _BASE ** np.arange(shingle_size - 1, -1, -1, dtype=np.uint64)
+
+        self._lock = threading.Lock()
+        self._signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._size = 0
+        self._keys: List[Any] = []
+        self._values: List[Any] = []
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def signature(self, text: str) -> np.ndarray:
+        """텍스트 하나의 MinHash 서명 (uint32, 길이 num_perm)"""
+        return self.signatures([text])[0]
+
+    def signatures(self, texts: Sequence[str]) -> np.ndarray:
+        """텍스트 여러 개의 MinHash 서명 (shape: 문서 수 × num_perm)"""
+        hashes, counts = self._shingle_hashes(texts)
+        result = np.full((len(texts), self.num_perm), _MAX_HASH, dtype=np.uint32)
+        if not len(hashes):
+            return result
+
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        per_chunk = max(1, _CHUNK_ELEMENTS // self.num_perm)
+        buffer = np.empty((self.num_perm, min(per_chunk, len(hashes))), dtype=np.uint64)
+        a, b = self._a[:, None], self._b[:, None]
+        doc = 0
+        while doc < len(texts):
+            # shingle 수가 per_chunk를 넘지 않는 범위의 문서를 한 번에 처리 (최소 1개)
+            last = max(doc + 1, int(np.searchsorted(ends, starts[doc] + per_chunk, side='right')))
+            lo, hi = starts[doc], ends[last - 1]
+            block = hashes[lo:hi]
+            if len(block) > buffer.shape[1]:
+                buffer = np.empty((self.num_perm, len(block)), dtype=np.uint64)
+            permuted = buffer[:, :len(block)]
+            # 임시 배열 없이 버퍼 안에서 계산 (상위 32비트는 최솟값을 구한 뒤에 잘라도 같음)
+            np.multiply(a, block[None, :], out=permuted)
+            permuted += b
+            nonempty = counts[doc:last] > 0
+            mins = np.minimum.reduceat(permuted, starts[doc:last][nonempty] - lo, axis=1)
+            result[np.arange(doc, last)[nonempty]] = (mins >> np.uint64(32)).T
+            doc = last
+        return result
+
+    def _shingle_hashes(self, texts: Sequence[str]):
+        """모든 문서의 shingle 해시를 이어 붙인 배열과 문서별 shingle 수"""
+        k = self.shingle_size
+        encoded = []
+        for text in texts:
+            normalized = normalize_text(text)
+            if normalized and len(normalized) < k:
+                normalized = normalized.ljust(k, ' ')
+            encoded.append(normalized)
+
+        lengths = np.fromiter((len(t) for t in encoded), dtype=np.int64, count=len(encoded))
+        counts = np.maximum(lengths - k + 1, 0)
+        if not counts.sum():
+            return np.empty(0, dtype=np.uint64), counts
+
+        codes = np.frombuffer(''.join(encoded).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        windows = np.lib.stride_tricks.sliding_window_view(codes, k)
+        # 문서 경계를 넘는 shingle 제외
+        starts = np.cumsum(lengths) - lengths
+        doc_ids = np.repeat(np.arange(len(encoded)), lengths)[:len(windows)]
+        valid = np.arange(len(windows)) - starts[doc_ids] < counts[doc_ids]
+        hashes = _mix((windows[valid] * self._powers).sum(axis=1, dtype=np.uint64))
+        return hashes, counts
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """서명별 band 해시 (shape: 문서 수 × bands)"""
+        bands = signatures.reshape(len(signatures), self.bands, self.rows).astype(np.uint64)
+        return (bands * self._band_weights).sum(axis=2, dtype=np.uint64)
+
+    def add(self, key: Any, text: Optional[str] = None, value: Any = None,
+            signature: Optional[np.ndarray] = None) -> None:
+        """문서 추가 (signature를 주면 text 대신 사용)"""
+        if signature is None:
+            if text is None:
+                raise ValueError("text 또는 signature가 필요합니다")
+            signature = self.signature(text)
+        self._insert([key], signature[None, :], [value])
+
+    def add_many(self, keys: Sequence[Any], texts: Sequence[str],
+                 values: Optional[Sequence[Any]] = None) -> None:
+        """문서 여러 개를 한 번에 서명 계산 후 추가"""
+        if len(keys) != len(texts):
+            raise ValueError("keys와 texts의 길이가 다릅니다")
+        values = list(values) if values is not None else [None] * len(keys)
+        self._insert(list(keys), self.signatures(texts), values)
+
+    def _insert(self, keys: List[Any], signatures: np.ndarray, values: List[Any]) -> None:
+        band_keys = self._band_keys(signatures)
+        with self._lock:
+            start = self._size
+            needed = start + len(keys)
+            if needed > len(self._signatures):
+                grown = np.empty((max(needed, 2 * len(self._signatures), 64), self.num_perm), dtype=np.uint32)
+                grown[:start] = self._signatures[:start]
+                self._signatures = grown
+            self._signatures[start:needed] = signatures
+            self._keys.extend(keys)
+            self._values.extend(values)
+            for offset, row in enumerate(band_keys.tolist()):
+                for band, bucket_key in enumerate(row):
+                    self._buckets[band].setdefault(bucket_key, []).append(start + offset)
+            self._size = needed
+
+    def query(self, text: Optional[str] = None, signature: Optional[np.ndarray] = None,
+              limit: Optional[int] = None) -> List[DuplicateMatch]:
+        """threshold 이상 유사한 문서를 유사도 내림차순으로 반환"""
+        if signature is None:
+            if text is None:
+                raise ValueError("text 또는 signature가 필요합니다")
+            signature = self.signature(text)
+
+        band_keys = self._band_keys(signature[None, :])[0].tolist()
+        with self._lock:
+            candidates = set()
+            for band, bucket_key in enumerate(band_keys):
+                candidates.update(self._buckets[band].get(bucket_key, ()))
+            if not candidates:
+                return []
+            ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            similarities = (self._signatures[ids] == signature).mean(axis=1)
+            keys, values = self._keys, self._values
+
+            order = np.argsort(-similarities, kind='stable')
+            matches = [
+                DuplicateMatch(keys[ids[i]], float(similarities[i]), values[ids[i]])
+                for i in order if similarities[i] >= self.threshold
+            ]
+        return matches[:limit] if limit is not None else matches
+
+    def best_match(self, text: Optional[str] = None,
+                   signature: Optional[np.ndarray] = None) -> Optional[DuplicateMatch]:
+        """가장 유사한 중복 문서 (없으면 None)"""
+        matches = self.query(text, signature, limit=1)
+        return matches[0] if matches else None
@@ -4,6 +4,7 @@ Exception classes for resume_extract
 
 from typing import Optional
 
+
 class ResumeExtractError(Exception):
     """Resume Extract 기본 예외 클래스"""
     def __init__(self, message: str, details: Optional[str] = None):
@@ -56,3 +57,28 @@ class LangExtractAPIError(ResumeExtractError):
     def __init__(self, details: Optional[str] = None):
         message = "LangExtract API 호출 중 오류가 발생했습니다"
         super().__init__(message, details)
+
+
+class ExtractionTimeoutError(ExtractionError):
+    """모델 호출 시간 초과 예외"""
+    def __init__(self, timeout: float, details: Optional[str] = None):
+        message = f"정보 추출 시간이 초과되었습니다 ({timeout:g}초)"
+        ResumeExtractError.__init__(self, message, details)
+        self.timeout = timeout
+
+
+class DeadlineExceededError(ExtractionTimeoutError):
+    """이력서 한 건의 처리 마감 시간 초과 예외 (다운로드/파싱/추출 중 어느 단계든)"""
+    def __init__(self, budget: float, stage: str, details: Optional[str] = None):
+        message = f"이력서 처리 마감 시간이 초과되었습니다 ({budget:g}초, 단계: {stage})"
+        ResumeExtractError.__init__(self, message, details)
+        self.timeout = budget
+        self.stage = stage
+
+
+class LeaseLostError(ResumeExtractError):
+    """작업 큐 항목의 점유를 잃어 상태를 기록하지 못한 예외 (다른 워커가 회수함)"""
+    def __init__(self, item_id: str, details: Optional[str] = None):
+        message = f"작업 점유가 만료되어 상태를 기록하지 못했습니다: {item_id}"
+        super().__init__(message, details)
+        self.item_id = item_id
@@ -0,0 +1,288 @@
+"""
+추출 결과 일괄 내보내기 모듈
+
+분석 시스템에 적재할 대량의 ResumeInfo를 객체마다 to_json/to_dict로 변환하지 않고,
+batch_size건씩 열(column) 단위로 모아 Apache Arrow RecordBatch로 만듭니다.
+경력/학력/프로젝트/자격증은 list<struct> 열, 기술과 회사/학교/발급 기관은 사전 인코딩
+(dictionary<int32, string>) 열이 되고, 메모리에는 쓰기 전 배치 한 개만 유지합니다.
+
+pyarrow가 필요합니다 (pip install pyarrow).
+
+Usage:
+    with ParquetResumeWriter("results.parquet") as writer:
+        for result in extractor.extract_many(urls):
+            if result.ok:
+                writer.write(result.result)
+"""
+
+import json
+import os
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .models import ResumeInfo
+
+# 배치(Parquet row group) 하나에 모으는 기본 행 수
+DEFAULT_BATCH_SIZE = 4096
+
+# 열 종류: 문자열, 사전 인코딩 문자열, 사전 인코딩 문자열 목록
+_STR = 'str'
+_DICT = 'dict'
+_DICT_LIST = 'dict_list'
+
+# 목록 열별 (필드, 종류)
+_NESTED_COLUMNS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    'experience': (
+        ('company', _DICT),
+        ('position', _STR),
+        ('duration', _STR),
+        ('description', _STR),
+        ('technologies', _DICT_LIST),
+    ),
+    'education': (
+        ('institution', _DICT),
+        ('degree', _STR),
+        ('major', _STR),
+        ('duration', _STR),
+        ('gpa', _STR),
+        ('description', _STR),
+    ),
+    'projects': (
+        ('name', _STR),
+        ('description', _STR),
+        ('technologies', _DICT_LIST),
+        ('duration', _STR),
+        ('url', _STR),
+        ('role', _STR),
+    ),
+    'certifications': (
+        ('name', _STR),
+        ('issuer', _DICT),
+        ('date', _STR),
+        ('expiration_date', _STR),
+        ('credential_id', _STR),
+        ('url', _STR),
+    ),
+}
+
+_CONTACT_FIELDS = ('name', 'email', 'phone', 'address', 'linkedin', 'github', 'website')
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow가 설치되지 않았습니다. pip install pyarrow") from None
+    return pyarrow
+
+
+def resume_arrow_schema(include_raw_text: bool = True) -> Any:
+    """
+    ResumeInfo 한 건을 한 행으로 표현하는 Arrow 스키마
+
+    Args:
+        include_raw_text: raw_text 열 포함 여부 (원문은 보통 열 중 가장 큼)
+    """
+    pa = _require_pyarrow()
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    kinds = {_STR: pa.string(), _DICT: dictionary, _DICT_LIST: pa.list_(dictionary)}
+
+    fields = [
+        pa.field('name', pa.string()),
+        pa.field('contact', pa.struct([pa.field(name, pa.string()) for name in _CONTACT_FIELDS])),
+        pa.field('summary', pa.string()),
+        pa.field('skills', pa.list_(dictionary)),
+    ]
+    for column, spec in _NESTED_COLUMNS.items():
+        struct = pa.struct([pa.field(name, kinds[kind]) for name, kind in spec])
+        fields.append(pa.field(column, pa.list_(struct)))
+    fields.append(pa.field('languages', pa.list_(pa.string())))
+    if include_raw_text:
+        fields.append(pa.field('raw_text', pa.large_string()))
+    fields += [
+        pa.field('raw_text_ref', pa.struct([
+            pa.field('sha256', pa.string()),
+            pa.field('length', pa.int64()),
+            pa.field('offset', pa.int64()),
+            pa.field('size', pa.int64()),
+        ])),
+        pa.field('confidence_score', pa.float64()),
+        pa.field('metadata', pa.string()),  # 텔레메트리 JSON
+    ]
+    return pa.schema(fields)
+
+
+class ArrowBatchBuilder:
+    """
+    ResumeInfo를 모아 RecordBatch로 만드는 빌더
+
+    append()로 행을 추가하고 flush()로 모은 행을 RecordBatch로 꺼냅니다. model_dump 대신
+    모델의 속성 딕셔너리를 얕게 복사해 모으고, 열 변환과 사전 인코딩은 pyarrow가 배치 단위로
+    처리합니다. 사전은 배치마다 새로 만들어지므로 IPC 스트림에서는 배치마다 교체됩니다.
+    """
+
+    def __init__(self, include_raw_text: bool = True):
+        self.pa = _require_pyarrow()
+        self.include_raw_text = include_raw_text
+        self.schema = resume_arrow_schema(include_raw_text)
+        self._rows: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def append(self, resume_info: ResumeInfo) -> None:
+        """결과 한 건을 한 행으로 추가"""
+        row = dict(resume_info.__dict__)
+        row['contact'] = row['contact'].__dict__ if row['contact'] is not None else None
+        for column in _NESTED_COLUMNS:
+            row[column] = [item.__dict__ for item in row[column]]
+        if row['raw_text_ref'] is not None:
+            row['raw_text_ref'] = row['raw_text_ref'].__dict__
+        if row['metadata'] is not None:
+            row['metadata'] = json.dumps(row['metadata'], ensure_ascii=False, default=str)
+        if not self.include_raw_text:
+            del row['raw_text']
+        self._rows.append(row)
+
+    def flush(self) -> Optional[Any]:
+        """모은 행을 RecordBatch로 만들고 비움 (모은 행이 없으면 None)"""
+        if not self._rows:
+            return None
+        batch = self.pa.RecordBatch.from_pylist(self._rows, schema=self.schema)
+        self._rows = []
+        return batch
+
+
+def to_record_batches(resumes: Iterable[ResumeInfo],
+                      batch_size: int = DEFAULT_BATCH_SIZE,
+                      include_raw_text: bool = True) -> Iterator[Any]:
+    """ResumeInfo 스트림을 batch_size행씩 RecordBatch로 변환"""
+    if batch_size <= 0:
+        raise ValueError("batch_size는 0보다 커야 합니다")
+    builder = ArrowBatchBuilder(include_raw_text)
+    for resume_info in resumes:
+        builder.append(resume_info)
+        if len(builder) >= batch_size:
+            yield builder.flush()
+    batch = builder.flush()
+    if batch is not None:
+        yield batch
+
+
+class _BatchWriter:
+    """batch_size행마다 RecordBatch를 만들어 내보내는 쓰기 도구 공통 부분"""
+
+    def __init__(self, batch_size: int, include_raw_text: bool):
+        if batch_size <= 0:
+            raise ValueError("batch_size는 0보다 커야 합니다")
+        self.batch_size = batch_size
+        self.builder = ArrowBatchBuilder(include_raw_text)
+        self.schema = self.builder.schema
+        self.rows = 0
+        self.closed = False
+
+    def write(self, resume_info: ResumeInfo) -> None:
+        """결과 한 건 추가 (batch_size건이 모이면 기록)"""
+        self.builder.append(resume_info)
+        self.rows += 1
+        if len(self.builder) >= self.batch_size:
+            self._write_batch(self.builder.flush())
+
+    def write_all(self, resumes: Iterable[ResumeInfo]) -> int:
+        """여러 건을 추가하고 추가한 건수 반환"""
+        count = 0
+        for resume_info in resumes:
+            self.write(resume_info)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """모인 행을 배치 크기와 관계없이 기록"""
+        batch = self.builder.flush()
+        if batch is not None:
+            self._write_batch(batch)
+
+    def close(self) -> None:
+        """남은 행을 기록하고 파일 닫기"""
+        if self.closed:
+            return
+        self.flush()
+        self._close()
+        self.closed = True
+
+    def _write_batch(self, batch: Any) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ParquetResumeWriter(_BatchWriter):
+    """ResumeInfo를 batch_size행 단위 row group으로 Parquet 파일에 기록"""
+
+    def __init__(self,
+                 path: Union[str, os.PathLike],
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 compression: str = 'zstd',
+                 include_raw_text: bool = True):
+        """
+        Args:
+            path: Parquet 파일 경로
+            batch_size: row group 하나의 행 수 (쓰기 중 메모리에 모으는 최대 행 수)
+            compression: Parquet 압축 코덱 ('zstd', 'snappy', 'gzip', 'none' 등)
+            include_raw_text: raw_text 열 포함 여부
+        """
+        super().__init__(batch_size, include_raw_text)
+        import pyarrow.parquet as pq
+
+        self.path = os.fspath(path)
+        self._writer = pq.ParquetWriter(self.path, self.schema, compression=compression)
+
+    def _write_batch(self, batch: Any) -> None:
+        self._writer.write_batch(batch)
+
+    def _close(self) -> None:
+        self._writer.close()
+
+
+class ArrowResumeWriter(_BatchWriter):
+    """
+    ResumeInfo를 Arrow IPC 스트림 형식으로 기록
+
+    사전 인코딩 열의 사전은 배치마다 교체되어 전송됩니다. pyarrow.ipc.open_stream으로 읽습니다.
+    """
+
+    def __init__(self,
+                 sink: Union[str, os.PathLike, BinaryIO],
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 include_raw_text: bool = True):
+        """
+        Args:
+            sink: 파일 경로 또는 쓰기 가능한 바이너리 스트림
+            batch_size: 배치 하나의 행 수
+            include_raw_text: raw_text 열 포함 여부
+        """
+        super().__init__(batch_size, include_raw_text)
+        pa = self.builder.pa
+        self._owns_sink = isinstance(sink, (str, os.PathLike))
+        self._sink = pa.OSFile(os.fspath(sink), 'wb') if self._owns_sink else sink
+        self._writer = pa.ipc.new_stream(self._sink, self.schema)
+
+    def _write_batch(self, batch: Any) -> None:
+        self._writer.write_batch(batch)
+
+    def _close(self) -> None:
+        self._writer.close()
+        if self._owns_sink:
+            self._sink.close()
+
+
+def write_parquet(resumes: Iterable[ResumeInfo], path: Union[str, os.PathLike], **kwargs: Any) -> int:
+    """ResumeInfo 스트림을 Parquet 파일로 기록하고 기록한 건수 반환 (인자는 ParquetResumeWriter 참고)"""
+    with ParquetResumeWriter(path, **kwargs) as writer:
+        return writer.write_all(resumes)
@@ -2,98 +2,197 @@
 메인 이력서 정보 추출기
 """
 
-import os
+import asyncio
+import atexit
+import hashlib
 import logging
-from typing import Optional, Union
+import threading
+import time
 from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Union
 
-from .models import ResumeInfo
+from pydantic import ValidationError
+
+from .backends import ExtractionBackend
+from .deadline import Deadline
+from .dedup import NearDuplicateIndex
 from .downloader import URLDownloader
-from .parsers import FileParser
+from .exceptions import ExtractionError, ParseError
+from .hedging import HedgedCaller
 from .langextract_integration import LangExtractProcessor
-from .exceptions import (
-    ResumeExtractError, 
-    InvalidURLError, 
-    UnsupportedFileTypeError,
-    DownloadError,
-    ParseError,
-    ExtractionError
-)
+from .models import ResumeInfo, validate_resume_info
+from .parsers import FileParser
+from .pipeline import BatchResult, PipelineItem, SourceDocument, Stage, run_pipeline
+from .process_parser import ProcessPoolParser
+from .retention import RawTextRetention
+from .routing import ModelRouter
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .streaming import CONTACT, RESULT, TEXT_READY, StreamEvent
+from .taxonomy import SkillTaxonomy
+from .telemetry import MetricsSink
 
 logger = logging.getLogger(__name__)
 
+# 유사 중복 처리 방식 ('reuse': 이전 결과 재사용, 'flag': 추출 후 표시)
+DEDUP_ACTIONS = ('reuse', 'flag')
+
+# 결과 모델 검증 시점 ('eager': 생성할 때마다, 'lazy': 내부 단계는 생략하고 반환 직전에 한 번)
+VALIDATION_MODES = ('eager', 'lazy')
+
+
+def _copy_result(resume_info: ResumeInfo) -> ResumeInfo:
+    """병합된 요청마다 따로 수정할 수 있는 결과 복사본"""
+    return resume_info.model_copy(deep=True)
+
 
 class ResumeExtractor:
     """
     이력서 정보 추출을 위한 메인 클래스
-    
+
     Usage:
         extractor = ResumeExtractor()
         result = extractor.extract_from_url("https://example.com/resume.pdf")
         print(result.name)
         print(result.contact.email)
     """
-    
-    def __init__(self, 
+
+    def __init__(self,
                  langextract_api_key: Optional[str] = None,
                  model_id: str = "gemini-2.0-flash",
                  max_file_size_mb: int = 10,
                  timeout: int = 30,
-                 max_retries: int = 3):
+                 max_retries: int = 3,
+                 fields: Optional[Iterable[str]] = None,
+                 use_contact_rules: bool = True,
+                 engine: str = "langextract",
+                 backend: Optional[ExtractionBackend] = None,
+                 coalesce: bool = True,
+                 single_flight: Optional[SingleFlight] = None,
+                 router: Optional[ModelRouter] = None,
+                 call_timeout: Optional[float] = None,
+                 hedging: Optional[HedgedCaller] = None,
+                 metrics_sink: Optional[MetricsSink] = None,
+                 backend_options: Optional[Dict] = None,
+                 parse_processes: Optional[int] = None,
+                 dedup_index: Optional[NearDuplicateIndex] = None,
+                 dedup_action: str = "reuse",
+                 deadline: Optional[float] = None,
+                 raw_text_retention: Union[str, RawTextRetention, None] = None,
+                 validation: str = "eager",
+                 skill_taxonomy: Optional[SkillTaxonomy] = None):
         """
         ResumeExtractor 초기화
-        
+
         Args:
             langextract_api_key: LangExtract API 키 (환경변수에서 자동 로드)
             model_id: LangExtract에서 사용할 모델 ID
             max_file_size_mb: 최대 파일 크기 (MB)
             timeout: 네트워크 타임아웃 (초)
             max_retries: 최대 재시도 횟수
+            fields: 추출할 필드 목록 (None이면 전체, 연락처 필드만 요청하면 LLM 미호출)
+            use_contact_rules: 연락처 필드를 정규식으로 먼저 추출할지 여부
+            engine: 추출 엔진 ('langextract' 또는 LLM 없이 동작하는 'heuristic')
+            backend: 모델 호출 백엔드 (오프라인 테스트 시 MockBackend 등)
+            coalesce: 동시에 들어온 동일 요청(URL, 텍스트 해시)을 하나의 파이프라인으로 병합
+                (병합된 호출자들은 결과의 복사본을 각각 받으므로 수정해도 서로 영향 없음)
+            single_flight: 여러 추출기가 공유할 SingleFlight (None이면 인스턴스 전용)
+            router: 저렴한 모델 우선 캐스케이드 라우터 (지정하면 model_id 대신 사용)
+            call_timeout: 모델 호출당 마감 시간(초), 초과 시 ExtractionTimeoutError
+            hedging: 헤지 요청 설정을 가진 HedgedCaller (지정하면 call_timeout 대신 사용)
+            metrics_sink: 호출별 텔레메트리를 받을 저장소 (InMemorySink, JSONLSink, PrometheusSink)
+            backend_options: 기본 LangExtractBackend에 전달할 lx.extract 인자 (테넌트별 설정)
+            parse_processes: 파일 파싱을 실행할 프로세스 수 (None이면 호출 스레드에서 파싱,
+                0이면 CPU 코어 수). 모델 호출은 스레드/이벤트 루프에서 실행됩니다.
+            dedup_index: 모델 호출 전에 확인할 유사 중복 인덱스 (추출 결과가 자동으로 추가됨)
+            dedup_action: 유사 중복일 때 'reuse'(이전 결과 재사용, 모델 미호출) 또는
+                'flag'(추출 후 metadata['near_duplicate']에 표시)
+            deadline: 이력서 한 건의 전체 처리 시간(초). 다운로드 → 파싱 → 추출 단계가 남은 시간을
+                나눠 쓰며, 초과하면 DeadlineExceededError (None이면 단계별 timeout만 적용)
+            raw_text_retention: 결과 raw_text 보관 정책 ('full'(기본), 'truncate', 'drop' 또는
+                TextStore를 지정한 RawTextRetention, 'reference'는 저장소가 필요)
+            validation: 결과 모델 검증 시점. 'eager'(기본)는 모델을 만들 때마다 검증하고,
+                'lazy'는 내부 단계에서 검증 없이 만든 뒤 결과를 반환하기 직전에 한 번 검증
+                (검증 실패는 ExtractionError)
+            skill_taxonomy: 기술 분류 사전 (SkillTaxonomy). 모델이 추출한 기술의 표기를 별칭 사전으로
+                통일하고 원문에서 찾은 기술을 추가 (휴리스틱 엔진은 기본 사전 대신 사용)
         """
+        if dedup_action not in DEDUP_ACTIONS:
+            raise ValueError(f"지원하지 않는 dedup_action입니다: {dedup_action}")
+        if validation not in VALIDATION_MODES:
+            raise ValueError(f"지원하지 않는 validation입니다: {validation}")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline은 0보다 커야 합니다")
         self.langextract_api_key = langextract_api_key
         self.model_id = model_id
         self.max_file_size_mb = max_file_size_mb
         self.timeout = timeout
         self.max_retries = max_retries
-        
+        self.fields = fields
+        self.use_contact_rules = use_contact_rules
+        self.engine = engine
+        self.backend = backend
+        self.coalesce = coalesce
+        self.single_flight = single_flight or SingleFlight()
+        self.async_single_flight = AsyncSingleFlight()
+        self.router = router
+        self.call_timeout = call_timeout
+        self.deadline = deadline
+        self.raw_text_retention = RawTextRetention.coerce(raw_text_retention)
+        self.validation = validation
+        self.skill_taxonomy = skill_taxonomy
+        # 마감 시간이 있으면 모델 호출을 중간에 끊을 수 있도록 caller를 항상 사용
+        self._owns_caller = hedging is None and (call_timeout is not None or deadline is not None)
+        self.caller = hedging or (HedgedCaller(timeout=call_timeout) if self._owns_caller else None)
+        self.metrics_sink = metrics_sink
+        self.backend_options = backend_options
+        self.dedup_index = dedup_index
+        self.dedup_action = dedup_action
+
         # 컴포넌트 초기화
         self.downloader = URLDownloader(
             max_file_size_mb=max_file_size_mb,
             timeout=timeout,
             max_retries=max_retries
         )
-        self.parser = FileParser()
-        self.langextract_processor = None
-        
-        # 로깅 설정
-        self._setup_logging()
-    
-    def _setup_logging(self):
-        """로깅 설정"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        self.parser = (
+            ProcessPoolParser(max_workers=parse_processes or None)
+            if parse_processes is not None else FileParser()
         )
-    
+        self.langextract_processor = None
+        self._processor_lock = threading.Lock()
+
     def _get_langextract_processor(self) -> LangExtractProcessor:
-        """LangExtract 프로세서 lazily 초기화"""
-        if self.langextract_processor is None:
-            self.langextract_processor = LangExtractProcessor(
-                api_key=self.langextract_api_key,
-                model_id=self.model_id
-            )
+        """LangExtract 프로세서 lazily 초기화 (여러 스레드가 동시에 호출해도 하나만 생성)"""
+        if self.langextract_processor is not None:
+            return self.langextract_processor
+        with self._processor_lock:
+            if self.langextract_processor is None:
+                self.langextract_processor = LangExtractProcessor(
+                    api_key=self.langextract_api_key,
+                    model_id=self.model_id,
+                    fields=self.fields,
+                    use_contact_rules=self.use_contact_rules,
+                    engine=self.engine,
+                    backend=self.backend,
+                    router=self.router,
+                    caller=self.caller,
+                    metrics_sink=self.metrics_sink,
+                    backend_options=self.backend_options,
+                    trusted=self.validation == 'lazy',
+                    skill_taxonomy=self.skill_taxonomy
+                )
         return self.langextract_processor
-    
+
     def extract_from_url(self, url: str) -> ResumeInfo:
         """
         URL에서 이력서 정보를 추출합니다.
-        
+
         Args:
             url: 이력서 파일이나 웹페이지 URL
-            
+
         Returns:
             ResumeInfo: 추출된 이력서 정보
-            
+
         Raises:
             InvalidURLError: 잘못된 URL
             UnsupportedFileTypeError: 지원하지 않는 파일 형식
@@ -101,48 +200,59 @@ class ResumeExtractor:
             ParseError: 파싱 실패
             ExtractionError: 정보 추출 실패
         """
+        if self.coalesce:
+            return self.single_flight.do_isolated(('url', url), _copy_result, self._extract_from_url, url)
+        return self._extract_from_url(url)
+
+    def _extract_from_url(self, url: str) -> ResumeInfo:
+        """URL 추출 파이프라인 (다운로드 → 파싱 → 구조화)"""
         temp_file_path = None
-        
+
         try:
-            logger.info(f"이력서 추출 시작: {url}")
-            
+            logger.debug("이력서 추출 시작: %s", url)
+
             # 1. URL에서 파일 다운로드 또는 웹페이지 텍스트 추출
-            text_content, temp_file_path = self.downloader.download_and_extract_text(url)
-            
+            deadline = Deadline.after(self.deadline)
+            phases = {}
+            started = time.perf_counter()
+            text_content, temp_file_path = self.downloader.download_and_extract_text(url, deadline)
+            phases['download'] = time.perf_counter() - started
+
             # 2. 파일인 경우 텍스트로 파싱
             if temp_file_path:
-                text_content = self.parser.parse(temp_file_path)
-                logger.info(f"파일 파싱 완료. 텍스트 길이: {len(text_content)} 문자")
+                started = time.perf_counter()
+                text_content = self.parser.parse(temp_file_path, deadline=deadline)
+                phases['parse'] = time.perf_counter() - started
+                logger.debug("파일 파싱 완료. 텍스트 길이: %d 문자", len(text_content))
             else:
-                logger.info(f"웹페이지 텍스트 추출 완료. 텍스트 길이: {len(text_content)} 문자")
-            
+                logger.debug("웹페이지 텍스트 추출 완료. 텍스트 길이: %d 문자", len(text_content))
+
             # 3. LangExtract를 사용하여 구조화된 정보 추출
-            langextract_processor = self._get_langextract_processor()
-            resume_info = langextract_processor.extract_resume_info(text_content)
-            
-            logger.info(f"이력서 정보 추출 완료: {resume_info.name or '이름 없음'}")
-            
+            resume_info = self._extract_structured(text_content, phases, deadline)
+
+            logger.debug("이력서 정보 추출 완료: %s", resume_info.name or '이름 없음')
+
             return resume_info
-            
+
         except Exception as e:
-            logger.error(f"이력서 추출 중 오류: {str(e)}")
+            logger.error("이력서 추출 중 오류: %s", e)
             raise
-        
+
         finally:
             # 임시 파일 정리
             if temp_file_path:
                 self.downloader.cleanup_temp_file(temp_file_path)
-    
+
     def extract_from_file(self, file_path: Union[str, Path]) -> ResumeInfo:
         """
         로컬 파일에서 이력서 정보를 추출합니다.
-        
+
         Args:
             file_path: 이력서 파일 경로
-            
+
         Returns:
             ResumeInfo: 추출된 이력서 정보
-            
+
         Raises:
             UnsupportedFileTypeError: 지원하지 않는 파일 형식
             ParseError: 파싱 실패
@@ -150,58 +260,415 @@ class ResumeExtractor:
         """
         try:
             file_path = Path(file_path)
-            logger.info(f"로컬 파일 추출 시작: {file_path}")
-            
+            logger.debug("로컬 파일 추출 시작: %s", file_path)
+
             if not file_path.exists():
                 raise ParseError(str(file_path), "파일이 존재하지 않습니다")
-            
+
             # 1. 파일을 텍스트로 파싱
-            text_content = self.parser.parse(str(file_path))
-            logger.info(f"파일 파싱 완료. 텍스트 길이: {len(text_content)} 문자")
-            
+            deadline = Deadline.after(self.deadline)
+            started = time.perf_counter()
+            text_content = self.parser.parse(str(file_path), deadline=deadline)
+            phases = {'parse': time.perf_counter() - started}
+            logger.debug("파일 파싱 완료. 텍스트 길이: %d 문자", len(text_content))
+
             # 2. LangExtract를 사용하여 구조화된 정보 추출
-            langextract_processor = self._get_langextract_processor()
-            resume_info = langextract_processor.extract_resume_info(text_content)
-            
-            logger.info(f"이력서 정보 추출 완료: {resume_info.name or '이름 없음'}")
-            
+            resume_info = self._extract_structured(text_content, phases, deadline)
+
+            logger.debug("이력서 정보 추출 완료: %s", resume_info.name or '이름 없음')
+
             return resume_info
-            
+
         except Exception as e:
-            logger.error(f"로컬 파일 추출 중 오류: {str(e)}")
+            logger.error("로컬 파일 추출 중 오류: %s", e)
             raise
-    
+
     def extract_from_text(self, text: str) -> ResumeInfo:
         """
         텍스트에서 직접 이력서 정보를 추출합니다.
-        
+
         Args:
             text: 이력서 텍스트 내용
-            
+
         Returns:
             ResumeInfo: 추출된 이력서 정보
-            
+
         Raises:
             ExtractionError: 정보 추출 실패
         """
         try:
-            logger.info(f"텍스트에서 직접 추출 시작. 텍스트 길이: {len(text)} 문자")
-            
+            logger.debug("텍스트에서 직접 추출 시작. 텍스트 길이: %d 문자", len(text))
+
             if not text.strip():
                 raise ExtractionError("빈 텍스트입니다")
-            
+
             # LangExtract를 사용하여 구조화된 정보 추출
-            langextract_processor = self._get_langextract_processor()
-            resume_info = langextract_processor.extract_resume_info(text)
-            
-            logger.info(f"이력서 정보 추출 완료: {resume_info.name or '이름 없음'}")
-            
+            resume_info = self._extract_structured(text, deadline=Deadline.after(self.deadline))
+
+            logger.debug("이력서 정보 추출 완료: %s", resume_info.name or '이름 없음')
+
             return resume_info
-            
+
         except Exception as e:
-            logger.error(f"텍스트 추출 중 오류: {str(e)}")
+            logger.error("텍스트 추출 중 오류: %s", e)
             raise
-    
+
+    def update_from_text(self,
+                         text: str,
+                         previous: ResumeInfo,
+                         previous_text: Optional[str] = None) -> ResumeInfo:
+        """
+        같은 이력서의 새 버전에서 바뀐 섹션만 재추출해 이전 결과에 병합합니다.
+
+        Args:
+            text: 새 버전 이력서 텍스트
+            previous: 이전 버전의 추출 결과
+            previous_text: 이전 버전 텍스트 (None이면 previous의 원문, 보관 정책의 저장소에서도 찾음)
+
+        Returns:
+            ResumeInfo: 병합된 이력서 정보 (metadata['incremental']에 섹션 비교 결과)
+
+        Raises:
+            ExtractionError: 정보 추출 실패
+        """
+        if not text.strip():
+            raise ExtractionError("빈 텍스트입니다")
+        if previous_text is None:
+            previous_text = self.raw_text_retention.resolve(previous)
+        resume_info = self._get_langextract_processor().update_resume_info(
+            text, previous, previous_text, deadline=Deadline.after(self.deadline)
+        )
+        return self.raw_text_retention.apply(self._validated(resume_info), text)
+
+    def update_from_file(self,
+                         file_path: Union[str, Path],
+                         previous: ResumeInfo,
+                         previous_text: Optional[str] = None) -> ResumeInfo:
+        """
+        로컬 파일로 올라온 새 버전을 증분 재추출합니다 (update_from_text 참고).
+
+        Raises:
+            UnsupportedFileTypeError: 지원하지 않는 파일 형식
+            ParseError: 파싱 실패
+            ExtractionError: 정보 추출 실패
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise ParseError(str(file_path), "파일이 존재하지 않습니다")
+
+        deadline = Deadline.after(self.deadline)
+        started = time.perf_counter()
+        text_content = self.parser.parse(str(file_path), deadline=deadline)
+        phases = {'parse': time.perf_counter() - started}
+        if previous_text is None:
+            previous_text = self.raw_text_retention.resolve(previous)
+        resume_info = self._get_langextract_processor().update_resume_info(
+            text_content, previous, previous_text, phases=phases, deadline=deadline
+        )
+        return self.raw_text_retention.apply(self._validated(resume_info), text_content)
+
+    def _extract_structured(self,
+                            text: str,
+                            phases: Optional[Dict[str, float]] = None,
+                            deadline: Optional[Deadline] = None) -> ResumeInfo:
+        """
+        텍스트를 ResumeInfo로 구조화 (유사 중복 인덱스가 있으면 모델 호출 전에 확인)
+
+        phases는 다운로드/파싱 소요 시간으로, 호출 텔레메트리에 함께 기록됩니다.
+        raw_text는 마지막에 보관 정책에 따라 줄이거나 저장소로 옮깁니다.
+        """
+        resume_info = self._extract_or_reuse(text, phases, deadline)
+        return self.raw_text_retention.apply(resume_info, text)
+
+    def _extract_or_reuse(self,
+                          text: str,
+                          phases: Optional[Dict[str, float]],
+                          deadline: Optional[Deadline]) -> ResumeInfo:
+        """유사 중복이면 이전 결과를 재사용하고, 아니면 모델로 추출해 인덱스에 추가"""
+        if self.dedup_index is None:
+            return self._extract_with_model(text, phases, deadline)
+
+        signature = self.dedup_index.signature(text)
+        match = self.dedup_index.best_match(signature=signature)
+        if match is not None:
+            duplicate = {'key': match.key, 'similarity': match.similarity}
+            logger.debug("유사 중복 발견: %s (%.2f)", match.key, match.similarity)
+            if self.dedup_action == 'reuse' and isinstance(match.value, ResumeInfo):
+                return match.value.model_copy(
+                    update={'raw_text': text, 'metadata': {'near_duplicate': dict(duplicate, reused=True)}},
+                    deep=True,
+                )
+
+        resume_info = self._extract_with_model(text, phases, deadline)
+        if match is None:
+            # 원본 텍스트와 텔레메트리는 빼고 보관
+            stored = resume_info.model_copy(
+                update={'raw_text': None, 'raw_text_ref': None, 'metadata': None}, deep=True
+            )
+            key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            self.dedup_index.add(key, value=stored, signature=signature)
+        else:
+            resume_info.metadata = dict(resume_info.metadata or {}, near_duplicate=dict(duplicate, reused=False))
+        return resume_info
+
+    def _extract_with_model(self,
+                            text: str,
+                            phases: Optional[Dict[str, float]],
+                            deadline: Optional[Deadline] = None) -> ResumeInfo:
+        """모델로 구조화 (동일 텍스트의 동시 요청은 병합, 병합된 요청은 먼저 온 요청의 마감 시간을 따름)"""
+        langextract_processor = self._get_langextract_processor()
+        kwargs = {'phases': phases} if phases else {}
+        if deadline is not None:
+            kwargs['deadline'] = deadline
+        def extract(text: str, **kwargs: Any) -> ResumeInfo:
+            # 검증은 한 번만 하고, 병합된 요청들은 검증된 결과의 복사본을 받음
+            # (이후 보관 정책과 유사 중복 표시가 결과를 제자리에서 수정)
+            return self._validated(langextract_processor.extract_resume_info(text, **kwargs))
+
+        if self.coalesce:
+            key = ('text', hashlib.sha256(text.encode('utf-8')).hexdigest())
+            return self.single_flight.do_isolated(key, _copy_result, extract, text, **kwargs)
+        return extract(text, **kwargs)
+
+    def _validated(self, data: Any) -> Any:
+        """'lazy' 모드에서 검증 없이 만든 결과(ResumeInfo, 스트림 ContactInfo)를 API 경계에서 한 번 검증"""
+        if self.validation != 'lazy':
+            return data
+        try:
+            if isinstance(data, ResumeInfo):
+                return validate_resume_info(data)
+            return type(data).model_validate(data.model_dump())
+        except ValidationError as e:
+            raise ExtractionError(f"결과 검증 오류: {e}") from e
+
+    def extract_many(self,
+                     sources: Iterable[Union[str, Path]],
+                     download_workers: int = 8,
+                     parse_workers: Optional[int] = None,
+                     extract_workers: int = 4,
+                     queue_size: int = 16,
+                     ordered: bool = False) -> Iterator[BatchResult]:
+        """
+        여러 이력서를 다운로드 → 파싱 → 추출 단계가 겹치도록 파이프라인으로 처리합니다.
+
+        단계마다 작업 스레드 수를 따로 지정하며, 단계 사이는 크기가 제한된 큐로 연결되어
+        느린 단계가 앞단계를 자연스럽게 늦춥니다. http(s):// 로 시작하는 문자열은 URL,
+        그 외는 로컬 파일 경로로 처리합니다.
+
+        Args:
+            sources: URL 또는 파일 경로 (제너레이터도 필요한 만큼만 읽음)
+            download_workers: 동시 다운로드 수
+            parse_workers: 동시 파싱 수 (None이면 파싱 프로세스 수, 프로세스 풀이 없으면 2)
+            extract_workers: 동시 모델 추출 수
+            queue_size: 단계 사이 큐의 최대 크기
+            ordered: True면 입력 순서, False면 완료 순서로 반환
+
+        Yields:
+            BatchResult: index, source, result(ResumeInfo) 또는 error, elapsed
+
+        Raises:
+            ValueError: 단계별 작업 스레드 수나 queue_size가 1보다 작을 때 (호출 시점)
+        """
+        if parse_workers is None:
+            parse_workers = self.parser.max_workers if isinstance(self.parser, ProcessPoolParser) else 2
+
+        stages = [
+            Stage('download', lambda item: self.download_stage(item.source), download_workers),
+            Stage('parse', lambda item: self.parse_stage(item.payload), parse_workers),
+            Stage('extract', lambda item: self.extract_stage(item.payload), extract_workers),
+        ]
+        return run_pipeline(sources, stages, queue_size=queue_size, ordered=ordered,
+                            discard=self._discard_item)
+
+    def download_stage(self, source: Union[str, Path]) -> SourceDocument:
+        """
+        처리 단계 1: URL은 다운로드(웹페이지는 텍스트 추출), 파일 경로는 존재 여부만 확인
+
+        extract_many와 작업 큐가 단계별로 나눠 실행할 때 사용합니다. 이력서별 마감 시간은
+        이 단계에서 시작해 뒤 단계로 전달됩니다 (단계 사이 대기 시간 포함).
+
+        Raises:
+            ParseError: 파일이 존재하지 않음
+            DownloadError, InvalidURLError: 다운로드 실패
+        """
+        deadline = Deadline.after(self.deadline)
+        if isinstance(source, str) and source.startswith(('http://', 'https://')):
+            started = time.perf_counter()
+            text_content, temp_file_path = self.downloader.download_and_extract_text(source, deadline)
+            return SourceDocument(
+                source=source,
+                text=text_content,
+                path=temp_file_path,
+                temporary=temp_file_path is not None,
+                phases={'download': time.perf_counter() - started},
+                deadline=deadline,
+            )
+
+        file_path = Path(source)
+        if not file_path.exists():
+            raise ParseError(str(file_path), "파일이 존재하지 않습니다")
+        return SourceDocument(source=source, path=str(file_path), deadline=deadline)
+
+    def parse_stage(self, document: SourceDocument) -> SourceDocument:
+        """처리 단계 2: 파일을 텍스트로 파싱 (다운로드한 임시 파일은 파싱 후 삭제)"""
+        if not document.path:
+            return document
+
+        started = time.perf_counter()
+        try:
+            document.text = self.parser.parse(document.path, deadline=document.deadline)
+        finally:
+            self.discard_stage(document)
+        document.phases['parse'] = time.perf_counter() - started
+        return document
+
+    def extract_stage(self, document: SourceDocument) -> ResumeInfo:
+        """
+        처리 단계 3: 파싱된 텍스트를 ResumeInfo로 구조화
+
+        Raises:
+            ExtractionError: 빈 텍스트 또는 추출 실패
+        """
+        if not document.text or not document.text.strip():
+            raise ExtractionError("빈 텍스트입니다")
+        return self._extract_structured(document.text, document.phases, document.deadline)
+
+    def discard_stage(self, document: SourceDocument) -> None:
+        """parse_stage까지 가지 못한 문서의 다운로드 임시 파일 삭제 (여러 번 호출해도 안전)"""
+        if document.temporary:
+            self.downloader.cleanup_temp_file(document.path)
+            document.temporary = False
+
+    def _discard_item(self, item: PipelineItem) -> None:
+        """배치가 중간에 멈춰 내보내지 못한 항목 정리"""
+        if isinstance(item.payload, SourceDocument):
+            self.discard_stage(item.payload)
+
+    async def aextract_from_url(self, url: str) -> ResumeInfo:
+        """
+        extract_from_url의 asyncio 버전
+
+        블로킹 파이프라인은 스레드에서 실행되며, 같은 이벤트 루프에서 동시에 들어온
+        동일 URL 요청은 하나의 스레드 작업을 공유합니다.
+        """
+        return await self._run_async(('url', url), self.extract_from_url, url)
+
+    async def aextract_from_file(self, file_path: Union[str, Path]) -> ResumeInfo:
+        """extract_from_file의 asyncio 버전"""
+        return await self._run_async(('file', str(file_path)), self.extract_from_file, file_path)
+
+    async def aextract_from_text(self, text: str) -> ResumeInfo:
+        """extract_from_text의 asyncio 버전"""
+        key = ('text', hashlib.sha256(text.encode('utf-8')).hexdigest())
+        return await self._run_async(key, self.extract_from_text, text)
+
+    async def _run_async(self, key, fn, *args) -> ResumeInfo:
+        """블로킹 함수를 스레드에서 실행 (coalesce 시 동일 키 병합)"""
+        if self.coalesce:
+            return await self.async_single_flight.do_isolated(key, _copy_result, asyncio.to_thread, fn, *args)
+        return await asyncio.to_thread(fn, *args)
+
+    def stream_from_url(self, url: str, chunk_chars: int = 2000, max_workers: int = 4) -> Iterator[StreamEvent]:
+        """
+        URL에서 이력서 정보를 추출하며 부분 결과를 이벤트로 내보냅니다.
+
+        이벤트 순서와 내용은 resume_extract.streaming 모듈을 참고하세요.
+
+        Args:
+            url: 이력서 파일이나 웹페이지 URL
+            chunk_chars: 모델 호출 청크 최대 문자 수
+            max_workers: 동시에 호출할 청크 수
+
+        Yields:
+            StreamEvent: text → contact → chunk(0회 이상) → result
+
+        deadline을 설정했으면 다운로드부터 마지막 청크까지 하나의 마감 시간이 적용됩니다.
+        """
+        started = time.perf_counter()
+        deadline = Deadline.after(self.deadline)
+        temp_file_path = None
+        phases = {}
+
+        try:
+            text_content, temp_file_path = self.downloader.download_and_extract_text(url, deadline)
+            phases['download'] = time.perf_counter() - started
+            if temp_file_path:
+                text_content = self.parser.parse(temp_file_path, deadline=deadline)
+                phases['parse'] = time.perf_counter() - started - phases['download']
+        finally:
+            if temp_file_path:
+                self.downloader.cleanup_temp_file(temp_file_path)
+
+        yield from self._stream_events(text_content, started, chunk_chars, max_workers, phases, deadline)
+
+    def stream_from_file(self,
+                         file_path: Union[str, Path],
+                         chunk_chars: int = 2000,
+                         max_workers: int = 4) -> Iterator[StreamEvent]:
+        """
+        로컬 파일에서 이력서 정보를 추출하며 부분 결과를 이벤트로 내보냅니다.
+
+        Yields:
+            StreamEvent: text → contact → chunk(0회 이상) → result
+        """
+        started = time.perf_counter()
+        deadline = Deadline.after(self.deadline)
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise ParseError(str(file_path), "파일이 존재하지 않습니다")
+
+        text_content = self.parser.parse(str(file_path), deadline=deadline)
+        phases = {'parse': time.perf_counter() - started}
+        yield from self._stream_events(text_content, started, chunk_chars, max_workers, phases, deadline)
+
+    def stream_from_text(self, text: str, chunk_chars: int = 2000, max_workers: int = 4) -> Iterator[StreamEvent]:
+        """
+        텍스트에서 이력서 정보를 추출하며 부분 결과를 이벤트로 내보냅니다.
+
+        Yields:
+            StreamEvent: text → contact → chunk(0회 이상) → result
+        """
+        if not text.strip():
+            raise ExtractionError("빈 텍스트입니다")
+
+        yield from self._stream_events(text, time.perf_counter(), chunk_chars, max_workers,
+                                       deadline=Deadline.after(self.deadline))
+
+    def _stream_events(self,
+                       text: str,
+                       started: float,
+                       chunk_chars: int,
+                       max_workers: int,
+                       phases: Optional[Dict[str, float]] = None,
+                       deadline: Optional[Deadline] = None) -> Iterator[StreamEvent]:
+        """파싱된 텍스트부터 최종 결과까지의 이벤트 생성"""
+        yield StreamEvent(TEXT_READY, text, time.perf_counter() - started)
+
+        langextract_processor = self._get_langextract_processor()
+        for kind, data in langextract_processor.stream_resume_info(
+            text, chunk_chars=chunk_chars, max_workers=max_workers, phases=phases, deadline=deadline
+        ):
+            if kind == CONTACT:
+                data = self._validated(data)
+            elif kind == RESULT:
+                data = self.raw_text_retention.apply(self._validated(data), text)
+            yield StreamEvent(kind, data, time.perf_counter() - started)
+
+    def warm_up(self, preconnect: Iterable[str] = ()) -> 'ResumeExtractor':
+        """
+        첫 요청 지연을 줄이기 위해 프로세서를 미리 생성하고 연결을 맺어 둡니다.
+
+        Args:
+            preconnect: HEAD 요청으로 미리 연결(TCP/TLS)해 둘 URL 목록 (실패는 무시)
+        """
+        self._get_langextract_processor()
+        for url in preconnect:
+            try:
+                self.downloader.session.head(url, timeout=self.timeout, allow_redirects=True)
+            except Exception as e:
+                logger.debug("사전 연결 실패: %s (%s)", url, e)
+        return self
+
     def get_supported_file_types(self) -> list:
         """지원하는 파일 형식 리스트 반환"""
         return [
@@ -212,63 +679,152 @@ class ResumeExtractor:
             'HTML (.html, .htm)',
             'Web Pages (HTTP/HTTPS URLs)'
         ]
-    
+
     def close(self):
         """리소스 정리"""
         if self.downloader:
             self.downloader.close()
-        logger.info("ResumeExtractor 리소스 정리 완료")
-    
+        if self._owns_caller:
+            self.caller.close()
+        if isinstance(self.parser, ProcessPoolParser):
+            self.parser.close()
+        logger.debug("ResumeExtractor 리소스 정리 완료")
+
     def __enter__(self):
         """컨텍스트 매니저 진입"""
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 매니저 종료"""
         self.close()
 
 
-# 편의 함수들
+def _freeze(value: Any) -> Hashable:
+    """설정 값을 풀 키로 쓸 수 있는 해시 가능한 값으로 변환"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        # 해시할 수 없는 객체(백엔드 등)는 인스턴스 단위로 구분
+        return ('id', id(value))
+
+
+class ExtractorPool:
+    """
+    설정별로 ResumeExtractor를 하나씩 만들어 재사용하는 스레드 안전 풀
+
+    같은 설정의 호출은 하나의 추출기를 공유하므로 requests 세션의 keep-alive 연결과
+    TLS 세션, LangExtractProcessor가 호출 사이에 재사용됩니다.
+    """
+
+    def __init__(self, factory: Optional[Callable[..., ResumeExtractor]] = None):
+        """
+        Args:
+            factory: 추출기 생성 함수 (None이면 ResumeExtractor)
+        """
+        self.factory = factory or ResumeExtractor
+        self._extractors: Dict[Hashable, ResumeExtractor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, **kwargs: Any) -> ResumeExtractor:
+        """kwargs 설정의 추출기 반환 (없으면 생성)"""
+        key = _freeze(kwargs)
+        extractor = self._extractors.get(key)
+        if extractor is not None:
+            return extractor
+        with self._lock:
+            extractor = self._extractors.get(key)
+            if extractor is None:
+                extractor = self.factory(**kwargs)
+                self._extractors[key] = extractor
+            return extractor
+
+    def warm_up(self, preconnect: Iterable[str] = (), **kwargs: Any) -> ResumeExtractor:
+        """kwargs 설정의 추출기를 미리 만들고 프로세서 생성과 사전 연결까지 수행"""
+        return self.get(**kwargs).warm_up(preconnect)
+
+    def close(self) -> None:
+        """풀의 모든 추출기 정리"""
+        with self._lock:
+            extractors = list(self._extractors.values())
+            self._extractors.clear()
+        for extractor in extractors:
+            extractor.close()
+
+    def __len__(self) -> int:
+        return len(self._extractors)
+
+
+# 편의 함수가 공유하는 프로세스 전역 풀
+_default_pool = ExtractorPool()
+atexit.register(_default_pool.close)
+
+
+def get_extractor(**kwargs: Any) -> ResumeExtractor:
+    """프로세스 전역 풀에서 kwargs 설정의 공유 추출기 반환"""
+    return _default_pool.get(**kwargs)
+
+
+def warm_up(preconnect: Iterable[str] = (), **kwargs: Any) -> ResumeExtractor:
+    """
+    편의 함수가 사용할 공유 추출기를 미리 준비합니다.
+
+    Args:
+        preconnect: 미리 연결해 둘 URL 목록
+        **kwargs: 이후 편의 함수 호출에 사용할 ResumeExtractor 생성자 인자들
+    """
+    return _default_pool.warm_up(preconnect, **kwargs)
+
+
+def close_pool() -> None:
+    """공유 추출기 풀 정리 (프로세스 종료 시 자동 호출)"""
+    _default_pool.close()
+
+
+# 편의 함수들 (같은 설정의 호출은 공유 추출기를 재사용)
 def extract_from_url(url: str, **kwargs) -> ResumeInfo:
     """
     URL에서 이력서 정보를 추출하는 편의 함수
-    
+
     Args:
         url: 이력서 URL
         **kwargs: ResumeExtractor 생성자 인자들
-        
+
     Returns:
         ResumeInfo: 추출된 이력서 정보
     """
-    with ResumeExtractor(**kwargs) as extractor:
-        return extractor.extract_from_url(url)
+    return get_extractor(**kwargs).extract_from_url(url)
 
 
 def extract_from_file(file_path: Union[str, Path], **kwargs) -> ResumeInfo:
     """
     파일에서 이력서 정보를 추출하는 편의 함수
-    
+
     Args:
         file_path: 이력서 파일 경로
         **kwargs: ResumeExtractor 생성자 인자들
-        
+
     Returns:
         ResumeInfo: 추출된 이력서 정보
     """
-    with ResumeExtractor(**kwargs) as extractor:
-        return extractor.extract_from_file(file_path)
+    return get_extractor(**kwargs).extract_from_file(file_path)
 
 
 def extract_from_text(text: str, **kwargs) -> ResumeInfo:
     """
     텍스트에서 이력서 정보를 추출하는 편의 함수
-    
+
     Args:
         text: 이력서 텍스트
         **kwargs: ResumeExtractor 생성자 인자들
-        
+
     Returns:
         ResumeInfo: 추출된 이력서 정보
     """
-    with ResumeExtractor(**kwargs) as extractor:
-        return extractor.extract_from_text(text)
+    return get_extractor(**kwargs).extract_from_text(text)
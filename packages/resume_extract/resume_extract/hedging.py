@@ -0,0 +1,197 @@
+"""
+모델 호출 마감 시간과 헤지(hedged) 요청 모듈
+
+모델 호출의 p99 지연 시간은 중앙값의 몇 배에 달하므로, 설정한 백분위 시간까지
+응답이 없으면 같은 요청을 한 번 더 보내고 먼저 도착한 응답을 사용합니다.
+헤지 요청도 레이트 리밋 토큰을 소비하며, 토큰이 없으면 헤지를 보내지 않습니다.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .exceptions import ExtractionTimeoutError
+
+
+class RateLimiter:
+    """토큰 버킷 레이트 리미터 (스레드 안전)"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: 초당 허용 호출 수
+            burst: 버킷 크기 (None이면 rate를 올림한 값)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate + 0.999)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """토큰이 있으면 소비하고 True, 없으면 즉시 False"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """토큰을 얻을 때까지 대기 (timeout 초과 시 False)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.try_acquire():
+            wait_for = 1.0 / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait_for = min(wait_for, remaining)
+            time.sleep(wait_for)
+        return True
+
+
+class HedgedCaller:
+    """마감 시간과 헤지 요청을 적용해 함수를 호출하는 실행기"""
+
+    def __init__(self,
+                 timeout: Optional[float] = None,
+                 hedge_after: Optional[float] = None,
+                 hedge_percentile: Optional[float] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 min_samples: int = 20,
+                 latency_window: int = 1000,
+                 max_workers: int = 32):
+        """
+        Args:
+            timeout: 호출당 마감 시간(초), None이면 무제한
+            hedge_after: 헤지를 보낼 고정 대기 시간(초)
+            hedge_percentile: 최근 지연 시간의 이 백분위(0~1)에 헤지 (표본이 충분할 때 hedge_after보다 우선)
+            rate_limiter: 원 요청과 헤지 요청이 함께 소비하는 레이트 리미터
+            min_samples: 백분위 계산에 필요한 최소 표본 수
+            latency_window: 보관할 최근 지연 시간 개수
+            max_workers: 동시 시도 실행 스레드 수
+        """
+        if hedge_percentile is not None and not 0.0 < hedge_percentile < 1.0:
+            raise ValueError("hedge_percentile은 0과 1 사이여야 합니다")
+
+        self.timeout = timeout
+        self.hedge_after = hedge_after
+        self.hedge_percentile = hedge_percentile
+        self.rate_limiter = rate_limiter
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedged-call")
+        self._lock = threading.Lock()
+        self._counters = {
+            'calls': 0, 'timeouts': 0, 'hedged': 0, 'hedge_wins': 0, 'hedges_throttled': 0,
+        }
+
+    @property
+    def hedging_enabled(self) -> bool:
+        return self.hedge_after is not None or self.hedge_percentile is not None
+
+    def hedge_delay(self) -> Optional[float]:
+        """현재 헤지 대기 시간 (헤지 비활성화 시 None)"""
+        if self.hedge_percentile is not None:
+            with self._lock:
+                samples = sorted(self._latencies)
+            if len(samples) >= self.min_samples:
+                return samples[min(len(samples) - 1, int(self.hedge_percentile * len(samples)))]
+        return self.hedge_after
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        fn을 호출하고 가장 먼저 성공한 시도의 결과를 반환합니다.
+
+        마감 시간을 넘긴 시도는 결과를 버리며, 실행 중인 스레드는 끝날 때까지 남습니다.
+
+        Raises:
+            ExtractionTimeoutError: 마감 시간 내에 성공한 시도가 없음
+            시도가 모두 실패하면 마지막 예외를 그대로 전달
+        """
+        return self.call_within(self.timeout, fn, *args, **kwargs)
+
+    def call_within(self, timeout: Optional[float], fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """설정된 timeout 대신 이번 호출의 마감 시간(초)을 지정해 call과 같이 호출"""
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        self._count('calls')
+
+        if self.rate_limiter and not self.rate_limiter.acquire(self._remaining(deadline)):
+            self._count('timeouts')
+            raise ExtractionTimeoutError(timeout, "레이트 리밋 대기 중 마감 시간 초과")
+
+        pending: List[Future] = [self._executor.submit(fn, *args, **kwargs)]
+        hedge: Optional[Future] = None
+        hedge_delay = self.hedge_delay() if self.hedging_enabled else None
+        last_error: Optional[BaseException] = None
+
+        while pending:
+            wait_for = self._remaining(deadline)
+            if hedge is None and hedge_delay is not None:
+                until_hedge = max(0.0, hedge_delay - (time.monotonic() - started))
+                wait_for = until_hedge if wait_for is None else min(wait_for, until_hedge)
+
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                error = future.exception()
+                if error is None:
+                    self._record_success(time.monotonic() - started, future is hedge)
+                    return future.result()
+                last_error = error
+
+            if done:
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            if hedge is None and hedge_delay is not None:
+                hedge_delay = None
+                if self.rate_limiter and not self.rate_limiter.try_acquire():
+                    self._count('hedges_throttled')
+                    continue
+                hedge = self._executor.submit(fn, *args, **kwargs)
+                pending.append(hedge)
+                self._count('hedged')
+
+        if last_error is not None and not pending:
+            raise last_error
+        self._count('timeouts')
+        raise ExtractionTimeoutError(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """호출/시간 초과/헤지 횟수와 헤지 승률"""
+        with self._lock:
+            counters = dict(self._counters)
+        counters['hedge_win_rate'] = (
+            counters['hedge_wins'] / counters['hedged'] if counters['hedged'] else 0.0
+        )
+        counters['hedge_delay'] = self.hedge_delay() if self.hedging_enabled else None
+        return counters
+
+    def close(self) -> None:
+        """실행 스레드 정리 (진행 중인 시도는 기다리지 않음)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _record_success(self, latency: float, hedge_won: bool) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+            if hedge_won:
+                self._counters['hedge_wins'] += 1
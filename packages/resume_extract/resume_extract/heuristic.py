@@ -0,0 +1,370 @@
+"""
+LLM 없이 규칙만으로 이력서 정보를 추출하는 휴리스틱 엔진
+
+섹션 분할, 기간 문법, 기술 사전, 연락처 정규식을 조합하여 ResumeInfo를 만듭니다.
+대량 선별 작업처럼 근사치로 충분하고 비용/지연이 중요한 경우에 사용합니다.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from .models import (
+    CertificationInfo,
+    ContactInfo,
+    EducationInfo,
+    ExperienceInfo,
+    M,
+    ProjectInfo,
+    ResumeInfo,
+)
+from .rules import ContactRuleExtractor
+from .taxonomy import DEFAULT_SKILLS as DEFAULT_SKILLS  # 기존 import 경로 호환
+from .taxonomy import SkillTaxonomy, default_taxonomy
+
+# 휴리스틱 결과의 기본 신뢰도 (LLM 결과보다 낮게 설정)
+HEURISTIC_CONFIDENCE = 0.5
+
+# 섹션 제목 키워드 → 섹션 이름
+SECTION_KEYWORDS = {
+    'summary': ('요약', '자기소개', '소개', 'summary', 'profile', 'about me', 'about'),
+    'experience': ('경력', '경력사항', '경력 사항', '업무 경력', '직무 경험', '경험',
+                   'experience', 'work experience', 'employment', 'career'),
+    'education': ('학력', '학력사항', '학력 사항', 'education'),
+    'skills': ('기술', '기술 스택', '보유 기술', '스킬', 'skills', 'tech stack', 'technical skills'),
+    'projects': ('프로젝트', '프로젝트 경험', 'projects', 'project experience'),
+    'certifications': ('자격증', '자격 사항', '자격사항', 'certifications', 'certificates', 'licenses'),
+    'languages': ('언어', '어학', '외국어', 'languages'),
+    'contact': ('연락처', '인적사항', 'contact'),
+}
+
+_HEADING_PREFIX = re.compile(r'^[#\s■□●○◆◇▶▷\-*\[\(【<]+')
+_HEADING_SUFFIX = re.compile(r'[\]\)】>:：\s]+$')
+
+_DATE = r'(\d{4})\s*(?:[./\-년]\s*(\d{1,2})\s*월?)?'
+_DATE_RANGE = re.compile(
+    _DATE + r'\s*[~\-–—]\s*(?:' + _DATE + r'|(현재|재직\s*중|진행\s*중|present|current|now))',
+    re.IGNORECASE,
+)
+_SINGLE_DATE = re.compile(r'\b(\d{4})\s*[./\-년]\s*(\d{1,2})\b')
+
+_LABEL = re.compile(r'^([^:：]{1,20})[:：]\s*(.*)$')
+_BULLET = re.compile(r'^[-*•·▪◦]\s*')
+_ADDRESS = re.compile(r'(?:주소|거주지|address)\s*[:：]\s*(.+)', re.IGNORECASE)
+_NAME_KO = re.compile(r'^[가-힣]{2,4}$')
+_NAME_EN = re.compile(r'^[A-Z][a-z]+(?:\s[A-Z][a-z]+){1,2}$')
+_GPA = re.compile(r'(?:학점|GPA|평점)?\s*[:：]?\s*(\d\.\d{1,2}\s*/\s*\d\.\d{1,2})', re.IGNORECASE)
+_URL = re.compile(r'https?://\S+')
+
+_INSTITUTION = re.compile(r'\S*(?:대학교|대학원|대학|고등학교|University|College|Institute|School)\b')
+_DEGREE = re.compile(r'(학사|석사|박사|전문학사|졸업|수료|Bachelor\S*|Master\S*|Ph\.?D\.?|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?)(?!\w)')
+_MAJOR = re.compile(r'(\S+(?:학과|학부|전공|공학|과))(?!\w)')
+
+_LABEL_KEYS = {
+    'technologies': ('기술', '사용 기술', '사용기술', '기술 스택', 'tech', 'stack', 'technologies'),
+    'role': ('역할', '담당', 'role'),
+    'url': ('url', '링크', 'link'),
+    'issuer': ('발급기관', '발급 기관', '주관', 'issuer'),
+    'date': ('취득일', '취득', '발급일', 'date', 'issued'),
+    'expiration_date': ('만료일', '만료', 'expires', 'expiration'),
+    'credential_id': ('자격증 id', '자격증 번호', '자격번호', 'credential id', 'id'),
+}
+
+
+class HeuristicExtractor:
+    """LLM 호출 없이 ResumeInfo를 구성하는 규칙 기반 추출기"""
+
+    def __init__(self,
+                 skills: Optional[Iterable[str]] = None,
+                 contact_rules: Optional[ContactRuleExtractor] = None,
+                 trusted: bool = False,
+                 taxonomy: Optional[SkillTaxonomy] = None):
+        """
+        Args:
+            skills: 별칭 없는 기술 이름 목록 (taxonomy 대신 사용)
+            contact_rules: 연락처 정규식 추출기
+            trusted: 결과 모델을 검증 없이 생성 (검증은 호출자가 API 경계에서 한 번)
+            taxonomy: 기술 분류 사전 (None이고 skills도 없으면 DEFAULT_SKILLS와 기본 별칭)
+        """
+        self.contact_rules = contact_rules or ContactRuleExtractor()
+        self.trusted = trusted
+        if taxonomy is None:
+            taxonomy = SkillTaxonomy.from_names(skills) if skills else default_taxonomy()
+        self.taxonomy = taxonomy
+        self._heading_lookup = {
+            keyword: section
+            for section, keywords in SECTION_KEYWORDS.items()
+            for keyword in keywords
+        }
+
+    def extract(self, text: str) -> ResumeInfo:
+        """텍스트에서 ResumeInfo 생성"""
+        header, sections = self.segment_sections(text)
+        contact = self.contact_rules.extract(text)
+
+        address = _ADDRESS.search(text)
+        if address:
+            contact['address'] = address.group(1).strip()
+
+        skills_text = sections.get('skills')
+        skills = self._parse_skill_list(skills_text) if skills_text else self.find_skills(text)
+
+        return self._make(
+            ResumeInfo,
+            name=self._find_name(header or text),
+            contact=self._make(ContactInfo, **contact),
+            summary=self._join_lines(sections.get('summary')),
+            skills=skills,
+            experience=self._parse_experience(sections.get('experience', '')),
+            education=self._parse_education(sections.get('education', '')),
+            projects=self._parse_projects(sections.get('projects', '')),
+            certifications=self._parse_certifications(sections.get('certifications', '')),
+            languages=self._parse_lines(sections.get('languages', '')),
+            raw_text=text,
+            confidence_score=HEURISTIC_CONFIDENCE,
+        )
+
+    def _make(self, model: Type[M], **data: Any) -> M:
+        """결과 모델 생성 (trusted면 검증 생략)"""
+        return model.trusted(**data) if self.trusted else model(**data)
+
+    def segment_sections(self, text: str) -> Tuple[str, Dict[str, str]]:
+        """
+        섹션 제목을 기준으로 텍스트를 분할합니다.
+
+        Returns:
+            Tuple[str, Dict[str, str]]: (첫 섹션 이전 머리말, 섹션 이름 → 본문)
+        """
+        header_lines: List[str] = []
+        sections: Dict[str, List[str]] = {}
+        current: Optional[List[str]] = None
+
+        for line in text.splitlines():
+            section = self.match_heading(line)
+            if section:
+                current = sections.setdefault(section, [])
+                continue
+            if current is None:
+                header_lines.append(line)
+            else:
+                current.append(line)
+
+        return '\n'.join(header_lines), {
+            name: '\n'.join(lines).strip() for name, lines in sections.items()
+        }
+
+    def match_heading(self, line: str) -> Optional[str]:
+        """줄이 섹션 제목이면 섹션 이름 반환"""
+        stripped = line.strip()
+        if not stripped or len(stripped) > 30:
+            return None
+        keyword = _HEADING_SUFFIX.sub('', _HEADING_PREFIX.sub('', stripped)).lower()
+        return self._heading_lookup.get(keyword)
+
+    def find_skills(self, text: str) -> List[str]:
+        """기술 사전에 있는 기술을 등장 순서대로 표준 이름으로 추출"""
+        return self.taxonomy.find(text)
+
+    @staticmethod
+    def parse_date_range(text: str) -> Optional[str]:
+        """텍스트에서 첫 기간 표기를 'YYYY.MM ~ YYYY.MM' 형태로 반환"""
+        match = _DATE_RANGE.search(text)
+        if not match:
+            return None
+        start_year, start_month, end_year, end_month, ongoing = match.groups()
+
+        def fmt(year: str, month: Optional[str]) -> str:
+            return f"{year}.{int(month):02d}" if month else year
+
+        end = ongoing if ongoing else fmt(end_year, end_month)
+        return f"{fmt(start_year, start_month)} ~ {end}"
+
+    def _find_name(self, header: str) -> Optional[str]:
+        for line in header.splitlines()[:10]:
+            candidate = line.strip().strip('#').strip()
+            if _NAME_KO.match(candidate) or _NAME_EN.match(candidate):
+                return candidate
+        return None
+
+    def _parse_skill_list(self, section: str) -> List[str]:
+        items: List[str] = []
+        for line in self._parse_lines(section):
+            label = _LABEL.match(line)
+            if label:
+                line = label.group(2)
+            items.extend(re.split(r'[,/·|]', line))
+        return self.taxonomy.canonicalize(items)
+
+    def _split_entries(self, section: str) -> List[List[str]]:
+        """
+        섹션을 항목 단위로 분할
+
+        하위 제목(###)이나 기간 표기가 있는 줄이 새 항목을 시작하며,
+        둘 다 없는 섹션은 빈 줄로 나눕니다.
+        """
+        lines = [line.strip() for line in section.splitlines()]
+        has_markers = any(
+            line.startswith('#') or _DATE_RANGE.search(line) for line in lines
+        )
+
+        entries: List[List[str]] = []
+        current: List[str] = []
+        for line in lines:
+            if not line:
+                if not has_markers and current:
+                    entries.append(current)
+                    current = []
+                continue
+            starts_entry = line.startswith('#') or (
+                _DATE_RANGE.search(line) and not _BULLET.match(line)
+            )
+            if has_markers and starts_entry and current:
+                # 하위 제목 바로 다음 줄의 기간은 같은 항목으로 취급
+                if not (current[-1].startswith('#') and len(current) == 1 and not line.startswith('#')):
+                    entries.append(current)
+                    current = []
+            current.append(line)
+        if current:
+            entries.append(current)
+        return entries
+
+    @staticmethod
+    def _strip_title(line: str) -> str:
+        """항목 제목 줄에서 하위 제목 기호와 기간 표기 제거"""
+        title = _DATE_RANGE.sub('', line.lstrip('#').strip())
+        title = re.sub(r'\(\s*\)|\[\s*\]', '', title)
+        return title.strip(' -|,')
+
+    def _labeled_values(self, lines: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+        """'라벨: 값' 형식의 줄과 나머지 줄을 분리"""
+        values: Dict[str, str] = {}
+        rest: List[str] = []
+        for line in lines:
+            text = _BULLET.sub('', line)
+            label = _LABEL.match(text)
+            key = None
+            if label:
+                name = label.group(1).strip().lower()
+                key = next(
+                    (field for field, names in _LABEL_KEYS.items() if name in names), None
+                )
+            if key and key not in values:
+                values[key] = label.group(2).strip()
+            else:
+                rest.append(text)
+        return values, rest
+
+    def _split_technologies(self, text: str) -> List[str]:
+        return self.taxonomy.canonicalize(re.split(r'[,/·|]', text))
+
+    def _parse_experience(self, section: str) -> List[ExperienceInfo]:
+        experiences = []
+        for entry in self._split_entries(section):
+            head = ' '.join(entry[:2]) if entry[0].startswith('#') else entry[0]
+            title = self._strip_title(entry[0])
+            parts = re.split(r'\s+[-|–—]\s+|\s*[|@]\s*', title, maxsplit=1)
+            company = parts[0].strip()
+            position = parts[1].strip() if len(parts) > 1 else ''
+
+            values, rest = self._labeled_values(entry[1:])
+            description_lines = [line for line in rest if not _DATE_RANGE.fullmatch(line.strip('() '))]
+            description = '\n'.join(description_lines) or None
+            technologies = (
+                self._split_technologies(values['technologies'])
+                if 'technologies' in values else self.find_skills('\n'.join(entry))
+            )
+
+            if not company:
+                continue
+            experiences.append(self._make(
+                ExperienceInfo,
+                company=company,
+                position=position,
+                duration=self.parse_date_range(head) or '',
+                description=description,
+                technologies=technologies,
+            ))
+        return experiences
+
+    def _parse_education(self, section: str) -> List[EducationInfo]:
+        educations = []
+        for entry in self._split_entries(section):
+            text = ' '.join(entry)
+            institution = _INSTITUTION.search(text)
+            if not institution:
+                continue
+            degree = _DEGREE.search(text)
+            major = _MAJOR.search(self._strip_title(entry[0]).replace(institution.group(0), ''))
+            gpa = _GPA.search(text)
+            description = [
+                _BULLET.sub('', line) for line in entry[1:]
+                if not _GPA.search(line) and not _DATE_RANGE.search(line)
+            ]
+            educations.append(self._make(
+                EducationInfo,
+                institution=institution.group(0),
+                degree=degree.group(1) if degree else '',
+                major=major.group(1) if major else None,
+                duration=self.parse_date_range(text) or '',
+                gpa=gpa.group(1).replace(' ', '') if gpa else None,
+                description='\n'.join(description) or None,
+            ))
+        return educations
+
+    def _parse_projects(self, section: str) -> List[ProjectInfo]:
+        projects = []
+        for entry in self._split_entries(section):
+            name = self._strip_title(entry[0])
+            if not name:
+                continue
+            values, rest = self._labeled_values(entry[1:])
+            url = values.get('url')
+            if not url:
+                found = _URL.search('\n'.join(rest))
+                url = found.group(0) if found else None
+            technologies = (
+                self._split_technologies(values['technologies'])
+                if 'technologies' in values else self.find_skills('\n'.join(rest))
+            )
+            projects.append(self._make(
+                ProjectInfo,
+                name=name,
+                description='\n'.join(line for line in rest if not _DATE_RANGE.search(line)),
+                technologies=technologies,
+                duration=self.parse_date_range(' '.join(entry[:2])),
+                url=url,
+                role=values.get('role'),
+            ))
+        return projects
+
+    def _parse_certifications(self, section: str) -> List[CertificationInfo]:
+        certifications = []
+        for entry in self._split_entries(section):
+            values, rest = self._labeled_values(entry)
+            if not rest:
+                continue
+            date = values.get('date')
+            if not date:
+                single = _SINGLE_DATE.search(rest[0])
+                date = single.group(0) if single else None
+            certifications.append(self._make(
+                CertificationInfo,
+                name=_SINGLE_DATE.sub('', rest[0]).strip(' ()-|,'),
+                issuer=values.get('issuer', ''),
+                date=date,
+                expiration_date=values.get('expiration_date'),
+                credential_id=values.get('credential_id'),
+                url=values.get('url'),
+            ))
+        return certifications
+
+    @staticmethod
+    def _parse_lines(section: Optional[str]) -> List[str]:
+        if not section:
+            return []
+        return [
+            _BULLET.sub('', line.strip()) for line in section.splitlines() if line.strip()
+        ]
+
+    def _join_lines(self, section: Optional[str]) -> Optional[str]:
+        lines = self._parse_lines(section)
+        return '\n'.join(lines) if lines else None
@@ -0,0 +1,160 @@
+"""
+섹션 단위 증분 재추출 모듈
+
+같은 이력서의 새 버전이 올라오면 이전 텍스트와 섹션별로 비교해 바뀐 섹션만 모델에
+보내고, 결과를 이전 ResumeInfo에 병합합니다. 섹션 분할은 휴리스틱 엔진의 섹션 제목
+인식을 그대로 사용하며, 첫 제목 이전 머리말과 연락처 섹션은 'profile' 섹션 하나로 묶습니다.
+
+제한 사항:
+    기술 섹션이 없는 이력서에서 경력 본문에만 있던 기술은 skills가 재추출되지 않으므로
+    이전 값이 유지됩니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .heuristic import HeuristicExtractor
+from .models import ResumeInfo
+
+# 머리말(이름, 연락처)과 연락처 섹션을 묶은 섹션 이름
+PROFILE = 'profile'
+
+# 섹션 → 재추출할 필드 ('contact'는 연락처 세부 필드 전체)
+SECTION_FIELDS = {
+    PROFILE: ('name', 'contact'),
+    'summary': ('summary',),
+    'experience': ('experience',),
+    'education': ('education',),
+    'skills': ('skills',),
+    'projects': ('projects',),
+    'certifications': ('certifications',),
+    'languages': ('languages',),
+}
+
+# 이 비율보다 많이 바뀌면 증분 대신 전체 재추출
+DEFAULT_MAX_CHANGED_RATIO = 0.5
+
+_WHITESPACE = re.compile(r'\s+')
+
+_default_segmenter: Optional[HeuristicExtractor] = None
+
+
+def _segmenter() -> HeuristicExtractor:
+    global _default_segmenter
+    if _default_segmenter is None:
+        _default_segmenter = HeuristicExtractor()
+    return _default_segmenter
+
+
+def split_sections(text: str, segmenter: Optional[HeuristicExtractor] = None) -> Dict[str, str]:
+    """
+    텍스트를 섹션 이름 → 본문(제목 줄 포함)으로 분할합니다.
+
+    같은 섹션 제목이 여러 번 나오면 본문을 이어 붙입니다.
+    """
+    segmenter = segmenter or _segmenter()
+    sections: Dict[str, List[str]] = {}
+    current = sections.setdefault(PROFILE, [])
+
+    for line in text.splitlines():
+        section = segmenter.match_heading(line)
+        if section:
+            current = sections.setdefault(PROFILE if section == 'contact' else section, [])
+        current.append(line)
+
+    return {name: '\n'.join(lines).strip() for name, lines in sections.items() if ''.join(lines).strip()}
+
+
+def _normalize(section: str) -> str:
+    """공백 차이는 변경으로 보지 않음"""
+    return _WHITESPACE.sub(' ', section).strip()
+
+
+@dataclass
+class SectionDiff:
+    """이전/새 텍스트의 섹션 비교 결과"""
+    sections: Dict[str, str]                       # 새 텍스트의 섹션
+    changed: List[str] = field(default_factory=list)    # 새로 생겼거나 내용이 바뀐 섹션
+    removed: List[str] = field(default_factory=list)    # 새 텍스트에서 사라진 섹션
+    unchanged: List[str] = field(default_factory=list)  # 이전 결과를 재사용할 섹션
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changed or self.removed)
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """재추출할 필드"""
+        return tuple(f for name in self.changed for f in SECTION_FIELDS[name])
+
+    @property
+    def changed_text(self) -> str:
+        """모델에 보낼 바뀐 섹션 텍스트 (원래 순서)"""
+        return '\n\n'.join(self.sections[name] for name in self.changed)
+
+    @property
+    def changed_ratio(self) -> float:
+        """새 텍스트 중 바뀐 섹션이 차지하는 비율"""
+        total = sum(len(section) for section in self.sections.values())
+        return len(self.changed_text) / total if total else 1.0
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return {'changed': self.changed, 'removed': self.removed, 'unchanged': self.unchanged}
+
+
+def diff_sections(previous_text: str,
+                  text: str,
+                  segmenter: Optional[HeuristicExtractor] = None) -> SectionDiff:
+    """이전 텍스트와 새 텍스트를 섹션 단위로 비교"""
+    old = split_sections(previous_text, segmenter)
+    new = split_sections(text, segmenter)
+    diff = SectionDiff(sections=new)
+
+    for name, section in new.items():
+        if name in old and _normalize(old[name]) == _normalize(section):
+            diff.unchanged.append(name)
+        else:
+            diff.changed.append(name)
+    diff.removed = [name for name in old if name not in new]
+    return diff
+
+
+def needs_full_extraction(diff: SectionDiff, max_changed_ratio: float = DEFAULT_MAX_CHANGED_RATIO) -> bool:
+    """
+    증분 병합보다 전체 재추출이 나은 경우
+
+    섹션 제목을 하나도 찾지 못했거나(전체가 profile) 바뀐 분량이 max_changed_ratio를 넘는 경우입니다.
+    """
+    if set(diff.sections) <= {PROFILE}:
+        return True
+    return diff.changed_ratio > max_changed_ratio
+
+
+def merge_resume_info(previous: ResumeInfo,
+                      partial: ResumeInfo,
+                      diff: SectionDiff,
+                      text: str) -> ResumeInfo:
+    """
+    바뀐 섹션의 추출 결과를 이전 결과에 병합합니다.
+
+    Args:
+        previous: 이전 버전의 추출 결과
+        partial: 바뀐 섹션만으로 추출한 결과
+        diff: 섹션 비교 결과
+        text: 새 버전 전체 텍스트 (raw_text로 저장)
+    """
+    update = {name: getattr(partial, name) for name in diff.fields}
+    defaults = ResumeInfo()
+    for section in diff.removed:
+        for name in SECTION_FIELDS[section]:
+            update[name] = getattr(defaults, name)
+
+    update['raw_text'] = text
+    update['raw_text_ref'] = None
+    scores = [s for s in (previous.confidence_score, partial.confidence_score) if s is not None]
+    update['confidence_score'] = min(scores) if scores else None
+    metadata = dict(partial.metadata or {})
+    metadata['incremental'] = diff.to_dict()
+    update['metadata'] = metadata
+    return previous.model_copy(update=update, deep=True)
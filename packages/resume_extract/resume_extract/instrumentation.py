@@ -0,0 +1,191 @@
+"""
+단계별 트레이싱 스팬 모듈
+
+파이프라인의 각 단계(HEAD, GET, 파싱, 정규화, LLM, 변환)는 span()으로 감싸져 있으며,
+바이트/문자 수 등의 속성을 기록합니다. 등록된 훅이 없으면 span()은 미리 만든
+no-op 컨텍스트 매니저를 반환하므로 비활성 상태의 비용은 속성 딕셔너리 생성 정도입니다.
+
+Usage:
+    from resume_extract.instrumentation import CallbackHook, add_span_hook
+
+    add_span_hook(CallbackHook(lambda span: print(span.name, span.duration, span.attributes)))
+
+    # OpenTelemetry (opentelemetry-api 설치 필요)
+    add_span_hook(OpenTelemetryHook())
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 스팬 이름
+HEAD = 'head'            # 원격 파일 정보 확인 (bytes: content-length)
+GET = 'get'              # 파일/웹페이지 다운로드 (bytes, chars)
+PARSE = 'parse'          # 파일 → 텍스트 (bytes: 파일 크기, chars)
+NORMALIZE = 'normalize'  # HTML 정리, 연락처 규칙 추출 등 모델 호출 전 처리 (chars)
+LLM = 'llm'              # 모델 호출 (model_id, chars, prompt_chars, extractions)
+CONVERT = 'convert'      # 추출 결과 → ResumeInfo (extractions)
+
+
+class Span:
+    """진행 중이거나 끝난 스팬"""
+
+    __slots__ = ('name', 'attributes', 'started', 'duration', 'error')
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+        self.started = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.error: Optional[BaseException] = None
+
+    def set(self, key: str, value: Any) -> None:
+        """속성 추가 (바이트/문자 수처럼 단계가 끝나야 알 수 있는 값)"""
+        self.attributes[key] = value
+
+
+class SpanHook(ABC):
+    """스팬 시작/종료를 받는 훅 인터페이스"""
+
+    def start(self, span: Span) -> Any:
+        """스팬 시작 (반환값은 같은 스팬의 end에 전달)"""
+        return None
+
+    @abstractmethod
+    def end(self, span: Span, token: Any) -> None:
+        """스팬 종료 (span.duration, span.error 설정됨)"""
+
+
+class CallbackHook(SpanHook):
+    """끝난 스팬을 함수 하나로 전달하는 훅"""
+
+    def __init__(self, callback: Callable[[Span], None]):
+        self.callback = callback
+
+    def end(self, span: Span, token: Any) -> None:
+        self.callback(span)
+
+
+class OpenTelemetryHook(SpanHook):
+    """스팬을 OpenTelemetry 스팬으로 기록하는 훅 (중첩 스팬은 부모-자식으로 연결)"""
+
+    def __init__(self, tracer: Any = None, prefix: str = 'resume_extract.'):
+        """
+        Args:
+            tracer: OpenTelemetry Tracer (None이면 전역 TracerProvider에서 생성)
+            prefix: 스팬 이름 접두사
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError("opentelemetry-api가 설치되지 않았습니다. pip install opentelemetry-api") from None
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer('resume_extract')
+        self.prefix = prefix
+
+    def start(self, span: Span) -> Any:
+        otel_span = self.tracer.start_span(self.prefix + span.name, attributes=span.attributes)
+        activation = self._trace.use_span(otel_span, end_on_exit=False)
+        activation.__enter__()
+        return otel_span, activation
+
+    def end(self, span: Span, token: Any) -> None:
+        otel_span, activation = token
+        otel_span.set_attributes(span.attributes)
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(span.error)))
+        activation.__exit__(None, None, None)
+        otel_span.end()
+
+
+class _NoopSpan:
+    """훅이 없을 때 사용하는 스팬 (모든 동작 무시)"""
+
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+class _ActiveSpan:
+    """훅이 있을 때 사용하는 스팬 컨텍스트 매니저"""
+
+    __slots__ = ('span', 'hooks', 'tokens')
+
+    def __init__(self, span: Span, hooks: Tuple[SpanHook, ...]):
+        self.span = span
+        self.hooks = hooks
+        self.tokens: List[Any] = []
+
+    def __enter__(self) -> Span:
+        self.span.started = time.perf_counter()
+        for hook in self.hooks:
+            try:
+                self.tokens.append(hook.start(self.span))
+            except Exception as e:
+                logger.debug("스팬 훅 시작 실패: %s", e)
+                self.tokens.append(None)
+        return self.span
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.span.duration = time.perf_counter() - self.span.started
+        self.span.error = exc_val
+        # 중첩된 OpenTelemetry 컨텍스트를 올바르게 복원하도록 역순으로 종료
+        for hook, token in zip(reversed(self.hooks), reversed(self.tokens), strict=True):
+            try:
+                hook.end(self.span, token)
+            except Exception as e:
+                logger.debug("스팬 훅 종료 실패: %s", e)
+
+
+_hooks: Tuple[SpanHook, ...] = ()
+_hooks_lock = threading.Lock()
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """
+    단계 스팬 컨텍스트 매니저
+
+    with span(PARSE, bytes=size) as s:
+        text = ...
+        s.set('chars', len(text))
+    """
+    hooks = _hooks
+    if not hooks:
+        return _NOOP
+    return _ActiveSpan(Span(name, attributes), hooks)
+
+
+def add_span_hook(hook: SpanHook) -> SpanHook:
+    """프로세스 전역 스팬 훅 등록"""
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+    return hook
+
+
+def remove_span_hook(hook: SpanHook) -> None:
+    """등록한 스팬 훅 제거"""
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h is not hook)
+
+
+def tracing_enabled() -> bool:
+    """등록된 스팬 훅이 있는지 여부 (속성 계산 비용이 큰 경우 확인용)"""
+    return bool(_hooks)
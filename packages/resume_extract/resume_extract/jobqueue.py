@@ -0,0 +1,460 @@
+"""
+SQLite 기반 영속 작업 큐
+
+배치 추출 항목의 상태(queued → downloading → parsing → extracting → done/failed)를
+SQLite 파일에 기록합니다. 작업을 가져간 워커는 가시성 제한 시간(visibility timeout)
+동안 항목을 점유하며, 워커가 죽어 점유가 만료되면 다른 워커가 다시 가져갑니다.
+실패한 항목은 예외 종류에 따라 지수 백오프 후 재시도하거나 바로 failed로 기록합니다.
+
+WAL 모드와 BEGIN IMMEDIATE 트랜잭션을 사용하므로 여러 프로세스의 워커가 같은 큐
+파일에서 동시에 작업을 가져갈 수 있습니다.
+
+Usage:
+    queue = JobQueue("jobs.db")
+    queue.enqueue([("r1", "https://example.com/a.pdf"), ("r2", "b.docx")])
+
+    # 워커 프로세스마다
+    JobWorker(ResumeExtractor(), JobQueue("jobs.db")).run()
+
+    print(queue.counts())   # {'done': 2}
+"""
+
+import json
+import logging
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Type, Union
+
+from .exceptions import (
+    DownloadError,
+    ExtractionTimeoutError,
+    LangExtractAPIError,
+    LeaseLostError,
+)
+from .models import ResumeInfo
+
+logger = logging.getLogger(__name__)
+
+# 항목 상태
+QUEUED = 'queued'
+DOWNLOADING = 'downloading'
+PARSING = 'parsing'
+EXTRACTING = 'extracting'
+DONE = 'done'
+FAILED = 'failed'
+
+STATES = (QUEUED, DOWNLOADING, PARSING, EXTRACTING, DONE, FAILED)
+ACTIVE_STATES = (DOWNLOADING, PARSING, EXTRACTING)
+
+# 예외 종류 → 첫 재시도 대기 시간(초) (없는 예외는 재시도하지 않음)
+DEFAULT_RETRY_DELAYS: Dict[Type[BaseException], float] = {
+    ExtractionTimeoutError: 1.0,
+    DownloadError: 2.0,
+    LangExtractAPIError: 5.0,
+    ConnectionError: 2.0,
+    TimeoutError: 1.0,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_id TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease TEXT,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (state, available_at);
+"""
+
+
+class RetryPolicy:
+    """예외 종류별 지수 백오프 재시도 정책"""
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 delays: Optional[Dict[Type[BaseException], float]] = None,
+                 max_delay: float = 300.0,
+                 jitter: float = 0.1):
+        """
+        Args:
+            max_attempts: 최대 시도 횟수 (점유 만료로 회수된 시도 포함)
+            delays: 예외 종류 → 첫 재시도 대기 시간 (None이면 DEFAULT_RETRY_DELAYS)
+            max_delay: 최대 대기 시간(초)
+            jitter: 대기 시간에 더할 무작위 비율 (워커들의 동시 재시도 분산)
+        """
+        self.max_attempts = max_attempts
+        self.delays = DEFAULT_RETRY_DELAYS if delays is None else delays
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def retry_delay(self, error: BaseException, attempts: int) -> Optional[float]:
+        """재시도 대기 시간 (재시도하지 않으면 None)"""
+        if attempts >= self.max_attempts:
+            return None
+        base = next((delay for error_type, delay in self.delays.items() if isinstance(error, error_type)), None)
+        if base is None:
+            return None
+        delay = min(self.max_delay, base * 2 ** (attempts - 1))
+        return delay * (1 + random.uniform(0, self.jitter))
+
+
+@dataclass
+class Job:
+    """워커가 점유한 작업"""
+    id: int
+    item_id: str
+    source: str
+    attempts: int
+    lease: str
+
+
+class JobQueue:
+    """SQLite 파일 하나에 저장되는 작업 큐 (스레드/프로세스 안전)"""
+
+    def __init__(self,
+                 path: Union[str, os.PathLike],
+                 visibility_timeout: float = 300.0,
+                 retry: Optional[RetryPolicy] = None):
+        """
+        Args:
+            path: SQLite 파일 경로
+            visibility_timeout: 워커가 하트비트 없이 항목을 점유할 수 있는 시간(초)
+            retry: 재시도 정책
+        """
+        self.path = str(path)
+        self.visibility_timeout = visibility_timeout
+        self.retry = retry or RetryPolicy()
+        self._local = threading.local()
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간에 공유하지 않음)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """현재 스레드의 연결 종료"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def enqueue(self, items: Iterable[Union[str, Tuple[str, str]]]) -> int:
+        """
+        항목 추가 ((항목 ID, 소스) 또는 소스 문자열). 이미 있는 항목 ID는 무시합니다.
+
+        Returns:
+            int: 새로 추가된 항목 수
+        """
+        now = time.time()
+        rows = []
+        for item in items:
+            item_id, source = (item, item) if isinstance(item, str) else item
+            rows.append((str(item_id), str(source), QUEUED, now, now, now))
+
+        conn = self._conn()
+        before = conn.total_changes
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (item_id, source, state, available_at, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return conn.total_changes - before
+
+    def claim(self, owner: Optional[str] = None) -> Optional[Job]:
+        """
+        처리할 항목 하나를 점유합니다 (대기 중이거나 점유가 만료된 항목).
+
+        점유가 만료된 항목 중 시도 횟수를 모두 쓴 항목은 failed로 기록합니다.
+
+        Returns:
+            Optional[Job]: 점유한 작업 (없으면 None)
+        """
+        owner = owner or default_worker_id()
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            placeholders = ','.join('?' * len(ACTIVE_STATES))
+            conn.execute(
+                f"UPDATE jobs SET state = ?, error = ?, lease = NULL, lease_owner = NULL, updated_at = ?"
+                f" WHERE state IN ({placeholders}) AND lease_expires < ? AND attempts >= ?",
+                (FAILED, json.dumps({'type': 'LeaseExpired', 'message': "워커 점유 시간이 만료되었습니다"},
+                                   ensure_ascii=False),
+                 now, *ACTIVE_STATES, now, self.retry.max_attempts),
+            )
+            row = conn.execute(
+                f"SELECT id, item_id, source, attempts FROM jobs"
+                f" WHERE (state = ? AND available_at <= ?) OR (state IN ({placeholders}) AND lease_expires < ?)"
+                f" ORDER BY available_at, id LIMIT 1",
+                (QUEUED, now, *ACTIVE_STATES, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            lease = uuid.uuid4().hex
+            conn.execute(
+                "UPDATE jobs SET state = ?, attempts = attempts + 1, lease = ?, lease_owner = ?,"
+                " lease_expires = ?, updated_at = ? WHERE id = ?",
+                (DOWNLOADING, lease, owner, now + self.visibility_timeout, now, row['id']),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return Job(row['id'], row['item_id'], row['source'], row['attempts'] + 1, lease)
+
+    def heartbeat(self, job: Job, state: Optional[str] = None) -> bool:
+        """
+        점유 연장 (state를 주면 단계 상태도 기록)
+
+        Returns:
+            bool: 점유가 유효하면 True (만료되어 다른 워커가 가져갔으면 False)
+        """
+        now = time.time()
+        if state is None:
+            cursor = self._conn().execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? WHERE id = ? AND lease = ?",
+                (now + self.visibility_timeout, now, job.id, job.lease),
+            )
+        else:
+            cursor = self._conn().execute(
+                "UPDATE jobs SET state = ?, lease_expires = ?, updated_at = ? WHERE id = ? AND lease = ?",
+                (state, now + self.visibility_timeout, now, job.id, job.lease),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job: Job, result: ResumeInfo) -> bool:
+        """작업 완료 기록 (점유를 잃었으면 False)"""
+        cursor = self._conn().execute(
+            "UPDATE jobs SET state = ?, result = ?, error = NULL, lease = NULL, lease_owner = NULL,"
+            " lease_expires = NULL, updated_at = ? WHERE id = ? AND lease = ?",
+            (DONE, result.model_dump_json(), time.time(), job.id, job.lease),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job: Job, error: BaseException) -> Optional[float]:
+        """
+        작업 실패 기록 (재시도 정책에 따라 다시 대기시키거나 failed로 기록)
+
+        Returns:
+            Optional[float]: 재시도 대기 시간 (재시도하지 않으면 None)
+
+        Raises:
+            LeaseLostError: 점유를 잃어 실패를 기록하지 못함 (complete()가 False를 반환하는 경우와 같음)
+        """
+        now = time.time()
+        delay = self.retry.retry_delay(error, job.attempts)
+        error_json = json.dumps(
+            {'type': type(error).__name__, 'message': str(error), 'attempts': job.attempts},
+            ensure_ascii=False,
+        )
+        if delay is None:
+            state, available_at = FAILED, now
+        else:
+            state, available_at = QUEUED, now + delay
+        cursor = self._conn().execute(
+            "UPDATE jobs SET state = ?, error = ?, available_at = ?, lease = NULL, lease_owner = NULL,"
+            " lease_expires = NULL, updated_at = ? WHERE id = ? AND lease = ?",
+            (state, error_json, available_at, now, job.id, job.lease),
+        )
+        if cursor.rowcount != 1:
+            raise LeaseLostError(job.item_id)
+        return delay
+
+    def requeue_failed(self) -> int:
+        """failed 항목을 시도 횟수를 초기화해 다시 대기시킴"""
+        now = time.time()
+        cursor = self._conn().execute(
+            "UPDATE jobs SET state = ?, attempts = 0, available_at = ?, updated_at = ? WHERE state = ?",
+            (QUEUED, now, now, FAILED),
+        )
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 항목 수"""
+        rows = self._conn().execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return dict(rows)
+
+    def pending(self) -> int:
+        """아직 끝나지 않은 항목 수 (대기 중 + 처리 중)"""
+        counts = self.counts()
+        return sum(counts.get(state, 0) for state in (QUEUED,) + ACTIVE_STATES)
+
+    def get(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """항목 상태 조회 (result/error는 JSON 디코딩)"""
+        row = self._conn().execute("SELECT * FROM jobs WHERE item_id = ?", (item_id,)).fetchone()
+        return self._row_dict(row) if row else None
+
+    def records(self, state: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """항목 목록 (state를 주면 해당 상태만)"""
+        if state is None:
+            cursor = self._conn().execute("SELECT * FROM jobs ORDER BY id")
+        else:
+            cursor = self._conn().execute("SELECT * FROM jobs WHERE state = ? ORDER BY id", (state,))
+        for row in cursor:
+            yield self._row_dict(row)
+
+    @staticmethod
+    def _row_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        data = dict(row)
+        for key in ('result', 'error'):
+            if data[key] is not None:
+                data[key] = json.loads(data[key])
+        return data
+
+
+def default_worker_id() -> str:
+    """호스트, 프로세스, 스레드로 구성된 워커 ID"""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class JobWorker:
+    """JobQueue에서 항목을 가져와 ResumeExtractor로 처리하는 워커"""
+
+    def __init__(self,
+                 extractor: Any,
+                 queue: JobQueue,
+                 worker_id: Optional[str] = None,
+                 poll_interval: float = 1.0):
+        """
+        Args:
+            extractor: 항목을 처리할 ResumeExtractor
+            queue: 작업 큐
+            worker_id: 점유자 표시 (None이면 호스트:PID:스레드)
+            poll_interval: 가져올 항목이 없을 때 다시 확인하는 주기(초)
+        """
+        self.extractor = extractor
+        self.queue = queue
+        self.worker_id = worker_id
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """현재 항목을 마친 뒤 종료"""
+        self._stop.set()
+
+    def run(self, max_jobs: Optional[int] = None, wait: bool = False) -> int:
+        """
+        항목을 처리합니다.
+
+        Args:
+            max_jobs: 처리할 최대 항목 수 (None이면 제한 없음)
+            wait: True면 큐가 비어도 stop()까지 대기, False면 끝나지 않은 항목이 없을 때 종료
+
+        Returns:
+            int: 처리한 항목 수
+        """
+        owner = self.worker_id or default_worker_id()
+        processed = 0
+        try:
+            while not self._stop.is_set() and (max_jobs is None or processed < max_jobs):
+                job = self.queue.claim(owner)
+                if job is None:
+                    # 다른 워커가 처리 중이거나 재시도 대기 중인 항목이 있으면 계속 확인
+                    if not wait and not self.queue.pending():
+                        break
+                    self._stop.wait(self.poll_interval)
+                    continue
+                self.process(job)
+                processed += 1
+        finally:
+            self.queue.close()
+        return processed
+
+    def process(self, job: Job) -> bool:
+        """작업 하나 처리 (성공하면 True)"""
+        extractor = self.extractor
+        renew = _LeaseRenewer(self.queue, job)
+        renew.start()
+        document = None
+        try:
+            document = extractor.download_stage(job.source)
+            renew.state(PARSING)
+            document = extractor.parse_stage(document)
+            renew.state(EXTRACTING)
+            result = extractor.extract_stage(document)
+        except Exception as e:
+            renew.stop()
+            if document is not None:
+                extractor.discard_stage(document)
+            try:
+                delay = self.queue.fail(job, e)
+            except LeaseLostError:
+                logger.warning("점유가 만료되어 실패를 기록하지 못했습니다: %s (%s)", job.item_id, e)
+                return False
+            if delay is None:
+                logger.warning("작업 실패: %s (%s)", job.item_id, e)
+            else:
+                logger.info("작업 재시도 예정: %s, %.1f초 후 (%s)", job.item_id, delay, e)
+            return False
+        finally:
+            renew.stop()
+
+        if not self.queue.complete(job, result):
+            logger.warning("점유가 만료되어 결과를 기록하지 못했습니다: %s", job.item_id)
+            return False
+        return True
+
+
+class _LeaseRenewer:
+    """처리 중인 작업의 점유를 주기적으로 연장하는 스레드"""
+
+    def __init__(self, queue: JobQueue, job: Job):
+        self.queue = queue
+        self.job = job
+        self._stopped = threading.Event()
+        self._state: Optional[str] = None
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=f"lease-{job.id}", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def state(self, state: str) -> None:
+        """단계 상태 기록 (점유도 함께 연장)"""
+        with self._lock:
+            self.queue.heartbeat(self.job, state)
+
+    def stop(self) -> None:
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self._thread.join()
+
+    def _run(self) -> None:
+        interval = max(0.05, self.queue.visibility_timeout / 3)
+        try:
+            while not self._stopped.wait(interval):
+                with self._lock:
+                    if not self.queue.heartbeat(self.job):
+                        logger.warning("작업 점유를 잃었습니다: %s", self.job.item_id)
+                        return
+        finally:
+            self.queue.close()
@@ -0,0 +1,209 @@
+"""
+JSONL 스트리밍 쓰기 모듈
+
+ResumeInfo.to_json은 indent=2로 들여쓴 문자열을 객체마다 만듭니다. JSONLWriter는 결과를
+pydantic-core 직렬화기로 바로 UTF-8 바이트(공백 없는 한 줄)로 만들어 버퍼에 모으고,
+버퍼가 차면 바이너리 출력(파일, 표준 출력, gzip/zstd 압축 스트림)에 한 번에 씁니다.
+
+결과를 감싸는 레코드({'id': ..., 'source': ..., 'result': ...})는 orjson이 설치되어 있으면
+orjson으로, 없으면 표준 json으로 직렬화하고, 결과 부분은 직렬화된 바이트를 그대로 이어 붙입니다.
+
+Usage:
+    with JSONLWriter("results.jsonl.zst") as writer:
+        for result in results:
+            writer.write(result)
+"""
+
+import gzip
+import json
+import os
+import sys
+from typing import Any, BinaryIO, Dict, Iterable, Optional, Set, Union
+
+from .models import ResumeInfo
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+GZIP = 'gzip'
+ZSTD = 'zstd'
+
+COMPRESSIONS = (GZIP, ZSTD)
+
+# 파일 확장자로 추정하는 압축 방식
+_SUFFIXES = {'.gz': GZIP, '.zst': ZSTD}
+
+# 출력에 한 번에 쓰는 기본 버퍼 크기 (바이트)
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+_serializer = ResumeInfo.__pydantic_serializer__
+
+
+def json_backend() -> str:
+    """레코드 직렬화에 사용하는 JSON 라이브러리 이름"""
+    return 'orjson' if orjson is not None else 'json'
+
+
+def dumps(value: Any) -> bytes:
+    """공백 없는 한 줄 UTF-8 JSON (orjson이 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def resume_json(resume_info: ResumeInfo, exclude: Optional[Set[str]] = None) -> bytes:
+    """ResumeInfo를 공백 없는 한 줄 UTF-8 JSON 바이트로 직렬화 (model_dump를 거치지 않음)"""
+    return _serializer.to_json(resume_info, exclude=exclude)
+
+
+def infer_compression(path: Union[str, os.PathLike]) -> Optional[str]:
+    """파일 확장자(.gz, .zst)로 압축 방식 추정"""
+    return _SUFFIXES.get(os.path.splitext(os.fspath(path))[1])
+
+
+def _require_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstandard가 설치되지 않았습니다. pip install zstandard") from None
+    return zstandard
+
+
+def _compressed(stream: BinaryIO, compression: Optional[str], level: Optional[int]) -> BinaryIO:
+    if compression is None:
+        return stream
+    if compression == GZIP:
+        return gzip.GzipFile(fileobj=stream, mode='wb', compresslevel=6 if level is None else level)
+    if compression == ZSTD:
+        zstandard = _require_zstandard()
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.stream_writer(stream, closefd=False)
+    raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+
+
+class JSONLWriter:
+    """
+    ResumeInfo와 레코드를 한 줄씩 바이너리 출력에 쓰는 JSONL 쓰기 도구
+
+    압축 출력은 실행마다 하나의 gzip 멤버/zstd 프레임이 되므로, 기존 파일 뒤에 이어 쓴(append=True)
+    파일도 gzip/zstd로 한 번에 풀 수 있습니다.
+    """
+
+    def __init__(self,
+                 sink: Union[str, os.PathLike, BinaryIO],
+                 compression: Optional[str] = None,
+                 level: Optional[int] = None,
+                 exclude: Optional[Iterable[str]] = None,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 append: bool = False):
+        """
+        Args:
+            sink: 파일 경로, '-'(표준 출력) 또는 쓰기 가능한 바이너리 스트림
+            compression: 'gzip', 'zstd' 또는 None (None이면 경로 확장자 .gz/.zst로 추정)
+            level: 압축 수준 (None이면 gzip 6, zstd 3)
+            exclude: 결과에서 뺄 필드 (예: {'raw_text'})
+            buffer_size: 출력에 한 번에 쓰는 바이트 수
+            append: 파일 경로일 때 기존 내용 뒤에 이어 쓰기
+        """
+        is_path = isinstance(sink, (str, os.PathLike)) and os.fspath(sink) != '-'
+        if compression is None and is_path:
+            compression = infer_compression(sink)
+        # 파일을 열기(기존 내용 비우기) 전에 압축 방식을 확인
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+        if compression == ZSTD:
+            _require_zstandard()
+
+        if is_path:
+            self._file: Optional[BinaryIO] = open(sink, 'ab' if append else 'wb')
+            stream = self._file
+        else:
+            self._file = None
+            stream = sys.stdout.buffer if isinstance(sink, (str, os.PathLike)) else sink
+
+        self.compression = compression
+        self.exclude = set(exclude) if exclude else None
+        self.buffer_size = buffer_size
+        self.rows = 0
+        self.closed = False
+        self._raw = stream
+        try:
+            self._stream = _compressed(stream, compression, level)
+        except BaseException:
+            if self._file is not None:
+                self._file.close()
+            raise
+        self._buffer = bytearray()
+
+    def write(self, resume_info: ResumeInfo) -> None:
+        """결과 한 건을 한 줄로 쓰기"""
+        self._append(resume_json(resume_info, self.exclude))
+
+    def write_record(self, record: Dict[str, Any], result: Optional[ResumeInfo] = None, key: str = 'result') -> None:
+        """
+        레코드 한 건을 한 줄로 쓰기
+
+        result를 주면 직렬화된 결과 바이트를 record[key]로 이어 붙입니다 (result를 dict로 바꾸지 않음).
+        """
+        line = dumps(record)
+        if result is not None:
+            separator = b',' if record else b''
+            line = b''.join((line[:-1], separator, dumps(key), b':', resume_json(result, self.exclude), b'}'))
+        self._append(line)
+
+    def write_all(self, resumes: Iterable[ResumeInfo]) -> int:
+        """여러 건을 쓰고 쓴 건수 반환"""
+        count = 0
+        for resume_info in resumes:
+            self.write(resume_info)
+            count += 1
+        return count
+
+    def _append(self, line: bytes) -> None:
+        self._buffer += line
+        self._buffer += b'\n'
+        self.rows += 1
+        if len(self._buffer) >= self.buffer_size:
+            self._drain()
+
+    def _drain(self) -> None:
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer.clear()
+
+    def flush(self) -> None:
+        """
+        모인 줄을 출력에 쓰기
+
+        압축하지 않는 출력은 파일까지 flush하고, 압축 출력은 압축률을 위해 압축기에만 넘깁니다
+        (압축기 안에 남은 바이트는 close()에서 기록).
+        """
+        self._drain()
+        if self.compression is None:
+            self._stream.flush()
+
+    def close(self) -> None:
+        """남은 줄을 쓰고 압축 스트림을 마무리 (전달받은 스트림은 닫지 않음)"""
+        if self.closed:
+            return
+        self._drain()
+        if self.compression is not None:
+            self._stream.close()
+        self._raw.flush()
+        if self._file is not None:
+            self._file.close()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def write_jsonl(resumes: Iterable[ResumeInfo], sink: Union[str, os.PathLike, BinaryIO], **kwargs: Any) -> int:
+    """ResumeInfo 스트림을 JSONL로 쓰고 쓴 건수 반환 (인자는 JSONLWriter 참고)"""
+    with JSONLWriter(sink, **kwargs) as writer:
+        return writer.write_all(resumes)
@@ -2,81 +2,716 @@
 LangExtract를 이용한 정보 추출 모듈
 """
 
-import os
+import copy
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
 import langextract as lx
+from pydantic import ValidationError
+
+from .backends import ExtractionBackend, LangExtractBackend
+from .deadline import EXTRACT, Deadline
+from .exceptions import (
+    DeadlineExceededError,
+    ExtractionError,
+    ExtractionTimeoutError,
+    LangExtractAPIError,
+)
+from .hedging import HedgedCaller
+from .heuristic import HeuristicExtractor
+from .incremental import (
+    DEFAULT_MAX_CHANGED_RATIO,
+    diff_sections,
+    merge_resume_info,
+    needs_full_extraction,
+)
+from .instrumentation import CONVERT, LLM, NORMALIZE, span
 from .models import (
-    ResumeInfo, ContactInfo, ExperienceInfo, EducationInfo, 
-    ProjectInfo, CertificationInfo
+    CertificationInfo,
+    ContactInfo,
+    EducationInfo,
+    ExperienceInfo,
+    M,
+    ProjectInfo,
+    ResumeInfo,
+    validate_resume_info,
 )
-from .exceptions import LangExtractAPIError, ExtractionError
+from .retention import full_raw_text
+from .routing import CHEAP, ESCALATED, REASON_VALIDATION, ModelRouter
+from .rules import RULE_CONTACT_FIELDS, ContactRuleExtractor
+from .streaming import CHUNK, CONTACT, RESULT, ChunkExtraction, split_into_chunks
+from .taxonomy import SkillTaxonomy
+from .telemetry import CallMetrics, MetricsSink, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# 지원하는 추출 엔진 ('heuristic'은 LLM 호출 없이 규칙만 사용)
+ENGINES = ('langextract', 'heuristic')
+
+# 추출 요청 가능한 필드 (ResumeInfo 최상위 필드 + 연락처 세부 필드)
+CONTACT_FIELDS = ('email', 'phone', 'address', 'linkedin', 'github', 'website')
+RESUME_FIELDS = ('name',) + CONTACT_FIELDS + (
+    'summary', 'skills', 'experience', 'education',
+    'projects', 'certifications', 'languages',
+)
+
+_CONTACT_LABELS = {
+    'email': '이메일',
+    'phone': '전화번호',
+    'address': '주소',
+    'linkedin': 'LinkedIn',
+    'github': 'GitHub',
+    'website': '웹사이트',
+}
+
+_PROMPT_LINES = {
+    'name': '- 개인 정보 (이름)',
+    'summary': '- 요약/자기소개',
+    'skills': '- 기술/스킬',
+    'experience': '- 경력 사항 (회사명, 직책, 기간, 업무 설명, 사용 기술)',
+    'education': '- 학력 (기관명, 학위, 전공, 기간, 성적, 설명)',
+    'projects': '- 프로젝트 경험 (프로젝트명, 설명, 사용 기술, 기간, URL, 역할)',
+    'certifications': '- 자격증 (자격증명, 발급기관, 취득일, 만료일, 자격증 ID, URL)',
+    'languages': '- 언어 능력',
+}
+
+# 예제 추출 클래스 → 필드 (프롬프트 축소 시 예제 필터링에 사용)
+_EXAMPLE_CLASS_FIELDS = {
+    '이름': 'name',
+    '이메일': 'email',
+    '전화번호': 'phone',
+    '주소': 'address',
+    'LinkedIn': 'linkedin',
+    'GitHub': 'github',
+    '회사': 'experience',
+    '직책': 'experience',
+    '근무기간': 'experience',
+    '업무설명': 'experience',
+    '학교': 'education',
+    '학위': 'education',
+    '전공': 'education',
+    '학업기간': 'education',
+    '성적': 'education',
+    '기술': 'skills',
+    '프로젝트명': 'projects',
+    '프로젝트설명': 'projects',
+    '프로젝트기술': 'projects',
+    '프로젝트기간': 'projects',
+    '자격증': 'certifications',
+    '발급기관': 'certifications',
+    '취득일': 'certifications',
+}
+
+
+# 추출 클래스 → (대상, 필드) 디스패치 테이블
+# 대상은 'scalar'(첫 값 유지), 'list'(누적) 또는 레코드 종류(experience 등)
+_SCALAR, _LIST = 'scalar', 'list'
+_CLASS_DISPATCH: Dict[str, Tuple[str, str]] = {}
+for _target, _field, _aliases in (
+    (_SCALAR, 'name', ('이름', '성명', '지원자이름', '지원자명', '후보자이름', 'name', 'fullname',
+                       'candidatename', 'applicantname', 'personname')),
+    (_SCALAR, 'email', ('이메일', '메일', 'email', 'e-mail')),
+    (_SCALAR, 'phone', ('전화번호', '전화', '휴대폰', '연락처', 'phone', 'mobile', 'tel')),
+    (_SCALAR, 'address', ('주소', '거주지', 'address')),
+    (_SCALAR, 'linkedin', ('linkedin',)),
+    (_SCALAR, 'github', ('github',)),
+    (_SCALAR, 'website', ('웹사이트', '홈페이지', '블로그', '포트폴리오', 'website', 'homepage', 'blog')),
+    (_SCALAR, 'summary', ('요약', '자기소개', '소개', 'summary', 'profile')),
+    (_LIST, 'skills', ('기술', '스킬', '기술스택', 'skill', 'skills', 'techstack')),
+    (_LIST, 'languages', ('언어', '어학', '언어능력', 'language', 'languages')),
+    ('experience', 'company', ('회사', '회사명', '직장', 'company', 'companyname', 'employer')),
+    ('experience', 'position', ('직책', '직위', '직무', 'position', 'jobtitle')),
+    ('experience', 'duration', ('근무기간', '재직기간', '경력기간', 'employmentperiod', 'workduration')),
+    ('experience', 'description', ('업무설명', '업무', '담당업무', 'jobdescription', 'responsibility')),
+    ('experience', 'technologies', ('사용기술', '업무기술', 'worktechnologies')),
+    ('education', 'institution', ('학교', '학교명', '대학', '교육기관', 'school', 'schoolname', 'institution', 'university')),
+    ('education', 'degree', ('학위', 'degree')),
+    ('education', 'major', ('전공', '학과', 'major')),
+    ('education', 'duration', ('학업기간', '재학기간', 'educationperiod', 'studyduration')),
+    ('education', 'gpa', ('성적', '학점', 'gpa')),
+    ('education', 'description', ('학력설명', 'educationdescription')),
+    ('projects', 'name', ('프로젝트명', '프로젝트', 'project', 'projectname')),
+    ('projects', 'description', ('프로젝트설명', 'projectdescription')),
+    ('projects', 'technologies', ('프로젝트기술', 'projecttechnologies', 'projecttech')),
+    ('projects', 'duration', ('프로젝트기간', 'projectperiod', 'projectduration')),
+    ('projects', 'url', ('프로젝트url', 'projecturl', 'url')),
+    ('projects', 'role', ('역할', '프로젝트역할', 'role', 'projectrole')),
+    ('certifications', 'name', ('자격증', '자격증명', 'certification', 'certificationname', 'certificate',
+                                       'license')),
+    ('certifications', 'issuer', ('발급기관', 'issuer')),
+    ('certifications', 'date', ('취득일', '발급일', 'issuedate')),
+    ('certifications', 'expiration_date', ('만료일', 'expirationdate', 'expiry')),
+    ('certifications', 'credential_id', ('자격증id', '자격번호', 'credentialid')),
+    ('certifications', 'url', ('자격증url', 'credentialurl')),
+):
+    for _alias in _aliases:
+        _CLASS_DISPATCH[_alias] = (_target, _field)
+
+# 테이블에 없는 클래스를 위한 부분 문자열 규칙 (앞에서부터 우선)
+# 'name'/'이름'은 company_name, 학교이름처럼 다른 레코드의 이름에도 들어가므로 부분 일치로 쓰지 않음
+_CLASS_FALLBACKS = (
+    (('이메일', 'email'), (_SCALAR, 'email')),
+    (('전화', 'phone'), (_SCALAR, 'phone')),
+    (('주소', 'address'), (_SCALAR, 'address')),
+    (('linkedin',), (_SCALAR, 'linkedin')),
+    (('github',), (_SCALAR, 'github')),
+    (('기술', 'skill'), (_LIST, 'skills')),
+)
+
+_CLASS_NOISE = re.compile(r'[\s_\-]+')
+
+# 레코드를 대표하는 필드 (없는 레코드는 버림)
+_RECORD_ANCHORS = {
+    'experience': 'company',
+    'education': 'institution',
+    'projects': 'name',
+    'certifications': 'name',
+}
+
+# 반복되면 새 레코드를 시작하지 않고 누적하는 필드
+_RECORD_APPEND_FIELDS = ('description', 'technologies')
+
+# 같은 레코드로 묶을 최대 문자 간격 (char_interval 기준)
+_RECORD_GAP = 400
+
+
+@lru_cache(maxsize=1024)
+def _dispatch_class(extraction_class: str) -> Optional[Tuple[str, str]]:
+    """추출 클래스를 (대상, 필드)로 변환 (정규화된 클래스별로 캐시)"""
+    key = _CLASS_NOISE.sub('', extraction_class.lower())
+    target = _CLASS_DISPATCH.get(key)
+    if target is not None:
+        return target
+    for needles, fallback in _CLASS_FALLBACKS:
+        if any(needle in key for needle in needles):
+            return fallback
+    return None
+
+
+def _split_list(text: str) -> List[str]:
+    return [item.strip() for item in text.split(',') if item.strip()]
+
 
 class LangExtractProcessor:
-    """LangExtract를 사용한 이력서 정보 추출 프로세서"""
-    
-    def __init__(self, api_key: Optional[str] = None, model_id: str = "gemini-2.0-flash"):
+    """
+    LangExtract를 사용한 이력서 정보 추출 프로세서
+
+    API 키와 모델 설정은 인스턴스에만 보관하고 백엔드에 직접 전달하므로,
+    키나 모델이 다른 프로세서 여러 개를 한 프로세스에서 동시에 사용할 수 있습니다.
+    생성 후 설정을 바꾸지 않으면 하나의 인스턴스를 여러 스레드에서 공유해도 안전합니다.
+    """
+
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 model_id: str = "gemini-2.0-flash",
+                 fields: Optional[Iterable[str]] = None,
+                 use_contact_rules: bool = True,
+                 engine: str = "langextract",
+                 backend: Optional[ExtractionBackend] = None,
+                 router: Optional[ModelRouter] = None,
+                 caller: Optional[HedgedCaller] = None,
+                 metrics_sink: Optional[MetricsSink] = None,
+                 backend_options: Optional[Dict[str, Any]] = None,
+                 trusted: bool = False,
+                 skill_taxonomy: Optional[SkillTaxonomy] = None):
+        """
+        Args:
+            api_key: LangExtract API 키 (환경변수에서 자동 로드)
+            model_id: 사용할 모델 ID
+            fields: 추출할 필드 목록 (None이면 전체, 'contact'는 연락처 전체)
+            use_contact_rules: 연락처 필드를 정규식으로 먼저 추출할지 여부
+            engine: 추출 엔진 ('langextract' 또는 LLM 없이 동작하는 'heuristic')
+            backend: 모델 호출 백엔드 (None이면 lx.extract를 호출하는 LangExtractBackend)
+            router: 모델 라우터 (지정하면 model_id 대신 저렴한 모델 우선 캐스케이드 사용)
+            caller: 모델 호출마다 마감 시간/헤지 요청을 적용하는 실행기
+            metrics_sink: 호출별 텔레메트리(CallMetrics)를 받을 저장소
+            backend_options: 기본 LangExtractBackend에 전달할 lx.extract 인자
+                (예: {"language_model_params": {"model_url": ...}})
+            trusted: 결과 모델을 검증 없이 생성 (ResumeModel.trusted). 잘못된 이메일 등은
+                호출자가 API 경계에서 validate_resume_info로 한 번 검증해야 합니다.
+            skill_taxonomy: 기술 분류 사전. 지정하면 모델이 추출한 기술의 표기를 통일하고 원문에서
+                찾은 기술을 추가합니다 (휴리스틱 엔진은 지정하지 않으면 기본 사전 사용)
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"지원하지 않는 엔진입니다: {engine}")
+
+        self.engine = engine
+        self.model_id = model_id
+        self.fields = self._resolve_fields(fields)
+        self.contact_rules = ContactRuleExtractor() if use_contact_rules else None
+        self.trusted = trusted
+        self.skill_taxonomy = skill_taxonomy
+        self.heuristic = HeuristicExtractor(
+            contact_rules=self.contact_rules, trusted=trusted, taxonomy=skill_taxonomy
+        )
+        self.api_key = api_key or os.getenv('LANGEXTRACT_API_KEY')
+        self.backend = backend
+        self.router = router
+        self.caller = caller
+        self.metrics_sink = metrics_sink
+
+        # 휴리스틱 엔진이나 외부 백엔드는 API 키가 필요 없음
+        if engine == 'heuristic' or backend is not None:
+            return
+
         if lx is None:
             raise ImportError("langextract가 설치되지 않았습니다. pip install langextract")
-        
-        self.api_key = api_key or os.getenv('LANGEXTRACT_API_KEY')
+
         if not self.api_key:
             raise ValueError("LANGEXTRACT_API_KEY 환경 변수가 설정되어야 합니다")
-        
-        self.model_id = model_id
-        
-        # LangExtract 설정 (API 키가 필요한 경우 설정)
-        os.environ['LANGEXTRACT_API_KEY'] = self.api_key
-    
-    def extract_resume_info(self, text: str) -> ResumeInfo:
-        """텍스트에서 이력서 정보 추출"""
+
+        # API 키는 프로세스 환경 변수에 쓰지 않고 백엔드 호출마다 직접 전달
+        self.backend = LangExtractBackend(api_key=self.api_key, **(backend_options or {}))
+
+    def extract_resume_info(self,
+                            text: str,
+                            fields: Optional[Iterable[str]] = None,
+                            phases: Optional[Dict[str, float]] = None,
+                            deadline: Optional[Deadline] = None) -> ResumeInfo:
+        """
+        텍스트에서 이력서 정보 추출
+
+        연락처 필드는 정규식으로 먼저 채우고, 남은 필드만 LLM 프롬프트에 포함합니다.
+        요청한 필드가 모두 규칙으로 추출 가능한 연락처 필드라면 LLM을 호출하지 않습니다.
+        호출 텔레메트리는 결과의 metadata에 붙고 metrics_sink로 전달됩니다.
+
+        Args:
+            text: 이력서 텍스트
+            fields: 추출할 필드 목록 (None이면 프로세서 설정)
+            phases: 호출 전에 측정한 단계별 소요 시간 (다운로드, 파싱 등)
+            deadline: 이력서 처리 마감 시간 (모델 호출은 남은 시간까지만 기다림)
+        """
+        requested = self._resolve_fields(fields) if fields is not None else self.fields
+        started = time.perf_counter()
+        metrics = self._new_metrics(text, phases)
+
         try:
-            # 추출 작업 정의
-            prompt = self._get_extraction_prompt()
-            examples = self._get_extraction_examples()
-            
-            # LangExtract를 사용한 정보 추출
-            result = lx.extract(
-                text_or_documents=text,
-                prompt_description=prompt,
-                examples=examples,
-                model_id=self.model_id
+            resume_info = self._extract(text, requested, metrics, deadline)
+        except Exception as e:
+            metrics.error = type(e).__name__
+            self._emit_metrics(metrics, started, phases)
+            raise
+
+        resume_info.metadata = self._emit_metrics(metrics, started, phases).to_dict()
+        return resume_info
+
+    def update_resume_info(self,
+                           text: str,
+                           previous: ResumeInfo,
+                           previous_text: Optional[str] = None,
+                           phases: Optional[Dict[str, float]] = None,
+                           max_changed_ratio: float = DEFAULT_MAX_CHANGED_RATIO,
+                           deadline: Optional[Deadline] = None) -> ResumeInfo:
+        """
+        이전 추출 결과를 바탕으로 새 버전 이력서를 증분 재추출
+
+        이전 텍스트와 섹션 단위로 비교해 바뀐 섹션만 모델에 보내고 결과를 이전 값에 병합합니다.
+        섹션을 찾지 못했거나 바뀐 분량이 max_changed_ratio를 넘으면 전체를 다시 추출합니다.
+        결과 metadata['incremental']에 바뀐/삭제된/재사용한 섹션이 기록됩니다.
+
+        Args:
+            text: 새 버전 이력서 텍스트
+            previous: 이전 버전의 추출 결과
+            previous_text: 이전 버전 텍스트 (None이면 잘리지 않은 previous.raw_text)
+            phases: 호출 전에 측정한 단계별 소요 시간
+            max_changed_ratio: 증분 추출을 적용할 최대 변경 비율 (0.0 ~ 1.0)
+            deadline: 이력서 처리 마감 시간
+        """
+        previous_text = previous_text if previous_text is not None else full_raw_text(previous)
+        if self.engine == 'heuristic' or not previous_text:
+            return self.extract_resume_info(text, phases=phases, deadline=deadline)
+
+        diff = diff_sections(previous_text, text, self.heuristic)
+        if needs_full_extraction(diff, max_changed_ratio):
+            logger.debug("변경 비율 %.2f: 전체 재추출", diff.changed_ratio)
+            resume_info = self.extract_resume_info(text, phases=phases, deadline=deadline)
+            resume_info.metadata['incremental'] = None
+            return resume_info
+
+        requested = tuple(f for f in self._resolve_fields(diff.fields) if f in self.fields)
+        if requested:
+            partial = self.extract_resume_info(
+                diff.changed_text, fields=requested, phases=phases, deadline=deadline
             )
-            
+        else:
+            # 바뀐 섹션이 없으면 모델 호출 없이 텔레메트리만 기록
+            metrics = self._new_metrics('', phases)
+            partial = ResumeInfo(metadata=self._emit_metrics(metrics, time.perf_counter(), phases).to_dict())
+        logger.debug("증분 재추출: 변경 %s, 삭제 %s", diff.changed, diff.removed)
+        return merge_resume_info(previous, partial, diff, text)
+
+    def _extract(self,
+                 text: str,
+                 requested: Tuple[str, ...],
+                 metrics: CallMetrics,
+                 deadline: Optional[Deadline] = None) -> ResumeInfo:
+        """엔진/라우터 설정에 따라 추출 (예외는 ExtractionError 계열로 변환)"""
+        if deadline is not None:
+            deadline.check(EXTRACT)
+        if self.engine == 'heuristic':
+            try:
+                with metrics.phase('heuristic'):
+                    return self.heuristic.extract(text)
+            except Exception as e:
+                logger.error("휴리스틱 추출 중 오류: %s", e)
+                raise ExtractionError(str(e)) from e
+
+        try:
+            with metrics.phase('rules'):
+                rule_contact = self._extract_rule_contact(text, requested)
+                remaining = self._remaining_fields(requested, rule_contact)
+
+            if remaining and self.router:
+                return self._extract_routed(text, requested, remaining, rule_contact, metrics, deadline)
+
+            result = None
+            if remaining:
+                result = self._call_backend(text, remaining, self.model_id, metrics, deadline)
+
             # 결과를 ResumeInfo 모델로 변환
-            resume_info = self._convert_to_resume_info(result, text)
-            
+            with metrics.phase('convert'):
+                resume_info = self._convert_to_resume_info(result, text, requested, rule_contact)
+
             return resume_info
-            
+
         except Exception as e:
-            logger.error(f"LangExtract 추출 중 오류: {str(e)}")
-            if "api" in str(e).lower() or "key" in str(e).lower():
-                raise LangExtractAPIError(str(e))
-            raise ExtractionError(str(e))
-    
-    def _get_extraction_prompt(self) -> str:
-        """추출 작업을 위한 프롬프트 반환"""
-        return """
-        다음 이력서 텍스트에서 구조화된 정보를 추출해주세요:
-        
-        - 개인 정보 (이름, 연락처)
-        - 연락처 (이메일, 전화번호, 주소, LinkedIn, GitHub, 웹사이트)
-        - 요약/자기소개
-        - 기술/스킬
-        - 경력 사항 (회사명, 직책, 기간, 업무 설명, 사용 기술)
-        - 학력 (기관명, 학위, 전공, 기간, 성적, 설명)
-        - 프로젝트 경험 (프로젝트명, 설명, 사용 기술, 기간, URL, 역할)
-        - 자격증 (자격증명, 발급기관, 취득일, 만료일, 자격증 ID, URL)
-        - 언어 능력
-        
-        정확한 정보만 추출하고, 없는 정보는 추측하지 마세요.
+            self._raise_extraction_error(e)
+
+    def _new_metrics(self, text: str, phases: Optional[Dict[str, float]]) -> CallMetrics:
+        """호출 텔레메트리 초기화"""
+        return CallMetrics(
+            engine=self.engine,
+            input_chars=len(text),
+            phases=dict(phases or {}),
+        )
+
+    def _emit_metrics(self,
+                      metrics: CallMetrics,
+                      started: float,
+                      phases: Optional[Dict[str, float]]) -> CallMetrics:
+        """총 소요 시간을 확정하고 metrics_sink로 전달"""
+        metrics.finish(time.perf_counter() - started + sum((phases or {}).values()))
+        if self.metrics_sink:
+            try:
+                self.metrics_sink.record(metrics)
+            except Exception as e:
+                logger.warning("텔레메트리 기록 실패: %s", e)
+        return metrics
+
+    def _call_backend(self,
+                      text: str,
+                      fields: Tuple[str, ...],
+                      model_id: str,
+                      metrics: Optional[CallMetrics] = None,
+                      deadline: Optional[Deadline] = None) -> Any:
+        """요청 필드에 맞는 프롬프트/예제로 백엔드 호출"""
+        # 추출 작업 정의
+        prompt = self._get_extraction_prompt(fields)
+        examples = self._get_extraction_examples(fields)
+
+        if metrics is None:
+            return self._invoke_backend(text, prompt, examples, model_id, deadline)
+
+        # 백엔드를 통한 정보 추출
+        self._count_model_call(metrics, text, prompt, model_id)
+        with metrics.phase('model'):
+            result = self._invoke_backend(text, prompt, examples, model_id, deadline)
+        metrics.add_usage(result)
+        return result
+
+    @staticmethod
+    def _count_model_call(metrics: CallMetrics, text: str, prompt: str, model_id: str) -> None:
+        """모델 호출 한 번(청크 하나)의 모델/호출 수/추정 입력 토큰 기록"""
+        metrics.model_id = model_id
+        metrics.model_calls += 1
+        metrics.chunk_count += 1
+        metrics.estimated_tokens += estimate_tokens(prompt) + estimate_tokens(text)
+
+    def _invoke_backend(self,
+                        text: str,
+                        prompt: str,
+                        examples: List[Any],
+                        model_id: str,
+                        deadline: Optional[Deadline] = None) -> Any:
         """
-    
-    def _get_extraction_examples(self) -> List[lx.data.ExampleData]:
-        """추출 예제 데이터 반환"""
+        백엔드 호출 (caller가 있으면 마감 시간/헤지 적용)
+
+        deadline이 있으면 caller의 호출당 마감 시간을 남은 시간 이하로 줄입니다.
+        caller가 없으면 호출 중에는 끊을 수 없으므로 호출 전후에만 확인합니다.
+        """
+        with span(LLM, model_id=model_id, chars=len(text), prompt_chars=len(prompt)) as s:
+            if deadline is not None and self.caller:
+                timeout = deadline.timeout(EXTRACT, self.caller.timeout)
+                try:
+                    result = self.caller.call_within(timeout, self.backend.extract, text, prompt, examples, model_id)
+                except ExtractionTimeoutError as e:
+                    if deadline.expired and not isinstance(e, DeadlineExceededError):
+                        raise DeadlineExceededError(deadline.seconds, EXTRACT) from e
+                    raise
+            elif self.caller:
+                result = self.caller.call(self.backend.extract, text, prompt, examples, model_id)
+            else:
+                if deadline is not None:
+                    deadline.check(EXTRACT)
+                result = self.backend.extract(text, prompt, examples, model_id)
+                if deadline is not None:
+                    deadline.check(EXTRACT)
+            s.set('extractions', len(getattr(result, 'extractions', None) or ()))
+        return result
+
+    def _extract_routed(self,
+                        text: str,
+                        requested: Tuple[str, ...],
+                        remaining: Tuple[str, ...],
+                        rule_contact: Dict[str, str],
+                        metrics: CallMetrics,
+                        deadline: Optional[Deadline] = None) -> ResumeInfo:
+        """
+        라우터가 고른 모델로 추출하고, 저렴한 모델 결과가 검증에 실패하거나
+        필수 필드가 비어 있으면 강한 모델로 한 번 더 추출합니다.
+        """
+        route, model_id = self.router.choose(text)
+        metrics.route = route
+        started = time.perf_counter()
+        reason = None
+        try:
+            result = self._call_backend(text, remaining, model_id, metrics, deadline)
+            with metrics.phase('convert'):
+                resume_info = self._convert_to_resume_info(result, text, requested, rule_contact)
+            if route == CHEAP:
+                if self.trusted:
+                    # trusted 결과는 생성 시 검증되지 않으므로 escalation 판단 전에 검증
+                    self._check_valid(resume_info)
+                reason = self.router.escalation_reason(resume_info, remaining)
+        except ExtractionTimeoutError:
+            raise
+        except ExtractionError:
+            if route != CHEAP:
+                raise
+            reason = REASON_VALIDATION
+        self.router.record(route, time.perf_counter() - started, reason)
+
+        if reason is None:
+            return resume_info
+
+        logger.debug("강한 모델로 escalation: %s (%s)", self.router.strong_model_id, reason)
+        metrics.route = ESCALATED
+        started = time.perf_counter()
+        result = self._call_backend(text, remaining, self.router.strong_model_id, metrics, deadline)
+        with metrics.phase('convert'):
+            resume_info = self._convert_to_resume_info(result, text, requested, rule_contact)
+        self.router.record(ESCALATED, time.perf_counter() - started)
+        return resume_info
+
+    @staticmethod
+    def _check_valid(resume_info: ResumeInfo) -> None:
+        """trusted로 만든 결과 검증 (실패하면 ExtractionError)"""
+        try:
+            validate_resume_info(resume_info)
+        except ValidationError as e:
+            raise ExtractionError(f"결과 검증 오류: {e}") from e
+
+    def stream_resume_info(self,
+                           text: str,
+                           fields: Optional[Iterable[str]] = None,
+                           chunk_chars: int = 2000,
+                           max_workers: int = 4,
+                           phases: Optional[Dict[str, float]] = None,
+                           deadline: Optional[Deadline] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        텍스트에서 이력서 정보를 추출하며 부분 결과를 (이벤트 종류, 데이터)로 내보냅니다.
+
+        정규식 연락처를 먼저 내보낸 뒤, 텍스트를 청크로 나누어 병렬로 모델을 호출하고
+        완료되는 순서대로 청크 결과를 내보냅니다. 마지막으로 모든 청크를 문서 순서로
+        합쳐 변환한 ResumeInfo를 내보냅니다.
+
+        Args:
+            text: 이력서 텍스트
+            fields: 추출할 필드 목록 (None이면 프로세서 설정)
+            chunk_chars: 청크 최대 문자 수 (작을수록 첫 결과가 빠르지만 호출 수 증가)
+            max_workers: 동시에 호출할 청크 수
+            phases: 호출 전에 측정한 단계별 소요 시간 (다운로드, 파싱 등)
+            deadline: 이력서 처리 마감 시간 (청크 호출은 남은 시간까지만 기다림)
+        """
+        requested = self._resolve_fields(fields) if fields is not None else self.fields
+        started = time.perf_counter()
+        metrics = self._new_metrics(text, phases)
+
+        try:
+            if deadline is not None:
+                deadline.check(EXTRACT)
+            with metrics.phase('rules'):
+                rule_contact = self._extract_rule_contact(text, requested)
+            yield CONTACT, self._make(ContactInfo, **rule_contact)
+
+            if self.engine == 'heuristic':
+                with metrics.phase('heuristic'):
+                    resume_info = self.heuristic.extract(text)
+                resume_info.metadata = self._emit_metrics(metrics, started, phases).to_dict()
+                yield RESULT, resume_info
+                return
+
+            remaining = self._remaining_fields(requested, rule_contact)
+            chunk_results: Dict[int, List[Any]] = {}
+
+            if remaining:
+                prompt = self._get_extraction_prompt(remaining)
+                examples = self._get_extraction_examples(remaining)
+                chunks = split_into_chunks(text, chunk_chars)
+                for _, chunk in chunks:
+                    self._count_model_call(metrics, chunk, prompt, self.model_id)
+
+                model_started = time.perf_counter()
+                pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks))))
+                try:
+                    futures = {
+                        pool.submit(self._invoke_backend, chunk, prompt, examples, self.model_id, deadline):
+                            (index, offset)
+                        for index, (offset, chunk) in enumerate(chunks)
+                    }
+                    for future in self._as_completed(futures, deadline):
+                        index, offset = futures[future]
+                        result = future.result()
+                        metrics.add_usage(result)
+                        extractions = self._shift_extractions(result, offset)
+                        chunk_results[index] = extractions
+                        yield CHUNK, ChunkExtraction(
+                            index=index,
+                            offset=offset,
+                            extractions=extractions,
+                            fields=self._parse_langextract_result(
+                                lx.data.AnnotatedDocument(extractions=extractions)
+                            ),
+                        )
+                finally:
+                    # 소비자가 중간에 멈추면 대기 중인 청크 호출은 취소
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    metrics.phases['model'] = time.perf_counter() - model_started
+
+            with metrics.phase('convert'):
+                merged = lx.data.AnnotatedDocument(
+                    text=text,
+                    extractions=[
+                        extraction
+                        for index in sorted(chunk_results)
+                        for extraction in chunk_results[index]
+                    ],
+                )
+                resume_info = self._convert_to_resume_info(merged, text, requested, rule_contact)
+            resume_info.metadata = self._emit_metrics(metrics, started, phases).to_dict()
+            yield RESULT, resume_info
+
+        except Exception as e:
+            try:
+                self._raise_extraction_error(e)
+            except Exception as converted:
+                metrics.error = type(converted).__name__
+                self._emit_metrics(metrics, started, phases)
+                raise
+
+    @staticmethod
+    def _as_completed(futures: Iterable[Future], deadline: Optional[Deadline]) -> Iterator[Future]:
+        """완료 순서대로 반환하되 마감 시간이 지나면 DeadlineExceededError"""
+        if deadline is None:
+            yield from as_completed(futures)
+            return
+        try:
+            yield from as_completed(futures, timeout=deadline.timeout(EXTRACT))
+        except FutureTimeoutError:
+            # Python 3.10에서는 concurrent.futures.TimeoutError가 내장 TimeoutError와 다른 클래스
+            raise DeadlineExceededError(deadline.seconds, EXTRACT) from None
+
+    def _extract_rule_contact(self, text: str, requested: Tuple[str, ...]) -> Dict[str, str]:
+        """정규식으로 요청 필드에 해당하는 연락처 추출"""
+        if not self.contact_rules:
+            return {}
+        with span(NORMALIZE, kind='contact_rules', chars=len(text)) as s:
+            contact = {
+                field: value for field, value in self.contact_rules.extract(text).items()
+                if field in requested
+            }
+            s.set('fields', len(contact))
+        return contact
+
+    @staticmethod
+    def _shift_extractions(result: Any, offset: int) -> List[Any]:
+        """청크 기준 char_interval을 원문 기준으로 옮긴 추출 목록 반환"""
+        shifted = []
+        for extraction in getattr(result, 'extractions', None) or ():
+            extraction = copy.copy(extraction)
+            interval = extraction.char_interval
+            if offset and interval and interval.start_pos is not None:
+                extraction.char_interval = lx.data.CharInterval(
+                    start_pos=interval.start_pos + offset,
+                    end_pos=interval.end_pos + offset if interval.end_pos is not None else None,
+                )
+            shifted.append(extraction)
+        return shifted
+
+    @staticmethod
+    def _raise_extraction_error(error: Exception) -> None:
+        """예외를 ExtractionError 계열로 변환하여 발생"""
+        if isinstance(error, (LangExtractAPIError, ExtractionError)):
+            raise error
+        logger.error("LangExtract 추출 중 오류: %s", error)
+        if "api" in str(error).lower() or "key" in str(error).lower():
+            raise LangExtractAPIError(str(error))
+        raise ExtractionError(str(error))
+
+    @staticmethod
+    def _resolve_fields(fields: Optional[Iterable[str]]) -> Tuple[str, ...]:
+        """요청 필드 목록을 정규화 ('contact'는 연락처 세부 필드로 확장)"""
+        if fields is None:
+            return RESUME_FIELDS
+
+        resolved = []
+        for field in fields:
+            expanded = CONTACT_FIELDS if field == 'contact' else (field,)
+            for name in expanded:
+                if name not in RESUME_FIELDS:
+                    raise ValueError(f"지원하지 않는 필드입니다: {name}")
+                if name not in resolved:
+                    resolved.append(name)
+        return tuple(resolved)
+
+    @staticmethod
+    def _remaining_fields(requested: Tuple[str, ...], rule_contact: Dict[str, str]) -> Tuple[str, ...]:
+        """LLM으로 추출해야 할 필드 목록 반환"""
+        if all(field in RULE_CONTACT_FIELDS for field in requested):
+            return ()
+        return tuple(field for field in requested if field not in rule_contact)
+
+    def _get_extraction_prompt(self, fields: Iterable[str] = RESUME_FIELDS) -> str:
+        """추출 작업을 위한 프롬프트 반환 (요청 필드만 포함)"""
+        fields = tuple(fields)
+        lines = []
+
+        if 'name' in fields:
+            lines.append(_PROMPT_LINES['name'])
+        contact_labels = [_CONTACT_LABELS[f] for f in CONTACT_FIELDS if f in fields]
+        if contact_labels:
+            lines.append(f"- 연락처 ({', '.join(contact_labels)})")
+        for field in ('summary', 'skills', 'experience', 'education',
+                      'projects', 'certifications', 'languages'):
+            if field in fields:
+                lines.append(_PROMPT_LINES[field])
+
+        items = '\n'.join(lines)
+        return (
+            "다음 이력서 텍스트에서 구조화된 정보를 추출해주세요:\n\n"
+            f"{items}\n\n"
+            "정확한 정보만 추출하고, 없는 정보는 추측하지 마세요."
+        )
+
+    def _get_extraction_examples(self, fields: Iterable[str] = RESUME_FIELDS) -> List[lx.data.ExampleData]:
+        """추출 예제 데이터 반환 (요청 필드에 해당하는 추출만 포함)"""
+        fields = set(fields)
         examples = [
             lx.data.ExampleData(
                 text="""
@@ -86,25 +721,25 @@ class LangExtractProcessor:
                 주소: 서울특별시 강남구
                 LinkedIn: linkedin.com/in/chulsookim
                 GitHub: github.com/chulsookim
-                
+
                 ## 경력
                 ### ABC 회사 - 시니어 소프트웨어 엔지니어 (2020.01 ~ 2023.12)
                 - React, Node.js를 이용한 웹 애플리케이션 개발
                 - 마이크로서비스 아키텍처 설계 및 구현
-                
+
                 ## 학력
                 서울대학교 컴퓨터공학과 학사 (2014.03 ~ 2018.02)
                 학점: 3.8/4.0
-                
+
                 ## 기술
                 JavaScript, React, Node.js, Python, AWS
-                
+
                 ## 프로젝트
                 ### E-commerce 플랫폼 (2022.01 ~ 2022.06)
                 온라인 쇼핑몰 개발 프로젝트
                 기술: React, Node.js, MongoDB
                 역할: 프론트엔드 개발 담당
-                
+
                 ## 자격증
                 AWS Solutions Architect - Associate
                 발급기관: Amazon Web Services
@@ -137,19 +772,44 @@ class LangExtractProcessor:
                 ]
             )
         ]
-        
+
+        if fields != set(RESUME_FIELDS):
+            for example in examples:
+                example.extractions = [
+                    extraction for extraction in example.extractions
+                    if _EXAMPLE_CLASS_FIELDS.get(extraction.extraction_class) in fields
+                ]
+
         return examples
-    
-    def _convert_to_resume_info(self, langextract_result: Any, original_text: str) -> ResumeInfo:
-        """LangExtract 결과를 ResumeInfo 모델로 변환"""
+
+    def _convert_to_resume_info(self,
+                                langextract_result: Any,
+                                original_text: str,
+                                requested: Tuple[str, ...],
+                                rule_contact: Optional[Dict[str, str]] = None) -> ResumeInfo:
+        """LangExtract 결과를 ResumeInfo 모델로 변환 (규칙 기반 연락처 우선)"""
+        extractions = getattr(langextract_result, 'extractions', None) or ()
+        with span(CONVERT, extractions=len(extractions), chars=len(original_text)):
+            return self._build_resume_info(langextract_result, original_text, requested, rule_contact)
+
+    def _build_resume_info(self,
+                           langextract_result: Any,
+                           original_text: str,
+                           requested: Tuple[str, ...],
+                           rule_contact: Optional[Dict[str, str]]) -> ResumeInfo:
+        """_convert_to_resume_info 본문 (변환 오류는 ExtractionError)"""
         try:
             # LangExtract 결과에서 정보 추출
             extracted_data = self._parse_langextract_result(langextract_result)
-            
+            if rule_contact:
+                extracted_data.update(rule_contact)
+
             # ResumeInfo 객체 생성
-            resume_info = ResumeInfo(
+            resume_info = self._make(
+                ResumeInfo,
                 name=extracted_data.get('name'),
-                contact=ContactInfo(
+                contact=self._make(
+                    ContactInfo,
                     email=extracted_data.get('email'),
                     phone=extracted_data.get('phone'),
                     address=extracted_data.get('address'),
@@ -158,7 +818,7 @@ class LangExtractProcessor:
                     website=extracted_data.get('website')
                 ),
                 summary=extracted_data.get('summary'),
-                skills=extracted_data.get('skills', []),
+                skills=self._merge_skills(extracted_data.get('skills', []), original_text, requested),
                 experience=self._build_experience_list(extracted_data.get('experience', [])),
                 education=self._build_education_list(extracted_data.get('education', [])),
                 projects=self._build_projects_list(extracted_data.get('projects', [])),
@@ -167,49 +827,92 @@ class LangExtractProcessor:
                 raw_text=original_text,
                 confidence_score=extracted_data.get('confidence_score', 0.8)
             )
-            
+
             return resume_info
-            
+
         except Exception as e:
-            logger.error(f"ResumeInfo 변환 중 오류: {str(e)}")
-            raise ExtractionError(f"결과 변환 오류: {str(e)}")
-    
+            logger.error("ResumeInfo 변환 중 오류: %s", e)
+            raise ExtractionError(f"결과 변환 오류: {str(e)}") from e
+
+    def _make(self, model: Type[M], **data: Any) -> M:
+        """결과 모델 생성 (trusted면 검증 생략)"""
+        return model.trusted(**data) if self.trusted else model(**data)
+
+    def _merge_skills(self, skills: List[str], original_text: str, requested: Tuple[str, ...]) -> List[str]:
+        """기술 분류 사전이 있고 이번 호출에서 skills를 요청했으면 표기를 통일하고 원문에서 찾은 기술 추가"""
+        if self.skill_taxonomy is None or 'skills' not in requested:
+            return skills
+        return self.skill_taxonomy.merge(skills, original_text)
+
     def _parse_langextract_result(self, result: Any) -> Dict[str, Any]:
-        """LangExtract 결과를 파싱하여 딕셔너리로 변환"""
-        # LangExtract 결과의 구조에 따라 적절히 파싱
-        # 실제 구현은 LangExtract의 응답 형식에 맞춰 조정 필요
-        parsed_data = {}
-        
-        if hasattr(result, 'extractions'):
-            extractions = result.extractions
-            for extraction in extractions:
-                class_name = extraction.extraction_class.lower()
-                text = extraction.extraction_text
-                
-                # 분류별로 정보 정리
-                if '이름' in class_name or 'name' in class_name:
-                    parsed_data['name'] = text
-                elif '이메일' in class_name or 'email' in class_name:
-                    parsed_data['email'] = text
-                elif '전화' in class_name or 'phone' in class_name:
-                    parsed_data['phone'] = text
-                elif '주소' in class_name or 'address' in class_name:
-                    parsed_data['address'] = text
-                elif 'linkedin' in class_name:
-                    parsed_data['linkedin'] = text
-                elif 'github' in class_name:
-                    parsed_data['github'] = text
-                elif '기술' in class_name or 'skill' in class_name:
-                    skills = [s.strip() for s in text.split(',')]
-                    parsed_data['skills'] = skills
-        
+        """
+        LangExtract 결과를 파싱하여 딕셔너리로 변환
+
+        디스패치 테이블로 각 추출을 한 번에 분류하는 단일 선형 패스입니다.
+        경력/학력/프로젝트/자격증 추출은 char_interval 위치를 기준으로 레코드로 묶습니다.
+        같은 종류에서 이미 채워진 필드가 다시 나오거나, 직전 추출과 _RECORD_GAP 이상
+        떨어져 있으면 새 레코드를 시작합니다.
+        """
+        parsed_data: Dict[str, Any] = {}
+        records: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in _RECORD_ANCHORS}
+        last_end: Dict[str, Optional[int]] = {}
+
+        for extraction in getattr(result, 'extractions', None) or ():
+            text = (extraction.extraction_text or '').strip()
+            target = _dispatch_class(extraction.extraction_class or '')
+            if not text or target is None:
+                continue
+            kind, field = target
+
+            if kind == _SCALAR:
+                # 반복되면 첫 값 유지
+                parsed_data.setdefault(field, text)
+                continue
+
+            if kind == _LIST:
+                items = _split_list(text) if field == 'skills' else [text]
+                values = parsed_data.setdefault(field, [])
+                values.extend(item for item in items if item not in values)
+                continue
+
+            interval = extraction.char_interval
+            start = interval.start_pos if interval else None
+            end = interval.end_pos if interval else None
+
+            kind_records = records[kind]
+            current = kind_records[-1] if kind_records else None
+            previous_end = last_end.get(kind)
+            far_apart = (
+                start is not None and previous_end is not None
+                and start - previous_end > _RECORD_GAP
+            )
+            if (current is None or far_apart
+                    or (field in current and field not in _RECORD_APPEND_FIELDS)):
+                current = {}
+                kind_records.append(current)
+
+            if field == 'technologies':
+                current.setdefault(field, []).extend(_split_list(text))
+            elif field == 'description' and field in current:
+                current[field] += '\n' + text
+            else:
+                current[field] = text
+            if end is not None:
+                last_end[kind] = end
+
+        for kind, anchor_field in _RECORD_ANCHORS.items():
+            grouped = [record for record in records[kind] if anchor_field in record]
+            if grouped:
+                parsed_data[kind] = grouped
+
         return parsed_data
-    
+
     def _build_experience_list(self, experience_data: List[Dict]) -> List[ExperienceInfo]:
         """경력 정보 리스트 생성"""
         experiences = []
         for exp in experience_data:
-            experience = ExperienceInfo(
+            experience = self._make(
+                ExperienceInfo,
                 company=exp.get('company', ''),
                 position=exp.get('position', ''),
                 duration=exp.get('duration', ''),
@@ -218,12 +921,13 @@ class LangExtractProcessor:
             )
             experiences.append(experience)
         return experiences
-    
+
     def _build_education_list(self, education_data: List[Dict]) -> List[EducationInfo]:
         """학력 정보 리스트 생성"""
         educations = []
         for edu in education_data:
-            education = EducationInfo(
+            education = self._make(
+                EducationInfo,
                 institution=edu.get('institution', ''),
                 degree=edu.get('degree', ''),
                 major=edu.get('major'),
@@ -233,12 +937,13 @@ class LangExtractProcessor:
             )
             educations.append(education)
         return educations
-    
+
     def _build_projects_list(self, projects_data: List[Dict]) -> List[ProjectInfo]:
         """프로젝트 정보 리스트 생성"""
         projects = []
         for proj in projects_data:
-            project = ProjectInfo(
+            project = self._make(
+                ProjectInfo,
                 name=proj.get('name', ''),
                 description=proj.get('description', ''),
                 technologies=proj.get('technologies', []),
@@ -248,12 +953,13 @@ class LangExtractProcessor:
             )
             projects.append(project)
         return projects
-    
+
     def _build_certifications_list(self, certifications_data: List[Dict]) -> List[CertificationInfo]:
         """자격증 정보 리스트 생성"""
         certifications = []
         for cert in certifications_data:
-            certification = CertificationInfo(
+            certification = self._make(
+                CertificationInfo,
                 name=cert.get('name', ''),
                 issuer=cert.get('issuer', ''),
                 date=cert.get('date'),
@@ -0,0 +1,148 @@
+"""
+로컬 모델 제공자 대역 HTTP 서버
+
+Ollama의 /api/generate 프로토콜을 흉내내어, 실제 lx.extract 호출 경로
+(프롬프트 구성, 청크 분할, 응답 파싱, 정렬)를 네트워크 의존 없이 시험할 수 있습니다.
+
+Usage:
+    with MockProviderServer(extractions=[("이름", "김철수")]) as server:
+        backend = LangExtractBackend(**server.backend_kwargs())
+        extractor = ResumeExtractor(model_id=server.model_id, backend=backend)
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Union
+
+from .backends import CannedExtractions, LatencyDistribution, fixed_latency
+
+logger = logging.getLogger(__name__)
+
+
+class MockProviderServer:
+    """Ollama 호환 /api/generate 엔드포인트를 제공하는 로컬 HTTP 서버"""
+
+    model_id = "llama-mock:latest"
+
+    def __init__(self,
+                 extractions: CannedExtractions = (),
+                 latency: Union[float, LatencyDistribution] = 0.0,
+                 error_rate: float = 0.0,
+                 seed: Optional[int] = None,
+                 host: str = "127.0.0.1",
+                 port: int = 0):
+        """
+        Args:
+            extractions: 고정 응답 (함수인 경우 프롬프트를 인자로 받음)
+            latency: 응답 지연 시간(초) 또는 지연 시간 분포
+            error_rate: HTTP 500을 반환할 확률 (0.0 ~ 1.0)
+            seed: 난수 시드
+            host: 바인딩 주소
+            port: 포트 (0이면 임의의 빈 포트)
+        """
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate는 0.0 ~ 1.0 사이여야 합니다")
+        self.canned = extractions
+        self.latency = latency if callable(latency) else fixed_latency(latency)
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """서버 기본 URL"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def backend_kwargs(self) -> Dict[str, Any]:
+        """이 서버를 가리키는 LangExtractBackend 생성 인자"""
+        return {
+            'language_model_params': {'model_url': self.url},
+            'fence_output': False,
+            'use_schema_constraints': False,
+            'show_progress': False,
+        }
+
+    def start(self) -> 'MockProviderServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.debug("MockProviderServer 시작: %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _respond(self, prompt: str) -> Optional[str]:
+        """프롬프트에 대한 응답 본문 생성 (오류를 주입하면 None)"""
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency(self._rng))
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+
+        if delay:
+            time.sleep(delay)
+        if failed:
+            return None
+
+        items = self.canned(prompt) if callable(self.canned) else self.canned
+        output = {'extractions': [
+            {item.extraction_class: item.extraction_text} if hasattr(item, 'extraction_class')
+            else {item[0]: item[1]}
+            for item in items
+        ]}
+        return json.dumps(output, ensure_ascii=False)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.rstrip('/') != '/api/generate':
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get('content-length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+
+                output = server._respond(payload.get('prompt', ''))
+                if output is None:
+                    self.send_error(500, "mock provider error")
+                    return
+
+                body = json.dumps({
+                    'model': payload.get('model', server.model_id),
+                    'response': output,
+                    'done': True,
+                }).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("MockProviderServer: " + format, *args)
+
+        return Handler
@@ -2,11 +2,39 @@
 Data models for storing resume information
 """
 
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+M = TypeVar('M', bound='ResumeModel')
+
+
+@lru_cache(maxsize=None)
+def _required_fields(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """모델의 필수 필드 이름"""
+    return tuple(name for name, field in model.model_fields.items() if field.is_required())
+
+
+class ResumeModel(BaseModel):
+    """이력서 모델 공통 기반 (검증 없는 생성 경로 제공)"""
+
+    @classmethod
+    def trusted(cls: Type[M], **data: Any) -> M:
+        """
+        검증 없이 생성 (model_construct 사용)
+
+        내부 변환 코드가 만든, 타입이 이미 맞는 값에만 사용합니다. EmailStr 검증 등은
+        API 경계에서 validate_resume_info로 한 번 실행합니다. model_construct는 필수 필드
+        누락을 확인하지 않으므로 생성 전에 확인합니다.
+        """
+        for name in _required_fields(cls):
+            if name not in data:
+                raise ValueError(f"{cls.__name__}.{name} 필드가 필요합니다")
+        return cls.model_construct(**data)
+
 
-class ContactInfo(BaseModel):
+class ContactInfo(ResumeModel):
     """연락처 정보"""
     name: Optional[str] = None
     email: Optional[EmailStr] = None
@@ -17,26 +45,26 @@ class ContactInfo(BaseModel):
     website: Optional[str] = None
 
 
-class ExperienceInfo(BaseModel):
+class ExperienceInfo(ResumeModel):
     """경력 정보"""
     company: str
     position: str
     duration: str
     description: Optional[str] = None
     technologies: List[str] = Field(default_factory=list)
-    
 
-class EducationInfo(BaseModel):
+
+class EducationInfo(ResumeModel):
     """학력 정보"""
     institution: str
-    degree: str 
+    degree: str
     major: Optional[str] = None
     duration: str
     gpa: Optional[str] = None
     description: Optional[str] = None
 
 
-class ProjectInfo(BaseModel):
+class ProjectInfo(ResumeModel):
     """프로젝트 정보"""
     name: str
     description: str
@@ -46,7 +74,7 @@ class ProjectInfo(BaseModel):
     role: Optional[str] = None
 
 
-class CertificationInfo(BaseModel):
+class CertificationInfo(ResumeModel):
     """자격증 정보"""
     name: str
     issuer: str
@@ -56,7 +84,15 @@ class CertificationInfo(BaseModel):
     url: Optional[str] = None
 
 
-class ResumeInfo(BaseModel):
+class RawTextRef(ResumeModel):
+    """텍스트 저장소에 보관된 원문 참조 (raw_text 보관 정책 'reference'/'truncate')"""
+    sha256: str  # 원문 UTF-8의 SHA-256
+    length: int  # 원문 문자 수
+    offset: Optional[int] = None  # 저장소 안의 바이트 위치 (저장소에 보관하지 않았으면 None)
+    size: Optional[int] = None  # 저장소 안의 바이트 수
+
+
+class ResumeInfo(ResumeModel):
     """전체 이력서 정보"""
     name: Optional[str] = None
     contact: ContactInfo = Field(default_factory=ContactInfo)
@@ -68,7 +104,9 @@ class ResumeInfo(BaseModel):
     certifications: List[CertificationInfo] = Field(default_factory=list)
     languages: List[str] = Field(default_factory=list)
     raw_text: Optional[str] = None
+    raw_text_ref: Optional[RawTextRef] = None  # 원문 해시/저장소 위치 (raw_text를 줄이거나 뺀 경우)
     confidence_score: Optional[float] = None
+    metadata: Optional[Dict[str, Any]] = None  # 추출 텔레메트리 (모델, 토큰, 단계별 소요 시간 등)
 
     @field_validator('confidence_score')
     @classmethod
@@ -84,3 +122,20 @@ class ResumeInfo(BaseModel):
     def to_json(self) -> str:
         """JSON 문자열로 변환"""
         return self.model_dump_json(indent=2)
+
+
+# API 경계 검증에서 제외하고 그대로 옮기는 필드 (원문, 텔레메트리)
+_PASSTHROUGH_FIELDS = {'raw_text', 'metadata'}
+
+
+def validate_resume_info(resume_info: ResumeInfo) -> ResumeInfo:
+    """
+    trusted로 만든 결과 전체를 한 번에 검증한 새 ResumeInfo 반환
+
+    Raises:
+        pydantic.ValidationError: 잘못된 이메일, 범위를 벗어난 confidence_score 등
+    """
+    validated = ResumeInfo.model_validate(resume_info.model_dump(exclude=_PASSTHROUGH_FIELDS))
+    validated.raw_text = resume_info.raw_text
+    validated.metadata = resume_info.metadata
+    return validated
@@ -0,0 +1,252 @@
+"""
+단계별 파이프라인 배치 처리 모듈
+
+다운로드 → 파싱 → 추출 단계를 각각의 작업 스레드 풀에서 동시에 실행하고,
+단계 사이를 크기가 제한된 큐로 연결합니다. 뒷단계가 밀리면 앞단계가 큐에서
+대기하므로(backpressure) 메모리 사용량이 배치 크기와 무관하게 일정합니다.
+
+항목 하나의 실패는 BatchResult.error로 전달되고 나머지 항목 처리는 계속됩니다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# 단계 종료 신호
+_DONE = object()
+
+# 중지 여부를 확인하는 주기(초)
+_POLL_INTERVAL = 0.1
+
+
+class Stage(NamedTuple):
+    """파이프라인 단계 (fn은 항목을 받아 다음 단계로 넘길 payload를 반환)"""
+    name: str
+    fn: Callable[['PipelineItem'], Any]
+    workers: int
+
+
+class PipelineItem:
+    """파이프라인을 통과하는 항목"""
+
+    __slots__ = ('index', 'source', 'payload', 'error', 'started')
+
+    def __init__(self, index: int, source: Any):
+        self.index = index
+        self.source = source
+        self.payload: Any = None
+        self.error: Optional[Exception] = None
+        self.started = time.perf_counter()
+
+
+@dataclass
+class SourceDocument:
+    """
+    이력서 한 건의 단계 사이 상태 (ResumeExtractor.download_stage → parse_stage → extract_stage)
+
+    path가 temporary면 다운로드한 임시 파일이므로 parse_stage나 discard_stage에서 삭제됩니다.
+    """
+    source: Any
+    text: Optional[str] = None
+    path: Optional[str] = None
+    temporary: bool = False
+    phases: Dict[str, float] = field(default_factory=dict)
+    deadline: Optional[Deadline] = None
+
+
+@dataclass
+class BatchResult:
+    """배치 항목 하나의 처리 결과"""
+    index: int
+    source: Any
+    result: Any = None
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_pipeline(sources: Iterable[Any],
+                 stages: List[Stage],
+                 queue_size: int = 16,
+                 ordered: bool = False,
+                 max_in_flight: Optional[int] = None,
+                 discard: Optional[Callable[[PipelineItem], None]] = None) -> Iterator[BatchResult]:
+    """
+    sources의 각 항목을 stages 순서대로 처리하며 결과를 내보냅니다.
+
+    인자는 호출 시점에 검증하고, 처리는 반환된 이터레이터를 읽을 때 시작합니다.
+
+    Args:
+        sources: 입력 항목 (지연 iterable도 필요한 만큼만 읽음)
+        stages: 단계 목록
+        queue_size: 단계 사이 큐의 최대 크기
+        ordered: True면 입력 순서, False면 완료 순서로 반환
+        max_in_flight: 동시에 처리 중일 수 있는 최대 항목 수
+            (None이면 큐와 작업 스레드를 모두 채울 수 있는 값).
+            입력 순서 모드에서 앞 항목이 늦어질 때 재정렬 버퍼 크기도 이 값으로 제한됩니다.
+        discard: 소비자가 중간에 멈춰 내보내지 못한 항목마다 호출 (단계 사이 임시 자원 정리용)
+
+    Yields:
+        BatchResult: 항목별 결과 (실패한 항목은 error 설정)
+
+    Raises:
+        ValueError: stages가 비어 있거나, queue_size 또는 단계의 workers가 1보다 작을 때 (호출 시점)
+        sources를 읽는 중 발생한 예외는 이미 투입된 항목을 모두 내보낸 뒤 전달합니다.
+    """
+    if not stages:
+        raise ValueError("stages가 비어 있습니다")
+    if queue_size <= 0:
+        raise ValueError("queue_size는 0보다 커야 합니다")
+    for stage in stages:
+        # 작업 스레드가 없는 단계는 종료 신호를 넘기지 못해 파이프라인이 끝나지 않음
+        if stage.workers < 1:
+            raise ValueError(f"{stage.name} 단계의 작업 스레드 수는 1 이상이어야 합니다: {stage.workers}")
+    if max_in_flight is None:
+        max_in_flight = queue_size * (len(stages) + 1) + sum(stage.workers for stage in stages)
+    return _run(sources, stages, queue_size, ordered, max_in_flight, discard)
+
+
+def _run(sources: Iterable[Any],
+         stages: List[Stage],
+         queue_size: int,
+         ordered: bool,
+         max_in_flight: int,
+         discard: Optional[Callable[[PipelineItem], None]]) -> Iterator[BatchResult]:
+    """run_pipeline 본문 (인자는 검증된 상태)"""
+
+    stop = threading.Event()
+    in_flight = threading.Semaphore(max_in_flight)
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    remaining = [stage.workers for stage in stages]
+    lock = threading.Lock()
+    feed_error: List[BaseException] = []
+
+    def put(q: queue.Queue, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drop(item: Any) -> None:
+        if discard is None or item is _DONE:
+            return
+        try:
+            discard(item)
+        except Exception:
+            logger.warning("버려진 항목 정리 실패: %s", item.source, exc_info=True)
+
+    def drain(q: queue.Queue) -> None:
+        while True:
+            try:
+                drop(q.get_nowait())
+            except queue.Empty:
+                return
+
+    def get(q: queue.Queue) -> Any:
+        while not stop.is_set():
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def feed() -> None:
+        try:
+            for index, source in enumerate(sources):
+                while not in_flight.acquire(timeout=_POLL_INTERVAL):
+                    if stop.is_set():
+                        return
+                if not put(queues[0], PipelineItem(index, source)):
+                    return
+        except BaseException as e:
+            feed_error.append(e)
+        finally:
+            for _ in range(stages[0].workers):
+                put(queues[0], _DONE)
+
+    def work(position: int) -> None:
+        stage = stages[position]
+        inbox, outbox = queues[position], queues[position + 1]
+        while True:
+            item = get(inbox)
+            if item is _DONE:
+                break
+            if item.error is None:
+                try:
+                    item.payload = stage.fn(item)
+                except Exception as e:
+                    item.error = e
+            if not put(outbox, item):
+                drop(item)
+                break
+            if stop.is_set():
+                # 소비자가 큐를 비운 뒤에 넣은 항목은 이 스레드가 정리
+                drain(outbox)
+                break
+
+        # 단계의 마지막 작업 스레드가 다음 단계에 종료 신호 전달
+        with lock:
+            remaining[position] -= 1
+            last = remaining[position] == 0
+        if last:
+            next_workers = stages[position + 1].workers if position + 1 < len(stages) else 1
+            for _ in range(next_workers):
+                put(outbox, _DONE)
+
+    threads = [threading.Thread(target=feed, name="pipeline-feed", daemon=True)]
+    for position, stage in enumerate(stages):
+        threads.extend(
+            threading.Thread(target=work, args=(position,), name=f"pipeline-{stage.name}-{n}", daemon=True)
+            for n in range(stage.workers)
+        )
+    for thread in threads:
+        thread.start()
+
+    def to_result(item: PipelineItem) -> BatchResult:
+        return BatchResult(
+            index=item.index,
+            source=item.source,
+            result=item.payload if item.error is None else None,
+            error=item.error,
+            elapsed=time.perf_counter() - item.started,
+        )
+
+    pending = {}
+    next_index = 0
+    try:
+        while True:
+            item = get(queues[-1])
+            if item is _DONE:
+                break
+            if not ordered:
+                yield to_result(item)
+                in_flight.release()
+                continue
+            pending[item.index] = item
+            while next_index in pending:
+                yield to_result(pending.pop(next_index))
+                in_flight.release()
+                next_index += 1
+
+        if feed_error:
+            raise feed_error[0]
+    finally:
+        # 소비자가 중간에 멈추면 모든 단계를 중지하고 큐에 남은 항목 정리
+        stop.set()
+        for q in queues:
+            drain(q)
+        for item in pending.values():
+            drop(item)
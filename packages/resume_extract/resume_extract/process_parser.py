@@ -0,0 +1,158 @@
+"""
+프로세스 풀 파싱 모듈
+
+pypdf, BeautifulSoup, python-docx 파싱은 CPU 작업이라 스레드로는 GIL에 막혀
+병렬화되지 않습니다. ProcessPoolParser는 FileParser 작업을 코어 수만큼의 프로세스에서
+실행하고, 모델 호출은 기존처럼 스레드 풀(extract_many)이나 이벤트 루프(aextract_*)에서
+실행합니다.
+
+파싱된 텍스트는 작업 프로세스가 공유 메모리 블록에 UTF-8로 기록하고, 부모 프로세스는
+블록 이름과 길이만 받아 직접 디코딩합니다. 텍스트 자체는 pickle되지 않습니다.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Tuple
+
+from .deadline import PARSE as PARSE_STAGE
+from .deadline import Deadline
+from .exceptions import DeadlineExceededError, ParseError, UnsupportedFileTypeError
+from .instrumentation import PARSE, span
+from .parsers import FileParser
+
+logger = logging.getLogger(__name__)
+
+# 작업 프로세스별 FileParser (프로세스 초기화 시 생성)
+_worker_parser: Optional[FileParser] = None
+
+# 작업 결과: ('ok', 공유 메모리 이름, 바이트 수) 또는 ('unsupported', 파일 형식) / ('parse', 경로, 상세)
+ParseOutcome = Tuple[str, ...]
+
+
+def _init_worker() -> None:
+    global _worker_parser
+    _worker_parser = FileParser()
+
+
+def _parse_to_shared_memory(file_path: str, content_type: Optional[str]) -> ParseOutcome:
+    """작업 프로세스: 파일을 파싱해 공유 메모리에 기록 (예외는 구조화된 값으로 반환)"""
+    try:
+        text = (_worker_parser or FileParser()).parse(file_path, content_type)
+    except UnsupportedFileTypeError as e:
+        return ('unsupported', e.file_type)
+    except ParseError as e:
+        return ('parse', e.file_path, e.details or '')
+    except Exception as e:
+        return ('parse', file_path, str(e))
+
+    data = text.encode('utf-8')
+    shm = SharedMemory(create=True, size=max(1, len(data)))
+    try:
+        shm.buf[:len(data)] = data
+        return ('ok', shm.name, len(data))
+    finally:
+        # 블록 삭제(unlink)는 읽은 뒤 부모 프로세스가 담당
+        shm.close()
+
+
+def _read_outcome(outcome: ParseOutcome) -> str:
+    """작업 결과를 텍스트로 변환 (공유 메모리는 읽은 뒤 삭제)"""
+    kind = outcome[0]
+    if kind == 'unsupported':
+        raise UnsupportedFileTypeError(outcome[1])
+    if kind == 'parse':
+        raise ParseError(outcome[1], outcome[2] or None)
+
+    _, name, size = outcome
+    shm = SharedMemory(name=name)
+    try:
+        with shm.buf[:size] as view:
+            return str(view, 'utf-8')
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _discard_outcome(future: 'Future[ParseOutcome]') -> None:
+    """기다리지 않기로 한 작업이 끝나면 공유 메모리 블록만 정리"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    outcome = future.result()
+    if outcome[0] == 'ok':
+        try:
+            shm = SharedMemory(name=outcome[1])
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+
+
+class ProcessPoolParser:
+    """
+    FileParser와 같은 인터페이스로 파싱을 프로세스 풀에서 실행하는 파서
+
+    ResumeExtractor(parse_processes=N)로 사용하면 extract_from_file, extract_from_url,
+    extract_many의 파싱 단계가 모두 이 파서를 거칩니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, start_method: str = 'spawn'):
+        """
+        Args:
+            max_workers: 작업 프로세스 수 (None이면 CPU 코어 수)
+            start_method: 프로세스 시작 방식 (스레드가 있는 프로세스에서 안전한 'spawn' 기본)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+        )
+
+    def submit(self, file_path: str, content_type: Optional[str] = None) -> 'Future[ParseOutcome]':
+        """파싱 작업 제출 (결과는 read_result로 텍스트 변환)"""
+        return self._executor.submit(_parse_to_shared_memory, str(file_path), content_type)
+
+    @staticmethod
+    def read_result(future: 'Future[ParseOutcome]') -> str:
+        """제출한 작업의 텍스트 반환"""
+        return _read_outcome(future.result())
+
+    def parse(self,
+              file_path: str,
+              content_type: Optional[str] = None,
+              deadline: Optional[Deadline] = None) -> str:
+        """
+        파일을 텍스트로 변환 (작업 프로세스에서 파싱하고 완료될 때까지 대기)
+
+        deadline이 있으면 남은 시간까지만 기다립니다. 시간이 다 되면 대기 중인 작업은
+        취소하고, 이미 실행 중인 작업은 끝난 뒤 결과를 버립니다.
+        """
+        with span(PARSE, process=True) as s:
+            if deadline is None:
+                text = self.read_result(self.submit(file_path, content_type))
+            else:
+                wait_for = deadline.timeout(PARSE_STAGE)
+                future = self.submit(file_path, content_type)
+                try:
+                    outcome = future.result(timeout=wait_for)
+                except FutureTimeoutError:
+                    if not future.cancel():
+                        future.add_done_callback(_discard_outcome)
+                    raise DeadlineExceededError(deadline.seconds, PARSE_STAGE) from None
+                text = _read_outcome(outcome)
+            s.set('chars', len(text))
+        return text
+
+    def close(self) -> None:
+        """작업 프로세스 종료"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
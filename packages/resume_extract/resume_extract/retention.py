@@ -0,0 +1,196 @@
+"""
+raw_text 보관 정책 모듈
+
+ResumeInfo.raw_text는 파싱된 원문 전체라 대량 처리에서 결과 메모리의 상당 부분을 차지하고
+to_json 출력도 키웁니다. RawTextRetention은 추출이 끝난 결과의 원문을 다음 중 하나로 보관합니다.
+
+- 'full': 원문 전체 유지 (기본값, 기존 동작)
+- 'truncate': 앞부분 max_chars 문자만 유지하고 raw_text_ref에 원문 해시/길이 기록
+- 'reference': 원문은 TextStore에 한 번만 저장하고 raw_text_ref에 해시와 저장소 위치만 기록
+- 'drop': 원문을 보관하지 않음
+
+Usage:
+    store = FileTextStore("texts.bin")
+    extractor = ResumeExtractor(raw_text_retention=RawTextRetention('reference', store=store))
+    info = extractor.extract_from_file("resume.pdf")
+    text = store.get(info.raw_text_ref)
+"""
+
+import hashlib
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple, Union
+
+from .models import RawTextRef, ResumeInfo
+
+FULL = 'full'
+TRUNCATE = 'truncate'
+REFERENCE = 'reference'
+DROP = 'drop'
+
+RETENTION_MODES = (FULL, TRUNCATE, REFERENCE, DROP)
+
+# 'truncate'에서 유지할 기본 문자 수
+DEFAULT_MAX_CHARS = 2000
+
+
+def text_digest(text: str) -> str:
+    """원문 UTF-8의 SHA-256 (16진수)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class TextStore(ABC):
+    """원문 저장소 (같은 원문은 한 번만 저장)"""
+
+    @abstractmethod
+    def put(self, text: str) -> RawTextRef:
+        """원문을 저장하고 참조 반환"""
+
+    @abstractmethod
+    def get(self, ref: RawTextRef) -> str:
+        """참조가 가리키는 원문 반환 (없으면 KeyError)"""
+
+    def close(self) -> None:  # noqa: B027 - 정리할 리소스가 없는 저장소는 재정의하지 않음
+        """리소스 정리"""
+
+
+class InMemoryTextStore(TextStore):
+    """해시를 키로 원문을 메모리에 보관하는 저장소 (테스트, 단일 프로세스용)"""
+
+    def __init__(self):
+        self._texts: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def put(self, text: str) -> RawTextRef:
+        digest = text_digest(text)
+        with self._lock:
+            self._texts.setdefault(digest, text)
+        return RawTextRef(sha256=digest, length=len(text))
+
+    def get(self, ref: RawTextRef) -> str:
+        with self._lock:
+            return self._texts[ref.sha256]
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+
+class FileTextStore(TextStore):
+    """
+    원문을 하나의 파일에 UTF-8로 이어 붙이는 저장소
+
+    참조에는 파일 안의 바이트 위치(offset, size)가 기록되므로, 다른 프로세스나 다음 실행에서도
+    참조만으로 원문을 읽을 수 있습니다. 중복 저장 방지는 이 인스턴스가 저장한 원문에만 적용됩니다.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._file = open(self.path, 'ab')
+        self._index: Dict[str, Tuple[int, int]] = {}
+
+    def put(self, text: str) -> RawTextRef:
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            location = self._index.get(digest)
+            if location is None:
+                location = (self._file.tell(), len(data))
+                self._file.write(data)
+                self._file.flush()
+                self._index[digest] = location
+        offset, size = location
+        return RawTextRef(sha256=digest, length=len(text), offset=offset, size=size)
+
+    def get(self, ref: RawTextRef) -> str:
+        if ref.offset is None or ref.size is None:
+            raise KeyError(ref.sha256)
+        with open(self.path, 'rb') as f:
+            f.seek(ref.offset)
+            data = f.read(ref.size)
+        if hashlib.sha256(data).hexdigest() != ref.sha256:
+            raise KeyError(ref.sha256)
+        return data.decode('utf-8')
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class RawTextRetention:
+    """추출 결과의 raw_text 보관 정책"""
+
+    def __init__(self,
+                 mode: str = FULL,
+                 max_chars: int = DEFAULT_MAX_CHARS,
+                 store: Optional[TextStore] = None):
+        """
+        Args:
+            mode: 'full', 'truncate', 'reference', 'drop'
+            max_chars: 'truncate'에서 유지할 앞부분 문자 수
+            store: 원문 저장소 ('reference'는 필수, 'truncate'는 지정하면 원문 전체도 저장)
+        """
+        if mode not in RETENTION_MODES:
+            raise ValueError(f"지원하지 않는 raw_text 보관 정책입니다: {mode}")
+        if mode == REFERENCE and store is None:
+            raise ValueError("'reference' 정책에는 store가 필요합니다")
+        if max_chars < 0:
+            raise ValueError("max_chars는 0 이상이어야 합니다")
+        self.mode = mode
+        self.max_chars = max_chars
+        self.store = store
+
+    @classmethod
+    def coerce(cls, value: Union[str, 'RawTextRetention', None]) -> 'RawTextRetention':
+        """None(전체 유지), 정책 이름, RawTextRetention을 RawTextRetention으로 변환"""
+        if isinstance(value, RawTextRetention):
+            return value
+        return cls(value or FULL)
+
+    def apply(self, resume_info: ResumeInfo, text: Optional[str] = None) -> ResumeInfo:
+        """
+        정책에 따라 resume_info의 raw_text/raw_text_ref를 바꾸고 그대로 반환
+
+        Args:
+            resume_info: 추출 결과 (제자리에서 수정)
+            text: 원문 (None이면 resume_info.raw_text)
+        """
+        text = resume_info.raw_text if text is None else text
+        if text is None or self.mode == FULL:
+            return resume_info
+
+        if self.mode == DROP:
+            resume_info.raw_text = None
+            resume_info.raw_text_ref = None
+        elif self.mode == REFERENCE:
+            resume_info.raw_text = None
+            resume_info.raw_text_ref = self.store.put(text)
+        else:
+            resume_info.raw_text = text[:self.max_chars]
+            resume_info.raw_text_ref = (
+                self.store.put(text) if self.store else RawTextRef(sha256=text_digest(text), length=len(text))
+            )
+        return resume_info
+
+    def resolve(self, resume_info: ResumeInfo) -> Optional[str]:
+        """결과의 원문 전체 (이 정책의 저장소로 찾을 수 없으면 None)"""
+        return full_raw_text(resume_info, self.store)
+
+
+def full_raw_text(resume_info: ResumeInfo, store: Optional[TextStore] = None) -> Optional[str]:
+    """
+    잘리지 않은 원문 반환
+
+    raw_text가 원문 전체면 그대로, 잘렸거나 없으면 store에서 찾고, 찾을 수 없으면 None.
+    """
+    ref = resume_info.raw_text_ref
+    text = resume_info.raw_text
+    if text is not None and (ref is None or len(text) == ref.length):
+        return text
+    if ref is not None and store is not None:
+        try:
+            return store.get(ref)
+        except KeyError:
+            return None
+    return None
@@ -0,0 +1,127 @@
+"""
+모델 라우팅 모듈
+
+짧거나 구조가 명확한 이력서는 빠르고 저렴한 모델로 먼저 처리하고,
+검증에 실패하거나 필수 필드가 비어 있을 때만 강한 모델로 재시도(escalation)합니다.
+경로별 지연 시간과 escalation 비율을 집계하여 임계값 조정에 사용합니다.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+
+from .heuristic import HeuristicExtractor
+
+# 경로 이름
+CHEAP = 'cheap'          # 저렴한 모델로 처음 처리
+STRONG = 'strong'        # 길거나 구조가 불명확해 처음부터 강한 모델로 처리
+ESCALATED = 'escalated'  # 저렴한 모델 결과가 부족해 강한 모델로 재시도
+
+# escalation 사유
+REASON_VALIDATION = 'validation'
+REASON_MISSING_FIELDS = 'missing_fields'
+
+_CONTACT_SUBFIELDS = ('email', 'phone', 'address', 'linkedin', 'github', 'website')
+
+
+class RouteStats:
+    """경로 하나의 호출 수, escalation 수, 최근 지연 시간"""
+
+    def __init__(self, window: int):
+        self.calls = 0
+        self.escalations = 0
+        self.reasons: Dict[str, int] = {}
+        self.latencies: Deque[float] = deque(maxlen=window)
+
+    def summary(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+
+        def percentile(q: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        return {
+            'calls': self.calls,
+            'escalations': self.escalations,
+            'escalation_rate': self.escalations / self.calls if self.calls else 0.0,
+            'reasons': dict(self.reasons),
+            'latency_avg': sum(latencies) / len(latencies) if latencies else None,
+            'latency_p50': percentile(0.50),
+            'latency_p95': percentile(0.95),
+        }
+
+
+class ModelRouter:
+    """저렴한 모델 우선 캐스케이드 라우터"""
+
+    def __init__(self,
+                 cheap_model_id: str = "gemini-2.0-flash-lite",
+                 strong_model_id: str = "gemini-2.5-flash",
+                 max_cheap_chars: int = 6000,
+                 min_sections: int = 3,
+                 required_fields: Iterable[str] = ('name', 'skills'),
+                 latency_window: int = 1000):
+        """
+        Args:
+            cheap_model_id: 먼저 시도할 빠르고 저렴한 모델
+            strong_model_id: escalation 시 사용할 강한 모델
+            max_cheap_chars: 저렴한 모델로 보낼 최대 텍스트 길이
+            min_sections: 저렴한 모델로 보내기 위해 필요한 인식 가능한 섹션 제목 수
+            required_fields: 비어 있으면 escalation하는 필드 (연락처 세부 필드 포함 가능)
+            latency_window: 경로별로 보관할 최근 지연 시간 개수
+        """
+        self.cheap_model_id = cheap_model_id
+        self.strong_model_id = strong_model_id
+        self.max_cheap_chars = max_cheap_chars
+        self.min_sections = min_sections
+        self.required_fields = tuple(required_fields)
+        self._sections = HeuristicExtractor()
+        self._lock = threading.Lock()
+        self._stats = {route: RouteStats(latency_window) for route in (CHEAP, STRONG, ESCALATED)}
+
+    def choose(self, text: str) -> Tuple[str, str]:
+        """텍스트에 맞는 (경로, 모델 ID) 선택"""
+        if len(text) <= self.max_cheap_chars and self.count_sections(text) >= self.min_sections:
+            return CHEAP, self.cheap_model_id
+        return STRONG, self.strong_model_id
+
+    def count_sections(self, text: str) -> int:
+        """인식 가능한 섹션 제목 종류 수 (구조화 정도)"""
+        return len({
+            section for section in map(self._sections.match_heading, text.splitlines())
+            if section
+        })
+
+    def escalation_reason(self, resume_info: Any, requested: Iterable[str]) -> Optional[str]:
+        """요청된 필수 필드가 비어 있으면 escalation 사유 반환"""
+        requested = set(requested)
+        for field in self.required_fields:
+            if field not in requested:
+                continue
+            owner = resume_info.contact if field in _CONTACT_SUBFIELDS else resume_info
+            if not getattr(owner, field, None):
+                return REASON_MISSING_FIELDS
+        return None
+
+    def record(self, route: str, latency: float, reason: Optional[str] = None) -> None:
+        """
+        경로 호출 결과 기록
+
+        Args:
+            route: 경로 이름
+            latency: 모델 호출과 변환에 걸린 시간(초)
+            reason: 이 호출 이후 escalation한 경우 사유
+        """
+        with self._lock:
+            stats = self._stats[route]
+            stats.calls += 1
+            stats.latencies.append(latency)
+            if reason:
+                stats.escalations += 1
+                stats.reasons[reason] = stats.reasons.get(reason, 0) + 1
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """경로별 호출 수, escalation 비율, 지연 시간 통계"""
+        with self._lock:
+            return {route: stats.summary() for route, stats in self._stats.items()}
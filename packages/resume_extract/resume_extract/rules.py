@@ -0,0 +1,164 @@
+"""
+정규식 기반 연락처 사전 추출 모듈
+
+이메일, 전화번호, LinkedIn, GitHub, 웹사이트처럼 형식이 정해진 필드는
+LLM 호출 없이 컴파일된 정규식으로 추출합니다.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from pydantic import EmailStr, TypeAdapter, ValidationError
+
+from .models import ContactInfo
+
+# 규칙으로 추출 가능한 ContactInfo 필드
+RULE_CONTACT_FIELDS = ('email', 'phone', 'linkedin', 'github', 'website')
+
+# 난독화된 이메일 복원용 패턴 (예: name [at] domain [dot] com, name(골뱅이)domain.com)
+_OBFUSCATED_AT = re.compile(
+    r'\s*(?:[\[\(\{<]\s*(?:at|골뱅이|앳)\s*[\]\)\}>]|＠)\s*', re.IGNORECASE
+)
+_OBFUSCATED_DOT = re.compile(
+    r'\s*[\[\(\{<]\s*(?:dot|점|닷)\s*[\]\)\}>]\s*', re.IGNORECASE
+)
+_SPELLED_EMAIL = re.compile(
+    r'\b([A-Za-z0-9._%+-]+)\s+at\s+([A-Za-z0-9-]+(?:\s+dot\s+[A-Za-z0-9-]+)+)\b',
+    re.IGNORECASE,
+)
+_SPELLED_DOT = re.compile(r'\s+dot\s+', re.IGNORECASE)
+
+_EMAIL = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}')
+
+# 정규식 후보를 ContactInfo.email과 같은 기준으로 검증 ('john..doe@', '.kim@', '@corp.local' 등 제외)
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
+
+# 한국 전화번호: 휴대폰(010 등), 지역번호(02, 031 ...), 인터넷전화(070), +82 국가번호
+_PHONE = re.compile(
+    r'(?<![\d.])'
+    r'(?:\+\s?82[-.\s]?\(?0?|\(?0)'
+    r'(1[016789]|2|3[1-3]|4[1-4]|5[1-5]|6[1-4]|70|50[2-8])'
+    r'\)?[-.\s]?(\d{3,4})[-.\s]?(\d{4})'
+    r'(?![\d.])'
+)
+
+_LINKEDIN = re.compile(
+    r'(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[A-Za-z0-9_%-]+',
+    re.IGNORECASE,
+)
+_GITHUB = re.compile(
+    r'(?:https?://)?(?:www\.)?github\.com/([A-Za-z0-9](?:[A-Za-z0-9-]{0,38}))(/[^\s,)]*)?',
+    re.IGNORECASE,
+)
+_LABELED_WEBSITE = re.compile(
+    r'(?:웹사이트|홈페이지|블로그|포트폴리오|website|homepage|blog|portfolio)\s*[:：]\s*'
+    r'((?:https?://)?[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+(?:/[^\s,)]*)?)',
+    re.IGNORECASE,
+)
+_URL = re.compile(r'(?:https?://|www\.)[^\s<>"\',)]+', re.IGNORECASE)
+
+_SOCIAL_DOMAINS = ('linkedin.com', 'github.com')
+
+# 라벨 없는 URL을 웹사이트로 인정하는 문서 앞부분 범위 (연락처 블록)
+_HEADER_CHARS = 1000
+
+
+class ContactRuleExtractor:
+    """컴파일된 정규식으로 연락처 필드를 로컬에서 추출하는 추출기"""
+
+    def extract(self, text: str) -> Dict[str, str]:
+        """텍스트에서 찾은 연락처 필드만 딕셔너리로 반환"""
+        found = {}
+
+        email = self.find_email(text)
+        if email:
+            found['email'] = email
+
+        phone = self.find_phone(text)
+        if phone:
+            found['phone'] = phone
+
+        linkedin = _LINKEDIN.search(text)
+        if linkedin:
+            found['linkedin'] = linkedin.group(0).rstrip('/')
+
+        github = self.find_github(text)
+        if github:
+            found['github'] = github
+
+        website = self.find_website(text)
+        if website:
+            found['website'] = website
+
+        return found
+
+    def extract_contact(self, text: str) -> ContactInfo:
+        """텍스트에서 ContactInfo 생성"""
+        return ContactInfo(**self.extract(text))
+
+    def find_email(self, text: str) -> Optional[str]:
+        """
+        이메일 추출 (난독화된 표기 포함)
+
+        EmailStr 검증을 통과하지 못한 후보는 건너뛰므로, 유효한 후보가 없으면 None을 반환해
+        모델이 추출한 값을 그대로 사용합니다.
+        """
+        email = self._first_valid_email(text)
+        if email:
+            return email
+
+        deobfuscated = _OBFUSCATED_DOT.sub('.', _OBFUSCATED_AT.sub('@', text))
+        deobfuscated = _SPELLED_EMAIL.sub(
+            lambda m: f"{m.group(1)}@{_SPELLED_DOT.sub('.', m.group(2))}", deobfuscated
+        )
+        return self._first_valid_email(deobfuscated)
+
+    @staticmethod
+    def _first_valid_email(text: str) -> Optional[str]:
+        for match in _EMAIL.finditer(text):
+            try:
+                _EMAIL_ADAPTER.validate_python(match.group(0))
+            except ValidationError:
+                continue
+            return match.group(0)
+        return None
+
+    def find_phone(self, text: str) -> Optional[str]:
+        """전화번호 추출 (휴대폰 번호 우선, 하이픈 형식으로 정규화)"""
+        candidates: List[str] = []
+        for match in _PHONE.finditer(text):
+            prefix, middle, last = match.groups()
+            number = f"0{prefix}-{middle}-{last}"
+            if prefix.startswith('1'):
+                return number
+            candidates.append(number)
+        return candidates[0] if candidates else None
+
+    def find_github(self, text: str) -> Optional[str]:
+        """GitHub 프로필 추출 (저장소 URL보다 프로필 URL 우선)"""
+        fallback = None
+        for match in _GITHUB.finditer(text):
+            path = match.group(2)
+            if not path or path == '/':
+                return match.group(0).rstrip('/')
+            if fallback is None:
+                fallback = match.group(0)[:match.start(2) - match.start(0)]
+        return fallback
+
+    def find_website(self, text: str) -> Optional[str]:
+        """개인 웹사이트 추출 (라벨이 붙은 URL 우선)"""
+        for match in _LABELED_WEBSITE.finditer(text):
+            url = match.group(1)
+            if not self._is_social(url):
+                return url
+
+        for match in _URL.finditer(text[:_HEADER_CHARS]):
+            url = match.group(0).rstrip('.')
+            if not self._is_social(url):
+                return url
+        return None
+
+    @staticmethod
+    def _is_social(url: str) -> bool:
+        lowered = url.lower()
+        return any(domain in lowered for domain in _SOCIAL_DOMAINS)
@@ -0,0 +1,430 @@
+"""
+이력서 추출 HTTP 서비스
+
+ResumeExtractor를 제한된 작업 스레드 풀 위에서 실행하는 로컬 HTTP 서버입니다.
+작업 스레드와 대기열이 모두 차면 요청을 쌓아 두지 않고 즉시 429를 반환합니다.
+
+Endpoints:
+    POST /extract            동기 추출 (JSON {"url": ...} / {"text": ...} 또는 파일 본문)
+    POST /jobs               비동기 작업 제출 → 202 {"job_id": ...}
+    GET  /jobs/<job_id>      작업 상태/결과 조회
+    GET  /healthz            상태 확인
+    GET  /metrics            Prometheus 텍스트 형식 지표
+
+파일 업로드는 본문에 파일 바이트를 그대로 보내고, 파일 이름을 ?filename=resume.pdf
+쿼리나 Content-Type 헤더로 알려줍니다.
+
+Usage:
+    resume-extract serve --port 8080 --workers 4 --queue-size 32
+    resume-extract serve --mock --mock-latency 0.5   # 오프라인 부하 테스트
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .exceptions import (
+    DownloadError,
+    ExtractionTimeoutError,
+    InvalidURLError,
+    ParseError,
+    ResumeExtractError,
+    UnsupportedFileTypeError,
+)
+from .extractor import ResumeExtractor
+from .models import ResumeInfo
+from .telemetry import PrometheusSink
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+# 업로드 Content-Type → 파일 확장자
+_UPLOAD_SUFFIXES = {
+    'application/pdf': '.pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '.docx',
+    'application/msword': '.doc',
+    'text/plain': '.txt',
+    'text/html': '.html',
+}
+
+# 예외 → HTTP 상태 코드 (앞쪽 우선)
+_ERROR_STATUS = (
+    (InvalidURLError, 400),
+    (UnsupportedFileTypeError, 415),
+    (ParseError, 422),
+    (DownloadError, 502),
+    (ExtractionTimeoutError, 504),
+    (ResumeExtractError, 500),
+)
+
+
+class ServiceBusy(Exception):
+    """작업 스레드와 대기열이 모두 찬 상태"""
+
+
+class BadRequest(Exception):
+    """요청 형식 오류"""
+
+
+class Job:
+    """비동기 추출 작업"""
+
+    __slots__ = ('id', 'status', 'result', 'error', 'created', 'finished')
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = QUEUED
+        self.result: Optional[ResumeInfo] = None
+        self.error: Optional[Dict[str, Any]] = None
+        self.created = time.time()
+        self.finished: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {'job_id': self.id, 'status': self.status}
+        if self.result is not None:
+            data['result'] = self.result.model_dump(mode='json')
+        if self.error is not None:
+            data['error'] = self.error
+        return data
+
+
+def error_status(error: Exception) -> int:
+    """예외에 해당하는 HTTP 상태 코드"""
+    for error_type, status in _ERROR_STATUS:
+        if isinstance(error, error_type):
+            return status
+    return 500
+
+
+def error_body(error: Exception) -> Dict[str, Any]:
+    """예외의 JSON 표현"""
+    body = {'type': type(error).__name__, 'message': str(error)}
+    details = getattr(error, 'details', None)
+    if details:
+        body['details'] = details
+    return body
+
+
+class ExtractionService:
+    """제한된 작업 풀과 429 backpressure를 가진 추출 HTTP 서버"""
+
+    def __init__(self,
+                 extractor: Optional[ResumeExtractor] = None,
+                 workers: int = 4,
+                 queue_size: int = 32,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 max_body_mb: int = 10,
+                 job_ttl: float = 3600.0):
+        """
+        Args:
+            extractor: 요청을 처리할 추출기 (None이면 PrometheusSink를 연결한 기본 추출기)
+            workers: 동시에 실행할 추출 수
+            queue_size: 작업 스레드가 모두 바쁠 때 대기할 수 있는 요청 수 (초과 시 429)
+            host: 바인딩 주소
+            port: 포트 (0이면 임의의 빈 포트)
+            max_body_mb: 요청 본문 최대 크기 (MB)
+            job_ttl: 끝난 작업 결과를 보관할 시간(초)
+        """
+        if extractor is None:
+            self.metrics_sink = PrometheusSink()
+            extractor = ResumeExtractor(metrics_sink=self.metrics_sink)
+        else:
+            sink = extractor.metrics_sink
+            self.metrics_sink = sink if isinstance(sink, PrometheusSink) else None
+
+        self.extractor = extractor
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_body_bytes = max_body_mb * 1024 * 1024
+        self.job_ttl = job_ttl
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract-service")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._pending = 0
+        self._running = 0
+        self._counters: Dict[Tuple[str, int], int] = {}
+        self._rejected = 0
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """서버 기본 URL"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'ExtractionService':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("ExtractionService 시작: %s", self.url)
+        return self
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        logger.info("ExtractionService 시작: %s", self.url)
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """서버와 작업 풀 종료"""
+        if self._thread:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.extractor.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def submit(self, fn: Callable[[], ResumeInfo]) -> 'Future[ResumeInfo]':
+        """
+        추출 작업을 작업 풀에 제출합니다.
+
+        Raises:
+            ServiceBusy: 작업 스레드와 대기열이 모두 찬 경우
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise ServiceBusy()
+
+        with self._lock:
+            self._pending += 1
+
+        def run() -> ResumeInfo:
+            with self._lock:
+                self._pending -= 1
+                self._running += 1
+            try:
+                return fn()
+            finally:
+                with self._lock:
+                    self._running -= 1
+                self._slots.release()
+
+        return self._executor.submit(run)
+
+    def submit_job(self, fn: Callable[[], ResumeInfo]) -> Job:
+        """비동기 작업 제출 (결과는 get_job으로 조회)"""
+        job = Job()
+
+        def run() -> ResumeInfo:
+            job.status = RUNNING
+            return fn()
+
+        future = self.submit(run)
+        with self._lock:
+            self._expire_jobs()
+            self._jobs[job.id] = job
+        future.add_done_callback(lambda f: self._finish_job(job, f))
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            self._expire_jobs()
+            return self._jobs.get(job_id)
+
+    def health(self) -> Dict[str, Any]:
+        """작업 풀 상태"""
+        with self._lock:
+            return {
+                'status': 'ok',
+                'workers': self.workers,
+                'queue_size': self.queue_size,
+                'running': self._running,
+                'queued': self._pending,
+                'jobs': len(self._jobs),
+            }
+
+    def render_metrics(self) -> str:
+        """서비스 지표와 추출 텔레메트리를 Prometheus 텍스트 형식으로 반환"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            rejected, running, pending = self._rejected, self._running, self._pending
+
+        lines = [
+            "# HELP resume_extract_http_requests_total HTTP requests by path and status.",
+            "# TYPE resume_extract_http_requests_total counter",
+        ]
+        lines.extend(
+            f'resume_extract_http_requests_total{{path="{path}",status="{status}"}} {count}'
+            for (path, status), count in counters
+        )
+        lines.extend([
+            "# HELP resume_extract_rejected_total Requests rejected with 429.",
+            "# TYPE resume_extract_rejected_total counter",
+            f"resume_extract_rejected_total {rejected}",
+            "# HELP resume_extract_running Extractions currently running.",
+            "# TYPE resume_extract_running gauge",
+            f"resume_extract_running {running}",
+            "# HELP resume_extract_queued Extractions waiting for a worker.",
+            "# TYPE resume_extract_queued gauge",
+            f"resume_extract_queued {pending}",
+        ])
+        text = '\n'.join(lines) + '\n'
+        if self.metrics_sink:
+            text += self.metrics_sink.render()
+        return text
+
+    def build_task(self, query: Dict[str, str], headers: Any, body: bytes) -> Callable[[], ResumeInfo]:
+        """요청 본문을 추출 함수로 변환 (JSON url/text 또는 파일 업로드)"""
+        content_type = (headers.get('content-type') or '').split(';')[0].strip().lower()
+
+        if content_type == 'application/json':
+            try:
+                payload = json.loads(body or b'{}')
+            except json.JSONDecodeError as e:
+                raise BadRequest(f"JSON 형식이 아닙니다: {e}") from e
+            if not isinstance(payload, dict):
+                raise BadRequest("JSON 객체가 필요합니다")
+            if payload.get('url'):
+                url = str(payload['url'])
+                return lambda: self.extractor.extract_from_url(url)
+            if payload.get('text'):
+                text = str(payload['text'])
+                return lambda: self.extractor.extract_from_text(text)
+            raise BadRequest("url 또는 text 값이 필요합니다")
+
+        if not body:
+            raise BadRequest("업로드할 파일 본문이 없습니다")
+        filename = query.get('filename') or ''
+        suffix = os.path.splitext(filename)[1].lower() or _UPLOAD_SUFFIXES.get(content_type)
+        if not suffix:
+            raise BadRequest("파일 형식을 알 수 없습니다 (?filename= 또는 Content-Type 필요)")
+        return lambda: self._extract_upload(body, suffix)
+
+    def _extract_upload(self, body: bytes, suffix: str) -> ResumeInfo:
+        """업로드된 파일을 임시 파일로 저장해 추출"""
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as f:
+            f.write(body)
+            path = f.name
+        try:
+            return self.extractor.extract_from_file(path)
+        finally:
+            os.unlink(path)
+
+    def _finish_job(self, job: Job, future: 'Future[ResumeInfo]') -> None:
+        error = future.exception()
+        if error is None:
+            job.result = future.result()
+            job.status = DONE
+        else:
+            job.error = error_body(error)
+            job.status = FAILED
+        job.finished = time.time()
+
+    def _expire_jobs(self) -> None:
+        """보관 시간이 지난 끝난 작업 삭제 (호출 측에서 _lock 보유)"""
+        deadline = time.time() - self.job_ttl
+        expired = [job_id for job_id, job in self._jobs.items() if job.finished and job.finished < deadline]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _count(self, path: str, status: int) -> None:
+        with self._lock:
+            self._counters[(path, status)] = self._counters.get((path, status), 0) + 1
+
+    def _make_handler(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                path = parsed.path.rstrip('/')
+                if path == '/healthz':
+                    self._send_json(200, service.health(), '/healthz')
+                elif path == '/metrics':
+                    self._send(200, service.render_metrics().encode('utf-8'),
+                               'text/plain; version=0.0.4; charset=utf-8', '/metrics')
+                elif path.startswith('/jobs/'):
+                    job = service.get_job(path[len('/jobs/'):])
+                    if job is None:
+                        self._send_json(404, {'error': {'message': "작업을 찾을 수 없습니다"}}, '/jobs')
+                    else:
+                        self._send_json(200, job.to_dict(), '/jobs')
+                else:
+                    self._send_json(404, {'error': {'message': "경로를 찾을 수 없습니다"}}, 'other')
+
+            def do_POST(self):
+                parsed = urlparse(self.path)
+                path = parsed.path.rstrip('/')
+                if path not in ('/extract', '/jobs'):
+                    self._send_json(404, {'error': {'message': "경로를 찾을 수 없습니다"}}, 'other')
+                    return
+
+                length = int(self.headers.get('content-length') or 0)
+                if length > service.max_body_bytes:
+                    # 읽지 않은 본문이 다음 요청으로 해석되지 않도록 응답 후 연결을 닫음
+                    self.close_connection = True
+                    self._send_json(413, {'error': {'message': "요청 본문이 너무 큽니다"}}, path,
+                                    {'Connection': 'close'})
+                    return
+                body = self.rfile.read(length) if length else b''
+                query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+                try:
+                    task = service.build_task(query, self.headers, body)
+                    if path == '/jobs':
+                        job = service.submit_job(task)
+                        self._send_json(202, job.to_dict(), path, {'Location': f"/jobs/{job.id}"})
+                        return
+                    result = service.submit(task).result()
+                    self._send_json(200, result.model_dump(mode='json'), path)
+                except ServiceBusy:
+                    self._send_json(429, {'error': {'message': "처리 대기열이 가득 찼습니다"}}, path,
+                                    {'Retry-After': '1'})
+                except BadRequest as e:
+                    self._send_json(400, {'error': {'type': 'BadRequest', 'message': str(e)}}, path)
+                except Exception as e:
+                    self._send_json(error_status(e), {'error': error_body(e)}, path)
+
+            def _send_json(self, status: int, data: Any, path: str,
+                           headers: Optional[Dict[str, str]] = None) -> None:
+                body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+                self._send(status, body, 'application/json; charset=utf-8', path, headers)
+
+            def _send(self, status: int, body: bytes, content_type: str, path: str,
+                      headers: Optional[Dict[str, str]] = None) -> None:
+                service._count(path, status)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("ExtractionService: " + format, *args)
+
+        return Handler
@@ -0,0 +1,147 @@
+"""
+동일한 진행 중 요청을 하나로 합치는 single-flight 모듈
+
+같은 키로 동시에 들어온 요청 중 첫 요청(리더)만 실제로 실행하고,
+나머지 요청은 리더의 결과(또는 예외)를 그대로 공유합니다. 호출자가 결과를 제자리에서
+수정한다면 do_isolated로 병합된 호출자마다 결과의 복사본을 받습니다.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class _Call:
+    """진행 중인 호출"""
+
+    __slots__ = ('event', 'result', 'error', 'callers')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.callers = 1
+
+
+class SingleFlight:
+    """스레드 간 동일 요청 병합"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다려 반환하고, 없으면 fn을 실행합니다.
+
+        Raises:
+            리더 호출에서 발생한 예외를 모든 대기자에게 그대로 전달합니다.
+        """
+        return self._do(key, fn, args, kwargs, None)
+
+    def do_isolated(self, key: Hashable, copy: Callable[[Any], Any],
+                    fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        do와 같지만, 병합된 호출이면 리더를 포함한 호출자마다 copy(결과)를 반환합니다.
+
+        공유된 원본은 어느 호출자에게도 반환하지 않으므로, 호출자가 결과를 제자리에서
+        수정해도 다른 호출자의 결과에 영향을 주지 않습니다 (병합되지 않은 호출은 복사하지 않음).
+        """
+        return self._do(key, fn, args, kwargs, copy)
+
+    def _do(self, key: Hashable, fn: Callable[..., Any], args: Tuple[Any, ...],
+            kwargs: Dict[str, Any], copy: Optional[Callable[[Any], Any]]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                call.callers += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result if copy is None else copy(call.result)
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # 키를 지운 뒤에는 새 대기자가 붙지 않으므로 callers가 확정됨
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        if copy is None or call.callers == 1:
+            return call.result
+        return copy(call.result)
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 키 개수"""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """실행/공유 횟수 반환"""
+        with self._lock:
+            return {'executed': self.executed, 'shared': self.shared}
+
+
+class AsyncSingleFlight:
+    """asyncio 태스크 간 동일 요청 병합 (이벤트 루프별로 분리)"""
+
+    def __init__(self):
+        self._calls: Dict[Tuple[int, Hashable], 'asyncio.Future[Any]'] = {}
+        self._callers: Dict['asyncio.Future[Any]', List[int]] = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        key로 진행 중인 코루틴이 있으면 그 결과를 기다리고, 없으면 fn(*args)을 태스크로 실행합니다.
+
+        대기자 하나가 취소되어도 공유 태스크는 취소되지 않습니다.
+        """
+        return await self._do(key, fn, args, kwargs, None)
+
+    async def do_isolated(self, key: Hashable, copy: Callable[[Any], Any],
+                          fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """do와 같지만, 병합된 호출이면 호출자마다 copy(결과)를 반환 (SingleFlight.do_isolated 참고)"""
+        return await self._do(key, fn, args, kwargs, copy)
+
+    async def _do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], args: Tuple[Any, ...],
+                  kwargs: Dict[str, Any], copy: Optional[Callable[[Any], Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+
+        task = self._calls.get(loop_key)
+        if task is not None:
+            self.shared += 1
+            callers = self._callers[task]
+            callers[0] += 1
+        else:
+            task = loop.create_task(fn(*args, **kwargs))
+            self._calls[loop_key] = task
+            callers = self._callers[task] = [1]
+            self.executed += 1
+            task.add_done_callback(lambda _: self._calls.pop(loop_key, None))
+            task.add_done_callback(lambda done: self._callers.pop(done, None))
+
+        result = await asyncio.shield(task)
+        # 태스크가 끝나면 새 대기자가 붙지 않으므로 callers가 확정됨
+        if copy is None or callers[0] == 1:
+            return result
+        return copy(result)
+
+    def stats(self) -> Dict[str, int]:
+        """실행/공유 횟수 반환"""
+        return {'executed': self.executed, 'shared': self.shared}
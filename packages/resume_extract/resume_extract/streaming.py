@@ -0,0 +1,63 @@
+"""
+스트리밍 추출 이벤트 모듈
+
+ResumeExtractor.stream_from_* 메서드는 파이프라인이 끝나기 전에 부분 결과를
+이벤트로 내보냅니다. 이벤트 순서는 다음과 같습니다.
+
+    text    → 파싱된 텍스트 (다운로드/파싱 완료 직후)
+    contact → 정규식으로 추출한 ContactInfo (LLM 호출 전)
+    chunk   → 청크별 모델 추출 결과 (완료되는 순서대로, 0회 이상)
+    result  → 검증된 최종 ResumeInfo
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+# 이벤트 종류
+TEXT_READY = 'text'
+CONTACT = 'contact'
+CHUNK = 'chunk'
+RESULT = 'result'
+
+
+@dataclass
+class ChunkExtraction:
+    """청크 하나의 모델 추출 결과"""
+    index: int
+    offset: int
+    extractions: List[Any]
+    fields: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class StreamEvent:
+    """스트리밍 이벤트"""
+    kind: str
+    data: Any
+    elapsed: float
+
+
+def split_into_chunks(text: str, max_chars: int) -> List[Tuple[int, str]]:
+    """
+    텍스트를 최대 max_chars 길이의 청크로 분할합니다.
+
+    단락 경계(빈 줄)를 우선으로 자르고, 없으면 줄 경계에서 자릅니다.
+    각 청크는 원문의 연속 구간이므로 (오프셋, 청크) 쌍으로 위치를 복원할 수 있습니다.
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars는 0보다 커야 합니다")
+
+    chunks = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = min(start + max_chars, length)
+        if end < length:
+            cut = text.rfind('\n\n', start + max_chars // 2, end)
+            if cut < 0:
+                cut = text.rfind('\n', start + 1, end)
+            if cut > start:
+                end = cut + 1
+        chunks.append((start, text[start:end]))
+        start = end
+    return chunks
@@ -0,0 +1,258 @@
+"""
+기술 분류 사전 모듈
+
+SkillTaxonomy는 표준 기술 이름과 별칭("React" ← "React.js", "ReactJS", "react")을 담고,
+모든 별칭을 하나의 Aho-Corasick 오토마톤으로 컴파일합니다. 원문을 한 번 훑는 것으로
+(원문 길이에 비례하는 시간, 별칭 수와 무관) 등장한 기술을 찾아 표준 이름으로 바꾸며,
+모델이 추출한 기술 목록의 표기도 같은 사전으로 통일합니다.
+
+Usage:
+    taxonomy = SkillTaxonomy.from_json("skills.json")   # {"React": ["React.js", "ReactJS"], ...}
+    taxonomy.find("React.js와 nodejs로 개발")            # ['React', 'Node.js']
+    taxonomy.canonicalize(["reactjs", "Python"])        # ['React', 'Python']
+"""
+
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+# 기본 기술 사전 (표준 이름)
+DEFAULT_SKILLS = (
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'Go', 'Kotlin', 'Swift', 'C', 'C++', 'C#',
+    'Ruby', 'PHP', 'Rust', 'Scala', 'Dart', 'SQL', 'HTML', 'CSS',
+    'React', 'React Native', 'Vue.js', 'Angular', 'Next.js', 'Svelte', 'Redux', 'jQuery',
+    'Node.js', 'Express', 'NestJS', 'Django', 'Flask', 'FastAPI', 'Spring', 'Spring Boot',
+    'Rails', 'Laravel', 'GraphQL', 'Socket.io', 'WebSocket', 'Flutter',
+    'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'SQLite', 'Elasticsearch', 'Kafka',
+    'AWS', 'GCP', 'Azure', 'Docker', 'Kubernetes', 'Terraform', 'Jenkins', 'Git', 'Linux',
+    'TensorFlow', 'PyTorch', 'Pandas', 'NumPy', 'Spark', 'Hadoop', 'Airflow',
+)
+
+# 기본 별칭 (표준 이름 → 별칭)
+DEFAULT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'JavaScript': ('JS', 'ECMAScript', '자바스크립트'),
+    'TypeScript': ('타입스크립트',),
+    'Python': ('Python3', '파이썬'),
+    'Java': ('자바',),
+    'Go': ('Golang',),
+    'Kotlin': ('코틀린',),
+    'C++': ('CPP',),
+    'C#': ('CSharp',),
+    'React': ('React.js', 'ReactJS', '리액트'),
+    'React Native': ('ReactNative',),
+    'Vue.js': ('Vue', 'VueJS', 'Vue3'),
+    'Angular': ('AngularJS', 'Angular.js'),
+    'Next.js': ('NextJS',),
+    'Node.js': ('Node', 'NodeJS'),
+    'Express': ('Express.js', 'ExpressJS'),
+    'NestJS': ('Nest.js',),
+    'Spring Boot': ('SpringBoot', '스프링 부트', '스프링부트'),
+    'Spring': ('Spring Framework', '스프링'),
+    'Rails': ('Ruby on Rails', 'RoR'),
+    'PostgreSQL': ('Postgres', 'PSQL'),
+    'MongoDB': ('Mongo',),
+    'Elasticsearch': ('Elastic Search',),
+    'Kafka': ('Apache Kafka',),
+    'AWS': ('Amazon Web Services',),
+    'GCP': ('Google Cloud', 'Google Cloud Platform'),
+    'Kubernetes': ('K8s', '쿠버네티스'),
+    'Docker': ('도커',),
+    'TensorFlow': ('텐서플로',),
+    'Spark': ('Apache Spark', 'PySpark'),
+    'Airflow': ('Apache Airflow',),
+}
+
+# 이 문자가 앞뒤에 붙어 있으면 다른 단어의 일부로 보고 무시 ('React와'처럼 한글 조사는 허용)
+_WORD_BEFORE = frozenset('abcdefghijklmnopqrstuvwxyz0123456789_.+#')
+_WORD_AFTER = frozenset('abcdefghijklmnopqrstuvwxyz0123456789_+#')
+
+# 표기 비교 시 무시하는 문자 ('React.js' == 'reactjs', 'Spring Boot' == 'springboot')
+_SEPARATORS = re.compile(r'[\s.\-_]+')
+
+# 오토마톤 전이 키: (상태 << _CHAR_BITS) | 문자 코드
+_CHAR_BITS = 21
+
+
+def _normalize(alias: str) -> str:
+    return ' '.join(alias.lower().split())
+
+
+def _compact(alias: str) -> str:
+    return _SEPARATORS.sub('', alias.lower())
+
+
+class AhoCorasick:
+    """
+    여러 문자열을 한 번의 훑기로 찾는 Aho-Corasick 오토마톤
+
+    전이는 상태마다 딕셔너리를 두지 않고 (상태, 문자) 정수 키 하나의 딕셔너리에 담아,
+    별칭이 수만 개여도 메모리를 줄입니다.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        """
+        Args:
+            patterns: 찾을 문자열 (빈 문자열 제외, 목록 위치가 패턴 번호)
+        """
+        self.patterns = list(patterns)
+        goto: Dict[int, int] = {}
+        children: List[List[Tuple[str, int]]] = [[]]
+        outputs: List[Tuple[int, ...]] = [()]
+
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError("빈 문자열은 패턴으로 사용할 수 없습니다")
+            state = 0
+            for char in pattern:
+                key = (state << _CHAR_BITS) | ord(char)
+                nxt = goto.get(key)
+                if nxt is None:
+                    nxt = goto[key] = len(outputs)
+                    children[state].append((char, nxt))
+                    children.append([])
+                    outputs.append(())
+                state = nxt
+            outputs[state] += (index,)
+
+        # 너비 우선으로 실패 링크를 만들고, 실패 링크가 가리키는 상태의 출력을 합침
+        fail = [0] * len(outputs)
+        queue = [child for _, child in children[0]]
+        for state in queue:
+            for char, child in children[state]:
+                link = fail[state]
+                code = ord(char)
+                while link and (link << _CHAR_BITS) | code not in goto:
+                    link = fail[link]
+                fail[child] = goto.get((link << _CHAR_BITS) | code, 0)
+                outputs[child] += outputs[fail[child]]
+                queue.append(child)
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int, int]]:
+        """(시작, 끝, 패턴 번호)를 끝 위치 순서로 반환 (겹치는 매칭 포함)"""
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        patterns = self.patterns
+        state = 0
+        for end, char in enumerate(text, 1):
+            code = ord(char)
+            nxt = goto.get((state << _CHAR_BITS) | code)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto.get((state << _CHAR_BITS) | code)
+            state = nxt or 0
+            for index in outputs[state]:
+                yield end - len(patterns[index]), end, index
+
+
+class SkillTaxonomy:
+    """표준 기술 이름과 별칭 사전 (원문 탐지와 표기 통일)"""
+
+    def __init__(self, entries: Mapping[str, Iterable[str]]):
+        """
+        Args:
+            entries: 표준 이름 → 별칭 목록 (표준 이름 자체도 별칭으로 등록됨)
+        """
+        self._canonical: Dict[str, str] = {}
+        self._compact: Dict[str, str] = {}
+        for name, aliases in entries.items():
+            for alias in (name, *aliases):
+                key = _normalize(alias)
+                if key:
+                    self._canonical.setdefault(key, name)
+                    self._compact.setdefault(_compact(alias), name)
+        self.names = list(dict.fromkeys(entries))
+        self._keys = list(self._canonical)
+        self._automaton = AhoCorasick(self._keys)
+
+    @classmethod
+    def from_names(cls, names: Iterable[str],
+                   aliases: Optional[Mapping[str, Iterable[str]]] = None) -> 'SkillTaxonomy':
+        """표준 이름 목록과 선택적 별칭으로 생성 (aliases에만 있는 이름은 무시)"""
+        aliases = aliases or {}
+        return cls({name: aliases.get(name, ()) for name in names})
+
+    @classmethod
+    def from_json(cls, path: Union[str, os.PathLike]) -> 'SkillTaxonomy':
+        """{"표준 이름": ["별칭", ...]} 형식의 JSON 파일로 생성 (목록이면 별칭 없는 이름 목록)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            return cls.from_names(data)
+        return cls(data)
+
+    def __len__(self) -> int:
+        """등록된 별칭 수 (표준 이름 포함)"""
+        return len(self._keys)
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """표기를 표준 이름으로 (대소문자, 공백, '.', '-' 차이 무시, 모르는 기술이면 None)"""
+        return self._canonical.get(_normalize(skill)) or self._compact.get(_compact(skill))
+
+    def canonicalize(self, skills: Iterable[str]) -> List[str]:
+        """기술 목록의 표기를 통일하고 중복 제거 (모르는 기술은 그대로 유지)"""
+        found: Dict[str, None] = {}
+        seen = set()
+        for skill in skills:
+            skill = skill.strip()
+            if not skill:
+                continue
+            name = self.canonical(skill) or skill
+            if name.lower() not in seen:
+                seen.add(name.lower())
+                found[name] = None
+        return list(found)
+
+    def find(self, text: str) -> List[str]:
+        """
+        원문에 등장한 기술을 등장 순서대로 표준 이름으로 반환
+
+        같은 위치에서는 가장 긴 별칭을 고르고('Spring Boot' > 'Spring'), 영문자/숫자에 붙은 별칭은
+        다른 단어의 일부로 보고 무시합니다('Go'는 'Google'에서 찾지 않음).
+        """
+        lowered = text.lower()
+        length = len(lowered)
+        candidates = []
+        for start, end, index in self._automaton.iter_matches(lowered):
+            if start > 0 and lowered[start - 1] in _WORD_BEFORE:
+                continue
+            if end < length and lowered[end] in _WORD_AFTER:
+                continue
+            candidates.append((start, -end, index))
+        candidates.sort()
+
+        found: Dict[str, None] = {}
+        position = 0
+        for start, negative_end, index in candidates:
+            if start < position:
+                continue
+            found.setdefault(self._canonical[self._keys[index]], None)
+            position = -negative_end
+        return list(found)
+
+    def merge(self, skills: Iterable[str], text: Optional[str] = None) -> List[str]:
+        """모델이 추출한 기술의 표기를 통일하고, 원문에서 찾은 기술을 뒤에 추가"""
+        merged = self.canonicalize(skills)
+        if text:
+            known = {skill.lower() for skill in merged}
+            merged += [skill for skill in self.find(text) if skill.lower() not in known]
+        return merged
+
+
+_default_taxonomy: Optional[SkillTaxonomy] = None
+
+
+def default_taxonomy() -> SkillTaxonomy:
+    """DEFAULT_SKILLS와 DEFAULT_ALIASES로 만든 공유 사전"""
+    global _default_taxonomy
+    if _default_taxonomy is None:
+        _default_taxonomy = SkillTaxonomy.from_names(DEFAULT_SKILLS, DEFAULT_ALIASES)
+    return _default_taxonomy
@@ -0,0 +1,266 @@
+"""
+추출 호출 텔레메트리 모듈
+
+LangExtractProcessor는 호출마다 입력 크기, 추정/실제 토큰 수, 청크 수, 단계별 소요 시간,
+사용한 모델을 CallMetrics로 기록합니다. 기록은 ResumeInfo.metadata에 붙고,
+설정한 MetricsSink(메모리, JSONL 파일, Prometheus 텍스트 형식)로 전달됩니다.
+
+백엔드 결과에 usage 속성({'input_tokens': int, 'output_tokens': int})이 있으면
+실제 토큰 수로 기록하고, 없으면 문자 수 기반 추정치만 기록합니다.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+# 토큰당 평균 문자 수 (ASCII는 영어 기준, 그 외는 한글 기준 근사치)
+_CHARS_PER_TOKEN_ASCII = 4.0
+_CHARS_PER_TOKEN_OTHER = 1.5
+
+# 모델별 100만 토큰당 가격 (USD, 입력/출력)
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    'gemini-2.0-flash': (0.10, 0.40),
+    'gemini-2.0-flash-lite': (0.075, 0.30),
+    'gemini-2.5-flash': (0.30, 2.50),
+    'gemini-2.5-flash-lite': (0.10, 0.40),
+    'gemini-2.5-pro': (1.25, 10.00),
+}
+
+# Prometheus 단계별 소요 시간 히스토그램 경계(초)
+PHASE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def estimate_tokens(text: str) -> int:
+    """문자 종류별 평균 길이로 토큰 수 추정"""
+    if not text:
+        return 0
+    # 문자 단위 Python 루프 대신 C로 구현된 encode로 ASCII 문자 수를 셈
+    ascii_chars = len(text) if text.isascii() else len(text.encode('ascii', 'ignore'))
+    other_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / _CHARS_PER_TOKEN_ASCII + other_chars / _CHARS_PER_TOKEN_OTHER)
+
+
+def estimate_cost(model_id: Optional[str], input_tokens: int, output_tokens: int = 0) -> Optional[float]:
+    """모델 가격표로 비용(USD) 추정 (가격을 모르는 모델은 None)"""
+    prices = MODEL_PRICES.get(model_id or '')
+    if prices is None:
+        return None
+    return (input_tokens * prices[0] + output_tokens * prices[1]) / 1_000_000
+
+
+@dataclass
+class CallMetrics:
+    """추출 호출 한 번의 텔레메트리"""
+    engine: str
+    model_id: Optional[str] = None
+    route: Optional[str] = None
+    input_chars: int = 0
+    estimated_tokens: int = 0
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    chunk_count: int = 0
+    model_calls: int = 0
+    phases: Dict[str, float] = field(default_factory=dict)
+    wall_time: float = 0.0
+    cost_usd: Optional[float] = None
+    error: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """블록 실행 시간을 단계 소요 시간에 누적"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def add_usage(self, result: Any) -> None:
+        """백엔드 결과에 보고된 실제 토큰 사용량 누적"""
+        usage = getattr(result, 'usage', None)
+        if not usage:
+            return
+        self.input_tokens = (self.input_tokens or 0) + int(usage.get('input_tokens', 0))
+        self.output_tokens = (self.output_tokens or 0) + int(usage.get('output_tokens', 0))
+
+    def finish(self, wall_time: float) -> 'CallMetrics':
+        """총 소요 시간과 추정 비용 확정"""
+        self.wall_time = wall_time
+        if self.model_calls:
+            input_tokens = self.input_tokens if self.input_tokens is not None else self.estimated_tokens
+            self.cost_usd = estimate_cost(self.model_id, input_tokens, self.output_tokens or 0)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return asdict(self)
+
+
+class MetricsSink(ABC):
+    """CallMetrics를 받는 저장소 인터페이스"""
+
+    @abstractmethod
+    def record(self, metrics: CallMetrics) -> None:
+        """호출 텔레메트리 한 건 기록"""
+
+    def close(self) -> None:  # noqa: B027 - 정리할 리소스가 없는 저장소는 재정의하지 않음
+        """리소스 정리"""
+
+
+class InMemorySink(MetricsSink):
+    """최근 기록을 메모리에 보관하는 저장소 (테스트, 대화형 분석용)"""
+
+    def __init__(self, max_records: Optional[int] = None):
+        self.max_records = max_records
+        # 가득 차면 가장 오래된 기록부터 O(1)로 버림
+        self.records: Deque[CallMetrics] = deque(maxlen=max_records or None)
+        self._lock = threading.Lock()
+
+    def record(self, metrics: CallMetrics) -> None:
+        with self._lock:
+            self.records.append(metrics)
+
+    def summary(self) -> Dict[str, Any]:
+        """호출 수, 오류 수, 토큰/비용 합계, 평균 소요 시간"""
+        with self._lock:
+            records = list(self.records)
+        return {
+            'calls': len(records),
+            'errors': sum(1 for metrics in records if metrics.error),
+            'model_calls': sum(metrics.model_calls for metrics in records),
+            'estimated_tokens': sum(metrics.estimated_tokens for metrics in records),
+            'cost_usd': sum(metrics.cost_usd or 0.0 for metrics in records),
+            'wall_time_avg': (
+                sum(metrics.wall_time for metrics in records) / len(records) if records else None
+            ),
+        }
+
+
+class JSONLSink(MetricsSink):
+    """기록을 JSON Lines 파일에 한 줄씩 추가하는 저장소"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def record(self, metrics: CallMetrics) -> None:
+        line = json.dumps(metrics.to_dict(), ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class PrometheusSink(MetricsSink):
+    """
+    기록을 누적해 Prometheus 텍스트 노출 형식으로 제공하는 저장소
+
+    render() 결과를 HTTP /metrics로 노출하거나, write()로 node_exporter의
+    textfile collector 디렉터리에 기록합니다.
+    """
+
+    def __init__(self, namespace: str = 'resume_extract', buckets: Tuple[float, ...] = PHASE_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._calls: Dict[Tuple[str, str, str], int] = {}
+        self._input_chars: Dict[str, int] = {}
+        self._tokens: Dict[Tuple[str, str], int] = {}
+        self._cost: Dict[str, float] = {}
+        self._chunks: Dict[str, int] = {}
+        # 단계 → (버킷별 누적 개수, 합계, 개수)
+        self._phases: Dict[str, Tuple[List[int], float, int]] = {}
+
+    def record(self, metrics: CallMetrics) -> None:
+        model = metrics.model_id or metrics.engine
+        status = 'error' if metrics.error else 'ok'
+        phases = dict(metrics.phases, total=metrics.wall_time)
+        with self._lock:
+            key = (model, metrics.engine, status)
+            self._calls[key] = self._calls.get(key, 0) + 1
+            self._input_chars[model] = self._input_chars.get(model, 0) + metrics.input_chars
+            self._chunks[model] = self._chunks.get(model, 0) + metrics.chunk_count
+            for kind, count in (('estimated', metrics.estimated_tokens),
+                                ('input', metrics.input_tokens),
+                                ('output', metrics.output_tokens)):
+                if count is not None:
+                    self._tokens[(model, kind)] = self._tokens.get((model, kind), 0) + count
+            if metrics.cost_usd is not None:
+                self._cost[model] = self._cost.get(model, 0.0) + metrics.cost_usd
+            for name, seconds in phases.items():
+                counts, total, count = self._phases.get(name) or ([0] * len(self.buckets), 0.0, 0)
+                for i, bound in enumerate(self.buckets):
+                    if seconds <= bound:
+                        counts[i] += 1
+                self._phases[name] = (counts, total + seconds, count + 1)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 문자열"""
+        ns = self.namespace
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List[Tuple[Dict[str, str], Any]]) -> None:
+            lines.append(f"# HELP {ns}_{name} {help_text}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{ns}_{name}{_format_labels(labels)} {value}")
+
+        with self._lock:
+            metric('calls_total', 'counter', 'Extraction calls.', [
+                ({'model': model, 'engine': engine, 'status': status}, count)
+                for (model, engine, status), count in sorted(self._calls.items())
+            ])
+            metric('input_chars_total', 'counter', 'Input characters sent to extraction.', [
+                ({'model': model}, count) for model, count in sorted(self._input_chars.items())
+            ])
+            metric('chunks_total', 'counter', 'Model call chunks.', [
+                ({'model': model}, count) for model, count in sorted(self._chunks.items())
+            ])
+            metric('tokens_total', 'counter', 'Estimated and provider-reported tokens.', [
+                ({'model': model, 'kind': kind}, count)
+                for (model, kind), count in sorted(self._tokens.items())
+            ])
+            metric('cost_usd_total', 'counter', 'Estimated model cost in USD.', [
+                ({'model': model}, f"{cost:.6f}") for model, cost in sorted(self._cost.items())
+            ])
+
+            name = f"{ns}_phase_seconds"
+            lines.append(f"# HELP {name} Wall time per extraction phase.")
+            lines.append(f"# TYPE {name} histogram")
+            for phase, (counts, total, count) in sorted(self._phases.items()):
+                for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                    lines.append(f"{name}_bucket{_format_labels({'phase': phase, 'le': f'{bound:g}'})} {bucket_count}")
+                lines.append(f"{name}_bucket{_format_labels({'phase': phase, 'le': '+Inf'})} {count}")
+                lines.append(f"{name}_sum{_format_labels({'phase': phase})} {total:.6f}")
+                lines.append(f"{name}_count{_format_labels({'phase': phase})} {count}")
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str) -> None:
+        """render() 결과를 파일에 원자적으로 기록"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(temp_path, path)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """Prometheus 레이블 문자열 ({key="value",...})"""
+    if not labels:
+        return ''
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{key}="{value}"')
+    return '{' + ','.join(pairs) + '}'
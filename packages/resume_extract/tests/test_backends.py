@@ -0,0 +1,116 @@
+"""
+추출 백엔드 및 로컬 모델 서버 테스트
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from resume_extract.backends import (
+    LangExtractBackend,
+    MockBackend,
+    MockBackendError,
+    lognormal_latency,
+    uniform_latency,
+)
+from resume_extract.exceptions import LangExtractAPIError, ResumeExtractError
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.mock_server import MockProviderServer
+
+CANNED = [("이름", "김철수"), ("주소", "서울특별시 강남구")]
+
+
+class TestMockBackend:
+    """MockBackend 테스트"""
+
+    def test_canned_extractions_aligned(self, sample_resume_text):
+        """고정 응답이 입력 텍스트 위치에 정렬되는지 테스트"""
+        backend = MockBackend(extractions=CANNED)
+
+        result = backend.extract(sample_resume_text, "prompt", [], "mock")
+
+        name = result.extractions[0]
+        assert name.extraction_class == "이름"
+        start = name.char_interval.start_pos
+        assert sample_resume_text[start:name.char_interval.end_pos] == "김철수"
+
+    def test_error_rate(self):
+        """오류율에 따른 실패 테스트"""
+        backend = MockBackend(error_rate=1.0)
+
+        with pytest.raises(MockBackendError):
+            backend.extract("text", "prompt", [], "mock")
+        assert backend.stats() == {'calls': 1, 'errors': 1}
+
+    def test_invalid_error_rate(self):
+        """잘못된 오류율 테스트"""
+        with pytest.raises(ValueError):
+            MockBackend(error_rate=1.5)
+
+    def test_latency_distributions(self):
+        """지연 시간 분포 테스트"""
+        import random
+        rng = random.Random(0)
+
+        assert all(0.01 <= uniform_latency(0.01, 0.02)(rng) <= 0.02 for _ in range(100))
+        samples = sorted(lognormal_latency(0.1, 0.5)(rng) for _ in range(1000))
+        assert 0.08 < samples[500] < 0.12
+        assert samples[990] > 2 * samples[500]
+
+
+class TestOfflineThroughput:
+    """MockBackend를 이용한 ResumeExtractor 오프라인 처리량 테스트"""
+
+    def test_concurrent_extraction(self, sample_resume_text, monkeypatch):
+        """동시 추출 시 지연 시간이 겹쳐서 처리되는지 테스트"""
+        monkeypatch.delenv("LANGEXTRACT_API_KEY")
+        backend = MockBackend(extractions=CANNED, latency=0.05, seed=1)
+
+        with ResumeExtractor(backend=backend, coalesce=False) as extractor:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(extractor.extract_from_text, [sample_resume_text] * 16))
+            elapsed = time.perf_counter() - start
+
+        assert backend.stats()['calls'] == 16
+        assert all(result.name == "김철수" for result in results)
+        assert elapsed < 16 * 0.05
+
+    def test_backend_error_is_api_error(self, sample_resume_text):
+        """백엔드 오류가 LangExtractAPIError로 변환되는지 테스트"""
+        with ResumeExtractor(backend=MockBackend(error_rate=1.0)) as extractor:
+            with pytest.raises(LangExtractAPIError):
+                extractor.extract_from_text(sample_resume_text)
+
+
+class TestMockProviderServer:
+    """로컬 모델 제공자 대역 서버 테스트"""
+
+    def test_lx_extract_against_local_server(self, sample_resume_text):
+        """실제 lx.extract 경로가 로컬 서버로 동작하는지 테스트"""
+        with MockProviderServer(extractions=CANNED) as server:
+            backend = LangExtractBackend(**server.backend_kwargs())
+            with ResumeExtractor(model_id=server.model_id, backend=backend) as extractor:
+                result = extractor.extract_from_text(sample_resume_text)
+
+        assert server.requests >= 1
+        assert result.name == "김철수"
+        assert result.contact.address == "서울특별시 강남구"
+        assert result.contact.email == "chulsoo.kim@example.com"
+
+    def test_server_error_rate(self, sample_resume_text):
+        """서버 오류 주입 테스트"""
+        with MockProviderServer(error_rate=1.0) as server:
+            backend = LangExtractBackend(**server.backend_kwargs())
+            with ResumeExtractor(model_id=server.model_id, backend=backend) as extractor:
+                with pytest.raises(ResumeExtractError):
+                    extractor.extract_from_text(sample_resume_text)
+
+        assert server.errors >= 1
+
+    def test_invalid_error_rate(self):
+        """범위를 벗어난 error_rate는 서버를 열기 전에 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            MockProviderServer(error_rate=-0.1)
+        with pytest.raises(ValueError):
+            MockProviderServer(error_rate=1.5)
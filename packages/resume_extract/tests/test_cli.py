@@ -0,0 +1,156 @@
+"""
+명령줄 도구 테스트
+"""
+
+import json
+import logging
+
+import pytest
+from resume_extract.cli import configure_logging, main, read_manifest
+
+
+def _write_resumes(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"resume_{i}.txt"
+        path.write_text(f"지원자{i}\n이메일: user{i}@example.com\n\n## 기술\nPython", encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+class TestManifest:
+    """manifest 읽기 테스트"""
+
+    def test_jsonl(self, tmp_path):
+        """JSONL의 문자열/객체 줄을 모두 읽는지 테스트"""
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text('"a.pdf"\n\n{"id": "r2", "url": "https://example.com/b.pdf"}\n', encoding='utf-8')
+
+        assert list(read_manifest(str(manifest))) == [
+            ("a.pdf", "a.pdf"),
+            ("r2", "https://example.com/b.pdf"),
+        ]
+
+    def test_csv(self, tmp_path):
+        """CSV의 path 열과 id 열을 읽는지 테스트"""
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text("id,path\nr1,a.pdf\n,b.pdf\n", encoding='utf-8')
+
+        assert list(read_manifest(str(manifest))) == [("r1", "a.pdf"), ("b.pdf", "b.pdf")]
+
+    def test_missing_source(self, tmp_path):
+        """소스가 없는 줄은 위치와 함께 오류를 내는지 테스트"""
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text('{"id": "r1"}\n', encoding='utf-8')
+
+        with pytest.raises(ValueError, match="manifest.jsonl:1"):
+            list(read_manifest(str(manifest)))
+
+
+class TestBatchCommand:
+    """batch 명령 테스트"""
+
+    def test_batch_to_file(self, tmp_path):
+        """결과를 JSONL 파일로 기록하는지 테스트"""
+        paths = _write_resumes(tmp_path, 3)
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text("".join(json.dumps(str(p)) + "\n" for p in paths), encoding='utf-8')
+        output = tmp_path / "out.jsonl"
+
+        code = main(["batch", str(manifest), "-o", str(output), "--engine", "heuristic", "--ordered"])
+
+        records = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        assert code == 0
+        assert [r['source'] for r in records] == [str(p) for p in paths]
+        assert records[0]['result']['contact']['email'] == "user0@example.com"
+
+    def test_failed_items(self, tmp_path, capsys):
+        """실패한 항목은 error로 기록되고 종료 코드가 1인지 테스트"""
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text(json.dumps(str(tmp_path / "missing.txt")) + "\n", encoding='utf-8')
+
+        code = main(["batch", str(manifest), "--engine", "heuristic"])
+
+        record = json.loads(capsys.readouterr().out)
+        assert code == 1
+        assert record['error']['type'] == "ParseError"
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        """체크포인트에 기록된 항목은 다시 처리하지 않고 결과를 이어 붙이는지 테스트"""
+        paths = _write_resumes(tmp_path, 4)
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text("id,path\n" + "".join(f"r{i},{p}\n" for i, p in enumerate(paths)), encoding='utf-8')
+        output = tmp_path / "out.jsonl"
+        checkpoint = tmp_path / "progress.txt"
+        checkpoint.write_text("r0\nr1\n", encoding='utf-8')
+        output.write_text('{"id": "r0"}\n{"id": "r1"}\n', encoding='utf-8')
+
+        code = main(["batch", str(manifest), "-o", str(output), "--checkpoint", str(checkpoint),
+                     "--engine", "heuristic", "--ordered"])
+
+        ids = [json.loads(line)['id'] for line in output.read_text(encoding='utf-8').splitlines()]
+        assert code == 0
+        assert ids == ["r0", "r1", "r2", "r3"]
+        assert checkpoint.read_text(encoding='utf-8').split() == ["r0", "r1", "r2", "r3"]
+
+    def test_resume_replaces_failed_records(self, tmp_path):
+        """다시 실행할 때 실패 기록과 잘린 줄을 지우고 항목마다 한 줄만 남기는지 테스트"""
+        paths = _write_resumes(tmp_path, 2)
+        missing = tmp_path / "missing.txt"
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text(f"id,path\nr0,{paths[0]}\nr1,{missing}\nr2,{paths[1]}\n", encoding='utf-8')
+        output = tmp_path / "out.jsonl"
+        checkpoint = tmp_path / "progress.txt"
+        args = ["batch", str(manifest), "-o", str(output), "--checkpoint", str(checkpoint),
+                "--engine", "heuristic", "--ordered"]
+
+        assert main(args) == 1
+        assert checkpoint.read_text(encoding='utf-8').split() == ["r0", "r2"]
+        # 중단으로 마지막 줄이 잘린 상황
+        with open(output, 'a', encoding='utf-8') as f:
+            f.write('{"id": "r3", "sou')
+
+        missing.write_text("지원자\n이메일: late@example.com", encoding='utf-8')
+        assert main(args) == 0
+
+        records = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        assert [r['id'] for r in records] == ["r0", "r2", "r1"]
+        assert all('error' not in r for r in records)
+        assert checkpoint.read_text(encoding='utf-8').split() == ["r0", "r2", "r1"]
+
+    def test_missing_manifest(self, tmp_path, capsys):
+        """manifest가 없으면 종료 코드 2를 반환하는지 테스트"""
+        assert main(["batch", str(tmp_path / "none.jsonl"), "--engine", "heuristic"]) == 2
+        assert "오류" in capsys.readouterr().err
+
+
+class TestLogging:
+    """콘솔 스크립트 로그 설정 테스트"""
+
+    @staticmethod
+    def _configure(monkeypatch, verbose=False):
+        # pytest가 실행 단계에서 루트 로거에 붙이는 캡처 핸들러를 치우고 설정
+        monkeypatch.setattr(logging.root, 'handlers', [])
+        package = logging.getLogger('resume_extract')
+        monkeypatch.setattr(package, 'level', package.level)
+        configure_logging(verbose)
+
+    def test_warning_reaches_stderr(self, monkeypatch, capsys):
+        """NullHandler가 있어도 경고가 표준 에러에 출력되는지 테스트"""
+        self._configure(monkeypatch)
+        logging.getLogger('resume_extract.cli').warning("경고 메시지")
+        logging.getLogger('resume_extract.cli').debug("디버그 메시지")
+
+        err = capsys.readouterr().err
+        assert "경고 메시지" in err
+        assert "디버그 메시지" not in err
+
+    def test_verbose(self, monkeypatch, capsys):
+        """-v가 패키지 디버그 로그만 출력하는지 테스트"""
+        self._configure(monkeypatch, verbose=True)
+        logging.getLogger('resume_extract.extractor').debug("디버그 메시지")
+        logging.getLogger('urllib3').debug("외부 디버그")
+
+        err = capsys.readouterr().err
+        assert "디버그 메시지" in err
+        assert "외부 디버그" not in err
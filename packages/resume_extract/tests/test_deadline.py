@@ -0,0 +1,196 @@
+"""
+이력서별 마감 시간 전파 테스트
+"""
+
+import time
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.deadline import DOWNLOAD, EXTRACT, PARSE, Deadline
+from resume_extract.downloader import DeadlineRetry, URLDownloader, _active_deadline
+from resume_extract.exceptions import DeadlineExceededError, ExtractionTimeoutError
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.hedging import HedgedCaller
+from resume_extract.langextract_integration import LangExtractProcessor
+from resume_extract.parsers import FileParser
+from resume_extract.service import error_status
+
+
+class _SlowResponse:
+    """청크를 천천히 보내는 스트리밍 응답"""
+
+    headers = {'content-type': 'application/pdf', 'content-length': '100'}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for _ in range(100):
+            time.sleep(0.01)
+            yield b'x'
+
+
+class _SlowSession:
+    def __init__(self):
+        self.timeouts = []
+
+    def head(self, url, timeout, allow_redirects):
+        self.timeouts.append(timeout)
+        return _SlowResponse()
+
+    def get(self, url, timeout, stream=False):
+        self.timeouts.append(timeout)
+        return _SlowResponse()
+
+    def close(self):
+        pass
+
+
+class TestDeadline:
+    """Deadline 테스트"""
+
+    def test_timeout_is_capped(self):
+        """단계 timeout이 남은 시간 이하로 줄어드는지 테스트"""
+        deadline = Deadline(0.5)
+
+        assert deadline.timeout(DOWNLOAD, 30) <= 0.5
+        assert deadline.timeout(DOWNLOAD, 0.1) == 0.1
+        assert Deadline.after(None) is None
+
+    def test_expired(self):
+        """마감 시간이 지나면 단계 이름과 함께 예외가 발생하는지 테스트"""
+        deadline = Deadline(0.01)
+        time.sleep(0.02)
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            deadline.timeout(PARSE, 30)
+        assert exc_info.value.stage == PARSE
+        assert isinstance(exc_info.value, ExtractionTimeoutError)
+        assert error_status(exc_info.value) == 504
+
+    def test_invalid_seconds(self):
+        """0 이하의 마감 시간은 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            Deadline(0)
+        with pytest.raises(ValueError):
+            ResumeExtractor(deadline=-1)
+
+
+class TestStages:
+    """단계별 마감 시간 적용 테스트"""
+
+    def test_download_stops_mid_stream(self):
+        """느린 다운로드가 청크 수신 중에 중단되고 요청 timeout이 줄어드는지 테스트"""
+        downloader = URLDownloader(timeout=30)
+        downloader.session = _SlowSession()
+
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            downloader.download_and_extract_text("https://example.com/resume.pdf", Deadline(0.1))
+
+        assert exc_info.value.stage == DOWNLOAD
+        assert time.monotonic() - started < 0.5
+        assert all(timeout <= 0.1 for timeout in downloader.session.timeouts)
+        assert _active_deadline.get() is None
+
+    def test_retry_backoff_is_capped(self):
+        """재시도 대기 시간이 남은 시간을 넘지 않는지 테스트"""
+        retry = DeadlineRetry(total=5, backoff_factor=10).increment().increment()
+        token = _active_deadline.set(Deadline(0.2))
+        try:
+            assert retry.get_backoff_time() <= 0.2
+        finally:
+            _active_deadline.reset(token)
+        assert retry.get_backoff_time() >= 10
+
+    def test_parse_checks_deadline(self, tmp_path):
+        """마감 시간이 지난 뒤에는 파싱하지 않는지 테스트"""
+        path = tmp_path / "resume.txt"
+        path.write_text("홍길동", encoding='utf-8')
+        deadline = Deadline(0.01)
+        time.sleep(0.02)
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            FileParser().parse(str(path), deadline=deadline)
+        assert exc_info.value.stage == PARSE
+
+    def test_call_within(self):
+        """HedgedCaller가 호출별 마감 시간을 따르는지 테스트"""
+        caller = HedgedCaller(timeout=10)
+        try:
+            started = time.monotonic()
+            with pytest.raises(ExtractionTimeoutError):
+                caller.call_within(0.05, time.sleep, 1)
+            assert time.monotonic() - started < 0.5
+        finally:
+            caller.close()
+
+
+class TestExtractorDeadline:
+    """ResumeExtractor 마감 시간 테스트"""
+
+    def test_model_call_cut_at_deadline(self):
+        """느린 모델 호출을 남은 시간에서 끊는지 테스트"""
+        backend = MockBackend(extractions=[("이름", "홍길동")], latency=1.0)
+
+        with ResumeExtractor(backend=backend, deadline=0.1) as extractor:
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError) as exc_info:
+                extractor.extract_from_text("홍길동\n개발자")
+            elapsed = time.monotonic() - started
+
+        assert exc_info.value.stage == EXTRACT
+        assert elapsed < 0.5
+
+    def test_deadline_per_resume(self, tmp_path):
+        """마감 시간이 추출기 전체가 아니라 이력서마다 새로 시작되는지 테스트"""
+        backend = MockBackend(extractions=[("이름", "홍길동")], latency=0.05)
+
+        with ResumeExtractor(backend=backend, deadline=0.5, coalesce=False) as extractor:
+            results = [extractor.extract_from_text(f"홍길동 {i}\n개발자") for i in range(15)]
+
+        assert all(r.name == "홍길동" for r in results)
+
+    def test_stream_from_text(self):
+        """스트리밍 추출도 마감 시간에서 청크 대기를 끊는지 테스트"""
+        backend = MockBackend(extractions=[("이름", "홍길동")], latency=1.0)
+
+        with ResumeExtractor(backend=backend, deadline=0.1) as extractor:
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError) as exc_info:
+                list(extractor.stream_from_text("홍길동\n개발자"))
+            elapsed = time.monotonic() - started
+
+        assert exc_info.value.stage == EXTRACT
+        assert elapsed < 0.5
+
+    def test_stream_from_file_parse(self, tmp_path, monkeypatch):
+        """스트리밍 파일 추출이 파서에 마감 시간을 전달하는지 테스트"""
+        path = tmp_path / "resume.txt"
+        path.write_text("홍길동\n개발자", encoding='utf-8')
+        received = []
+
+        with ResumeExtractor(backend=MockBackend(extractions=[("이름", "홍길동")]), deadline=5.0) as extractor:
+            parse = extractor.parser.parse
+            monkeypatch.setattr(extractor.parser, "parse",
+                                lambda p, deadline=None: received.append(deadline) or parse(p, deadline=deadline))
+            events = list(extractor.stream_from_file(path))
+
+        assert events[-1].data.name == "홍길동"
+        assert isinstance(received[0], Deadline)
+
+    def test_stream_chunk_wait_cut_without_caller(self):
+        """caller가 없어도 스트리밍 청크 결과 대기를 마감 시간에서 끊는지 테스트"""
+        processor = LangExtractProcessor(
+            api_key="test-key", backend=MockBackend(extractions=[("이름", "홍길동")], latency=1.0)
+        )
+        stream = processor.stream_resume_info("홍길동\n개발자", deadline=Deadline(0.1))
+
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            list(stream)
+        elapsed = time.monotonic() - started
+
+        assert processor.caller is None
+        assert exc_info.value.stage == EXTRACT
+        assert elapsed < 0.5
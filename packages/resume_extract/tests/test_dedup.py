@@ -0,0 +1,109 @@
+"""
+유사 중복 탐지 테스트
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.dedup import NearDuplicateIndex, normalize_text
+from resume_extract.extractor import ResumeExtractor
+
+RESUME = (
+    "홍길동\n이메일: hong@example.com\n\n## 경력\n"
+    + "\n".join(f"회사{i} 백엔드 개발자 2015.01 ~ 2016.01 결제 시스템 개발과 운영" for i in range(6))
+    + "\n\n## 기술\nPython, Go, Kubernetes"
+)
+
+# 같은 이력서를 다른 형식에서 파싱한 것처럼 공백/기호/페이지 번호가 다른 텍스트
+RESUME_FROM_PDF = RESUME.replace("2015.01", "2015 . 01").replace("\n", "  \n") + "\n\n- 1 / 2 -"
+
+OTHER = "김철수\n프론트엔드 개발자\n\n## 경력\n" + "\n".join(
+    f"스타트업{i} React TypeScript 디자인 시스템 구축" for i in range(6)
+)
+
+
+class TestNearDuplicateIndex:
+    """NearDuplicateIndex 테스트"""
+
+    def test_normalize_text(self):
+        """형식 차이를 제거하는지 테스트"""
+        assert normalize_text("Ｐｙｔｈｏｎ,  Go!\n\nAWS") == "python go aws"
+
+    def test_finds_near_duplicate(self):
+        """형식만 다른 텍스트를 중복으로 찾는지 테스트"""
+        index = NearDuplicateIndex(threshold=0.7)
+        index.add("pdf", RESUME, value=1)
+        index.add("other", OTHER, value=2)
+
+        match = index.best_match(RESUME_FROM_PDF)
+
+        assert match.key == "pdf"
+        assert match.value == 1
+        assert match.similarity >= 0.7
+        assert index.best_match("전혀 관계없는 문서입니다. " * 10) is None
+
+    def test_batch_signatures_match_single(self):
+        """일괄 계산한 서명이 하나씩 계산한 서명과 같은지 테스트"""
+        index = NearDuplicateIndex()
+        texts = [RESUME, "", "짧음", OTHER]
+
+        batch = index.signatures(texts)
+
+        assert batch.shape == (4, 128)
+        assert batch.dtype == np.uint32
+        for text, signature in zip(texts, batch, strict=True):
+            assert np.array_equal(index.signature(text), signature)
+
+    def test_add_many(self):
+        """add_many로 추가한 문서를 검색하는지 테스트"""
+        index = NearDuplicateIndex()
+        index.add_many(["a", "b"], [RESUME, OTHER], ["A", "B"])
+
+        assert len(index) == 2
+        assert [m.key for m in index.query(OTHER)] == ["b"]
+
+    def test_invalid_bands(self):
+        """num_perm의 약수가 아닌 bands는 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(num_perm=128, bands=10)
+
+
+class TestExtractorDedup:
+    """ResumeExtractor 유사 중복 처리 테스트"""
+
+    def test_reuse_skips_model(self):
+        """유사 중복이면 모델을 호출하지 않고 이전 결과를 재사용하는지 테스트"""
+        backend = MockBackend(extractions=[("이름", "홍길동")])
+        extractor = ResumeExtractor(backend=backend, dedup_index=NearDuplicateIndex(threshold=0.7))
+
+        first = extractor.extract_from_text(RESUME)
+        second = extractor.extract_from_text(RESUME_FROM_PDF)
+
+        assert backend.calls == 1
+        assert second.name == first.name == "홍길동"
+        assert second.raw_text == RESUME_FROM_PDF
+        assert second.metadata['near_duplicate']['reused'] is True
+        assert second.metadata['near_duplicate']['key'] == hashlib.sha256(RESUME.encode('utf-8')).hexdigest()
+
+    def test_flag_extracts_again(self):
+        """flag 모드는 추출하고 중복 정보만 표시하는지 테스트"""
+        backend = MockBackend(extractions=[("이름", "홍길동")])
+        extractor = ResumeExtractor(
+            backend=backend, dedup_index=NearDuplicateIndex(threshold=0.7), dedup_action='flag'
+        )
+
+        extractor.extract_from_text(RESUME)
+        flagged = extractor.extract_from_text(RESUME_FROM_PDF)
+        distinct = extractor.extract_from_text(OTHER)
+
+        assert backend.calls == 3
+        assert flagged.metadata['near_duplicate']['reused'] is False
+        assert 'near_duplicate' not in distinct.metadata
+        assert len(extractor.dedup_index) == 2
+
+    def test_invalid_action(self):
+        """지원하지 않는 dedup_action은 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            ResumeExtractor(dedup_action='drop')
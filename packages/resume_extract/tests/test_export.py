@@ -0,0 +1,109 @@
+"""
+Arrow/Parquet 일괄 내보내기 테스트
+"""
+
+import io
+
+import pytest
+from resume_extract.export import (
+    ArrowBatchBuilder,
+    ArrowResumeWriter,
+    ParquetResumeWriter,
+    to_record_batches,
+    write_parquet,
+)
+from resume_extract.models import (
+    ContactInfo,
+    EducationInfo,
+    ExperienceInfo,
+    RawTextRef,
+    ResumeInfo,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def make_resume(i: int) -> ResumeInfo:
+    return ResumeInfo(
+        name=f"지원자{i}",
+        contact=ContactInfo(email=f"user{i}@example.com"),
+        skills=["Python", "Go"] if i % 2 else ["Python"],
+        experience=[
+            ExperienceInfo(company="카카오", position="개발자", duration="2020.01 ~ 2023.12",
+                           technologies=["Kafka"]),
+            ExperienceInfo(company=f"회사{i % 3}", position="인턴", duration="2019.01 ~ 2019.12"),
+        ],
+        education=[EducationInfo(institution="한국대학교", degree="학사", duration="2015 ~ 2019")],
+        raw_text=f"원문 {i}",
+        raw_text_ref=RawTextRef(sha256="ab", length=4) if i % 2 else None,
+        confidence_score=0.8,
+        metadata={'engine': 'mock'},
+    )
+
+
+def expected_row(info: ResumeInfo) -> dict:
+    """pyarrow to_pylist와 같은 모양의 model_dump (metadata는 JSON 문자열)"""
+    row = info.model_dump()
+    row['metadata'] = '{"engine": "mock"}'
+    return row
+
+
+class TestArrowBatchBuilder:
+    """ArrowBatchBuilder 테스트"""
+
+    def test_round_trip(self):
+        """행 값이 model_dump와 같고 중첩 목록이 list<struct> 열이 되는지 테스트"""
+        resumes = [make_resume(i) for i in range(5)]
+        batches = list(to_record_batches(resumes, batch_size=2))
+
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+        table = pa.Table.from_batches(batches)
+        assert table.to_pylist() == [expected_row(info) for info in resumes]
+        assert pa.types.is_struct(table.schema.field('experience').type.value_type)
+
+    def test_dictionary_encoding(self):
+        """기술과 회사가 사전 인코딩 열이 되고 raw_text 열을 뺄 수 있는지 테스트"""
+        builder = ArrowBatchBuilder(include_raw_text=False)
+        for i in range(4):
+            builder.append(make_resume(i))
+        batch = builder.flush()
+
+        skills = batch.column('skills').values
+        assert pa.types.is_dictionary(skills.type)
+        assert sorted(skills.dictionary.to_pylist()) == ["Go", "Python"]
+        companies = batch.column('experience').values.field('company')
+        assert companies.dictionary.to_pylist() == ["카카오", "회사0", "회사1", "회사2"]
+        assert 'raw_text' not in batch.schema.names
+        assert builder.flush() is None
+
+
+class TestWriters:
+    """Parquet/IPC 쓰기 도구 테스트"""
+
+    def test_parquet_row_groups(self, tmp_path):
+        """batch_size마다 row group을 기록하는지 테스트"""
+        path = tmp_path / "results.parquet"
+        resumes = [make_resume(i) for i in range(7)]
+
+        assert write_parquet(resumes, path, batch_size=3) == 7
+
+        assert pq.ParquetFile(path).num_row_groups == 3
+        table = pq.read_table(path)
+        assert table.column('name').to_pylist() == [info.name for info in resumes]
+        assert table.to_pylist()[1]['experience'][1]['company'] == "회사1"
+
+    def test_ipc_stream(self):
+        """배치마다 사전이 바뀌어도 IPC 스트림의 모든 배치를 읽을 수 있는지 테스트"""
+        sink = io.BytesIO()
+        resumes = [make_resume(i) for i in range(5)]
+        with ArrowResumeWriter(sink, batch_size=2) as writer:
+            writer.write_all(resumes)
+
+        table = pa.ipc.open_stream(sink.getvalue()).read_all()
+        assert table.to_pylist() == [expected_row(info) for info in resumes]
+
+    def test_invalid_batch_size(self, tmp_path):
+        """0 이하의 batch_size는 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            ParquetResumeWriter(tmp_path / "results.parquet", batch_size=0)
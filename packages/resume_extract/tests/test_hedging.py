@@ -0,0 +1,138 @@
+"""
+마감 시간과 헤지 요청 테스트
+"""
+
+import threading
+import time
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.exceptions import ExtractionTimeoutError
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.hedging import HedgedCaller, RateLimiter
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_burst_then_refuse(self):
+        """버킷 크기만큼 허용한 뒤 즉시 거절하는지 테스트"""
+        limiter = RateLimiter(rate=1, burst=2)
+
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+
+    def test_acquire_timeout(self):
+        """토큰이 없으면 timeout 후 False를 반환하는지 테스트"""
+        limiter = RateLimiter(rate=0.1, burst=1)
+        limiter.try_acquire()
+
+        assert not limiter.acquire(timeout=0.05)
+
+
+class TestHedgedCaller:
+    """HedgedCaller 테스트"""
+
+    def test_timeout_raises(self):
+        """마감 시간 내 응답이 없으면 ExtractionTimeoutError가 발생하는지 테스트"""
+        caller = HedgedCaller(timeout=0.05)
+
+        started = time.monotonic()
+        with pytest.raises(ExtractionTimeoutError) as exc_info:
+            caller.call(time.sleep, 1.0)
+
+        assert time.monotonic() - started < 0.5
+        assert exc_info.value.timeout == 0.05
+        assert caller.stats()['timeouts'] == 1
+        caller.close()
+
+    def test_hedge_wins_over_slow_primary(self):
+        """느린 원 요청 대신 헤지 요청의 결과를 사용하는지 테스트"""
+        attempts = []
+        lock = threading.Lock()
+
+        def flaky():
+            with lock:
+                attempts.append(1)
+                first = len(attempts) == 1
+            time.sleep(1.0 if first else 0.01)
+            return "first" if first else "hedge"
+
+        caller = HedgedCaller(timeout=2.0, hedge_after=0.05)
+        started = time.monotonic()
+
+        assert caller.call(flaky) == "hedge"
+        assert time.monotonic() - started < 0.5
+        stats = caller.stats()
+        assert stats['hedged'] == 1
+        assert stats['hedge_wins'] == 1
+        assert stats['hedge_win_rate'] == 1.0
+        caller.close()
+
+    def test_fast_call_not_hedged(self):
+        """헤지 대기 시간 안에 끝난 호출은 헤지하지 않는지 테스트"""
+        caller = HedgedCaller(hedge_after=1.0)
+
+        assert caller.call(lambda: 42) == 42
+        assert caller.stats()['hedged'] == 0
+        caller.close()
+
+    def test_hedge_throttled_by_rate_limiter(self):
+        """레이트 리밋 토큰이 없으면 헤지를 보내지 않는지 테스트"""
+        caller = HedgedCaller(hedge_after=0.01, rate_limiter=RateLimiter(rate=0.1, burst=1))
+
+        assert caller.call(time.sleep, 0.1) is None
+        stats = caller.stats()
+        assert stats['hedged'] == 0
+        assert stats['hedges_throttled'] == 1
+        caller.close()
+
+    def test_error_propagates(self):
+        """시도가 모두 실패하면 원래 예외가 전달되는지 테스트"""
+        caller = HedgedCaller(timeout=1.0)
+
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            caller.call(boom)
+        caller.close()
+
+    def test_percentile_delay(self):
+        """표본이 충분하면 최근 지연 시간 백분위를 헤지 대기 시간으로 쓰는지 테스트"""
+        caller = HedgedCaller(hedge_after=5.0, hedge_percentile=0.9, min_samples=5)
+        assert caller.hedge_delay() == 5.0
+
+        for _ in range(5):
+            caller.call(lambda: None)
+
+        assert caller.hedge_delay() < 1.0
+        caller.close()
+
+
+class TestExtractorDeadline:
+    """ResumeExtractor 마감 시간 테스트"""
+
+    def test_call_timeout(self, sample_resume_text):
+        """call_timeout을 넘긴 모델 호출이 ExtractionTimeoutError로 끝나는지 테스트"""
+        backend = MockBackend([("이름", "김철수")], latency=1.0)
+
+        with ResumeExtractor(backend=backend, call_timeout=0.05, coalesce=False) as extractor:
+            with pytest.raises(ExtractionTimeoutError):
+                extractor.extract_from_text(sample_resume_text)
+
+    def test_hedged_extraction(self, sample_resume_text):
+        """헤지 요청으로 지연 시간 꼬리를 줄이는지 테스트"""
+        latencies = iter([1.0, 0.0, 0.0])
+        backend = MockBackend([("이름", "김철수")], latency=lambda rng: next(latencies, 0.0))
+        caller = HedgedCaller(timeout=2.0, hedge_after=0.05)
+
+        started = time.monotonic()
+        with ResumeExtractor(backend=backend, hedging=caller, coalesce=False) as extractor:
+            result = extractor.extract_from_text(sample_resume_text)
+
+        assert result.name == "김철수"
+        assert time.monotonic() - started < 0.8
+        assert caller.stats()['hedge_wins'] == 1
+        caller.close()
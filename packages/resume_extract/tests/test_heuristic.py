@@ -0,0 +1,100 @@
+"""
+휴리스틱 추출 엔진 테스트
+"""
+
+from unittest.mock import patch
+
+import pytest
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.heuristic import HEURISTIC_CONFIDENCE, HeuristicExtractor
+
+
+class TestHeuristicExtractor:
+    """HeuristicExtractor 테스트"""
+
+    def setup_method(self):
+        """테스트 설정"""
+        self.extractor = HeuristicExtractor()
+
+    def test_segment_sections(self, sample_resume_text):
+        """섹션 분할 테스트"""
+        header, sections = self.extractor.segment_sections(sample_resume_text)
+
+        assert "김철수" in header
+        assert set(sections) >= {
+            'summary', 'experience', 'education', 'skills',
+            'projects', 'certifications', 'languages',
+        }
+        assert "ABC 회사" in sections['experience']
+
+    @pytest.mark.parametrize("text,expected", [
+        ("ABC 회사 (2020.01 ~ 2023.12)", "2020.01 ~ 2023.12"),
+        ("2020.1 - 2023.12", "2020.01 ~ 2023.12"),
+        ("2019년 3월 ~ 2021년 2월", "2019.03 ~ 2021.02"),
+        ("2021 - 현재", "2021 ~ 현재"),
+        ("2022/05 – present", "2022.05 ~ present"),
+        ("기간 없음", None),
+    ])
+    def test_parse_date_range(self, text, expected):
+        """기간 문법 테스트"""
+        assert HeuristicExtractor.parse_date_range(text) == expected
+
+    def test_extract_sample_resume(self, sample_resume_text):
+        """샘플 이력서 전체 추출 테스트"""
+        result = self.extractor.extract(sample_resume_text)
+
+        assert result.name == "김철수"
+        assert result.contact.email == "chulsoo.kim@example.com"
+        assert result.contact.address == "서울특별시 강남구"
+        assert result.summary == "5년 경력의 풀스택 개발자입니다."
+        assert "Spring Boot" in result.skills
+        assert result.confidence_score == HEURISTIC_CONFIDENCE
+
+        assert [e.company for e in result.experience] == ["ABC 회사", "XYZ 스타트업"]
+        assert result.experience[0].position == "시니어 소프트웨어 엔지니어"
+        assert result.experience[0].duration == "2020.01 ~ 2023.12"
+        assert result.experience[1].technologies == ["Python", "Django", "PostgreSQL"]
+
+        education = result.education[0]
+        assert education.institution == "서울대학교"
+        assert education.degree == "학사"
+        assert education.major == "컴퓨터공학과"
+        assert education.gpa == "3.8/4.0"
+
+        assert [p.name for p in result.projects] == ["E-commerce 플랫폼", "실시간 채팅 앱"]
+        assert result.projects[0].url == "https://github.com/example/ecommerce"
+        assert result.projects[0].role == "프론트엔드 개발 담당"
+
+        assert [c.name for c in result.certifications] == [
+            "AWS Solutions Architect - Associate", "정보처리기사"
+        ]
+        assert result.certifications[0].credential_id == "AWS-SAA-123456"
+        assert result.languages[0] == "한국어 (원어민)"
+
+    def test_find_skills_without_section(self):
+        """기술 섹션이 없을 때 사전 기반 추출 테스트"""
+        result = self.extractor.extract("홍길동\nSpring Boot와 react로 서비스를 개발했습니다.")
+
+        assert result.skills == ["Spring Boot", "React"]
+
+
+class TestHeuristicEngine:
+    """ResumeExtractor 휴리스틱 엔진 선택 테스트"""
+
+    @patch('resume_extract.langextract_integration.lx.extract')
+    def test_heuristic_engine_skips_llm(self, mock_extract, sample_resume_text, monkeypatch):
+        """휴리스틱 엔진은 API 키 없이 LLM을 호출하지 않는지 테스트"""
+        monkeypatch.delenv("LANGEXTRACT_API_KEY")
+
+        with ResumeExtractor(engine="heuristic") as extractor:
+            result = extractor.extract_from_text(sample_resume_text)
+
+        mock_extract.assert_not_called()
+        assert result.name == "김철수"
+        assert len(result.experience) == 2
+
+    def test_unknown_engine(self):
+        """지원하지 않는 엔진 테스트"""
+        with ResumeExtractor(engine="unknown") as extractor:
+            with pytest.raises(ValueError):
+                extractor.extract_from_text("홍길동")
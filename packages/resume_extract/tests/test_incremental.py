@@ -0,0 +1,155 @@
+"""
+섹션 단위 증분 재추출 테스트
+"""
+
+from resume_extract.backends import MockBackend
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.incremental import (
+    PROFILE,
+    diff_sections,
+    needs_full_extraction,
+    split_sections,
+)
+from resume_extract.models import ResumeInfo
+
+RESUME = """홍길동
+이메일: hong@example.com
+
+## 요약
+백엔드 개발자입니다.
+
+## 경력
+""" + "\n".join(
+    f"회사{i} 백엔드 개발자 2015.01 ~ 2016.01\n- 결제 시스템 개발과 운영 업무를 담당했습니다." for i in range(10)
+) + """
+
+## 학력
+서울대학교 컴퓨터공학과 학사 2010.03 ~ 2014.02
+
+## 기술
+Python, Go
+"""
+
+
+class RecordingBackend(MockBackend):
+    """모델에 전달된 텍스트를 기록하는 MockBackend"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.texts = []
+
+    def extract(self, text, prompt_description, examples, model_id):
+        self.texts.append(text)
+        return super().extract(text, prompt_description, examples, model_id)
+
+
+class TestSectionDiff:
+    """섹션 분할/비교 테스트"""
+
+    def test_split_sections(self):
+        """머리말은 profile로, 제목 줄은 섹션 본문에 포함되는지 테스트"""
+        sections = split_sections(RESUME)
+
+        assert list(sections) == [PROFILE, 'summary', 'experience', 'education', 'skills']
+        assert sections[PROFILE].startswith("홍길동")
+        assert sections['skills'] == "## 기술\nPython, Go"
+
+    def test_diff_ignores_whitespace(self):
+        """공백만 바뀐 섹션은 변경으로 보지 않는지 테스트"""
+        diff = diff_sections(RESUME, RESUME.replace("Python, Go", "Python,   Go\n"))
+
+        assert not diff.has_changes
+
+    def test_changed_and_removed(self):
+        """바뀐 섹션과 사라진 섹션을 구분하는지 테스트"""
+        new = RESUME.replace("백엔드 개발자입니다.", "플랫폼 개발자입니다.").split("## 학력")[0]
+        diff = diff_sections(RESUME, new)
+
+        assert diff.changed == ['summary']
+        assert diff.removed == ['education', 'skills']
+        assert diff.fields == ('summary',)
+        assert diff.changed_text == "## 요약\n플랫폼 개발자입니다."
+
+    def test_full_extraction_without_sections(self):
+        """섹션 제목이 없으면 전체 재추출이 필요한지 테스트"""
+        assert needs_full_extraction(diff_sections("홍길동\nPython", "홍길동\nGo"))
+
+
+class TestUpdateFromText:
+    """ResumeExtractor.update_from_text 테스트"""
+
+    def _extractor(self, extractions):
+        backend = RecordingBackend(extractions=extractions)
+        return ResumeExtractor(backend=backend, coalesce=False), backend
+
+    def test_only_changed_section_sent(self):
+        """바뀐 섹션만 모델에 보내고 나머지는 이전 결과를 유지하는지 테스트"""
+        extractor, backend = self._extractor([("기술", "Python, Go, Rust")])
+        previous = ResumeInfo(
+            name="홍길동", summary="백엔드 개발자", skills=["Python", "Go"], raw_text=RESUME,
+            confidence_score=0.9,
+        )
+        new = RESUME.replace("Python, Go", "Python, Go, Rust")
+
+        result = extractor.update_from_text(new, previous)
+
+        assert backend.texts == ["## 기술\nPython, Go, Rust"]
+        assert result.skills == ["Python", "Go", "Rust"]
+        assert result.name == "홍길동"
+        assert result.summary == "백엔드 개발자"
+        assert result.raw_text == new
+        assert result.metadata['incremental']['changed'] == ['skills']
+        assert result.metadata['estimated_tokens'] * 10 < len(new) / 1.5
+
+    def test_no_changes_skip_model(self):
+        """변경이 없으면 모델을 호출하지 않는지 테스트"""
+        extractor, backend = self._extractor([])
+        previous = ResumeInfo(name="홍길동", skills=["Python"], raw_text=RESUME)
+
+        result = extractor.update_from_text(RESUME, previous)
+
+        assert backend.texts == []
+        assert result.skills == ["Python"]
+        assert result.metadata['model_calls'] == 0
+
+    def test_removed_section_cleared(self):
+        """삭제된 섹션의 필드는 비워지는지 테스트"""
+        extractor, _ = self._extractor([])
+        previous = ResumeInfo(name="홍길동", skills=["Python", "Go"], raw_text=RESUME)
+        new = RESUME.split("## 기술")[0]
+
+        result = extractor.update_from_text(new, previous)
+
+        assert result.skills == []
+        assert result.metadata['incremental']['removed'] == ['skills']
+
+    def test_large_change_falls_back(self):
+        """대부분 바뀌면 전체 텍스트를 다시 추출하는지 테스트"""
+        extractor, backend = self._extractor([("이름", "김철수")])
+        previous = ResumeInfo(name="홍길동", raw_text=RESUME)
+        new = RESUME.replace("결제", "정산")
+
+        result = extractor.update_from_text(new, previous)
+
+        assert backend.texts == [new]
+        assert result.name == "김철수"
+        assert result.metadata['incremental'] is None
+
+    def test_profile_change_reextracts_contact(self):
+        """머리말이 바뀌면 이름과 연락처를 다시 추출하는지 테스트"""
+        extractor, _ = self._extractor([("이름", "홍길동")])
+        previous = ResumeInfo(name="홍길동", raw_text=RESUME)
+        new = RESUME.replace("hong@example.com", "gildong@example.com")
+
+        result = extractor.update_from_text(new, previous)
+
+        assert result.contact.email == "gildong@example.com"
+        assert result.metadata['incremental']['changed'] == [PROFILE]
+
+    def test_without_previous_text(self):
+        """이전 텍스트가 없으면 전체 추출하는지 테스트"""
+        extractor, backend = self._extractor([])
+
+        extractor.update_from_text(RESUME, ResumeInfo(name="홍길동"))
+
+        assert backend.texts == [RESUME]
@@ -0,0 +1,156 @@
+"""
+트레이싱 스팬 테스트
+"""
+
+import logging
+from unittest.mock import Mock
+
+import pytest
+from resume_extract import instrumentation
+from resume_extract.backends import MockBackend
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.instrumentation import (
+    CONVERT,
+    GET,
+    HEAD,
+    LLM,
+    NORMALIZE,
+    PARSE,
+    CallbackHook,
+    OpenTelemetryHook,
+    add_span_hook,
+    remove_span_hook,
+    span,
+)
+
+
+@pytest.fixture
+def spans():
+    """끝난 스팬을 모으는 콜백 훅 등록 (테스트 후 제거)"""
+    collected = []
+    hook = add_span_hook(CallbackHook(collected.append))
+    yield collected
+    remove_span_hook(hook)
+
+
+class FakeOtelSpan:
+    """OpenTelemetry 스팬 대역"""
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.ended = False
+        self.status = None
+
+    def set_attributes(self, attributes):
+        self.attributes.update(attributes)
+
+    def record_exception(self, error):
+        self.exception = error
+
+    def set_status(self, status):
+        self.status = status
+
+    def end(self):
+        self.ended = True
+
+
+class FakeTracer:
+    """OpenTelemetry Tracer 대역"""
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None):
+        otel_span = FakeOtelSpan(name, attributes)
+        self.spans.append(otel_span)
+        return otel_span
+
+
+class TestSpan:
+    """span() 테스트"""
+
+    def test_noop_without_hooks(self):
+        """훅이 없으면 공유 no-op 객체를 반환하는지 테스트"""
+        with span(PARSE, chars=1) as s:
+            s.set('bytes', 10)
+
+        assert span(LLM) is span(CONVERT)
+
+    def test_callback_receives_attributes(self, spans):
+        """콜백이 이름, 속성, 소요 시간, 예외를 받는지 테스트"""
+        with pytest.raises(ValueError):
+            with span(PARSE, extension='.pdf') as s:
+                s.set('chars', 42)
+                raise ValueError("bad")
+
+        assert spans[0].name == PARSE
+        assert spans[0].attributes == {'extension': '.pdf', 'chars': 42}
+        assert spans[0].duration >= 0
+        assert isinstance(spans[0].error, ValueError)
+
+    def test_opentelemetry_hook(self):
+        """OpenTelemetry 스팬으로 기록되고 종료되는지 테스트"""
+        tracer = FakeTracer()
+        hook = add_span_hook(OpenTelemetryHook(tracer=tracer))
+        try:
+            with span(LLM, model_id="m") as s:
+                s.set('extractions', 3)
+        finally:
+            remove_span_hook(hook)
+
+        otel_span = tracer.spans[0]
+        assert otel_span.name == "resume_extract.llm"
+        assert otel_span.attributes == {'model_id': "m", 'extractions': 3}
+        assert otel_span.ended
+        assert not instrumentation.tracing_enabled()
+
+
+class TestPipelineSpans:
+    """파이프라인 단계별 스팬 테스트"""
+
+    def test_file_pipeline(self, spans, tmp_path):
+        """파일 추출 시 parse, normalize, llm, convert 스팬이 기록되는지 테스트"""
+        path = tmp_path / "resume.txt"
+        path.write_text("김철수\n이메일: chulsoo@example.com", encoding='utf-8')
+
+        with ResumeExtractor(backend=MockBackend([("이름", "김철수")])) as extractor:
+            extractor.extract_from_file(path)
+
+        by_name = {s.name: s for s in spans}
+        assert [s.name for s in spans] == [PARSE, NORMALIZE, LLM, CONVERT]
+        assert by_name[PARSE].attributes['bytes'] == path.stat().st_size
+        assert by_name[PARSE].attributes['chars'] > 0
+        assert by_name[LLM].attributes['model_id'] == "gemini-2.0-flash"
+        assert by_name[LLM].attributes['extractions'] == 1
+        assert by_name[CONVERT].attributes['extractions'] == 1
+
+    def test_webpage_pipeline(self, spans):
+        """웹페이지 추출 시 head, get 스팬에 바이트/문자 수가 기록되는지 테스트"""
+        html = "<html><body><h1>김철수</h1></body></html>"
+        with ResumeExtractor(backend=MockBackend()) as extractor:
+            extractor.downloader.session.head = Mock(return_value=Mock(headers={'content-type': 'text/html'}))
+            extractor.downloader.session.get = Mock(return_value=Mock(
+                text=html, content=html.encode('utf-8'), encoding='utf-8', raise_for_status=Mock()
+            ))
+            extractor.extract_from_url("https://example.com/resume")
+
+        names = [s.name for s in spans]
+        assert names[:3] == [HEAD, GET, NORMALIZE]
+        get_span = spans[1]
+        assert get_span.attributes['bytes'] == len(html.encode('utf-8'))
+        assert get_span.attributes['chars'] == len(html)
+
+
+class TestLogging:
+    """로깅 설정 테스트"""
+
+    def test_root_logger_untouched(self):
+        """추출기를 만들어도 루트 로거 설정을 바꾸지 않는지 테스트"""
+        root = logging.getLogger()
+        handlers, level = list(root.handlers), root.level
+
+        ResumeExtractor(backend=MockBackend()).close()
+
+        assert root.handlers == handlers
+        assert root.level == level
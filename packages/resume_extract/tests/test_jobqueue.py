@@ -0,0 +1,186 @@
+"""
+SQLite 작업 큐 테스트
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.cli import main
+from resume_extract.exceptions import DownloadError, LeaseLostError, ParseError
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.jobqueue import (
+    DONE,
+    DOWNLOADING,
+    EXTRACTING,
+    FAILED,
+    QUEUED,
+    JobQueue,
+    JobWorker,
+    RetryPolicy,
+)
+from resume_extract.models import ResumeInfo
+
+
+def _write_resumes(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"resume_{i}.txt"
+        path.write_text(f"지원자{i}\n이메일: user{i}@example.com\n\n## 기술\nPython", encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+class TestJobQueue:
+    """JobQueue 상태 전이 테스트"""
+
+    def test_enqueue_is_idempotent(self, tmp_path):
+        """같은 항목 ID는 한 번만 추가되는지 테스트"""
+        queue = JobQueue(tmp_path / "jobs.db")
+
+        assert queue.enqueue([("r1", "a.pdf"), "b.pdf"]) == 2
+        assert queue.enqueue([("r1", "a.pdf"), ("r3", "c.pdf")]) == 1
+        assert queue.counts() == {QUEUED: 3}
+
+    def test_claim_and_complete(self, tmp_path):
+        """점유한 항목을 단계 상태를 거쳐 완료하는지 테스트"""
+        queue = JobQueue(tmp_path / "jobs.db")
+        queue.enqueue([("r1", "a.pdf")])
+
+        job = queue.claim("worker-a")
+        assert job.item_id == "r1" and job.attempts == 1
+        assert queue.get("r1")['state'] == DOWNLOADING
+        assert queue.claim("worker-b") is None
+
+        assert queue.heartbeat(job, EXTRACTING)
+        assert queue.complete(job, ResumeInfo(name="홍길동"))
+        record = queue.get("r1")
+        assert record['state'] == DONE
+        assert record['result']['name'] == "홍길동"
+
+    def test_expired_lease_reclaimed(self, tmp_path):
+        """점유가 만료된 항목은 다른 워커가 가져가고 이전 워커의 결과는 거부되는지 테스트"""
+        queue = JobQueue(tmp_path / "jobs.db", visibility_timeout=0.05)
+        queue.enqueue([("r1", "a.pdf")])
+        dead = queue.claim("dead-worker")
+        time.sleep(0.1)
+
+        job = queue.claim("worker-b")
+
+        assert job.id == dead.id and job.attempts == 2
+        assert not queue.complete(dead, ResumeInfo())
+        assert queue.get("r1")['lease_owner'] == "worker-b"
+
+    def test_fail_after_lease_lost(self, tmp_path):
+        """점유를 잃은 워커의 실패 기록은 거부되고 새 점유 상태가 유지되는지 테스트"""
+        queue = JobQueue(tmp_path / "jobs.db", visibility_timeout=0.05)
+        queue.enqueue([("r1", "a.pdf")])
+        dead = queue.claim("dead-worker")
+        time.sleep(0.1)
+        queue.claim("worker-b")
+
+        with pytest.raises(LeaseLostError):
+            queue.fail(dead, DownloadError("https://example.com/a.pdf"))
+
+        record = queue.get("r1")
+        assert record['lease_owner'] == "worker-b"
+        assert record['state'] == DOWNLOADING
+
+    def test_expired_lease_exhausts_attempts(self, tmp_path):
+        """점유 만료가 반복되어 시도 횟수를 다 쓰면 failed가 되는지 테스트"""
+        queue = JobQueue(tmp_path / "jobs.db", visibility_timeout=0.01, retry=RetryPolicy(max_attempts=1))
+        queue.enqueue([("r1", "a.pdf")])
+        queue.claim("dead-worker")
+        time.sleep(0.05)
+
+        assert queue.claim("worker-b") is None
+        assert queue.get("r1")['error']['type'] == "LeaseExpired"
+
+    def test_retry_by_exception_type(self, tmp_path):
+        """재시도 대상 예외는 백오프 후 다시 대기하고, 그 외는 바로 failed인지 테스트"""
+        queue = JobQueue(tmp_path / "jobs.db", retry=RetryPolicy(max_attempts=3, jitter=0.0))
+        queue.enqueue([("r1", "a.pdf"), ("r2", "b.pdf")])
+
+        first = queue.claim()
+        assert queue.fail(first, DownloadError("https://example.com/a.pdf")) == 2.0
+        assert queue.get("r1")['state'] == QUEUED
+        assert queue.get("r1")['available_at'] > time.time() + 1
+
+        second = queue.claim()
+        assert second.item_id == "r2"
+        assert queue.fail(second, ParseError("b.pdf")) is None
+        assert queue.get("r2")['state'] == FAILED
+        assert queue.get("r2")['error']['type'] == "ParseError"
+        assert queue.claim() is None
+
+    def test_backoff_grows(self):
+        """시도 횟수에 따라 대기 시간이 두 배씩 늘어나는지 테스트"""
+        policy = RetryPolicy(max_attempts=5, jitter=0.0)
+        error = DownloadError("https://example.com")
+
+        assert [policy.retry_delay(error, n) for n in (1, 2, 3, 5)] == [2.0, 4.0, 8.0, None]
+
+    def test_concurrent_claims_are_exclusive(self, tmp_path):
+        """연결이 다른 여러 워커가 동시에 가져가도 항목이 한 번씩만 점유되는지 테스트"""
+        path = tmp_path / "jobs.db"
+        JobQueue(path).enqueue([(f"r{i}", f"{i}.pdf") for i in range(40)])
+        claimed = []
+
+        def work():
+            queue = JobQueue(path)
+            while True:
+                job = queue.claim()
+                if job is None:
+                    return
+                claimed.append(job.item_id)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claimed) == sorted(f"r{i}" for i in range(40))
+
+
+class TestJobWorker:
+    """JobWorker 테스트"""
+
+    def test_process_queue(self, tmp_path):
+        """항목을 처리해 결과와 실패를 기록하는지 테스트"""
+        paths = _write_resumes(tmp_path, 3)
+        queue = JobQueue(tmp_path / "jobs.db")
+        queue.enqueue([(f"r{i}", str(p)) for i, p in enumerate(paths)] + [("missing", str(tmp_path / "x.txt"))])
+        extractor = ResumeExtractor(backend=MockBackend(extractions=[("이름", "지원자")]))
+
+        processed = JobWorker(extractor, queue, poll_interval=0.01).run()
+
+        assert processed == 4
+        assert queue.counts() == {DONE: 3, FAILED: 1}
+        assert queue.get("r1")['result']['contact']['email'] == "user1@example.com"
+        assert queue.get("missing")['error']['type'] == "ParseError"
+
+
+class TestQueueCommand:
+    """queue 명령 테스트"""
+
+    def test_add_work_export(self, tmp_path, capsys):
+        """add → work → export 흐름과 재실행 시 중복 추가가 없는지 테스트"""
+        paths = _write_resumes(tmp_path, 3)
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text("".join(json.dumps(str(p)) + "\n" for p in paths), encoding='utf-8')
+        database = str(tmp_path / "jobs.db")
+        output = tmp_path / "out.jsonl"
+
+        assert main(["queue", "add", database, str(manifest)]) == 0
+        assert main(["queue", "add", database, str(manifest)]) == 0
+        assert main(["queue", "work", database, "--engine", "heuristic", "--threads", "2"]) == 0
+        assert main(["queue", "export", database, "-o", str(output)]) == 0
+
+        status = json.loads(capsys.readouterr().out.splitlines()[-1])
+        records = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        assert status[DONE] == 3 and status[QUEUED] == 0
+        assert sorted(r['source'] for r in records) == sorted(str(p) for p in paths)
+        assert all('result' in r for r in records)
@@ -0,0 +1,127 @@
+"""
+JSONL 스트리밍 쓰기 테스트
+"""
+
+import gzip
+import io
+import json
+
+import pytest
+from resume_extract import jsonl
+from resume_extract.cli import main
+from resume_extract.jsonl import JSONLWriter, write_jsonl
+from resume_extract.models import ContactInfo, ExperienceInfo, ResumeInfo
+
+
+def make_resume(i: int) -> ResumeInfo:
+    return ResumeInfo(
+        name=f"지원자{i}",
+        contact=ContactInfo(email=f"user{i}@example.com"),
+        skills=["Python", "Go"],
+        experience=[ExperienceInfo(company="카카오", position="개발자", duration="2020.01 ~ 2023.12")],
+        raw_text=f"원문\n{i}",
+        confidence_score=0.8,
+    )
+
+
+class TestJSONLWriter:
+    """JSONLWriter 테스트"""
+
+    def test_compact_lines(self):
+        """결과마다 공백 없는 한 줄을 쓰고 값이 model_dump와 같은지 테스트"""
+        sink = io.BytesIO()
+        resumes = [make_resume(i) for i in range(3)]
+
+        assert write_jsonl(resumes, sink, buffer_size=64) == 3
+
+        lines = sink.getvalue().decode('utf-8').splitlines()
+        assert len(lines) == 3
+        assert [json.loads(line) for line in lines] == [info.model_dump(mode='json') for info in resumes]
+        assert '": ' not in lines[0] and "지원자0" in lines[0]
+
+    def test_record_with_result(self):
+        """레코드에 직렬화된 결과를 이어 붙이고 제외 필드를 빼는지 테스트"""
+        sink = io.BytesIO()
+        with JSONLWriter(sink, exclude={'raw_text'}) as writer:
+            writer.write_record({'id': "1", 'source': "a.pdf"}, make_resume(1))
+            writer.write_record({}, make_resume(2), key='value')
+            writer.write_record({'id': "3", 'error': {'type': "ParseError", 'message': "오류"}})
+
+        first, second, third = [json.loads(line) for line in sink.getvalue().splitlines()]
+        assert list(first) == ['id', 'source', 'result']
+        assert first['result']['name'] == "지원자1" and 'raw_text' not in first['result']
+        assert second['value']['name'] == "지원자2"
+        assert third['error']['message'] == "오류"
+
+    def test_json_fallback(self, monkeypatch):
+        """orjson이 없어도 같은 내용을 쓰는지 테스트"""
+        record = {'id': "1", 'score': 0.5, 'tags': ["한국어"]}
+        expected = jsonl.dumps(record)
+        monkeypatch.setattr(jsonl, 'orjson', None)
+
+        assert jsonl.json_backend() == 'json'
+        assert json.loads(jsonl.dumps(record)) == json.loads(expected)
+
+    def test_gzip_append(self, tmp_path):
+        """확장자로 gzip을 고르고, 이어 쓴 파일도 한 번에 풀리는지 테스트"""
+        path = tmp_path / "results.jsonl.gz"
+        write_jsonl([make_resume(0)], path)
+        write_jsonl([make_resume(1)], path, append=True)
+
+        lines = gzip.decompress(path.read_bytes()).splitlines()
+        assert [json.loads(line)['name'] for line in lines] == ["지원자0", "지원자1"]
+
+    def test_zstd(self, tmp_path):
+        """zstd 압축 출력 테스트"""
+        zstandard = pytest.importorskip("zstandard")
+        path = tmp_path / "results.jsonl.zst"
+
+        write_jsonl([make_resume(i) for i in range(3)], path)
+
+        with zstandard.ZstdDecompressor().stream_reader(path.open('rb')) as reader:
+            lines = reader.read().splitlines()
+        assert len(lines) == 3
+
+    def test_invalid_compression(self, tmp_path):
+        """지원하지 않는 압축 방식은 기존 파일을 비우기 전에 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            JSONLWriter(io.BytesIO(), compression='lz4')
+
+        path = tmp_path / "results.jsonl"
+        path.write_bytes(b'{"name":"kept"}\n')
+        with pytest.raises(ValueError):
+            JSONLWriter(path, compression='lz4')
+        assert path.read_bytes() == b'{"name":"kept"}\n'
+
+
+class TestBatchOutput:
+    """batch 명령 압축 출력 테스트"""
+
+    def test_compressed_output(self, tmp_path):
+        """출력 파일 확장자로 압축해서 기록하는지 테스트"""
+        resume = tmp_path / "resume.txt"
+        resume.write_text("홍길동\n이메일: hong@example.com", encoding='utf-8')
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text(f'{{"id": "r1", "source": "{resume}"}}\n', encoding='utf-8')
+        output = tmp_path / "out.jsonl.gz"
+
+        assert main(["batch", str(manifest), "-o", str(output), "--engine", "heuristic"]) == 0
+
+        record = json.loads(gzip.decompress(output.read_bytes()))
+        assert record['id'] == "r1" and record['result']['contact']['email'] == "hong@example.com"
+
+    def test_checkpoint_rejected_for_compressed_output(self, tmp_path, capsys):
+        """압축 출력에는 체크포인트를 쓸 수 없고 기존 출력을 건드리지 않는지 테스트"""
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text('"resume.txt"\n', encoding='utf-8')
+        output = tmp_path / "out.jsonl.gz"
+        output.write_bytes(b"partial")
+        checkpoint = tmp_path / "progress.txt"
+        checkpoint.write_text("r0\n", encoding='utf-8')
+
+        assert main(["batch", str(manifest), "-o", str(output), "--engine", "heuristic",
+                     "--checkpoint", str(checkpoint)]) == 2
+
+        assert "--checkpoint" in capsys.readouterr().err
+        assert output.read_bytes() == b"partial"
+        assert checkpoint.read_text(encoding='utf-8') == "r0\n"
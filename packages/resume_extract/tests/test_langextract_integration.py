@@ -0,0 +1,157 @@
+"""
+LangExtract 결과 변환 테스트
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import langextract as lx
+from resume_extract.backends import build_extractions
+from resume_extract.langextract_integration import LangExtractProcessor
+
+
+def make_result(text, items):
+    """(클래스, 텍스트) 목록으로 위치가 정렬된 AnnotatedDocument 생성"""
+    return lx.data.AnnotatedDocument(text=text, extractions=build_extractions(text, items))
+
+
+class TestParseLangExtractResult:
+    """_parse_langextract_result 디스패치/그룹화 테스트"""
+
+    def setup_method(self):
+        """테스트 설정"""
+        self.processor = LangExtractProcessor(api_key="test-key")
+
+    def test_scalar_first_value_wins(self):
+        """반복되는 단일 필드는 첫 값을 유지하는지 테스트"""
+        text = "김철수 kim@example.com 김영희 lee@example.com"
+        result = make_result(text, [
+            ("이름", "김철수"), ("이메일", "kim@example.com"),
+            ("이름", "김영희"), ("email", "lee@example.com"),
+        ])
+
+        parsed = self.processor._parse_langextract_result(result)
+
+        assert parsed['name'] == "김철수"
+        assert parsed['email'] == "kim@example.com"
+
+    def test_groups_records(self, sample_resume_text):
+        """경력/학력/프로젝트/자격증 레코드 그룹화 테스트"""
+        result = make_result(sample_resume_text, [
+            ("회사", "ABC 회사"),
+            ("직책", "시니어 소프트웨어 엔지니어"),
+            ("근무기간", "2020.01 ~ 2023.12"),
+            ("업무설명", "React, Node.js를 이용한 웹 애플리케이션 개발"),
+            ("업무설명", "마이크로서비스 아키텍처 설계 및 구현"),
+            ("회사", "XYZ 스타트업"),
+            ("직책", "주니어 개발자"),
+            ("근무기간", "2018.03 ~ 2019.12"),
+            ("학교", "서울대학교"),
+            ("학위", "학사"),
+            ("전공", "컴퓨터공학과"),
+            ("학업기간", "2014.03 ~ 2018.02"),
+            ("성적", "3.8/4.0"),
+            ("기술", "JavaScript, Python"),
+            ("기술", "React, Python"),
+            ("프로젝트명", "E-commerce 플랫폼"),
+            ("프로젝트기술", "React, Node.js, MongoDB, AWS"),
+            ("프로젝트명", "실시간 채팅 앱"),
+            ("역할", "풀스택 개발"),
+            ("자격증", "AWS Solutions Architect - Associate"),
+            ("발급기관", "Amazon Web Services"),
+            ("자격증", "정보처리기사"),
+            ("발급기관", "한국산업인력공단"),
+        ])
+
+        info = self.processor._convert_to_resume_info(result, sample_resume_text, self.processor.fields)
+
+        assert [e.company for e in info.experience] == ["ABC 회사", "XYZ 스타트업"]
+        assert info.experience[0].description == (
+            "React, Node.js를 이용한 웹 애플리케이션 개발\n마이크로서비스 아키텍처 설계 및 구현"
+        )
+        assert info.experience[1].duration == "2018.03 ~ 2019.12"
+        assert info.education[0].major == "컴퓨터공학과"
+        assert info.education[0].gpa == "3.8/4.0"
+        assert info.skills == ["JavaScript", "Python", "React"]
+        assert [p.name for p in info.projects] == ["E-commerce 플랫폼", "실시간 채팅 앱"]
+        assert info.projects[0].technologies == ["React", "Node.js", "MongoDB", "AWS"]
+        assert info.projects[1].role == "풀스택 개발"
+        assert [c.issuer for c in info.certifications] == ["Amazon Web Services", "한국산업인력공단"]
+
+    def test_distant_extractions_split_records(self):
+        """위치가 멀리 떨어진 추출은 다른 레코드로 나뉘는지 테스트"""
+        text = "ABC 회사" + " " * 1000 + "2020.01 ~ 2023.12"
+        result = make_result(text, [("회사", "ABC 회사"), ("근무기간", "2020.01 ~ 2023.12")])
+
+        parsed = self.processor._parse_langextract_result(result)
+
+        assert parsed['experience'] == [{'company': "ABC 회사"}]
+
+    def test_unknown_and_fallback_classes(self):
+        """테이블에 없는 클래스 처리 테스트"""
+        result = make_result("김철수 취미", [("지원자 이름", "김철수"), ("취미", "독서")])
+
+        parsed = self.processor._parse_langextract_result(result)
+
+        assert parsed == {'name': "김철수"}
+
+    def test_record_name_classes_do_not_overwrite_name(self):
+        """company_name 같은 다른 레코드의 이름 클래스가 지원자 이름을 덮어쓰지 않는지 테스트"""
+        text = "카카오 서울대학교 정보처리기사 라이선스 김철수"
+        result = make_result(text, [
+            ("company_name", "카카오"),
+            ("school_name", "서울대학교"),
+            ("certification_name", "정보처리기사"),
+            ("license_name", "라이선스"),
+            ("이름", "김철수"),
+        ])
+
+        parsed = self.processor._parse_langextract_result(result)
+
+        assert parsed['name'] == "김철수"
+        assert parsed['experience'] == [{'company': "카카오"}]
+        assert parsed['education'] == [{'institution': "서울대학교"}]
+        assert parsed['certifications'] == [{'name': "정보처리기사"}]
+
+    def test_empty_result(self):
+        """추출 결과가 없을 때 테스트"""
+        assert self.processor._parse_langextract_result(None) == {}
+
+
+class TestMultiTenant:
+    """테넌트별 설정 격리 테스트"""
+
+    def test_api_key_not_written_to_environment(self, monkeypatch):
+        """API 키를 프로세스 환경 변수에 쓰지 않고 백엔드에 보관하는지 테스트"""
+        processor = LangExtractProcessor(
+            api_key="tenant-a-key",
+            backend_options={'language_model_params': {'model_url': "http://tenant-a"}},
+        )
+
+        assert os.environ["LANGEXTRACT_API_KEY"] == "test-api-key"
+        assert processor.backend.api_key == "tenant-a-key"
+        assert processor.backend.extract_kwargs['language_model_params'] == {'model_url': "http://tenant-a"}
+
+    def test_concurrent_tenants(self, monkeypatch):
+        """키와 모델이 다른 프로세서를 동시에 사용해도 설정이 섞이지 않는지 테스트"""
+        def fake_extract(text_or_documents, prompt_description, examples, model_id, api_key=None, **kwargs):
+            time.sleep(0.001)
+            return lx.data.AnnotatedDocument(
+                text=text_or_documents,
+                extractions=[lx.data.Extraction(extraction_class="이름", extraction_text=f"{api_key}/{model_id}")],
+            )
+
+        monkeypatch.setattr(lx, "extract", fake_extract)
+        processors = {
+            tenant: LangExtractProcessor(api_key=f"{tenant}-key", model_id=f"{tenant}-model")
+            for tenant in ("a", "b", "c")
+        }
+
+        def run(tenant):
+            return tenant, processors[tenant].extract_resume_info("이력서", fields=["name"]).name
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(run, ["a", "b", "c"] * 20))
+
+        assert all(name == f"{tenant}-key/{tenant}-model" for tenant, name in results)
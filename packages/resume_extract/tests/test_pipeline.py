@@ -0,0 +1,242 @@
+"""
+파이프라인 배치 처리 테스트
+"""
+
+import threading
+import time
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.exceptions import ParseError
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.pipeline import Stage, run_pipeline
+
+
+def _write_resumes(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"resume_{i}.txt"
+        path.write_text(f"지원자{i}\n이메일: user{i}@example.com\n\n## 기술\nPython", encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+class TestRunPipeline:
+    """run_pipeline 테스트"""
+
+    def test_ordered_results(self):
+        """ordered=True면 완료 순서와 무관하게 입력 순서로 반환하는지 테스트"""
+        def slow_first(item):
+            time.sleep(0.05 if item.source == 0 else 0.0)
+            return item.source * 10
+
+        stages = [Stage('double', slow_first, 4)]
+        results = list(run_pipeline(range(8), stages, ordered=True))
+
+        assert [r.index for r in results] == list(range(8))
+        assert [r.result for r in results] == [i * 10 for i in range(8)]
+
+    def test_stage_error_isolated(self):
+        """실패한 항목은 error로 전달되고 뒷단계를 건너뛰는지 테스트"""
+        seen = []
+
+        def check(item):
+            if item.source == 2:
+                raise ValueError("bad")
+            return item.source
+
+        def record(item):
+            seen.append(item.source)
+            return item.payload
+
+        results = list(run_pipeline(range(4), [Stage('check', check, 2), Stage('record', record, 1)], ordered=True))
+
+        assert [r.ok for r in results] == [True, True, False, True]
+        assert isinstance(results[2].error, ValueError)
+        assert 2 not in seen
+
+    def test_backpressure(self):
+        """소비자가 느리면 처리 중인 항목 수가 max_in_flight로 제한되는지 테스트"""
+        lock = threading.Lock()
+        active = {'now': 0, 'max': 0}
+
+        def start(item):
+            with lock:
+                active['now'] += 1
+                active['max'] = max(active['max'], active['now'])
+            return item.source
+
+        stages = [Stage('start', start, 2)]
+        for _ in run_pipeline(range(30), stages, queue_size=2, max_in_flight=4):
+            time.sleep(0.005)
+            with lock:
+                active['now'] -= 1
+
+        assert active['max'] <= 4
+
+    def test_source_error_raised_after_results(self):
+        """입력을 읽다 실패하면 투입된 항목을 내보낸 뒤 예외를 전달하는지 테스트"""
+        def sources():
+            yield 1
+            yield 2
+            raise RuntimeError("manifest broken")
+
+        results = []
+        with pytest.raises(RuntimeError):
+            for result in run_pipeline(sources(), [Stage('same', lambda item: item.source, 1)]):
+                results.append(result.result)
+
+        assert sorted(results) == [1, 2]
+
+
+    def test_invalid_workers(self):
+        """작업 스레드 수가 1보다 작으면 이터레이터를 읽기 전에 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            run_pipeline(range(3), [Stage('same', lambda item: item.source, 0)])
+
+    def test_discard_on_early_stop(self):
+        """소비자가 중간에 멈추면 내보내지 못한 항목마다 discard가 호출되는지 테스트"""
+        produced, discarded = [], []
+        lock = threading.Lock()
+
+        def produce(item):
+            with lock:
+                produced.append(item.index)
+            return item.index
+
+        def slow(item):
+            time.sleep(0.02)
+            return item.payload
+
+        results = run_pipeline(range(20), [Stage('produce', produce, 4), Stage('slow', slow, 1)],
+                               queue_size=2, discard=lambda item: discarded.append(item.index))
+        first = next(results)
+        results.close()
+        time.sleep(0.3)
+
+        assert set(produced) <= {first.index} | set(discarded)
+        assert len(set(discarded)) == len(discarded)
+
+
+class TestExtractMany:
+    """ResumeExtractor.extract_many 테스트"""
+
+    def test_files(self, tmp_path):
+        """파일 여러 개를 처리하고 파싱 소요 시간을 기록하는지 테스트"""
+        paths = _write_resumes(tmp_path, 5)
+        backend = MockBackend([("이름", "김철수")])
+
+        with ResumeExtractor(backend=backend) as extractor:
+            results = list(extractor.extract_many(paths, ordered=True))
+
+        assert [r.source for r in results] == paths
+        assert all(r.ok for r in results)
+        assert results[0].result.contact.email == "user0@example.com"
+        assert 'parse' in results[0].result.metadata['phases']
+
+    def test_missing_file(self, tmp_path):
+        """없는 파일은 ParseError로 전달되고 나머지는 처리되는지 테스트"""
+        paths = _write_resumes(tmp_path, 2)
+        sources = [paths[0], tmp_path / "missing.txt", paths[1]]
+
+        with ResumeExtractor(backend=MockBackend()) as extractor:
+            results = list(extractor.extract_many(sources, ordered=True))
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, ParseError)
+
+    def test_urls(self, monkeypatch):
+        """URL은 다운로드 단계를 거치고 다운로드 시간이 기록되는지 테스트"""
+        with ResumeExtractor(backend=MockBackend([("이름", "김철수")])) as extractor:
+            monkeypatch.setattr(
+                extractor.downloader, "download_and_extract_text",
+                lambda url, deadline=None: (f"김철수\n{url}", None),
+            )
+            results = list(extractor.extract_many(
+                [f"https://example.com/{i}" for i in range(3)], ordered=True
+            ))
+
+        assert all(r.ok for r in results)
+        assert 'download' in results[0].result.metadata['phases']
+
+    def test_stages_overlap(self, tmp_path):
+        """모델 호출이 병렬로 진행되어 순차 처리보다 빠른지 테스트"""
+        paths = _write_resumes(tmp_path, 8)
+        backend = MockBackend([("이름", "김철수")], latency=0.05)
+
+        started = time.perf_counter()
+        with ResumeExtractor(backend=backend) as extractor:
+            results = list(extractor.extract_many(paths, extract_workers=8))
+        elapsed = time.perf_counter() - started
+
+        assert len(results) == 8
+        assert elapsed < 8 * 0.05
+
+    def test_invalid_workers(self, tmp_path):
+        """--parse-workers 0처럼 작업 스레드가 없는 단계는 호출 시점에 거부하는지 테스트"""
+        with ResumeExtractor(backend=MockBackend()) as extractor:
+            with pytest.raises(ValueError):
+                extractor.extract_many(_write_resumes(tmp_path, 1), parse_workers=0)
+
+    def test_temp_files_removed_on_early_stop(self, tmp_path, monkeypatch):
+        """배치를 중간에 멈춰도 파싱 전에 대기하던 다운로드 임시 파일이 삭제되는지 테스트"""
+        downloads = tmp_path / "downloads"
+        downloads.mkdir()
+
+        def download(url, deadline=None):
+            path = downloads / f"{url.rsplit('/', 1)[1]}.txt"
+            path.write_text(f"김철수\n{url}", encoding='utf-8')
+            return None, str(path)
+
+        with ResumeExtractor(backend=MockBackend([("이름", "김철수")])) as extractor:
+            monkeypatch.setattr(extractor.downloader, "download_and_extract_text", download)
+            parse = extractor.parser.parse
+
+            def slow_parse(path, deadline=None):
+                time.sleep(0.02)
+                return parse(path, deadline=deadline)
+
+            monkeypatch.setattr(extractor.parser, "parse", slow_parse)
+            results = extractor.extract_many([f"https://example.com/{i}" for i in range(30)],
+                                             download_workers=4, parse_workers=1, queue_size=2)
+            assert next(results).ok
+            results.close()
+
+            for _ in range(50):
+                if not any(downloads.iterdir()):
+                    break
+                time.sleep(0.05)
+        assert not any(downloads.iterdir())
+
+
+class TestStageAPI:
+    """ResumeExtractor 단계 API 테스트"""
+
+    def test_file_stages(self, tmp_path):
+        """파일이 단계 API를 차례로 거쳐 추출되는지 테스트"""
+        path = _write_resumes(tmp_path, 1)[0]
+
+        with ResumeExtractor(backend=MockBackend([("이름", "김철수")]), deadline=5.0) as extractor:
+            document = extractor.download_stage(path)
+            assert document.deadline is not None and not document.temporary
+            document = extractor.parse_stage(document)
+            result = extractor.extract_stage(document)
+
+        assert result.contact.email == "user0@example.com"
+        assert 'parse' in result.metadata['phases']
+
+    def test_discard_removes_download(self, tmp_path, monkeypatch):
+        """파싱 전에 discard_stage를 호출하면 다운로드 임시 파일이 삭제되는지 테스트"""
+        downloaded = tmp_path / "download.txt"
+        downloaded.write_text("김철수", encoding='utf-8')
+
+        with ResumeExtractor(backend=MockBackend()) as extractor:
+            monkeypatch.setattr(extractor.downloader, "download_and_extract_text",
+                                lambda url, deadline=None: (None, str(downloaded)))
+            document = extractor.download_stage("https://example.com/cv.txt")
+            assert document.temporary
+            extractor.discard_stage(document)
+            extractor.discard_stage(document)
+
+        assert not downloaded.exists()
+        assert not document.temporary
@@ -0,0 +1,76 @@
+"""
+공유 추출기 풀 테스트
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+from resume_extract import close_pool, extract_from_text, get_extractor
+from resume_extract.backends import MockBackend
+from resume_extract.extractor import ExtractorPool
+
+
+class TestExtractorPool:
+    """ExtractorPool 테스트"""
+
+    def test_same_config_reused(self):
+        """같은 설정은 같은 추출기를, 다른 설정은 다른 추출기를 반환하는지 테스트"""
+        pool = ExtractorPool(factory=MagicMock(side_effect=lambda **kwargs: MagicMock()))
+
+        a = pool.get(model_id="m1", fields=["name", "email"], backend_options={'x': [1]})
+        b = pool.get(backend_options={'x': [1]}, fields=["name", "email"], model_id="m1")
+        c = pool.get(model_id="m2")
+
+        assert a is b
+        assert a is not c
+        assert len(pool) == 2
+
+    def test_concurrent_get_creates_once(self):
+        """여러 스레드가 동시에 요청해도 추출기를 한 번만 만드는지 테스트"""
+        factory = MagicMock(side_effect=lambda **kwargs: MagicMock())
+        pool = ExtractorPool(factory=factory)
+        barrier = threading.Barrier(16)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(pool.get(model_id="m"))
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert factory.call_count == 1
+        assert all(result is results[0] for result in results)
+
+    def test_warm_up_and_close(self):
+        """warm_up이 프로세서를 미리 만들고 close가 모든 추출기를 정리하는지 테스트"""
+        pool = ExtractorPool()
+        backend = MockBackend()
+
+        extractor = pool.warm_up(backend=backend)
+        assert extractor.langextract_processor is not None
+        assert pool.get(backend=backend) is extractor
+
+        pool.close()
+        assert len(pool) == 0
+
+
+class TestConvenienceFunctionsPool:
+    """편의 함수 공유 풀 테스트"""
+
+    def test_connection_reuse(self, sample_resume_text):
+        """편의 함수가 호출 사이에 같은 추출기와 세션을 재사용하는지 테스트"""
+        backend = MockBackend([("이름", "김철수")])
+        try:
+            extract_from_text(sample_resume_text, backend=backend)
+            session = get_extractor(backend=backend).downloader.session
+            result = extract_from_text(sample_resume_text, backend=backend)
+
+            assert result.name == "김철수"
+            assert get_extractor(backend=backend).downloader.session is session
+            assert backend.stats()['calls'] == 2
+        finally:
+            close_pool()
@@ -0,0 +1,66 @@
+"""
+프로세스 풀 파싱 테스트
+"""
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.exceptions import ParseError, UnsupportedFileTypeError
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.process_parser import ProcessPoolParser
+
+
+@pytest.fixture(scope="module")
+def pool_parser():
+    """모듈 전체에서 공유하는 프로세스 풀 파서 (프로세스 시작 비용 절감)"""
+    with ProcessPoolParser(max_workers=2) as parser:
+        yield parser
+
+
+class TestProcessPoolParser:
+    """ProcessPoolParser 테스트"""
+
+    def test_parse_text(self, pool_parser, tmp_path):
+        """작업 프로세스에서 파싱한 텍스트를 그대로 받는지 테스트"""
+        path = tmp_path / "resume.txt"
+        text = "김철수\n이메일: chulsoo@example.com\n" * 500
+        path.write_text(text, encoding='utf-8')
+
+        assert pool_parser.parse(str(path)) == text.strip()
+
+    def test_parse_html(self, pool_parser, tmp_path):
+        """HTML 파싱 결과가 FileParser와 같은지 테스트"""
+        path = tmp_path / "resume.html"
+        path.write_text("<html><script>x()</script><body><h1>김철수</h1><p>개발자</p></body></html>", encoding='utf-8')
+
+        assert pool_parser.parse(str(path)) == "김철수\n개발자"
+
+    def test_errors_preserved(self, pool_parser, tmp_path):
+        """작업 프로세스의 예외가 같은 종류와 상세 내용으로 전달되는지 테스트"""
+        with pytest.raises(ParseError) as exc_info:
+            pool_parser.parse(str(tmp_path / "missing.txt"))
+        assert exc_info.value.file_path.endswith("missing.txt")
+        assert exc_info.value.details == "파일이 존재하지 않습니다"
+
+        path = tmp_path / "resume.xyz"
+        path.write_text("x", encoding='utf-8')
+        with pytest.raises(UnsupportedFileTypeError) as exc_info:
+            pool_parser.parse(str(path))
+        assert exc_info.value.file_type == ".xyz"
+
+
+class TestExtractorProcessMode:
+    """ResumeExtractor 프로세스 파싱 모드 테스트"""
+
+    def test_extract_many_with_processes(self, tmp_path):
+        """parse_processes로 파싱을 프로세스 풀에서 실행하는지 테스트"""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"resume_{i}.txt"
+            path.write_text(f"지원자{i}\n이메일: user{i}@example.com", encoding='utf-8')
+            paths.append(path)
+
+        with ResumeExtractor(backend=MockBackend(), parse_processes=2) as extractor:
+            assert isinstance(extractor.parser, ProcessPoolParser)
+            results = list(extractor.extract_many(paths, ordered=True))
+
+        assert [r.result.contact.email for r in results] == [f"user{i}@example.com" for i in range(4)]
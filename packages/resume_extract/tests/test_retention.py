@@ -0,0 +1,108 @@
+"""
+raw_text 보관 정책 테스트
+"""
+
+import json
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.cli import main
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.models import ResumeInfo
+from resume_extract.retention import (
+    FileTextStore,
+    InMemoryTextStore,
+    RawTextRetention,
+    full_raw_text,
+    text_digest,
+)
+
+RESUME = "홍길동\n이메일: hong@example.com\n\n## 경력\n카카오 - 백엔드 개발자 (2020.01 ~ 2023.12)\n\n## 기술\nPython, Go"
+
+
+class TestRawTextRetention:
+    """RawTextRetention 테스트"""
+
+    def test_truncate(self):
+        """앞부분만 남기고 원문 해시와 길이를 기록하는지 테스트"""
+        info = RawTextRetention('truncate', max_chars=5).apply(ResumeInfo(raw_text=RESUME))
+
+        assert info.raw_text == RESUME[:5]
+        assert info.raw_text_ref.sha256 == text_digest(RESUME)
+        assert info.raw_text_ref.length == len(RESUME)
+        assert full_raw_text(info) is None
+
+    def test_reference_round_trip(self, tmp_path):
+        """원문을 파일 저장소에 한 번만 저장하고 참조로 다시 읽는지 테스트"""
+        path = tmp_path / "texts.bin"
+        store = FileTextStore(path)
+        policy = RawTextRetention('reference', store=store)
+
+        first = policy.apply(ResumeInfo(), RESUME)
+        second = policy.apply(ResumeInfo(), RESUME)
+        other = policy.apply(ResumeInfo(), "김철수")
+        store.close()
+
+        assert first.raw_text is None
+        assert first.raw_text_ref == second.raw_text_ref
+        assert other.raw_text_ref.offset == first.raw_text_ref.size
+        assert path.stat().st_size == len(RESUME.encode('utf-8')) + len("김철수".encode('utf-8'))
+        # 다른 인스턴스(다음 실행)에서도 참조만으로 읽을 수 있음
+        assert FileTextStore(path).get(other.raw_text_ref) == "김철수"
+
+    def test_drop(self):
+        """원문을 보관하지 않는지 테스트"""
+        info = RawTextRetention('drop').apply(ResumeInfo(raw_text=RESUME))
+
+        assert info.raw_text is None and info.raw_text_ref is None
+
+    def test_invalid(self):
+        """잘못된 정책과 저장소 없는 reference는 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            RawTextRetention('compress')
+        with pytest.raises(ValueError):
+            RawTextRetention('reference')
+
+
+class TestExtractorRetention:
+    """ResumeExtractor raw_text 보관 정책 테스트"""
+
+    def test_policy_applied_to_results(self):
+        """추출 결과에 정책이 적용되고 JSON 출력이 줄어드는지 테스트"""
+        backend = MockBackend(extractions=[("이름", "홍길동")])
+        full = ResumeExtractor(backend=backend).extract_from_text(RESUME)
+        dropped = ResumeExtractor(backend=backend, raw_text_retention='drop').extract_from_text(RESUME)
+
+        assert full.raw_text == RESUME
+        assert dropped.raw_text is None
+        assert dropped.name == full.name == "홍길동"
+        assert len(dropped.to_json()) < len(full.to_json())
+
+    def test_update_resolves_text_from_store(self):
+        """원문을 저장소로 옮긴 결과도 증분 재추출에 사용할 수 있는지 테스트"""
+        store = InMemoryTextStore()
+        backend = MockBackend(extractions=[("기술", "Rust")])
+        extractor = ResumeExtractor(
+            backend=backend, raw_text_retention=RawTextRetention('reference', store=store)
+        )
+        previous = extractor.extract_from_text(RESUME)
+
+        updated = extractor.update_from_text(RESUME.replace("Python, Go", "Rust"), previous)
+
+        assert updated.metadata['incremental']['changed'] == ['skills']
+        assert updated.raw_text is None
+        assert store.get(updated.raw_text_ref).endswith("Rust")
+        assert len(store) == 2
+
+    def test_cli_option(self, tmp_path):
+        """batch 명령의 --raw-text 옵션이 출력에 반영되는지 테스트"""
+        resume = tmp_path / "resume.txt"
+        resume.write_text(RESUME, encoding='utf-8')
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text(f'"{resume}"\n', encoding='utf-8')
+        output = tmp_path / "out.jsonl"
+
+        assert main(["batch", str(manifest), "-o", str(output), "--engine", "heuristic",
+                     "--raw-text", "truncate", "--raw-text-chars", "3"]) == 0
+
+        assert json.loads(output.read_text(encoding='utf-8'))['result']['raw_text'] == "홍길동"
@@ -0,0 +1,97 @@
+"""
+모델 라우팅 테스트
+"""
+
+import langextract as lx
+import pytest
+from resume_extract.backends import ExtractionBackend, build_extractions
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.routing import (
+    CHEAP,
+    ESCALATED,
+    REASON_MISSING_FIELDS,
+    STRONG,
+    ModelRouter,
+)
+
+
+class ModelAwareBackend(ExtractionBackend):
+    """모델 ID별로 다른 고정 응답을 반환하는 테스트용 백엔드"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.models = []
+
+    def extract(self, text, prompt_description, examples, model_id):
+        self.models.append(model_id)
+        return lx.data.AnnotatedDocument(
+            text=text, extractions=build_extractions(text, self.responses.get(model_id, []))
+        )
+
+
+FULL = [("이름", "김철수"), ("기술", "JavaScript, Python")]
+
+
+class TestModelRouter:
+    """ModelRouter 테스트"""
+
+    def test_structured_short_text_goes_cheap(self, sample_resume_text):
+        """구조화된 짧은 이력서는 저렴한 모델로 라우팅되는지 테스트"""
+        router = ModelRouter(cheap_model_id="cheap", strong_model_id="strong")
+
+        assert router.choose(sample_resume_text) == (CHEAP, "cheap")
+
+    def test_long_or_unstructured_text_goes_strong(self, sample_resume_text):
+        """길거나 구조가 불명확한 이력서는 강한 모델로 라우팅되는지 테스트"""
+        router = ModelRouter(cheap_model_id="cheap", strong_model_id="strong", max_cheap_chars=100)
+
+        assert router.choose(sample_resume_text) == (STRONG, "strong")
+        assert router.choose("김철수 개발자입니다.")[0] == STRONG
+
+
+class TestCascade:
+    """LangExtractProcessor 캐스케이드 테스트"""
+
+    def test_cheap_result_accepted(self, sample_resume_text):
+        """저렴한 모델 결과가 충분하면 escalation하지 않는지 테스트"""
+        backend = ModelAwareBackend({"cheap": FULL})
+        router = ModelRouter(cheap_model_id="cheap", strong_model_id="strong")
+
+        with ResumeExtractor(backend=backend, router=router) as extractor:
+            result = extractor.extract_from_text(sample_resume_text)
+
+        assert backend.models == ["cheap"]
+        assert result.name == "김철수"
+        report = router.report()
+        assert report[CHEAP]['calls'] == 1
+        assert report[CHEAP]['escalation_rate'] == 0.0
+        assert report[CHEAP]['latency_p50'] is not None
+
+    def test_missing_fields_escalate(self, sample_resume_text):
+        """필수 필드가 비어 있으면 강한 모델로 escalation하는지 테스트"""
+        backend = ModelAwareBackend({"cheap": [("이름", "김철수")], "strong": FULL})
+        router = ModelRouter(cheap_model_id="cheap", strong_model_id="strong")
+
+        with ResumeExtractor(backend=backend, router=router) as extractor:
+            result = extractor.extract_from_text(sample_resume_text)
+
+        assert backend.models == ["cheap", "strong"]
+        assert result.skills == ["JavaScript", "Python"]
+        report = router.report()
+        assert report[CHEAP]['escalation_rate'] == 1.0
+        assert report[CHEAP]['reasons'] == {REASON_MISSING_FIELDS: 1}
+        assert report[ESCALATED]['calls'] == 1
+
+    @pytest.mark.parametrize("validation", ["eager", "lazy"])
+    def test_validation_failure_escalates(self, sample_resume_text, validation):
+        """검증 실패 시 escalation하는지 테스트 (lazy 모드에서도 저렴한 모델 결과를 먼저 검증)"""
+        backend = ModelAwareBackend({"cheap": [("이메일", "not-an-email")], "strong": FULL})
+        router = ModelRouter(cheap_model_id="cheap", strong_model_id="strong")
+
+        with ResumeExtractor(backend=backend, router=router, use_contact_rules=False,
+                             validation=validation) as extractor:
+            result = extractor.extract_from_text(sample_resume_text)
+
+        assert backend.models == ["cheap", "strong"]
+        assert result.name == "김철수"
+        assert router.report()[CHEAP]['reasons'] == {'validation': 1}
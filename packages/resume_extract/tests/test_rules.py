@@ -0,0 +1,146 @@
+"""
+정규식 기반 연락처 추출 테스트
+"""
+
+from unittest.mock import patch
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.langextract_integration import LangExtractProcessor
+from resume_extract.rules import ContactRuleExtractor
+
+INVALID_EMAILS = ["john..doe@example.com", ".kim@example.com", "kim@corp.local"]
+
+
+class TestContactRuleExtractor:
+    """ContactRuleExtractor 테스트"""
+
+    def setup_method(self):
+        """테스트 설정"""
+        self.rules = ContactRuleExtractor()
+
+    def test_extract_sample_resume(self, sample_resume_text):
+        """샘플 이력서 연락처 추출 테스트"""
+        contact = self.rules.extract(sample_resume_text)
+
+        assert contact['email'] == "chulsoo.kim@example.com"
+        assert contact['phone'] == "010-1234-5678"
+        assert contact['linkedin'] == "linkedin.com/in/chulsookim"
+        assert contact['github'] == "github.com/chulsookim"
+        assert 'website' not in contact
+
+    @pytest.mark.parametrize("text,expected", [
+        ("010-1234-5678", "010-1234-5678"),
+        ("01012345678", "010-1234-5678"),
+        ("010.1234.5678", "010-1234-5678"),
+        ("+82 10-1234-5678", "010-1234-5678"),
+        ("+82-10-1234-5678", "010-1234-5678"),
+        ("(02) 123-4567", "02-123-4567"),
+        ("031-123-4567", "031-123-4567"),
+    ])
+    def test_korean_phone_formats(self, text, expected):
+        """한국 전화번호 형식 정규화 테스트"""
+        assert self.rules.find_phone(f"연락처: {text}") == expected
+
+    def test_mobile_phone_preferred(self):
+        """휴대폰 번호 우선 추출 테스트"""
+        text = "회사: 02-123-4567\n휴대폰: 010-9876-5432"
+        assert self.rules.find_phone(text) == "010-9876-5432"
+
+    def test_dates_are_not_phone_numbers(self):
+        """기간 표기를 전화번호로 오인하지 않는지 테스트"""
+        assert self.rules.find_phone("2020.01 ~ 2023.12, 학점 3.8/4.0") is None
+
+    @pytest.mark.parametrize("text", [
+        "hong [at] example [dot] com",
+        "hong(at)example(dot)com",
+        "hong (골뱅이) example.com",
+        "hong at example dot com",
+        "hong＠example.com",
+    ])
+    def test_obfuscated_email(self, text):
+        """난독화된 이메일 복원 테스트"""
+        assert self.rules.find_email(text) == "hong@example.com"
+
+    @pytest.mark.parametrize("email", INVALID_EMAILS)
+    def test_invalid_email_skipped(self, email):
+        """EmailStr 검증에 실패하는 후보는 건너뛰고 다음 유효한 후보를 사용하는지 테스트"""
+        assert self.rules.find_email(f"이메일: {email}") is None
+        assert self.rules.find_email(f"{email}, hong@example.com") == "hong@example.com"
+
+    def test_github_profile_preferred_over_repository(self):
+        """저장소 URL보다 프로필 URL 우선 테스트"""
+        text = "URL: https://github.com/example/ecommerce\nGitHub: github.com/hong"
+        assert self.rules.find_github(text) == "github.com/hong"
+        assert self.rules.find_github("https://github.com/example/ecommerce") == "https://github.com/example"
+
+    def test_website(self):
+        """웹사이트 추출 테스트"""
+        assert self.rules.find_website("블로그: https://velog.io/@hong") == "https://velog.io/@hong"
+        assert self.rules.find_website("https://linkedin.com/in/hong\nhttps://hong.dev") == "https://hong.dev"
+
+    def test_extract_contact(self):
+        """ContactInfo 생성 테스트"""
+        contact = self.rules.extract_contact("hong@example.com / 010-1234-5678")
+
+        assert contact.email == "hong@example.com"
+        assert contact.phone == "010-1234-5678"
+        assert contact.address is None
+
+
+class TestProcessorContactRules:
+    """LangExtractProcessor 연락처 사전 추출 연동 테스트"""
+
+    @patch('resume_extract.langextract_integration.lx.extract')
+    def test_contact_only_skips_llm(self, mock_extract, sample_resume_text):
+        """연락처 필드만 요청하면 LLM을 호출하지 않는지 테스트"""
+        processor = LangExtractProcessor(api_key="test-key", fields=['email', 'phone'])
+
+        result = processor.extract_resume_info(sample_resume_text)
+
+        mock_extract.assert_not_called()
+        assert result.contact.email == "chulsoo.kim@example.com"
+        assert result.contact.phone == "010-1234-5678"
+        assert result.contact.github is None
+
+    @patch('resume_extract.langextract_integration.lx.extract')
+    def test_prompt_shrinks_to_remaining_fields(self, mock_extract, sample_resume_text):
+        """규칙으로 찾은 필드가 프롬프트와 예제에서 제외되는지 테스트"""
+        processor = LangExtractProcessor(api_key="test-key")
+
+        result = processor.extract_resume_info(sample_resume_text)
+
+        kwargs = mock_extract.call_args.kwargs
+        assert "이메일" not in kwargs['prompt_description']
+        assert "주소" in kwargs['prompt_description']
+        example_classes = {e.extraction_class for e in kwargs['examples'][0].extractions}
+        assert "이메일" not in example_classes
+        assert "주소" in example_classes
+        assert result.contact.email == "chulsoo.kim@example.com"
+
+    def test_unknown_field(self):
+        """지원하지 않는 필드 테스트"""
+        with pytest.raises(ValueError):
+            LangExtractProcessor(api_key="test-key", fields=['hobby'])
+
+
+class TestInvalidRuleEmail:
+    """규칙 이메일이 유효하지 않을 때 추출 결과 테스트"""
+
+    @pytest.mark.parametrize("email", INVALID_EMAILS)
+    def test_model_email_kept(self, email):
+        """유효하지 않은 규칙 이메일이 모델이 추출한 값을 덮어쓰지 않는지 테스트"""
+        text = f"홍길동\n이메일: {email}"
+        backend = MockBackend(extractions=[("이름", "홍길동"), ("이메일", "hong@example.com")])
+
+        result = ResumeExtractor(backend=backend).extract_from_text(text)
+
+        assert result.contact.email == "hong@example.com"
+
+    @pytest.mark.parametrize("email", INVALID_EMAILS)
+    def test_heuristic_engine(self, email):
+        """휴리스틱 엔진이 유효하지 않은 이메일로 실패하지 않는지 테스트"""
+        result = ResumeExtractor(engine='heuristic').extract_from_text(f"홍길동\n이메일: {email}")
+
+        assert result.contact.email is None
@@ -0,0 +1,198 @@
+"""
+HTTP 추출 서비스 테스트
+"""
+
+import json
+import socket
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.service import ExtractionService
+from resume_extract.telemetry import PrometheusSink
+
+RESUME_TEXT = "홍길동\n이메일: hong@example.com\n\n## 기술\nPython"
+
+
+def _request(url, data=None, headers=None):
+    """(상태 코드, 헤더, 본문) 반환 (4xx/5xx도 예외 없이 반환)"""
+    request = urllib.request.Request(url, data=data, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def _post_json(url, payload):
+    return _request(url, json.dumps(payload).encode('utf-8'), {'Content-Type': 'application/json'})
+
+
+def _service(latency=0.0, **kwargs):
+    extractor = ResumeExtractor(
+        backend=MockBackend(extractions=[("이름", "홍길동")], latency=latency),
+        metrics_sink=PrometheusSink(),
+    )
+    return ExtractionService(extractor, **kwargs)
+
+
+class TestExtractEndpoint:
+    """POST /extract 테스트"""
+
+    def test_extract_text(self):
+        """JSON text 요청을 동기로 추출하는지 테스트"""
+        with _service() as service:
+            status, _, body = _post_json(service.url + "/extract", {'text': RESUME_TEXT})
+
+        assert status == 200
+        data = json.loads(body)
+        assert data['name'] == "홍길동"
+        assert data['contact']['email'] == "hong@example.com"
+
+    def test_extract_upload(self):
+        """파일 본문 업로드를 filename 확장자로 파싱하는지 테스트"""
+        with _service() as service:
+            status, _, body = _request(
+                service.url + "/extract?filename=resume.txt",
+                RESUME_TEXT.encode('utf-8'),
+                {'Content-Type': 'application/octet-stream'},
+            )
+
+        assert status == 200
+        assert json.loads(body)['contact']['email'] == "hong@example.com"
+
+    def test_bad_request(self):
+        """url/text가 없는 요청은 400을 반환하는지 테스트"""
+        with _service() as service:
+            status, _, body = _post_json(service.url + "/extract", {'foo': 1})
+
+        assert status == 400
+        assert json.loads(body)['error']['type'] == 'BadRequest'
+
+    def test_invalid_url(self):
+        """잘못된 URL은 추출 예외를 400으로 변환하는지 테스트"""
+        with _service() as service:
+            status, _, body = _post_json(service.url + "/extract", {'url': "not-a-url"})
+
+        assert status == 400
+        assert json.loads(body)['error']['type'] == 'InvalidURLError'
+
+
+    def test_too_large_body_closes_connection(self):
+        """413 응답 후 연결을 닫아 읽지 않은 본문이 다음 요청으로 해석되지 않는지 테스트"""
+        body = b'{"text": "' + b'x' * 200 + b'"}'
+        follow_up = b"GET /healthz HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        with _service(max_body_mb=100 / (1024 * 1024)) as service:
+            host, port = service.url[len("http://"):].split(':')
+            with socket.create_connection((host, int(port)), timeout=5) as sock:
+                sock.sendall(
+                    b"POST /extract HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode() + body + follow_up
+                )
+                received = b''
+                while chunk := sock.recv(65536):
+                    received += chunk
+
+        assert received.startswith(b"HTTP/1.1 413")
+        assert b"Connection: close" in received
+        assert received.count(b"HTTP/1.1 ") == 1
+
+
+class TestBackpressure:
+    """작업 풀 포화 테스트"""
+
+    def test_full_queue_returns_429(self):
+        """작업 스레드와 대기열이 모두 차면 429와 Retry-After를 반환하는지 테스트"""
+        with _service(latency=0.5, workers=1, queue_size=0) as service:
+            first, _, _ = _post_json(service.url + "/jobs", {'text': RESUME_TEXT})
+            second, headers, _ = _post_json(service.url + "/jobs", {'text': RESUME_TEXT})
+            metrics = service.render_metrics()
+
+        assert first == 202
+        assert second == 429
+        assert headers['Retry-After'] == '1'
+        assert "resume_extract_rejected_total 1" in metrics
+
+
+class TestJobs:
+    """비동기 작업 테스트"""
+
+    def test_submit_and_poll(self):
+        """202로 작업을 받고 폴링으로 결과를 조회하는지 테스트"""
+        with _service(latency=0.05) as service:
+            status, headers, body = _post_json(service.url + "/jobs", {'text': RESUME_TEXT})
+            job_id = json.loads(body)['job_id']
+            assert status == 202
+            assert headers['Location'] == f"/jobs/{job_id}"
+
+            deadline = time.time() + 5
+            while True:
+                _, _, body = _request(service.url + f"/jobs/{job_id}")
+                job = json.loads(body)
+                if job['status'] in ('done', 'failed') or time.time() > deadline:
+                    break
+                time.sleep(0.02)
+
+        assert job['status'] == 'done'
+        assert job['result']['name'] == "홍길동"
+
+    def test_failed_job(self):
+        """실패한 작업의 오류 정보를 반환하는지 테스트"""
+        with _service() as service:
+            _, _, body = _request(
+                service.url + "/jobs?filename=resume.xyz", b"data", {'Content-Type': 'application/octet-stream'}
+            )
+            job_id = json.loads(body)['job_id']
+            deadline = time.time() + 5
+            while service.get_job(job_id).status not in ('done', 'failed') and time.time() < deadline:
+                time.sleep(0.02)
+            _, _, body = _request(service.url + f"/jobs/{job_id}")
+
+        job = json.loads(body)
+        assert job['status'] == 'failed'
+        assert job['error']['type'] == 'UnsupportedFileTypeError'
+
+    def test_unknown_job(self):
+        """없는 작업 ID는 404를 반환하는지 테스트"""
+        with _service() as service:
+            status, _, _ = _request(service.url + "/jobs/missing")
+
+        assert status == 404
+
+
+class TestHealthAndMetrics:
+    """상태/지표 엔드포인트 테스트"""
+
+    def test_healthz(self):
+        """작업 풀 설정과 상태를 반환하는지 테스트"""
+        with _service(workers=2, queue_size=3) as service:
+            status, _, body = _request(service.url + "/healthz")
+
+        assert status == 200
+        assert json.loads(body) == {
+            'status': 'ok', 'workers': 2, 'queue_size': 3, 'running': 0, 'queued': 0, 'jobs': 0,
+        }
+
+    def test_metrics(self):
+        """HTTP 요청 수와 추출 텔레메트리를 함께 노출하는지 테스트"""
+        with _service() as service:
+            _post_json(service.url + "/extract", {'text': RESUME_TEXT})
+            status, headers, body = _request(service.url + "/metrics")
+
+        text = body.decode('utf-8')
+        assert status == 200
+        assert headers['Content-Type'].startswith('text/plain')
+        assert 'resume_extract_http_requests_total{path="/extract",status="200"} 1' in text
+        assert "resume_extract_calls_total" in text
+
+
+@pytest.mark.parametrize("argv", [["serve", "--mock", "--port", "0", "--workers", "2"]])
+def test_cli_serve_parser(argv):
+    """serve 명령 인자를 해석하는지 테스트"""
+    from resume_extract.cli import build_parser
+
+    args = build_parser().parse_args(argv)
+    assert args.mock and args.port == 0 and args.workers == 2 and args.queue_size == 32
@@ -0,0 +1,199 @@
+"""
+동일 요청 병합(single-flight) 테스트
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+
+    def test_concurrent_calls_share_result(self):
+        """동시 호출이 한 번만 실행되고 같은 결과를 공유하는지 테스트"""
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def work():
+            calls.append(1)
+            release.wait(1)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(flight.do, 'key', work) for _ in range(8)]
+            while flight.stats()['shared'] < 7:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == {'executed': 1, 'shared': 7}
+        assert flight.in_flight() == 0
+
+    def test_isolated_copies(self):
+        """do_isolated는 병합된 호출자마다 복사본을 주고, 병합되지 않으면 복사하지 않는지 테스트"""
+        flight = SingleFlight()
+        original = []
+        release = threading.Event()
+
+        def work():
+            release.wait(1)
+            return original
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flight.do_isolated, 'key', list, work) for _ in range(4)]
+            while flight.stats()['shared'] < 3:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len({id(result) for result in results}) == 4
+        assert all(result is not original for result in results)
+        assert flight.do_isolated('key', list, lambda: original) is original
+
+    def test_error_shared_and_key_released(self):
+        """리더 예외가 공유되고 이후 호출은 새로 실행되는지 테스트"""
+        flight = SingleFlight()
+
+        with pytest.raises(ValueError):
+            flight.do('key', Mock(side_effect=ValueError("boom")))
+
+        assert flight.do('key', lambda: 42) == 42
+
+
+class TestAsyncSingleFlight:
+    """AsyncSingleFlight 테스트"""
+
+    def test_concurrent_tasks_share_result(self):
+        """동시 태스크가 한 번만 실행되는지 테스트"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        async def main():
+            return await asyncio.gather(*(flight.do('key', work, 21) for _ in range(5)))
+
+        assert asyncio.run(main()) == [42] * 5
+        assert calls == [21]
+
+    def test_isolated_copies(self):
+        """do_isolated는 병합된 태스크마다 복사본을 반환하는지 테스트"""
+        flight = AsyncSingleFlight()
+        original = []
+
+        async def work():
+            await asyncio.sleep(0.01)
+            return original
+
+        async def main():
+            return await asyncio.gather(*(flight.do_isolated('key', list, work) for _ in range(3)))
+
+        results = asyncio.run(main())
+        assert len({id(result) for result in results}) == 3
+        assert all(result is not original for result in results)
+
+    def test_waiter_cancel_does_not_cancel_shared_task(self):
+        """대기자 취소가 공유 태스크를 취소하지 않는지 테스트"""
+        flight = AsyncSingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def main():
+            first = asyncio.ensure_future(flight.do('key', work))
+            second = asyncio.ensure_future(flight.do('key', work))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(main()) == "done"
+
+
+class TestExtractorCoalescing:
+    """ResumeExtractor 요청 병합 테스트"""
+
+    def test_identical_texts_share_one_model_call(self, sample_resume_text):
+        """동일 텍스트 동시 요청이 한 번의 모델 호출을 공유하는지 테스트"""
+        backend = MockBackend(extractions=[("이름", "김철수")], latency=0.05)
+
+        with ResumeExtractor(backend=backend) as extractor:
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                results = list(pool.map(extractor.extract_from_text, [sample_resume_text] * 6))
+
+        assert backend.stats()['calls'] == 1
+        assert all(result == results[0] for result in results)
+
+    def test_coalesced_results_are_independent(self, sample_resume_text):
+        """병합된 요청이 서로 다른 결과 인스턴스를 받아 한쪽 수정이 다른 쪽에 보이지 않는지 테스트"""
+        backend = MockBackend(extractions=[("이름", "김철수")], latency=0.05)
+
+        with ResumeExtractor(backend=backend, raw_text_retention='truncate') as extractor:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(extractor.extract_from_text, [sample_resume_text] * 4))
+
+        assert backend.stats()['calls'] == 1
+        assert len({id(result) for result in results}) == 4
+        results[0].metadata['marker'] = True
+        results[0].skills.append("Haskell")
+        assert all('marker' not in result.metadata for result in results[1:])
+        assert all("Haskell" not in result.skills for result in results[1:])
+
+    @patch('resume_extract.extractor.URLDownloader')
+    def test_identical_urls_share_one_download(self, mock_downloader, sample_resume_text):
+        """동일 URL 동시 요청이 한 번의 다운로드를 공유하는지 테스트"""
+        downloader = mock_downloader.return_value
+
+        def download(url, deadline=None):
+            time.sleep(0.05)
+            return sample_resume_text, None
+
+        downloader.download_and_extract_text.side_effect = download
+        backend = MockBackend(extractions=[("이름", "김철수")])
+
+        with ResumeExtractor(backend=backend) as extractor:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(extractor.extract_from_url, ["https://example.com/cv"] * 4))
+
+        assert downloader.download_and_extract_text.call_count == 1
+        assert backend.stats()['calls'] == 1
+        assert all(result.name == "김철수" for result in results)
+
+    def test_async_identical_requests(self, sample_resume_text):
+        """asyncio 동시 요청 병합 테스트"""
+        backend = MockBackend(extractions=[("이름", "김철수")], latency=0.05)
+
+        async def main(extractor):
+            return await asyncio.gather(
+                *(extractor.aextract_from_text(sample_resume_text) for _ in range(5))
+            )
+
+        with ResumeExtractor(backend=backend) as extractor:
+            results = asyncio.run(main(extractor))
+
+        assert backend.stats()['calls'] == 1
+        assert all(result.name == "김철수" for result in results)
+
+    def test_coalesce_disabled(self, sample_resume_text):
+        """병합 비활성화 테스트"""
+        backend = MockBackend(latency=0.02)
+
+        with ResumeExtractor(backend=backend, coalesce=False) as extractor:
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                list(pool.map(extractor.extract_from_text, [sample_resume_text] * 3))
+
+        assert backend.stats()['calls'] == 3
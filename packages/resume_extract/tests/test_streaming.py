@@ -0,0 +1,116 @@
+"""
+스트리밍 추출 테스트
+"""
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.exceptions import ExtractionError
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.models import ContactInfo, ResumeInfo
+from resume_extract.streaming import (
+    CHUNK,
+    CONTACT,
+    RESULT,
+    TEXT_READY,
+    split_into_chunks,
+)
+
+CANNED = [
+    ("이름", "김철수"),
+    ("회사", "ABC 회사"),
+    ("직책", "시니어 소프트웨어 엔지니어"),
+    ("회사", "XYZ 스타트업"),
+    ("직책", "주니어 개발자"),
+]
+
+
+def canned_in_chunk(text):
+    """청크에 실제로 있는 고정 응답만 반환 (청크별 모델 응답 흉내)"""
+    return [item for item in CANNED if item[1] in text]
+
+
+class TestSplitIntoChunks:
+    """split_into_chunks 테스트"""
+
+    def test_chunks_cover_text(self, sample_resume_text):
+        """청크를 이어붙이면 원문이 되는지 테스트"""
+        chunks = split_into_chunks(sample_resume_text, 300)
+
+        assert len(chunks) > 1
+        assert ''.join(chunk for _, chunk in chunks) == sample_resume_text
+        for offset, chunk in chunks:
+            assert len(chunk) <= 300
+            assert sample_resume_text[offset:offset + len(chunk)] == chunk
+
+    def test_invalid_max_chars(self):
+        """잘못된 청크 크기 테스트"""
+        with pytest.raises(ValueError):
+            split_into_chunks("text", 0)
+
+
+class TestStreamFromText:
+    """ResumeExtractor.stream_from_text 테스트"""
+
+    def test_event_order(self, sample_resume_text):
+        """이벤트 순서와 최종 결과 테스트"""
+        backend = MockBackend(extractions=canned_in_chunk, latency=0.01)
+
+        with ResumeExtractor(backend=backend) as extractor:
+            events = list(extractor.stream_from_text(sample_resume_text, chunk_chars=400))
+
+        kinds = [event.kind for event in events]
+        assert kinds[:2] == [TEXT_READY, CONTACT]
+        assert kinds[-1] == RESULT
+        assert kinds.count(CHUNK) == len(split_into_chunks(sample_resume_text, 400))
+
+        contact = events[1].data
+        assert isinstance(contact, ContactInfo)
+        assert contact.email == "chulsoo.kim@example.com"
+
+        result = events[-1].data
+        assert isinstance(result, ResumeInfo)
+        assert result.name == "김철수"
+        assert [e.company for e in result.experience] == ["ABC 회사", "XYZ 스타트업"]
+        assert all(a.elapsed <= b.elapsed for a, b in zip(events, events[1:], strict=False))
+
+    def test_contact_before_model(self, sample_resume_text):
+        """연락처 이벤트가 모델 응답보다 먼저 나오는지 테스트"""
+        backend = MockBackend(extractions=CANNED, latency=0.2)
+
+        with ResumeExtractor(backend=backend) as extractor:
+            stream = extractor.stream_from_text(sample_resume_text)
+            next(stream)
+            contact = next(stream)
+            stream.close()
+
+        assert contact.kind == CONTACT
+        assert contact.elapsed < 0.2
+
+    def test_chunk_offsets_are_document_positions(self, sample_resume_text):
+        """청크 추출 위치가 원문 기준으로 옮겨지는지 테스트"""
+        backend = MockBackend(extractions=[("회사", "XYZ 스타트업")])
+
+        with ResumeExtractor(backend=backend) as extractor:
+            chunks = [
+                event.data for event in extractor.stream_from_text(sample_resume_text, chunk_chars=300)
+                if event.kind == CHUNK
+            ]
+
+        for chunk in chunks:
+            for extraction in chunk.extractions:
+                interval = extraction.char_interval
+                if interval is not None:
+                    assert sample_resume_text[interval.start_pos:interval.end_pos] == "XYZ 스타트업"
+
+    def test_empty_text(self):
+        """빈 텍스트 테스트"""
+        with ResumeExtractor(backend=MockBackend()) as extractor:
+            with pytest.raises(ExtractionError):
+                list(extractor.stream_from_text("  "))
+
+    def test_heuristic_engine(self, sample_resume_text):
+        """휴리스틱 엔진 스트리밍 테스트"""
+        with ResumeExtractor(engine="heuristic") as extractor:
+            kinds = [event.kind for event in extractor.stream_from_text(sample_resume_text)]
+
+        assert kinds == [TEXT_READY, CONTACT, RESULT]
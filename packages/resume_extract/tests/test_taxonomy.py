@@ -0,0 +1,88 @@
+"""
+기술 분류 사전(Aho-Corasick) 테스트
+"""
+
+import json
+import random
+
+from resume_extract.backends import MockBackend
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.langextract_integration import LangExtractProcessor
+from resume_extract.taxonomy import AhoCorasick, SkillTaxonomy, default_taxonomy
+
+
+class TestAhoCorasick:
+    """AhoCorasick 테스트"""
+
+    def test_matches_brute_force(self):
+        """겹치는 패턴의 매칭 결과가 단순 탐색과 같은지 테스트"""
+        rng = random.Random(0)
+        patterns = list({''.join(rng.choice('abc') for _ in range(rng.randint(1, 4))) for _ in range(40)})
+        text = ''.join(rng.choice('abcd') for _ in range(300))
+
+        automaton = AhoCorasick(patterns)
+
+        expected = {
+            (start, start + len(pattern), index)
+            for index, pattern in enumerate(patterns)
+            for start in range(len(text)) if text.startswith(pattern, start)
+        }
+        assert set(automaton.iter_matches(text)) == expected
+
+
+class TestSkillTaxonomy:
+    """SkillTaxonomy 테스트"""
+
+    def test_canonicalize_aliases(self):
+        """별칭과 표기 차이가 표준 이름으로 통일되고 모르는 기술은 유지되는지 테스트"""
+        taxonomy = default_taxonomy()
+
+        assert taxonomy.canonicalize(["React.js", "ReactJS", "react", "node js", "Haskell"]) == [
+            "React", "Node.js", "Haskell"
+        ]
+
+    def test_find_boundaries_and_longest(self):
+        """가장 긴 별칭을 고르고 다른 단어 안의 별칭은 무시하는지 테스트"""
+        taxonomy = default_taxonomy()
+
+        found = taxonomy.find("Google에서 Spring Boot와 golang, k8s로 개발 (JavaScripts는 아님)")
+
+        assert found == ["Spring Boot", "Go", "Kubernetes"]
+
+    def test_from_json(self, tmp_path):
+        """JSON 파일(사전/목록)로 만든 사전 테스트"""
+        path = tmp_path / "skills.json"
+        path.write_text(json.dumps({"Vue.js": ["뷰"], "Nuxt": []}, ensure_ascii=False), encoding='utf-8')
+        taxonomy = SkillTaxonomy.from_json(path)
+
+        assert taxonomy.find("뷰와 nuxt 경험") == ["Vue.js", "Nuxt"]
+
+        path.write_text(json.dumps(["Nuxt"]), encoding='utf-8')
+        assert len(SkillTaxonomy.from_json(path)) == 1
+
+
+class TestExtractorTaxonomy:
+    """ResumeExtractor(skill_taxonomy=...) 테스트"""
+
+    def test_merge_model_skills(self):
+        """모델이 추출한 기술의 표기가 통일되고 원문의 기술이 추가되는지 테스트"""
+        text = "홍길동\n\n## 기술\nreactjs, Python3\n\n## 경력\n카카오에서 Golang으로 개발"
+        backend = MockBackend(extractions=[("이름", "홍길동"), ("기술", "reactjs, Python3")])
+
+        plain = ResumeExtractor(backend=backend).extract_from_text(text)
+        merged = ResumeExtractor(backend=backend, skill_taxonomy=default_taxonomy()).extract_from_text(text)
+
+        assert plain.skills == ["reactjs", "Python3"]
+        assert merged.skills == ["React", "Python", "Go"]
+
+    def test_skills_not_requested_per_call(self):
+        """호출별 fields에 skills가 없으면 원문의 기술을 추가하지 않는지 테스트"""
+        text = "홍길동\n\n## 경력\n카카오에서 Golang으로 개발"
+        processor = LangExtractProcessor(
+            api_key="test-key",
+            backend=MockBackend(extractions=[("이름", "홍길동")]),
+            skill_taxonomy=default_taxonomy(),
+        )
+
+        assert processor.extract_resume_info(text).skills == ["Go"]
+        assert processor.extract_resume_info(text, fields=["name"]).skills == []
@@ -0,0 +1,174 @@
+"""
+추출 텔레메트리 테스트
+"""
+
+import json
+
+import pytest
+from resume_extract.backends import MockBackend
+from resume_extract.exceptions import LangExtractAPIError
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.routing import ESCALATED, ModelRouter
+from resume_extract.telemetry import (
+    CallMetrics,
+    InMemorySink,
+    JSONLSink,
+    PrometheusSink,
+    estimate_cost,
+    estimate_tokens,
+)
+
+
+class UsageBackend(MockBackend):
+    """제공자가 보고한 토큰 사용량을 결과에 붙이는 테스트용 백엔드"""
+
+    def extract(self, text, prompt_description, examples, model_id):
+        result = super().extract(text, prompt_description, examples, model_id)
+        result.usage = {'input_tokens': 100, 'output_tokens': 20}
+        return result
+
+
+class TestEstimates:
+    """토큰/비용 추정 테스트"""
+
+    def test_estimate_tokens(self):
+        """ASCII와 한글의 토큰 수 추정 테스트"""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("김철수") == 2
+        assert estimate_tokens("abcd김철수😀") == 4
+
+    def test_estimate_cost(self):
+        """가격표에 있는 모델만 비용을 추정하는지 테스트"""
+        assert estimate_cost("gemini-2.0-flash", 1_000_000, 1_000_000) == pytest.approx(0.5)
+        assert estimate_cost("unknown-model", 1000) is None
+
+
+class TestProcessorTelemetry:
+    """호출별 텔레메트리 기록 테스트"""
+
+    def test_metadata_attached(self, sample_resume_text):
+        """결과 metadata에 모델, 입력 크기, 단계별 소요 시간이 기록되는지 테스트"""
+        sink = InMemorySink()
+        backend = MockBackend([("이름", "김철수")])
+
+        with ResumeExtractor(backend=backend, metrics_sink=sink, coalesce=False) as extractor:
+            result = extractor.extract_from_text(sample_resume_text)
+
+        metadata = result.metadata
+        assert metadata['model_id'] == "gemini-2.0-flash"
+        assert metadata['input_chars'] == len(sample_resume_text)
+        assert metadata['model_calls'] == 1
+        assert metadata['chunk_count'] == 1
+        assert metadata['estimated_tokens'] > estimate_tokens(sample_resume_text)
+        assert metadata['input_tokens'] is None
+        assert metadata['cost_usd'] > 0
+        assert {'rules', 'model', 'convert'} <= set(metadata['phases'])
+        assert metadata['wall_time'] >= sum(metadata['phases'].values())
+        assert len(sink.records) == 1
+
+    def test_reported_usage(self, sample_resume_text):
+        """백엔드가 보고한 실제 토큰 수를 기록하는지 테스트"""
+        with ResumeExtractor(backend=UsageBackend(), coalesce=False) as extractor:
+            metadata = extractor.extract_from_text(sample_resume_text).metadata
+
+        assert metadata['input_tokens'] == 100
+        assert metadata['output_tokens'] == 20
+        assert metadata['cost_usd'] == pytest.approx(estimate_cost("gemini-2.0-flash", 100, 20))
+
+    def test_rules_only_call_has_no_model(self, sample_resume_text):
+        """연락처만 요청하면 모델 호출 없이 기록되는지 테스트"""
+        backend = MockBackend()
+
+        with ResumeExtractor(backend=backend, fields=["email", "phone"]) as extractor:
+            metadata = extractor.extract_from_text(sample_resume_text).metadata
+
+        assert metadata['model_calls'] == 0
+        assert metadata['model_id'] is None
+        assert metadata['cost_usd'] is None
+
+    def test_escalation_recorded(self, sample_resume_text):
+        """escalation한 호출은 경로와 최종 모델이 기록되는지 테스트"""
+        router = ModelRouter(cheap_model_id="cheap", strong_model_id="strong")
+
+        with ResumeExtractor(backend=MockBackend(), router=router) as extractor:
+            metadata = extractor.extract_from_text(sample_resume_text).metadata
+
+        assert metadata['route'] == ESCALATED
+        assert metadata['model_id'] == "strong"
+        assert metadata['model_calls'] == 2
+
+    def test_error_recorded(self, sample_resume_text):
+        """실패한 호출도 오류 종류와 함께 기록되는지 테스트"""
+        sink = InMemorySink()
+
+        with ResumeExtractor(backend=MockBackend(error_rate=1.0), metrics_sink=sink) as extractor:
+            with pytest.raises(LangExtractAPIError):
+                extractor.extract_from_text(sample_resume_text)
+
+        assert sink.records[0].error == "LangExtractAPIError"
+        assert sink.summary()['errors'] == 1
+
+    def test_stream_records_chunks(self, sample_resume_text):
+        """스트리밍 호출은 청크 수만큼 모델 호출이 기록되는지 테스트"""
+        sink = InMemorySink()
+
+        with ResumeExtractor(backend=MockBackend(), metrics_sink=sink) as extractor:
+            events = list(extractor.stream_from_text(sample_resume_text, chunk_chars=200))
+
+        metadata = events[-1].data.metadata
+        assert metadata['chunk_count'] > 1
+        assert metadata['chunk_count'] == metadata['model_calls']
+        assert sink.records[0].chunk_count == metadata['chunk_count']
+
+
+class TestSinks:
+    """MetricsSink 구현 테스트"""
+
+    @staticmethod
+    def _metrics(**kwargs):
+        values = {'engine': "langextract", 'model_id': "gemini-2.0-flash", 'input_chars': 100,
+                  'estimated_tokens': 50, 'chunk_count': 1, 'model_calls': 1,
+                  'phases': {'model': 0.2}, 'wall_time': 0.3, 'cost_usd': 0.001}
+        values.update(kwargs)
+        return CallMetrics(**values)
+
+    def test_in_memory_sink_keeps_recent(self):
+        """max_records를 넘으면 오래된 기록부터 버리는지 테스트"""
+        sink = InMemorySink(max_records=2)
+        for calls in range(1, 4):
+            sink.record(self._metrics(model_calls=calls))
+
+        assert [metrics.model_calls for metrics in sink.records] == [2, 3]
+        assert sink.summary()['calls'] == 2
+
+    def test_jsonl_sink(self, tmp_path):
+        """JSONL 파일에 한 줄씩 기록되는지 테스트"""
+        path = tmp_path / "metrics.jsonl"
+        sink = JSONLSink(str(path))
+        sink.record(self._metrics())
+        sink.record(self._metrics(error="ExtractionError"))
+        sink.close()
+
+        lines = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+        assert len(lines) == 2
+        assert lines[0]['model_id'] == "gemini-2.0-flash"
+        assert lines[1]['error'] == "ExtractionError"
+
+    def test_prometheus_sink(self, tmp_path):
+        """Prometheus 텍스트 형식으로 카운터와 히스토그램을 노출하는지 테스트"""
+        sink = PrometheusSink()
+        sink.record(self._metrics())
+        sink.record(self._metrics(error="ExtractionError"))
+
+        text = sink.render()
+        assert '# TYPE resume_extract_calls_total counter' in text
+        assert 'resume_extract_calls_total{model="gemini-2.0-flash",engine="langextract",status="ok"} 1' in text
+        assert 'resume_extract_tokens_total{model="gemini-2.0-flash",kind="estimated"} 100' in text
+        assert 'resume_extract_phase_seconds_bucket{phase="model",le="0.25"} 2' in text
+        assert 'resume_extract_phase_seconds_bucket{phase="model",le="0.1"} 0' in text
+        assert 'resume_extract_phase_seconds_count{phase="total"} 2' in text
+
+        path = tmp_path / "resume_extract.prom"
+        sink.write(str(path))
+        assert path.read_text(encoding='utf-8') == text
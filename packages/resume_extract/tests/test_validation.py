@@ -0,0 +1,75 @@
+"""
+검증 없는 결과 생성 경로와 경계 검증 테스트
+"""
+
+import pytest
+from pydantic import ValidationError
+from resume_extract.backends import MockBackend
+from resume_extract.exceptions import ExtractionError
+from resume_extract.extractor import ResumeExtractor
+from resume_extract.models import (
+    ContactInfo,
+    ExperienceInfo,
+    ResumeInfo,
+    validate_resume_info,
+)
+from resume_extract.streaming import RESULT
+
+RESUME = "홍길동\n이메일: hong@example.com\n\n## 경력\n카카오 - 백엔드 개발자 (2020.01 ~ 2023.12)\n\n## 기술\nPython, Go"
+
+
+class TestTrusted:
+    """ResumeModel.trusted 테스트"""
+
+    def test_same_as_validated(self):
+        """기본값을 채운 결과가 검증 생성과 같은지 테스트"""
+        data = {'company': "카카오", 'position': "개발자", 'duration': "2020.01 ~ 2023.12"}
+
+        trusted = ExperienceInfo.trusted(**data)
+
+        assert trusted == ExperienceInfo(**data)
+        assert trusted.model_dump() == ExperienceInfo(**data).model_dump()
+        assert trusted.model_fields_set == set(data)
+
+    def test_missing_required(self):
+        """필수 필드가 빠지면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            ExperienceInfo.trusted(company="카카오")
+
+    def test_boundary_validation(self):
+        """검증을 건너뛴 잘못된 값이 경계 검증에서 걸리고 원문은 유지되는지 테스트"""
+        info = ResumeInfo.trusted(contact=ContactInfo.trusted(email="not-an-email"), raw_text=RESUME)
+        with pytest.raises(ValidationError):
+            validate_resume_info(info)
+
+        info.contact = ContactInfo.trusted(email="hong@example.com")
+        assert validate_resume_info(info).raw_text == RESUME
+
+
+class TestLazyValidation:
+    """ResumeExtractor validation='lazy' 테스트"""
+
+    def test_same_result_as_eager(self):
+        """lazy 모드 결과가 eager 모드와 같은지 테스트"""
+        eager = ResumeExtractor(engine='heuristic').extract_from_text(RESUME)
+        lazy = ResumeExtractor(engine='heuristic', validation='lazy').extract_from_text(RESUME)
+
+        assert lazy.model_dump(exclude={'metadata'}) == eager.model_dump(exclude={'metadata'})
+
+    def test_invalid_result_rejected(self):
+        """모델이 잘못된 이메일을 돌려주면 반환 전에 ExtractionError가 발생하는지 테스트"""
+        backend = MockBackend(extractions=[("이름", "홍길동"), ("이메일", "not-an-email")])
+        extractor = ResumeExtractor(backend=backend, validation='lazy')
+
+        with pytest.raises(ExtractionError) as exc_info:
+            extractor.extract_from_text("홍길동\n개발자")
+        assert "email" in exc_info.value.details
+
+        events = extractor.stream_from_text("홍길동\n개발자")
+        with pytest.raises(ExtractionError):
+            [event for event in events if event.kind == RESULT]
+
+    def test_invalid_mode(self):
+        """지원하지 않는 검증 모드는 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            ResumeExtractor(validation='never')